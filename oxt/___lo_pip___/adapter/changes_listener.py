@@ -0,0 +1,70 @@
+from __future__ import annotations
+from typing import Any, TYPE_CHECKING
+
+import uno
+from .adapter_base import AdapterBase, GenericArgs
+
+from com.sun.star.util import XChangesListener
+
+if TYPE_CHECKING:
+    from com.sun.star.lang import EventObject
+    from com.sun.star.util import ChangesEvent
+
+
+class ChangesListener(AdapterBase, XChangesListener):
+    """
+    Makes it possible to receive configuration change events.
+
+    See Also:
+        `API XChangesListener <https://api.libreoffice.org/docs/idl/ref/interfacecom_1_1sun_1_1star_1_1util_1_1XChangesListener.html>`_
+    """
+
+    def __init__(
+        self,
+        notifier: Any,  # noqa: ANN401
+        trigger_args: GenericArgs | None = None,
+        add_listener: bool = True,
+    ) -> None:
+        """
+        Constructor:
+
+        Arguments:
+            notifier (Any): Object that supports ``XChangesNotifier`` such as a ``ConfigurationAccess``.
+            trigger_args (GenericArgs, optional): Args that are passed to events when they are triggered.
+            add_listener (bool, optional): If ``True`` listener is automatically added. Default ``True``.
+        """
+        super().__init__(trigger_args=trigger_args)
+        # the notifier is kept so it is not disposed while listening.
+        self._notifier = notifier
+        self._is_added = False
+        if add_listener:
+            self._notifier.addChangesListener(self)
+            self._is_added = True
+
+    def remove(self) -> None:
+        """Stops listening."""
+        if self._is_added:
+            self._is_added = False
+            try:
+                self._notifier.removeChangesListener(self)
+            except Exception:
+                pass
+
+    def changesOccurred(self, event: ChangesEvent) -> None:
+        """Is invoked when changes to the configuration were committed."""
+        self._trigger_event("changesOccurred", event)
+
+    def disposing(self, event: EventObject) -> None:
+        """
+        Gets called when the broadcaster is about to be disposed.
+
+        All listeners and all other objects, which reference the broadcaster
+        should release the reference to the source. No method should be invoked
+        anymore on this object ( including ``XComponent.removeEventListener()`` ).
+
+        This method is called for every listener registration of derived listener
+        interfaced, not only for registrations at ``XComponent``.
+        """
+        # from com.sun.star.lang.XEventListener
+        self._is_added = False
+        self._trigger_event("disposing", event)
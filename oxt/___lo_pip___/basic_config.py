@@ -39,6 +39,15 @@ class BasicConfig(metaclass=ConfigMeta):
         self._install_on_no_uninstall_permission = bool(kwargs["install_on_no_uninstall_permission"])
         self._no_pip_remove = set(kwargs["no_pip_remove"])
         self._unload_after_install = bool(kwargs["unload_after_install"])
+        self._async_startup = bool(kwargs.get("async_startup", False))
+        self._batch_install = bool(kwargs.get("batch_install", True))
+        self._pip_worker_idle_timeout = int(kwargs.get("pip_worker_idle_timeout", 60))
+        self._prefetch_workers = int(kwargs.get("prefetch_workers", 4))
+        self._uninstall_workers = int(kwargs.get("uninstall_workers", 4))
+        self._wheel_cache_dir = str(kwargs.get("wheel_cache_dir", ""))
+        self._wheel_cache_size = int(kwargs.get("wheel_cache_size", 512))
+        self._share_requirements = bool(kwargs.get("share_requirements", True))
+        self._internet_check_ttl = int(kwargs.get("internet_check_ttl", 300))
         self._oxt_name = str(kwargs["oxt_name"])
         self._extension_version = str(kwargs["extension_version"])
 
@@ -67,6 +76,29 @@ class BasicConfig(metaclass=ConfigMeta):
         """
         return self._auto_install_in_site_packages
 
+    @property
+    def async_startup(self) -> bool:
+        """
+        Gets the flag indicating if the startup job runs on a background thread.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.async_startup)
+
+        When ``True`` the startup job returns immediately and the requirements check, installs and
+        imports run on a worker thread. Use ``StartupMonitor().wait_ready()`` before using installed packages.
+        """
+        return self._async_startup
+
+    @property
+    def batch_install(self) -> bool:
+        """
+        Gets the flag indicating if all pending packages are installed with a single pip call.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.batch_install)
+
+        If the batch install fails then packages are installed one at a time.
+        """
+        return self._batch_install
+
     @property
     def default_locale(self) -> List[str]:
         """
@@ -121,6 +153,18 @@ class BasicConfig(metaclass=ConfigMeta):
         """
         return self._install_wheel
 
+    @property
+    def internet_check_ttl(self) -> int:
+        """
+        Gets the number of seconds a successful internet check is reused.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.internet_check_ttl)
+
+        The result is saved in the user profile so it is also reused by later sessions.
+        A value of ``0`` checks every time.
+        """
+        return self._internet_check_ttl
+
     @property
     def isolate_windows(self) -> Set[str]:
         """
@@ -186,6 +230,29 @@ class BasicConfig(metaclass=ConfigMeta):
         """
         return self._package_name
 
+    @property
+    def pip_worker_idle_timeout(self) -> int:
+        """
+        Gets the number of seconds the pip worker process waits for the next command before it exits.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.pip_worker_idle_timeout)
+
+        pip commands of all installers in a session are run by one long lived process.
+        A value of ``0`` starts a new process for each pip command.
+        """
+        return self._pip_worker_idle_timeout
+
+    @property
+    def prefetch_workers(self) -> int:
+        """
+        Gets the number of concurrent downloads used to fetch pending packages before they are installed.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.prefetch_workers)
+
+        A value of ``0`` downloads each package while it is installed.
+        """
+        return self._prefetch_workers
+
     @property
     def py_pkg_dir(self) -> str:
         """
@@ -245,6 +312,15 @@ class BasicConfig(metaclass=ConfigMeta):
         """
         return self._uninstall_on_update
 
+    @property
+    def uninstall_workers(self) -> int:
+        """
+        Gets the number of threads used to delete the files of a package being uninstalled.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.uninstall_workers)
+        """
+        return self._uninstall_workers
+
     @property
     def unload_after_install(self) -> bool:
         """
@@ -252,6 +328,37 @@ class BasicConfig(metaclass=ConfigMeta):
         """
         return self._unload_after_install
 
+    @property
+    def wheel_cache_dir(self) -> str:
+        """
+        Gets the directory of the wheel cache.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.wheel_cache_dir)
+        """
+        return self._wheel_cache_dir
+
+    @property
+    def wheel_cache_size(self) -> int:
+        """
+        Gets the maximum size of the wheel cache in MB.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.wheel_cache_size)
+
+        A value of ``0`` disables the cache.
+        """
+        return self._wheel_cache_size
+
+    @property
+    def share_requirements(self) -> bool:
+        """
+        Gets the flag indicating if extensions that use the same site-packages install their requirements together.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.share_requirements)
+
+        Packages that another extension still needs are not uninstalled.
+        """
+        return self._share_requirements
+
     @property
     def window_timeout(self) -> int:
         """
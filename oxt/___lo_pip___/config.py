@@ -11,6 +11,7 @@ import site
 
 from .oxt_logger.logger_config import LoggerConfig
 from .basic_config import BasicConfig
+from .config_snapshot import ConfigSnapshot, get_key
 from .oxt_logger.oxt_logger import OxtLogger
 
 if TYPE_CHECKING:
@@ -63,7 +64,6 @@ class Config:
         if not TYPE_CHECKING:
             from .lo_util import Session
             from .info import ExtensionInfo
-            from .lo_util import Util
             from .settings.general_settings import GeneralSettings
 
         logger_config = LoggerConfig()
@@ -102,32 +102,19 @@ class Config:
             self._is_flatpak = bool(os.getenv("FLATPAK_ID", ""))
             self._is_snap = bool(os.getenv("SNAP_INSTANCE_NAME", ""))
             self._site_packages = ""
-            util = Util()
-
-            # self._package_location = Path(file_util.get_package_location(self._lo_identifier, True))
-            self._package_location = Path(self._extension_info.get_extension_loc(self.lo_identifier, True)).resolve()
             self._python_major_minor = self._get_python_major_minor()
 
-            self._is_user_installed = False
-            self._is_shared_installed = False
-            self._is_bundled_installed = False
-            self._set_extension_installs()
-
-            if self._is_win:
-                self._python_path = Path(self.join(util.config("Module"), "python.exe"))
-                self._site_packages = self._get_windows_site_packages_dir()
-            elif self._is_mac:
-                self._python_path = Path(self.join(util.config("Module"), "..", "Resources", "python")).resolve()
-                self._site_packages = self._get_mac_site_packages_dir()
-            elif self._is_app_image:
-                self._python_path = Path(self.join(util.config("Module"), "python"))
-                self._site_packages = self._get_default_site_packages_dir()
-            else:
-                self._python_path = Path(sys.executable)
-                if self._is_flatpak:
-                    self._site_packages = self._get_flatpak_site_packages_dir()
-                else:
-                    self._site_packages = self._get_default_site_packages_dir()
+            # the location is part of the key, it changes when the extension is installed to another layer.
+            ext_loc = self._extension_info.get_extension_loc(self.lo_identifier, True)
+            self._snapshot = ConfigSnapshot(
+                pth=Path(self._session.user_profile, f"{self.lo_implementation_name}_config_snapshot.json"),
+                key=get_key(self.extension_version, self._session.user_profile, ext_loc),
+            )
+            self._snapshot_checked = True
+            if self._load_snapshot():
+                self._logger.debug("Config values loaded from snapshot")
+            elif self._set_lo_values(ext_loc):
+                self._save_snapshot()
         except Exception as err:
             self._logger.error(f"Error initializing config: {err}", exc_info=True)
             raise
@@ -163,11 +150,7 @@ class Config:
                 self._basic_config.package_name,
                 package_ver,
             )
-        ver_rules = VerRules()
-        matched_rules = ver_rules.get_matched_rules(package_ver)
-        ver_strings = []
-        for rule in matched_rules:
-            ver_strings.append(rule.get_versions_str())
+        ver_strings = list(VerRules().compile(package_ver).versions_str)
 
         if ver_strings:
             txt_ver = ",".join(ver_strings)
@@ -188,6 +171,108 @@ class Config:
     def join(self, *paths: str) -> str:
         return str(Path(paths[0]).joinpath(*paths[1:]))
 
+    def _set_lo_values(self, ext_loc: str | None = None) -> bool:
+        """
+        Sets the values that are found by querying LibreOffice.
+
+        Args:
+            ext_loc (str, optional): Location of the extension if it was already queried.
+
+        Returns:
+            bool: ``False`` if LibreOffice did not report the location of the extension, such as while it is being
+            installed. The values should not be saved to the snapshot then.
+        """
+        if not TYPE_CHECKING:
+            from .lo_util import Util
+
+        util = Util()
+
+        # self._package_location = Path(file_util.get_package_location(self._lo_identifier, True))
+        if ext_loc is None:
+            ext_loc = self._extension_info.get_extension_loc(self.lo_identifier, True)
+        self._package_location = Path(ext_loc).resolve()
+
+        self._is_user_installed = False
+        self._is_shared_installed = False
+        self._is_bundled_installed = False
+        self._set_extension_installs()
+
+        if self._is_win:
+            self._python_path = Path(self.join(util.config("Module"), "python.exe"))
+            self._site_packages = self._get_windows_site_packages_dir()
+        elif self._is_mac:
+            self._python_path = Path(self.join(util.config("Module"), "..", "Resources", "python")).resolve()
+            self._site_packages = self._get_mac_site_packages_dir()
+        elif self._is_app_image:
+            self._python_path = Path(self.join(util.config("Module"), "python"))
+            self._site_packages = self._get_default_site_packages_dir()
+        else:
+            self._python_path = Path(sys.executable)
+            if self._is_flatpak:
+                self._site_packages = self._get_flatpak_site_packages_dir()
+            else:
+                self._site_packages = self._get_default_site_packages_dir()
+        return bool(ext_loc)
+
+    # region Snapshot
+    def _load_snapshot(self) -> bool:
+        """
+        Sets the values found by querying LibreOffice from the snapshot saved by an earlier start.
+
+        The paths are checked when first used, see ``_check_snapshot()``.
+
+        Returns:
+            bool: ``True`` if the values were loaded.
+        """
+        values = self._snapshot.load()
+        if values is None:
+            return False
+        try:
+            self._package_location = Path(values["package_location"])
+            self._python_path = Path(values["python_path"])
+            self._site_packages = str(values["site_packages"])
+            self._is_user_installed = bool(values["is_user_installed"])
+            self._is_shared_installed = bool(values["is_shared_installed"])
+            self._is_bundled_installed = bool(values["is_bundled_installed"])
+        except (KeyError, TypeError):
+            return False
+        self._snapshot_checked = False
+        return True
+
+    def _save_snapshot(self) -> None:
+        values = {
+            "package_location": str(self._package_location),
+            "python_path": str(self._python_path),
+            "site_packages": self._site_packages,
+            "is_user_installed": self._is_user_installed,
+            "is_shared_installed": self._is_shared_installed,
+            "is_bundled_installed": self._is_bundled_installed,
+        }
+        if not self._snapshot.save(values):
+            self._logger.debug("Unable to save config snapshot %s", self._snapshot.path)
+
+    def _check_snapshot(self) -> None:
+        """Queries LibreOffice again if a path loaded from the snapshot no longer exists."""
+        if self._snapshot_checked:
+            return
+        self._snapshot_checked = True
+        paths = [self._package_location, self._python_path]
+        if self._site_packages:
+            paths.append(Path(self._site_packages))
+        if all(pth.exists() for pth in paths):
+            return
+        self._logger.debug("Config snapshot is out of date. Querying LibreOffice.")
+        if self._set_lo_values():
+            self._save_snapshot()
+        else:
+            self._snapshot.clear()
+
+    def clear_snapshot(self) -> None:
+        """Removes the saved snapshot so LibreOffice is queried on the next start."""
+        self._snapshot.clear()
+
+    # endregion Snapshot
+
     def _set_extension_installs(self) -> None:
         details = self._extension_info.get_extension_details(self.lo_identifier)
         if details[0] is not None:
@@ -272,6 +357,29 @@ class Config:
         """
         return self._basic_config
 
+    @property
+    def async_startup(self) -> bool:
+        """
+        Gets the flag indicating if the startup job runs on a background thread.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.async_startup)
+
+        When ``True`` the startup job returns immediately and the requirements check, installs and
+        imports run on a worker thread. Use ``StartupMonitor().wait_ready()`` before using installed packages.
+        """
+        return self._basic_config.async_startup
+
+    @property
+    def batch_install(self) -> bool:
+        """
+        Gets the flag indicating if all pending packages are installed with a single pip call.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.batch_install)
+
+        If the batch install fails then packages are installed one at a time.
+        """
+        return self._basic_config.batch_install
+
     @property
     def delay_startup(self) -> bool:
         """
@@ -327,6 +435,7 @@ class Config:
 
         For some strange reason, on windows, the path can come back as 'soffice.bin' for 'sys.executable'.
         """
+        self._check_snapshot()
         return self._python_path
 
     @property
@@ -530,6 +639,18 @@ class Config:
         """
         return self._basic_config.install_wheel
 
+    @property
+    def internet_check_ttl(self) -> int:
+        """
+        Gets the number of seconds a successful internet check is reused.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.internet_check_ttl)
+
+        The result is saved in the user profile so it is also reused by later sessions.
+        A value of ``0`` checks every time.
+        """
+        return self._basic_config.internet_check_ttl
+
     @property
     def lo_identifier(self) -> str:
         """
@@ -560,6 +681,7 @@ class Config:
         """
         Gets the path to the site-packages directory. May be empty string.
         """
+        self._check_snapshot()
         return self._site_packages
 
     @property
@@ -574,6 +696,7 @@ class Config:
         """
         Gets the LibreOffice package location.
         """
+        self._check_snapshot()
         return self._package_location
 
     @property
@@ -651,6 +774,15 @@ class Config:
         """
         return self.basic_config.uninstall_on_update
 
+    @property
+    def uninstall_workers(self) -> int:
+        """
+        Gets the number of threads used to delete the files of a package being uninstalled.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.uninstall_workers)
+        """
+        return self._basic_config.uninstall_workers
+
     @property
     def window_timeout(self) -> int:
         """
@@ -689,6 +821,84 @@ class Config:
         """
         return self.basic_config.unload_after_install
 
+    @property
+    def pip_worker_idle_timeout(self) -> int:
+        """
+        Gets the number of seconds the pip worker process waits for the next command before it exits.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.pip_worker_idle_timeout)
+
+        pip commands of all installers in a session are run by one long lived process.
+        A value of ``0`` starts a new process for each pip command.
+        """
+        return self._basic_config.pip_worker_idle_timeout
+
+    @property
+    def prefetch_workers(self) -> int:
+        """
+        Gets the number of concurrent downloads used to fetch pending packages before they are installed.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.prefetch_workers)
+
+        A value of ``0`` downloads each package while it is installed.
+        """
+        return self._basic_config.prefetch_workers
+
+    @property
+    def wheel_cache_dir(self) -> str:
+        """
+        Gets the directory of the wheel cache.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.wheel_cache_dir)
+
+        When not set, ``oxt_wheel_cache`` next to the LibreOffice user profile is used
+        so the cache is shared by all extensions and survives a profile reset.
+        """
+        if self._basic_config.wheel_cache_dir:
+            return self._basic_config.wheel_cache_dir
+        return str(Path(self.session.user_profile).parent / "oxt_wheel_cache")
+
+    @property
+    def install_queue_dir(self) -> str:
+        """
+        Gets the directory of the install lock.
+
+        The directory is in the LibreOffice user profile so the installs of all extensions and all LibreOffice
+        processes that use the profile wait for each other. See ``install.install_lock.InstallLock``.
+        """
+        return str(Path(self.session.user_profile) / "oxt_install_queue")
+
+    @property
+    def wheel_cache_size(self) -> int:
+        """
+        Gets the maximum size of the wheel cache in MB.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.wheel_cache_size)
+
+        A value of ``0`` disables the cache.
+        """
+        return self._basic_config.wheel_cache_size
+
+    @property
+    def share_requirements(self) -> bool:
+        """
+        Gets the flag indicating if extensions that use the same site-packages install their requirements together.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.share_requirements)
+
+        Packages that another extension still needs are not uninstalled. See ``shared_requirements_file``.
+        """
+        return self._basic_config.share_requirements
+
+    @property
+    def shared_requirements_file(self) -> str:
+        """
+        Gets the file that records the requirements of each extension that installs packages in the user profile.
+
+        See ``install.shared_registry.SharedRegistry``.
+        """
+        return str(Path(self.session.user_profile) / "oxt_shared_requirements.json")
+
     @property
     def extension_version(self) -> str:
         """
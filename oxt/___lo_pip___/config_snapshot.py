@@ -0,0 +1,131 @@
+"""
+Snapshot of the :py:class:`~.config.Config` values that are found by querying LibreOffice.
+
+The extension location, the install layer of the extension, the python executable and the site-packages directory
+only change when LibreOffice, the extension, the user profile or python change. They are saved in the user profile
+with a key made of those and read back in one file read on later starts.
+
+The extension location is part of the key. It differs for each install layer, so a snapshot saved while the
+extension was installed for the user is not used once it is installed as shared, or the other way around.
+"""
+
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Dict
+import json
+import os
+import site
+import sys
+
+_VERSION = 1
+
+
+def get_lo_build() -> str:
+    """
+    Gets a string that changes when LibreOffice is updated, without querying LibreOffice.
+
+    The location and modified time of the ``uno`` module of the running LibreOffice are used.
+    Empty string if ``uno`` is not loaded.
+    """
+    uno = sys.modules.get("uno")
+    pth = getattr(uno, "__file__", "") or ""
+    if not pth:
+        return ""
+    try:
+        return f"{pth}|{os.stat(pth).st_mtime_ns}"
+    except OSError:
+        return pth
+
+
+def get_key(extension_version: str, user_profile: str, package_location: str = "") -> Dict[str, Any]:
+    """
+    Gets the key a snapshot is valid for.
+
+    Args:
+        extension_version (str): Version of the extension.
+        user_profile (str): LibreOffice user profile directory.
+        package_location (str, optional): Location of the extension as reported by LibreOffice.
+
+    Returns:
+        Dict[str, Any]: Key.
+    """
+    return {
+        "version": _VERSION,
+        "lo_build": get_lo_build(),
+        "extension_version": extension_version,
+        "user_profile": user_profile,
+        "package_location": package_location,
+        "python": sys.version,
+        "executable": sys.executable,
+        "user_site": site.USER_SITE or "",
+        "app_image": bool(os.getenv("APPIMAGE", "")),
+        "flatpak": bool(os.getenv("FLATPAK_ID", "")),
+    }
+
+
+class ConfigSnapshot:
+    """Reads and writes the snapshot file."""
+
+    def __init__(self, pth: str | Path, key: Dict[str, Any]) -> None:
+        """
+        Initialize ConfigSnapshot
+
+        Args:
+            pth (str | Path): Snapshot JSON file.
+            key (Dict[str, Any]): Key the snapshot must have been saved with, see :py:func:`get_key`.
+        """
+        self._pth = Path(pth)
+        self._key = key
+
+    def load(self) -> Dict[str, Any] | None:
+        """
+        Gets the saved values.
+
+        Returns:
+            Dict[str, Any] | None: Values or ``None`` if there is no snapshot or it was saved with another key.
+        """
+        try:
+            with open(self._pth, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("key") != self._key:
+            return None
+        values = data.get("values")
+        return values if isinstance(values, dict) else None
+
+    def save(self, values: Dict[str, Any]) -> bool:
+        """
+        Saves values with the key of this instance.
+
+        Args:
+            values (Dict[str, Any]): JSON serializable values.
+
+        Returns:
+            bool: ``True`` if saved.
+        """
+        data = {"key": self._key, "values": values}
+        tmp = self._pth.with_name(f"{self._pth.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=4)
+            os.replace(tmp, self._pth)
+            return True
+        except OSError:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+        return False
+
+    def clear(self) -> None:
+        """Removes the snapshot so LibreOffice is queried on the next start."""
+        try:
+            self._pth.unlink()
+        except OSError:
+            pass
+
+    @property
+    def path(self) -> Path:
+        """Gets the snapshot file."""
+        return self._pth
@@ -8,6 +8,7 @@ from com.sun.star.awt import XContainerWindowEventHandler
 from com.sun.star.ui.dialogs.TemplateDescription import FILESAVE_AUTOEXTENSION, FILEOPEN_SIMPLE  # type: ignore
 
 from ...basic_config import BasicConfig
+from . import impl_names
 from ...lo_util.resource_resolver import ResourceResolver
 
 from ...lo_util.configuration import Configuration, SettingsT
@@ -22,7 +23,7 @@ if TYPE_CHECKING:
     from com.sun.star.awt import UnoControlButton  # service
 
 
-IMPLEMENTATION_NAME = f"{BasicConfig().lo_implementation_name}.Example"
+IMPLEMENTATION_NAME = impl_names.EXAMPLE_PAGE
 
 
 class ButtonListener(unohelper.Base, XActionListener):
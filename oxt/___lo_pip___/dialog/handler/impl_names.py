@@ -0,0 +1,22 @@
+"""
+Implementation names of the dialog handlers.
+
+``py_runner`` registers the handlers by these names without importing the handler modules,
+which import the names from here as their ``IMPLEMENTATION_NAME``.
+The names must match the values in ``config/options.xcu``.
+"""
+
+from __future__ import annotations
+
+from ...basic_config import BasicConfig
+
+_IMPL_NAME = BasicConfig().lo_implementation_name
+
+LOGGING_OPTIONS_PAGE = f"{_IMPL_NAME}.LoggingOptionsPage"
+"""Implementation name of ``logger_options.OptionsDialogHandler``."""
+OPTIONS_PAGE = f"{_IMPL_NAME}.OptPage"
+"""Implementation name of ``options.OptionsDialogHandler``."""
+UNINSTALL_PAGE = f"{_IMPL_NAME}.OptUninstallPage"
+"""Implementation name of ``uninstall.OptionsDialogUninstallHandler``."""
+EXAMPLE_PAGE = f"{_IMPL_NAME}.Example"
+"""Implementation name of ``example.OptionsDialogHandler``."""
@@ -8,7 +8,7 @@ from com.sun.star.awt import XContainerWindowEventHandler
 from com.sun.star.beans import XPropertyChangeListener
 from com.sun.star.beans import PropertyChangeEvent  # struct
 
-from ...basic_config import BasicConfig
+from . import impl_names
 from ...config import Config
 from ...lo_util.resource_resolver import ResourceResolver
 
@@ -28,7 +28,7 @@ if TYPE_CHECKING:
     from com.sun.star.awt import UnoControlFixedText
 
 
-IMPLEMENTATION_NAME = f"{BasicConfig().lo_implementation_name}.LoggingOptionsPage"
+IMPLEMENTATION_NAME = impl_names.LOGGING_OPTIONS_PAGE
 
 _LOG_OPTS = {
     "optLogNone": "NONE",
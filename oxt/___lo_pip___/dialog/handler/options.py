@@ -1,6 +1,5 @@
 from __future__ import annotations
 from typing import Any, TYPE_CHECKING, List, Tuple, cast
-import contextlib
 
 import uno
 import unohelper
@@ -10,6 +9,7 @@ from com.sun.star.beans import PropertyChangeEvent  # type: ignore # struct
 from com.sun.star.beans import XPropertyChangeListener  # type: ignore
 
 from ...basic_config import BasicConfig
+from . import impl_names
 from ...lo_util.resource_resolver import ResourceResolver
 
 from ...lo_util.configuration import Configuration, SettingsT
@@ -27,7 +27,7 @@ if TYPE_CHECKING:
     from com.sun.star.awt import UnoControlCheckBoxModel  # type: ignore
 
 
-IMPLEMENTATION_NAME = f"{BasicConfig().lo_implementation_name}.OptPage"
+IMPLEMENTATION_NAME = impl_names.OPTIONS_PAGE
 
 
 class CheckBoxListener(unohelper.Base, XPropertyChangeListener):
@@ -208,11 +208,9 @@ class OptionsDialogHandler(unohelper.Base, XContainerWindowEventHandler):
                 self._logger.error("_save_data() %s", err, exc_info=True)
 
     def get_package_version(self) -> str:
-        from importlib.metadata import PackageNotFoundError, version
+        from ...install.dist_index import DistIndex
 
-        with contextlib.suppress(PackageNotFoundError):
-            return version(self._config.package_name)
-        return ""
+        return DistIndex().get_version(self._config.package_name)
 
     def _load_data(self, window: UnoControlDialog, ev_name: str) -> None:
         # sourcery skip: extract-method
@@ -1,6 +1,5 @@
 from __future__ import annotations
 from typing import Any, TYPE_CHECKING, List, Tuple, cast
-import contextlib
 
 import uno
 import unohelper
@@ -12,6 +11,7 @@ from com.sun.star.beans import XPropertyChangeListener  # type: ignore
 from com.sun.star.awt.MessageBoxType import QUERYBOX, INFOBOX, ERRORBOX  # type: ignore
 
 from ...basic_config import BasicConfig
+from . import impl_names
 from ...lo_util.resource_resolver import ResourceResolver
 
 from ...settings.settings import Settings
@@ -28,7 +28,7 @@ if TYPE_CHECKING:
     from com.sun.star.awt import UnoControlButton  # type: ignore # service
 
 
-IMPLEMENTATION_NAME = f"{BasicConfig().lo_implementation_name}.OptUninstallPage"
+IMPLEMENTATION_NAME = impl_names.UNINSTALL_PAGE
 
 
 class ButtonUninstallListener(unohelper.Base, XActionListener):
@@ -39,6 +39,7 @@ class ButtonUninstallListener(unohelper.Base, XActionListener):
         self._logger.debug("ButtonListener.__init__ done")
         self._config = BasicConfig()
         self._uninstall_items: List[str] = []
+        self._skipped_shared: List[str] = []
 
     def disposing(self, Source: Any) -> None:  # noqa: ANN401, N803
         pass
@@ -81,7 +82,13 @@ class ButtonUninstallListener(unohelper.Base, XActionListener):
                     self._uninstall_items.append(self._config.package_name)
                     if self._uninstall_item_list():
                         title = self.dialog_handler._resource_resolver.resolve_string("msg12")
-                        msg = self.dialog_handler._resource_resolver.resolve_string("msg16")
+                        if self._skipped_shared:
+                            # kept because other extensions that share the site-packages need them.
+                            msg = self.dialog_handler._resource_resolver.resolve_string("msg18").format(
+                                ", ".join(self._skipped_shared)
+                            )
+                        else:
+                            msg = self.dialog_handler._resource_resolver.resolve_string("msg16")
                         _ = MessageDialog(
                             self.dialog_handler.ctx,
                             title=title,
@@ -109,8 +116,10 @@ class ButtonUninstallListener(unohelper.Base, XActionListener):
 
             installer = InstallPkg(self.dialog_handler.ctx, flag_upgrade=False)
             success = True
+            self._skipped_shared.clear()
             for item in self._uninstall_items:
                 success = success and installer.uninstall(item, remove_tracking_file=True)
+            self._skipped_shared.extend(installer.skipped_shared)
             return success
         except Exception as e:
             self._logger.error("_uninstall_item_list(): %s", e, exc_info=True)
@@ -185,11 +194,9 @@ class OptionsDialogUninstallHandler(unohelper.Base, XContainerWindowEventHandler
         pass
 
     def get_package_version(self) -> str:
-        from importlib.metadata import PackageNotFoundError, version
+        from ...install.dist_index import DistIndex
 
-        with contextlib.suppress(PackageNotFoundError):
-            return version(self._config.package_name)
-        return ""
+        return DistIndex().get_version(self._config.package_name)
 
     def _load_data(self, window: UnoControlDialog, ev_name: str) -> None:
         # sourcery skip: extract-method
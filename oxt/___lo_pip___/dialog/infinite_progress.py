@@ -1,11 +1,11 @@
 from __future__ import annotations
 from typing import Any
 import threading
-import time
 import uno
 
 from .run_time_dialog_base import RuntimeDialogBase
 from ..config import Config
+from ..thread.cancellation import CancellationToken
 
 
 class InfiniteProgressDialog(RuntimeDialogBase):
@@ -92,7 +92,7 @@ class InfiniteProgress(threading.Thread):
         self._title = title
         self._msg = msg
         self._ellipsis = 0
-        self._stop_event = threading.Event()
+        self._token = CancellationToken()
         self._lock = threading.Lock()
 
     def run(self):
@@ -101,16 +101,16 @@ class InfiniteProgress(threading.Thread):
         # in_progress.dialog.setVisible(True)
         # _ = in_progress.execute()
         in_progress = InfiniteProgressDialog(self._ctx, self._title)
-        while not self._stop_event.is_set():
+        while not self._token.is_cancelled:
             with self._lock:
-                # possibly sleep and update a label to show progress
                 self._ellipsis += 1
                 in_progress.dialog.setVisible(True)
                 in_progress.update(f"{self._msg} {'.' * self._ellipsis}")
                 if self._ellipsis > 300:
                     self._ellipsis = 0
-                time.sleep(1)
+            # wakes up as soon as stop() is called.
+            self._token.wait(1)
         in_progress.dialog.dispose()
 
     def stop(self):
-        self._stop_event.set()
+        self._token.cancel()
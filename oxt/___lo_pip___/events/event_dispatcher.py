@@ -0,0 +1,118 @@
+"""
+Runs event triggers on a thread pool.
+
+Triggers of the same event name run one at a time in the order they were submitted.
+Triggers of different event names run concurrently, so a slow handler of one event does not hold up the others,
+nor the thread that triggered the event.
+
+Callers of ``trigger_async`` rarely check the returned future, so :py:func:`log_exception` is added to it
+as a done callback to log handlers that fail.
+"""
+
+from __future__ import annotations
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from logging import Logger
+from typing import Any, Callable, Deque, Dict, Tuple
+import threading
+
+from ..meta.singleton import Singleton
+
+_Job = Tuple[Future, Callable[..., Any], Tuple[Any, ...]]
+
+
+def _get_logger() -> Logger:
+    # imported on the first error so this module does not need LibreOffice.
+    from ..oxt_logger import OxtLogger
+
+    return OxtLogger(log_name=__name__)
+
+
+def log_exception(future: Future) -> None:
+    """
+    Done callback that logs the error of a job that failed.
+
+    Args:
+        future (Future): Future returned by :py:meth:`EventDispatcher.submit`.
+    """
+    if future.cancelled():
+        return
+    err = future.exception()
+    if err is None:
+        return
+    _get_logger().error("Event handler failed: %s", err, exc_info=err)
+
+
+class EventDispatcher(metaclass=Singleton):
+    """Singleton class. Thread pool shared by all event buses."""
+
+    def __init__(self, max_workers: int = 4) -> None:
+        """
+        Initialize EventDispatcher
+
+        Args:
+            max_workers (int, optional): Maximum number of event names dispatched at the same time.
+        """
+        self._max_workers = max(1, max_workers)
+        self._lock = threading.Lock()
+        self._queues: Dict[str, Deque[_Job]] = {}
+        self._executor: ThreadPoolExecutor | None = None
+        self._idle = threading.Condition(self._lock)
+
+    def submit(self, key: str, fn: Callable[..., Any], *args: object) -> Future:
+        """
+        Runs ``fn(*args)`` on the thread pool after the earlier jobs of ``key``.
+
+        Args:
+            key (str): Ordering key, usually the event name.
+            fn (Callable[..., Any]): Function such as the ``trigger`` method of an event bus.
+
+        Returns:
+            Future: Future of the result. Errors raised by ``fn`` are set on the future.
+        """
+        future: Future = Future()
+        with self._lock:
+            queue = self._queues.get(key)
+            if queue is not None:
+                # a drain for this key is running, it picks the job up.
+                queue.append((future, fn, args))
+                return future
+            self._queues[key] = deque([(future, fn, args)])
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="OxtEvents")
+            executor = self._executor
+        executor.submit(self._drain, key)
+        return future
+
+    def _drain(self, key: str) -> None:
+        while True:
+            with self._lock:
+                queue = self._queues[key]
+                if not queue:
+                    del self._queues[key]
+                    if not self._queues:
+                        self._idle.notify_all()
+                    return
+                future, fn, args = queue.popleft()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except BaseException as err:
+                future.set_exception(err)
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        Waits until all submitted jobs are done.
+
+        Returns:
+            bool: ``False`` if ``timeout`` expired first.
+        """
+        with self._lock:
+            return self._idle.wait_for(lambda: not self._queues, timeout=timeout)
+
+    @property
+    def pending(self) -> int:
+        """Gets the number of jobs that have not started."""
+        with self._lock:
+            return sum(len(queue) for queue in self._queues.values())
@@ -6,12 +6,12 @@ This module is for the purpose of sharing events between classes internally
 """
 
 from __future__ import annotations
-import contextlib
-from weakref import ref, ReferenceType
+from concurrent.futures import Future
 from .args.event_args import EventArgs, AbstractEvent
-from typing import List, Dict, Union, cast
 from ..lo_util import type_var
 from ..proto import event_observer
+from .event_dispatcher import EventDispatcher, log_exception
+from .subscribers import Subscribers, WeakRefs
 
 
 class _Events(object):
@@ -26,13 +26,13 @@ class _Events(object):
     def __new__(cls, *args, **kwargs):
         if not cls._instance:
             cls._instance = super(_Events, cls).__new__(cls, *args, **kwargs)
-            cls._instance._callbacks = None
-            cls._instance._observers = None
+            cls._instance._callbacks = Subscribers()
+            cls._instance._observers = WeakRefs()
         return cls._instance
 
     def __init__(self, *args, **kwargs):
-        self._callbacks: Union[Dict[str, List[ReferenceType[type_var.EventCallback]]], None]
-        self._observers: Union[List[ReferenceType[event_observer.EventObserver]], None]
+        self._callbacks: Subscribers
+        self._observers: WeakRefs
 
     def on(self, event_name: str, callback: type_var.EventCallback):
         """
@@ -42,13 +42,7 @@ class _Events(object):
             event_name (str): Unique event name
             callback (Callable[[object, EventArgs], None]): Callback function
         """
-        if self._callbacks is None:
-            self._callbacks = {}
-
-        if event_name not in self._callbacks:
-            self._callbacks[event_name] = [ref(callback)]
-        else:
-            self._callbacks[event_name].append(ref(callback))
+        self._callbacks.add(event_name, callback)
 
     def trigger(self, event_name: str, event_args: AbstractEvent, *args, **kwargs) -> None:
         """
@@ -60,58 +54,61 @@ class _Events(object):
             args (Any, optional): Optional positional args to pass to callback
             kwargs (Any, optional): Optional keyword args to pass to callback
         """
-        if self._callbacks is not None and event_name in self._callbacks:
-            cleanup = None
-            for i, callback in enumerate(self._callbacks[event_name]):
-                if callback() is None:
-                    if cleanup is None:
-                        cleanup = []
-                    cleanup.append(i)
+        refs = self._callbacks.get(event_name)
+        if refs:
+            if event_args is not None:
+                event_args._event_name = event_name
+                if event_args.event_source is None:
+                    event_args._event_source = self  # type: ignore
+            dead = False
+            for r in refs:
+                callback = r()
+                if callback is None:
+                    dead = True
                     continue
-                if event_args is not None:
-                    event_args._event_name = event_name
-                    if event_args.event_source is None:
-                        event_args._event_source = self  # type: ignore
-                if callable(callback()):
-                    try:
-                        callback()(event_args.source, event_args, *args, **kwargs)  # type: ignore
-                    except AttributeError:
-                        # event_arg is None
-                        callback()(self, None)  # type: ignore
-            if cleanup:
-                # reverse list to allow removing form highest to lowest to avoid errors
-                cleanup.reverse()
-                for i in cleanup:
-                    self._callbacks[event_name].pop(i)
-                if len(self._callbacks[event_name]) == 0:
-                    del self._callbacks[event_name]
+                if event_args is None:
+                    callback(self, None)  # type: ignore
+                else:
+                    callback(event_args.source, event_args, *args, **kwargs)
+            if dead:
+                self._callbacks.prune(event_name)
         self._update_observers(event_name, event_args)  # type: ignore
 
+    def trigger_async(self, event_name: str, event_args: AbstractEvent) -> Future:
+        """
+        Trigger event(s) for a given name on the event thread pool.
+
+        Triggers of the same event name run in the order they were made, one at a time.
+
+        Args:
+            event_name (str): Name of event to trigger
+            event_args (AbstractEvent): Event args passed to the callback for trigger.
+
+        Returns:
+            Future: Done when all callbacks and observers have been called. The error of a callback that failed
+                is logged.
+        """
+        future = EventDispatcher().submit(event_name, self.trigger, event_name, event_args)
+        future.add_done_callback(log_exception)
+        return future
+
     def _update_observers(self, event_name: str, event_args: EventArgs) -> None:
-        # sourcery skip: last-if-guard
-        if self._observers is not None:
-            cleanup = None
-            for i, observer in enumerate(self._observers):
-                if observer() is None:
-                    if cleanup is None:
-                        cleanup = []
-                    cleanup.append(i)
-                    continue
-                observer().trigger(event_name=event_name, event_args=event_args)  # type: ignore
-            if cleanup:
-                # reverse list to allow removing form highest to lowest to avoid errors
-                cleanup.reverse()
-                for i in cleanup:
-                    self._observers.pop(i)
+        dead = False
+        for r in self._observers.refs:
+            observer = r()
+            if observer is None:
+                dead = True
+                continue
+            observer.trigger(event_name=event_name, event_args=event_args)
+        if dead:
+            self._observers.prune()
 
     def add_observer(self, *args: event_observer.EventObserver) -> None:
         """
         Adds observers that gets their ``trigger`` method called when this class ``trigger`` method is called.
         """
-        if self._observers is None:
-            self._observers = []
         for observer in args:
-            self._observers.append(ref(observer))
+            self._observers.add(observer)
 
     def remove(self, event_name: str, callback: type_var.EventCallback) -> bool:
         """
@@ -125,12 +122,4 @@ class _Events(object):
             bool: True if callback has been removed; Otherwise, False.
             False means the callback was not found.
         """
-        if self._callbacks is None:
-            return False
-        result = False
-        if event_name in self._callbacks:
-            # cb = cast(Dict[str, List[EventCallback]], self._callbacks)
-            with contextlib.suppress(ValueError):
-                self._callbacks[event_name].remove(ref(callback))
-                result = True
-        return result
+        return self._callbacks.remove(event_name, callback)
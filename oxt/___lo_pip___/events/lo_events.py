@@ -4,9 +4,12 @@ This module is for the purpose of sharing events between classes.
 """
 from __future__ import annotations
 import contextlib
-from weakref import ref, ReferenceType, proxy
-from typing import Any, Dict, List, NamedTuple, Generator, Callable, Union
+from concurrent.futures import Future
+from weakref import proxy
+from typing import Any, NamedTuple, Generator, Callable
 from . import event_singleton
+from .event_dispatcher import EventDispatcher, log_exception
+from .subscribers import Subscribers, WeakRefs
 from ..proto import event_observer
 from ..lo_util.type_var import EventCallback as EventCallback
 from .args.event_args import AbstractEvent
@@ -30,7 +33,7 @@ class _event_base(object):
     """Base events class"""
 
     def __init__(self) -> None:
-        self._callbacks: Dict[str, List[ReferenceType[EventCallback]]] | None = None
+        self._callbacks: Subscribers | None = None
 
     def on(self, event_name: str, callback: EventCallback):
         """
@@ -41,12 +44,8 @@ class _event_base(object):
             callback (Callable[[object, EventArgs], None]): Callback function
         """
         if self._callbacks is None:
-            self._callbacks = {}
-
-        if event_name not in self._callbacks:
-            self._callbacks[event_name] = [ref(callback)]
-        else:
-            self._callbacks[event_name].append(ref(callback))
+            self._callbacks = Subscribers()
+        self._callbacks.add(event_name, callback)
 
     def remove(self, event_name: str, callback: EventCallback) -> bool:
         """
@@ -62,13 +61,7 @@ class _event_base(object):
         """
         if self._callbacks is None:
             return False
-        result = False
-        if event_name in self._callbacks:
-            # cb = cast(Dict[str, List[EventCallback]], self._callbacks)
-            with contextlib.suppress(ValueError):
-                self._callbacks[event_name].remove(ref(callback))
-                result = True
-        return result
+        return self._callbacks.remove(event_name, callback)
 
     def _set_event_args(self, event_name: str, event_args: AbstractEvent) -> None:
         if event_args is None:
@@ -89,29 +82,45 @@ class _event_base(object):
         Note:
             Events are removed automatically when they are out of scope.
         """
-        # sourcery skip: last-if-guard
-
-        if self._callbacks is not None and event_name in self._callbacks:
-            cleanup = None
-            for i, callback in enumerate(self._callbacks[event_name]):
-                if callback() is None:
-                    if cleanup is None:
-                        cleanup = []
-                    cleanup.append(i)
-                    continue
-                self._set_event_args(event_name=event_name, event_args=event_args)
-                if callable(callback()):
-                    try:
-                        callback()(event_args.source, event_args, *args, **kwargs)  # type: ignore
-                    except AttributeError:
-                        # event_arg is None
-                        callback()(self, None)  # type: ignore
-            if cleanup:
-                cleanup.reverse()
-                for i in cleanup:
-                    self._callbacks[event_name].pop(i)
-                if len(self._callbacks[event_name]) == 0:
-                    del self._callbacks[event_name]
+        if self._callbacks is None:
+            return
+        # the tuple does not change if a callback adds or removes callbacks while it runs.
+        refs = self._callbacks.get(event_name)
+        if not refs:
+            return
+        self._set_event_args(event_name=event_name, event_args=event_args)
+        dead = False
+        for r in refs:
+            callback = r()
+            if callback is None:
+                dead = True
+                continue
+            if event_args is None:
+                callback(self, None)  # type: ignore
+            else:
+                callback(event_args.source, event_args, *args, **kwargs)
+        if dead:
+            self._callbacks.prune(event_name)
+
+    def trigger_async(self, event_name: str, event_args: AbstractEvent) -> Future:
+        """
+        Trigger event(s) for a given name on the event thread pool.
+
+        Triggers of the same event name run in the order they were made, one at a time.
+        Use it for events that are only reported, such as progress. Use :py:meth:`trigger` when the result
+        is needed right away such as when ``event_args`` is a ``CancelEventArgs``.
+
+        Args:
+            event_name (str): Name of event to trigger
+            event_args (AbstractEvent): Event args passed to the callback for trigger.
+
+        Returns:
+            Future: Done when all callbacks have been called. Holds the error of a callback that failed,
+                the error is also logged.
+        """
+        future = EventDispatcher().submit(event_name, self.trigger, event_name, event_args)
+        future.add_done_callback(log_exception)
+        return future
 
 
 class Events(_event_base):
@@ -124,15 +133,14 @@ class Events(_event_base):
 
     # Dev Notes:
     # Event callbacks are assigned to this class as a weak ref.
-    # This is necessary; However, a side effect is class method cannot be assigned
-    # as an event from class __init__. It is possible to assign a class static method from
-    # __init__ but not a class method. Attempting to assign class method result with method
-    # being out of scope before trigger is called on it.
-    # Making an Events class with strong ref ( no weak ref ) and then assigning a class method
+    # This is necessary; Making an Events class with strong ref ( no weak ref ) and then assigning a class method
     # as a callback result in the class method being triggered even after the class instance is set
     # to none. In other words python does not release the object or callback because the strong ref Events class
     # is still holding on to it.
-    # In short, do not change this class!
+    # Class methods are assigned as a WeakMethod, see subscribers.make_ref(), so a class method can be assigned
+    # from class __init__ and lives as long as its instance. Keeping the method in a class attribute such as
+    # self._fn_on_x is no longer required but does no harm.
+    # In short, do not change this class to strong refs!
 
     def __init__(self, source: Any | None = None, trigger_args: GenericArgs | None = None) -> None:
         """
@@ -174,14 +182,13 @@ class LoEvents(_event_base):
         if not cls._instance:
             cls._instance = super(LoEvents, cls).__new__(cls, *args, **kwargs)
             cls._instance._callbacks = None
-            # cls._instance._observers: List[ReferenceType[event_observer.EventObserver]] | None = None
-            cls._instance._observers = None
+            cls._instance._observers = WeakRefs()
             # register wih _Events so this instance get triggered when _Events() are triggered.
             event_singleton._Events().add_observer(cls._instance)
         return cls._instance
 
     def __init__(self) -> None:
-        self._observers: Union[List[ReferenceType[event_observer.EventObserver]], None]
+        self._observers: WeakRefs
 
     def add_observer(self, *args: event_observer.EventObserver) -> None:
         """
@@ -196,31 +203,23 @@ class LoEvents(_event_base):
         Note:
             Observers are removed automatically when they are out of scope.
         """
-        if self._observers is None:
-            self._observers = []
         for observer in args:
-            self._observers.append(ref(observer))
+            self._observers.add(observer)
 
     def trigger(self, event_name: str, event_args: AbstractEvent):
         super().trigger(event_name, event_args)
         self._update_observers(event_name, event_args)
 
     def _update_observers(self, event_name: str, event_args: AbstractEvent) -> None:
-        # sourcery skip: last-if-guard
-        if self._observers is not None:
-            cleanup = None
-            for i, observer in enumerate(self._observers):
-                if observer() is None:
-                    if cleanup is None:
-                        cleanup = []
-                    cleanup.append(i)
-                    continue
-                observer().trigger(event_name=event_name, event_args=event_args)  # type: ignore
-            if cleanup:
-                # reverse list to allow removing form highest to lowest to avoid errors
-                cleanup.reverse()
-                for i in cleanup:
-                    _ = self._observers.pop(i)
+        dead = False
+        for r in self._observers.refs:
+            observer = r()
+            if observer is None:
+                dead = True
+                continue
+            observer.trigger(event_name=event_name, event_args=event_args)
+        if dead:
+            self._observers.prune()
 
 
 class DummyEvents:
@@ -238,6 +237,11 @@ class DummyEvents:
     def trigger(self, event_name: str, event_args: AbstractEvent, *args, **kwargs) -> None:
         pass
 
+    def trigger_async(self, event_name: str, event_args: AbstractEvent) -> Future:
+        future: Future = Future()
+        future.set_result(None)
+        return future
+
 
 @contextlib.contextmanager
 def event_ctx(*args: EventArg) -> Generator[event_observer.EventObserver, None, None]:
@@ -0,0 +1,14 @@
+"""
+Install Named Events.
+"""
+from __future__ import annotations
+from typing import NamedTuple
+
+
+class InstallNamedEvent(NamedTuple):
+    """
+    Named events for the package installers
+    """
+
+    PIP_PROGRESS = "install_pip_progress"
+    """Event triggered when a pip install starts a new phase. ``EventArgs.event_data`` is a ``PipProgressEvent``."""
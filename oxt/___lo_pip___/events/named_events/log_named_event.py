@@ -12,3 +12,6 @@ class LogNamedEvent(NamedTuple):
 
     LOGGING_READY = "log_logging_ready"
     """Event triggered when logging is ready."""
+
+    LOGGING_FLUSH = "log_logging_flush"
+    """Event triggered when the extension is done, such as when its startup job finishes. Records are written."""
@@ -12,3 +12,6 @@ class StartupNamedEvent(NamedTuple):
 
     WINDOW_STARTED = "startup_window_started"
     """Event triggered when LibreOffice window first starts."""
+
+    STARTUP_READY = "startup_ready"
+    """Event triggered when the startup job has finished checking requirements and importing packages."""
@@ -1,5 +1,6 @@
 from __future__ import annotations
 from typing import Any
+import threading
 from ...meta.singleton import Singleton
 from ...oxt_logger import OxtLogger
 from ...events.lo_events import LoEvents
@@ -13,14 +14,36 @@ class StartupMonitor(metaclass=Singleton):
     def __init__(self) -> None:
         self._logger = OxtLogger(log_name=__name__)
         self._window_started = False
+        self._ready = threading.Event()
 
         def on_window_started(source: Any, event: EventArgs) -> None:
             self._logger.debug("Window started.")
             self._window_started = True
 
+        def on_startup_ready(source: object, event: EventArgs) -> None:
+            self._logger.debug("Startup ready.")
+            self._ready.set()
+
         self._fn_on_window_started = on_window_started
+        self._fn_on_startup_ready = on_startup_ready
         events = LoEvents()
         events.on(StartupNamedEvent.WINDOW_STARTED, self._fn_on_window_started)
+        events.on(StartupNamedEvent.STARTUP_READY, self._fn_on_startup_ready)
+
+    def wait_ready(self, timeout: float | None = None) -> bool:
+        """
+        Blocks until the startup job has finished.
+
+        When ``async_startup`` is set in the config the startup job runs on a background thread.
+        Macros should call this method before importing packages installed by this extension.
+
+        Args:
+            timeout (float | None, optional): Maximum number of seconds to wait. Waits forever if omitted.
+
+        Returns:
+            bool: ``True`` if startup finished; Otherwise, ``False`` if the timeout expired.
+        """
+        return self._ready.wait(timeout)
 
     # region Properties
     @property
@@ -28,4 +51,14 @@ class StartupMonitor(metaclass=Singleton):
         """Gets if window started event has taken place."""
         return self._window_started
 
+    @property
+    def is_ready(self) -> bool:
+        """Gets if the startup job has finished checking requirements and importing packages."""
+        return self._ready.is_set()
+
+    @property
+    def ready_event(self) -> threading.Event:
+        """Gets the event that is set when the startup job has finished."""
+        return self._ready
+
     # endregion Properties
@@ -0,0 +1,117 @@
+"""
+Weak references to event callbacks and observers.
+
+References are kept in tuples that are replaced, never changed, when a callback is added or removed.
+A trigger iterates over the tuple it read without taking a lock, and callbacks added or removed while
+it runs take effect from the next trigger.
+
+Bound methods are referenced with :py:class:`weakref.WeakMethod` so they live as long as their instance
+instead of as long as the bound method object.
+"""
+
+from __future__ import annotations
+from typing import Any, Callable, Dict, Tuple
+from types import MethodType
+from weakref import ReferenceType, WeakMethod, ref
+import threading
+
+
+def make_ref(obj: object) -> ReferenceType:
+    """Gets a weak reference to ``obj``, a :py:class:`weakref.WeakMethod` if it is a bound method."""
+    if isinstance(obj, MethodType):
+        return WeakMethod(obj)
+    return ref(obj)
+
+
+class WeakRefs:
+    """Copy on write tuple of weak references."""
+
+    __slots__ = ("_lock", "_refs")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._refs: Tuple[ReferenceType, ...] = ()
+
+    def add(self, obj: object) -> None:
+        """Adds a weak reference to ``obj``."""
+        r = make_ref(obj)
+        with self._lock:
+            self._refs = (*self._refs, r)
+
+    def remove(self, obj: object) -> bool:
+        """
+        Removes the first reference to ``obj``.
+
+        Returns:
+            bool: ``True`` if a reference was removed.
+        """
+        with self._lock:
+            refs = self._refs
+            for i, r in enumerate(refs):
+                if r() == obj:
+                    self._refs = refs[:i] + refs[i + 1 :]
+                    return True
+        return False
+
+    def prune(self) -> int:
+        """
+        Removes references to objects that no longer exist.
+
+        Returns:
+            int: Number of references left.
+        """
+        with self._lock:
+            self._refs = tuple(r for r in self._refs if r() is not None)
+            return len(self._refs)
+
+    @property
+    def refs(self) -> Tuple[ReferenceType, ...]:
+        """Gets the references. The tuple does not change when references are added or removed."""
+        return self._refs
+
+    def __len__(self) -> int:
+        return len(self._refs)
+
+
+class Subscribers:
+    """Callbacks by event name."""
+
+    __slots__ = ("_lock", "_events")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._events: Dict[str, WeakRefs] = {}
+
+    def add(self, event_name: str, callback: Callable[..., Any]) -> None:
+        """Adds a callback for an event."""
+        with self._lock:
+            refs = self._events.get(event_name)
+            if refs is None:
+                refs = WeakRefs()
+                self._events[event_name] = refs
+            refs.add(callback)
+
+    def remove(self, event_name: str, callback: Callable[..., Any]) -> bool:
+        """
+        Removes a callback of an event.
+
+        Returns:
+            bool: ``True`` if the callback was removed.
+        """
+        refs = self._events.get(event_name)
+        return False if refs is None else refs.remove(callback)
+
+    def get(self, event_name: str) -> Tuple[ReferenceType, ...]:
+        """Gets the references to the callbacks of an event. Empty tuple if there are none."""
+        refs = self._events.get(event_name)
+        return () if refs is None else refs.refs
+
+    def prune(self, event_name: str) -> None:
+        """Removes references to callbacks that no longer exist, and the event when none are left."""
+        with self._lock:
+            refs = self._events.get(event_name)
+            if refs is not None and refs.prune() == 0:
+                del self._events[event_name]
+
+    def __contains__(self, event_name: str) -> bool:
+        return event_name in self._events
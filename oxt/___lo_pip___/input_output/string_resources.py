@@ -0,0 +1,189 @@
+"""
+Reads the localized strings of the extension from its ``.properties`` files without LibreOffice.
+
+Files are named ``<prefix>_<language>[_<country>[_<variant>]].properties`` such as ``pipstrings_en_US.properties``.
+A locale is matched the way ``com.sun.star.resource.StringResourceWithLocation`` matches it: the exact locale,
+then the language and country, then the language, then any file of the same language.
+"""
+
+from __future__ import annotations
+from pathlib import Path
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+_ESCAPES = {"t": "\t", "n": "\n", "r": "\r", "f": "\f"}
+
+
+def _unescape(text: str) -> str:
+    if "\\" not in text:
+        return text
+    result: List[str] = []
+    i = 0
+    size = len(text)
+    while i < size:
+        ch = text[i]
+        if ch != "\\" or i + 1 >= size:
+            result.append(ch)
+            i += 1
+            continue
+        nxt = text[i + 1]
+        if nxt == "u" and i + 6 <= size:
+            try:
+                result.append(chr(int(text[i + 2 : i + 6], 16)))
+                i += 6
+                continue
+            except ValueError:
+                pass
+        result.append(_ESCAPES.get(nxt, nxt))
+        i += 2
+    return "".join(result)
+
+
+def _split_entry(line: str) -> Tuple[str, str]:
+    # the key ends at the first unescaped "=", ":" or white space.
+    i = 0
+    size = len(line)
+    while i < size:
+        ch = line[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if ch in "=: \t\f":
+            break
+        i += 1
+    key = line[:i]
+    rest = line[i:].lstrip(" \t\f")
+    if rest[:1] in ("=", ":"):
+        rest = rest[1:].lstrip(" \t\f")
+    return _unescape(key), _unescape(rest)
+
+
+def parse_properties(text: str) -> Dict[str, str]:
+    """
+    Parses the content of a ``.properties`` file.
+
+    Supports comments, ``=``, ``:`` and white space separators, line continuations and ``\\uXXXX`` escapes.
+
+    Args:
+        text (str): File content.
+
+    Returns:
+        Dict[str, str]: Strings by key.
+    """
+    result: Dict[str, str] = {}
+    logical = ""
+    for raw in text.splitlines():
+        line = raw.lstrip(" \t\f") if not logical else raw.lstrip()
+        if not logical and (not line or line[0] in "#!"):
+            continue
+        # an odd number of trailing backslashes continues the line.
+        trailing = len(line) - len(line.rstrip("\\"))
+        if trailing % 2 == 1:
+            logical += line[:-1]
+            continue
+        logical += line
+        key, value = _split_entry(logical)
+        logical = ""
+        if key:
+            result[key] = value
+    if logical:
+        key, value = _split_entry(logical)
+        if key:
+            result[key] = value
+    return result
+
+
+def read_properties(pth: str | Path) -> Dict[str, str]:
+    """
+    Reads a ``.properties`` file.
+
+    Files are read as UTF-8. Files that are not valid UTF-8 are read as ISO 8859-1.
+
+    Args:
+        pth (str | Path): File path.
+
+    Returns:
+        Dict[str, str]: Strings by key.
+    """
+    data = Path(pth).read_bytes()
+    try:
+        text = data.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        text = data.decode("latin-1")
+    return parse_properties(text)
+
+
+def get_locale_files(pth: str | Path, prefix: str) -> Dict[str, Path]:
+    """
+    Gets the ``.properties`` files of a directory by locale.
+
+    Args:
+        pth (str | Path): Resource directory.
+        prefix (str): File name prefix such as ``pipstrings``.
+
+    Returns:
+        Dict[str, Path]: Files by locale tag such as ``en_US``. A file without a locale has the tag ``""``.
+    """
+    result: Dict[str, Path] = {}
+    try:
+        files = sorted(Path(pth).glob(f"{prefix}*.properties"))
+    except OSError:
+        return result
+    for file in files:
+        stem = file.stem
+        if stem == prefix:
+            result[""] = file
+        elif stem.startswith(f"{prefix}_"):
+            result[stem[len(prefix) + 1 :]] = file
+    return result
+
+
+def get_locale_chain(locale: Sequence[str], available: Iterable[str]) -> List[str]:
+    """
+    Gets the locale tags to look up strings in, best match first.
+
+    Args:
+        locale (Sequence[str]): Language, country and variant such as ``["en", "US", ""]``. Missing parts are empty.
+        available (Iterable[str]): Available tags such as the keys of :py:func:`get_locale_files`.
+
+    Returns:
+        List[str]: Tags that are available.
+    """
+    tags = list(available)
+    parts = [p for p in list(locale)[:3] if p]
+    chain: List[str] = []
+    for i in range(len(parts), 0, -1):
+        tag = "_".join(parts[:i])
+        if tag in tags and tag not in chain:
+            chain.append(tag)
+    if parts and not chain:
+        for tag in tags:
+            if tag.split("_")[0] == parts[0]:
+                chain.append(tag)
+                break
+    return chain
+
+
+def load_strings(pth: str | Path, prefix: str, locale: Sequence[str], default_locale: Sequence[str]) -> Dict[str, str]:
+    """
+    Loads the strings for a locale.
+
+    Strings missing for ``locale`` are taken from ``default_locale`` and then from the file without a locale.
+
+    Args:
+        pth (str | Path): Resource directory.
+        prefix (str): File name prefix such as ``pipstrings``.
+        locale (Sequence[str]): Language, country and variant of the user interface.
+        default_locale (Sequence[str]): Language, country and variant used for missing strings.
+
+    Returns:
+        Dict[str, str]: Strings by key. Empty if there are no files.
+    """
+    files = get_locale_files(pth, prefix)
+    chain = get_locale_chain(locale, files)
+    for tag in [*get_locale_chain(default_locale, files), ""]:
+        if tag in files and tag not in chain:
+            chain.append(tag)
+    result: Dict[str, str] = {}
+    for tag in reversed(chain):
+        result.update(read_properties(files[tag]))
+    return result
@@ -0,0 +1,218 @@
+"""
+Index of installed distributions.
+
+``importlib.metadata.version()`` scans every ``sys.path`` entry on each call.
+The index lists the ``*.dist-info`` and ``*.egg-info`` directories of each ``sys.path`` entry once, keyed on the
+normalized name in the directory name. The metadata of a distribution is only read when it is looked up.
+The index is reused until ``sys.path`` changes or it is invalidated after packages are installed or removed.
+
+No Internet needed.
+"""
+
+from __future__ import annotations
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Set, Tuple
+import importlib.metadata
+import os
+import re
+import sys
+import threading
+import zipfile
+
+from ..meta.singleton import Singleton
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a package name as described by PEP 503, such as ``Ooo_Dev.Tools`` to ``ooo-dev-tools``."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+DIST_SUFFIXES = (".dist-info", ".egg-info")
+"""Suffixes of the metadata directories of installed distributions."""
+
+
+def get_dist_name(entry: str) -> str:
+    """
+    Gets the normalized distribution name of a metadata directory name without reading it.
+
+    Args:
+        entry (str): Directory name such as ``Spam_Eggs-1.2.3.dist-info``.
+
+    Returns:
+        str: Normalized name such as ``spam-eggs`` or an empty string if ``entry`` is not a metadata directory.
+    """
+    for suffix in DIST_SUFFIXES:
+        if entry.endswith(suffix):
+            # names are escaped in directory names, ``-`` only separates the name from the version.
+            return normalize_name(entry[: -len(suffix)].split("-", 1)[0])
+    return ""
+
+
+def list_dists(pth: str) -> List[str]:
+    """
+    Gets the metadata directory names in a directory with a single ``os.listdir()``.
+
+    Zip files on ``sys.path`` are listed from their central directory.
+
+    Args:
+        pth (str): Directory or zip file such as a ``sys.path`` entry.
+
+    Returns:
+        List[str]: Sorted names such as ``["verr-1.1.2.dist-info"]``. Empty if ``pth`` can not be listed.
+    """
+    try:
+        if os.path.isfile(pth):
+            with zipfile.ZipFile(pth) as zf:
+                entries = {name.split("/", 1)[0] for name in zf.namelist() if "/" in name}
+        else:
+            entries = set(os.listdir(pth or "."))
+    except (OSError, zipfile.BadZipFile):
+        return []
+    return sorted(entry for entry in entries if entry.endswith(DIST_SUFFIXES))
+
+
+def get_dependencies(names: Iterable[str], pth: str) -> Set[str]:
+    """
+    Gets packages and everything they depend on from the metadata installed in a directory.
+
+    Environment markers are not evaluated, so a dependency that may be needed, such as one of an extra, is included.
+    Packages that are not installed in ``pth`` are included but their dependencies are not.
+
+    Args:
+        names (Iterable[str]): Package names such as ``ooo-dev-tools``.
+        pth (str): Install directory such as site-packages.
+
+    Returns:
+        Set[str]: Normalized names.
+    """
+    entries: Dict[str, str] = {}
+    for entry in list_dists(pth):
+        entries.setdefault(get_dist_name(entry), entry)
+    result: Set[str] = set()
+    pending = [normalize_name(name) for name in names if name]
+    while pending:
+        name = pending.pop()
+        if name in result:
+            continue
+        result.add(name)
+        entry = entries.get(name)
+        if entry is None:
+            continue
+        try:
+            requires = importlib.metadata.PathDistribution(Path(pth, entry)).requires or []
+        except Exception:
+            requires = []
+        for req in requires:
+            if m := re.match(r"[A-Za-z0-9][A-Za-z0-9._-]*", req.strip()):
+                pending.append(normalize_name(m.group(0)))
+    return result
+
+
+class DistInfo(NamedTuple):
+    name: str
+    """Distribution name as found in its metadata."""
+    version: str
+    """Installed version such as ``1.2.3``."""
+    location: str
+    """Directory, or zip file entry, the distribution is installed into."""
+
+
+class DistIndex(metaclass=Singleton):
+    """Singleton class. Maps normalized distribution names to their version and location."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._index: Dict[str, List[Tuple[str, str]]] | None = None
+        self._infos: Dict[str, DistInfo | None] = {}
+        self._paths: Tuple[str, ...] = ()
+
+    def _build(self) -> Dict[str, List[Tuple[str, str]]]:
+        """Maps normalized names to the ``(sys.path entry, metadata directory)`` of each install, in ``sys.path`` order."""
+        index: Dict[str, List[Tuple[str, str]]] = {}
+        for pth in sys.path:
+            for entry in list_dists(pth):
+                key = get_dist_name(entry)
+                if key:
+                    index.setdefault(key, []).append((pth, entry))
+        return index
+
+    def _read(self, pth: str, entry: str) -> DistInfo | None:
+        """Reads the metadata of a single distribution. ``None`` if it is broken."""
+        try:
+            dist_path = zipfile.Path(pth, f"{entry}/") if os.path.isfile(pth) else Path(pth or ".", entry)
+            dist = importlib.metadata.PathDistribution(dist_path)  # type: ignore[arg-type]
+            metadata = dist.metadata
+            name = metadata["Name"] if metadata else ""
+            if not name:
+                return None
+            return DistInfo(name=name, version=metadata["Version"], location=str(dist.locate_file("")))
+        except Exception:
+            # broken metadata is treated the same as not installed.
+            return None
+
+    def _get_index(self) -> Dict[str, List[Tuple[str, str]]]:
+        # call with the lock held.
+        paths = tuple(sys.path)
+        if self._index is None or paths != self._paths:
+            self._index = self._build()
+            self._infos = {}
+            self._paths = paths
+        return self._index
+
+    def invalidate(self) -> None:
+        """Invalidates the index. Call after packages are installed into or removed from a directory."""
+        with self._lock:
+            self._index = None
+            self._infos = {}
+
+    def get(self, package_name: str) -> DistInfo | None:
+        """
+        Gets the distribution info for a package.
+
+        Only the metadata of this package is read, on the first call after the index is built.
+
+        Args:
+            package_name (str): The name of the package such as ``verr``
+
+        Returns:
+            DistInfo | None: Distribution info or ``None`` if the package is not installed.
+        """
+        key = normalize_name(package_name)
+        with self._lock:
+            index = self._get_index()
+            if key in self._infos:
+                return self._infos[key]
+            info = None
+            # first entry on sys.path wins, the same as importlib.metadata.version()
+            for pth, entry in index.get(key, []):
+                info = self._read(pth, entry)
+                if info is not None:
+                    break
+            self._infos[key] = info
+            return info
+
+    def get_version(self, package_name: str) -> str:
+        """
+        Get the version of an installed package.
+
+        Args:
+            package_name (str): The name of the package such as ``verr``
+
+        Returns:
+            str: The version of the package or an empty string if the package is not installed.
+        """
+        info = self.get(package_name)
+        return info.version if info else ""
+
+    def get_location(self, package_name: str) -> str:
+        """
+        Get the directory an installed package is found in.
+
+        Args:
+            package_name (str): The name of the package such as ``verr``
+
+        Returns:
+            str: The location of the package or an empty string if the package is not installed.
+        """
+        info = self.get(package_name)
+        return info.location if info else ""
@@ -2,6 +2,7 @@ from __future__ import annotations
 from typing import Any, Dict, Tuple
 import ssl
 import json
+import threading
 from pathlib import Path
 from urllib.request import Request, urlopen
 from urllib.error import URLError, HTTPError
@@ -10,6 +11,7 @@ from urllib.error import URLError, HTTPError
 from ..meta.singleton import Singleton
 from ..oxt_logger import OxtLogger
 from ..config import Config
+from .net_probe import NetProbe
 
 
 class Download(metaclass=Singleton):
@@ -17,6 +19,33 @@ class Download(metaclass=Singleton):
 
     def __init__(self) -> None:
         self._logger = OxtLogger(log_name=__name__)
+        self._probe: NetProbe | None = None
+        self._probe_lock = threading.Lock()
+
+    def _get_probe(self) -> NetProbe:
+        """Gets the probe shared by all installers. The result is persisted in the user profile."""
+        with self._probe_lock:
+            if self._probe is None:
+                config = Config()
+                ttl = float(config.internet_check_ttl)
+                self._probe = NetProbe(
+                    url=config.test_internet_url,
+                    ttl=ttl,
+                    backoff=min(5.0, ttl),
+                    cache_file=Path(config.session.user_profile, f"{config.lo_implementation_name}_net_probe.json"),
+                )
+            return self._probe
+
+    def start_internet_check(self) -> None:
+        """
+        Starts checking for an internet connection on a background thread.
+
+        The result is used by :py:attr:`is_internet` once it is ready.
+        """
+        try:
+            self._get_probe().start()
+        except Exception as e:
+            self._logger.warning(f"Unable to start internet check: {e}")
 
     def url_open(
         self,
@@ -93,8 +122,8 @@ class Download(metaclass=Singleton):
         """
         Gets if there is an internet connection.
 
-        If url is not provided then it will use the url from the config.
-        If the config url is not provided then ``True`` will be returned.
+        Only a connection to the host of the url, or to the configured proxy, is opened.
+        If url is not provided then the shared probe for the config url is used and its result is cached.
 
         Args:
             url (str, optional): Test Url. Defaults to `Config().test_internet_url`.
@@ -103,23 +132,20 @@ class Download(metaclass=Singleton):
             bool: ``True`` if there is an internet connection. ``False`` if no internet connection or if no url is provided.
         """
         try:
-            if not url:
-                url = Config().test_internet_url
-            if not url:
-                return False
-            if url.startswith("https"):
-                # do not verify sss
-                context = ssl._create_unverified_context()
-                _ = urlopen(url=url, timeout=5.0, context=context)
-            else:
-                _ = urlopen(url=url, timeout=5.0)
-            return True
-        except URLError:
+            if url:
+                return NetProbe(url=url, ttl=0.0).is_reachable()
+            return self._get_probe().is_reachable()
+        except Exception as e:
+            self._logger.error(f"Unable to check internet connection: {e}")
             return False
 
     @property
     def is_internet(self) -> bool:
-        """Gets if there is an internet connection."""
+        """
+        Gets if there is an internet connection.
+
+        Checked once per session, the probe TTL only applies to the result persisted for later starts.
+        """
         try:
             return self._is_internet
         except AttributeError:
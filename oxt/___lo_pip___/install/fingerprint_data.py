@@ -0,0 +1,91 @@
+"""
+Data the requirements fingerprint is computed from.
+
+Only directory listings and modified times are used, no distribution metadata is read,
+so computing the fingerprint is cheaper than the requirements check it replaces.
+
+Kept apart from :py:class:`~.requirements_fingerprint.RequirementsFingerprint` so it does not depend on uno.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, Iterable, List
+import hashlib
+import json
+import os
+
+from .dist_index import get_dist_name, list_dists, normalize_name
+
+
+def get_mtime(pth: str) -> int:
+    """
+    Gets the modified time of a path.
+
+    Returns:
+        int: Modified time in nanoseconds or ``0`` if the path does not exist.
+    """
+    try:
+        return os.stat(pth).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def get_mtimes(dirs: Iterable[str]) -> Dict[str, int]:
+    """Gets the modified times of directories, empty names are skipped."""
+    return {d: get_mtime(d) for d in sorted({d for d in dirs if d})}
+
+
+def get_dir_dists(dirs: Iterable[str]) -> Dict[str, List[str]]:
+    """
+    Lists the metadata directories of installed distributions, one ``os.listdir()`` per directory.
+
+    Args:
+        dirs (Iterable[str]): Directories in ``sys.path`` order. Empty and duplicate names are skipped.
+
+    Returns:
+        Dict[str, List[str]]: Directory mapped to names such as ``["verr-1.1.2.dist-info"]``, in the order of ``dirs``.
+    """
+    result: Dict[str, List[str]] = {}
+    for d in dirs:
+        if d and d not in result:
+            result[d] = list_dists(d)
+    return result
+
+
+def get_locations(names: Iterable[str], dir_dists: Dict[str, List[str]]) -> Dict[str, str]:
+    """
+    Gets where each package is installed from directory listings.
+
+    The first directory that has a metadata directory for a package wins, the same as for imports.
+    A package that is removed, upgraded or shadowed by another install changes the result
+    because the metadata directory name holds the version.
+
+    Args:
+        names (Iterable[str]): Package names such as ``verr``.
+        dir_dists (Dict[str, List[str]]): Result of :py:func:`get_dir_dists`.
+
+    Returns:
+        Dict[str, str]: Normalized name mapped to a path such as ``/site/verr-1.1.2.dist-info``.
+        Empty string if the package is not installed.
+    """
+    wanted = {normalize_name(name) for name in names if name}
+    result = dict.fromkeys(wanted, "")
+    for d, entries in dir_dists.items():
+        for entry in entries:
+            key = get_dist_name(entry)
+            if key in wanted and not result[key]:
+                result[key] = os.path.join(d, entry)
+    return result
+
+
+def compute_fingerprint(data: Dict[str, Any]) -> str:
+    """
+    Computes the fingerprint of ``data``.
+
+    Args:
+        data (Dict[str, Any]): JSON serializable data. Values that are not are converted with ``str()``.
+
+    Returns:
+        str: Hex digest of the fingerprint. Dictionary key order does not change the result.
+    """
+    text = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
@@ -0,0 +1,298 @@
+"""
+Install lock shared by every extension and every LibreOffice process that uses the same user profile.
+
+Waiters are served in the order they arrived. Each waiter draws a ticket from a counter and holds an exclusive
+file lock on its own ticket file until it is done. A waiter blocks on the lock of the ticket right before its own,
+so it wakes up as soon as that one is released, without polling. The operating system releases the lock of a
+process that dies, the next waiter then finds the ticket was not marked done, counts it as stale and moves on.
+
+Locks use ``fcntl.flock`` on POSIX, which also orders threads of one process, and ``msvcrt.locking`` on Windows.
+On Windows a blocked lock is retried once per second, so a waiter may wake up to a second late.
+"""
+
+from __future__ import annotations
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any, Generator, List, NamedTuple
+import errno
+import os
+import threading
+import time
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+_DONE = "done"
+
+
+class LockStats(NamedTuple):
+    ticket: int
+    """Ticket drawn from the counter."""
+    ahead: int
+    """Number of waiters ahead when the ticket was drawn, including the holder."""
+    stale: int
+    """Number of tickets left behind by processes that ended without releasing them."""
+    wait_time: float
+    """Seconds spent waiting for the lock."""
+    hold_time: float
+    """Seconds the lock was held. Zero until released."""
+
+
+def _lock(f: IO[Any], timeout: float | None = None) -> None:
+    """
+    Locks a file, waiting while another process or file object holds the lock.
+
+    Args:
+        f (IO[Any]): Open file.
+        timeout (float, optional): Seconds to wait. Defaults to waiting until the lock is acquired.
+
+    Raises:
+        TimeoutError: If the lock is still held by another after ``timeout`` seconds.
+        OSError: If the file can not be locked.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    if os.name == "nt":
+        f.seek(0)
+        while True:
+            try:
+                msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)  # type: ignore[attr-defined]
+                return
+            except OSError as e:
+                # only a lock held by another is worth waiting for.
+                if e.errno not in (errno.EDEADLK, errno.EACCES):
+                    raise
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Timed out after {timeout} seconds waiting for a lock on {f.name}")
+            time.sleep(1.0 if deadline is None else max(0.0, min(1.0, deadline - time.monotonic())))
+    if deadline is None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)  # type: ignore
+        return
+    while True:
+        try:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)  # type: ignore
+            return
+        except BlockingIOError:
+            pass
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"Timed out after {timeout} seconds waiting for a lock on {f.name}")
+        time.sleep(0.05)
+
+
+def _unlock(f: IO[Any]) -> None:
+    try:
+        if os.name == "nt":
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)  # type: ignore[attr-defined]
+        else:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)  # type: ignore
+    except OSError:
+        pass
+
+
+def _remove(pth: Path) -> None:
+    try:
+        pth.unlink()
+    except OSError:
+        # Windows does not remove a file that is open somewhere else, a later waiter removes it.
+        pass
+
+
+@contextmanager
+def file_lock(pth: str | Path, timeout: float | None = None) -> Generator[None, None, None]:
+    """
+    Holds an exclusive lock on a file, created when needed, for a short read-modify-write.
+
+    Unlike :py:class:`InstallLock` waiters are not served in order.
+
+    Args:
+        pth (str | Path): Lock file.
+        timeout (float, optional): Seconds to wait for the lock. Defaults to waiting until it is acquired.
+
+    Raises:
+        TimeoutError: If the lock is not acquired within ``timeout`` seconds.
+    """
+    lock_pth = Path(pth)
+    lock_pth.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_pth, "a+", encoding="utf-8") as f:
+        _lock(f, timeout)
+        try:
+            yield
+        finally:
+            _unlock(f)
+
+
+class InstallLock:
+    """
+    First in first out lock across processes.
+
+    Example:
+
+        .. code-block:: python
+
+            with InstallLock(queue_dir) as lock:
+                ...  # install
+            print(lock.stats.wait_time)
+    """
+
+    def __init__(self, queue_dir: str | Path) -> None:
+        """
+        Initialize InstallLock
+
+        Args:
+            queue_dir (str | Path): Directory shared by all processes that use the lock, created when needed.
+        """
+        self._dir = Path(queue_dir)
+        self._ticket = -1
+        self._ticket_file: IO[Any] | None = None
+        self._ahead = 0
+        self._stale = 0
+        self._wait_time = 0.0
+        self._hold_time = 0.0
+        self._acquired_at = 0.0
+        self._thread_lock = threading.Lock()
+
+    def _ticket_path(self, ticket: int) -> Path:
+        return self._dir / f"{ticket:012d}.ticket"
+
+    def _get_tickets(self) -> List[int]:
+        tickets: List[int] = []
+        try:
+            names = os.listdir(self._dir)
+        except OSError:
+            return tickets
+        for name in names:
+            stem, _, ext = name.partition(".")
+            if ext == "ticket" and stem.isdigit():
+                tickets.append(int(stem))
+        return tickets
+
+    def _draw_ticket(self, timeout: float | None) -> None:
+        self._dir.mkdir(parents=True, exist_ok=True)
+        counter = self._dir / "counter"
+        with open(counter, "a+", encoding="utf-8") as f:
+            _lock(f, timeout)
+            try:
+                f.seek(0)
+                text = f.read().strip()
+                ticket = int(text) if text.isdigit() else 0
+                # the ticket file is locked before the counter is released so a later waiter always sees it held.
+                ticket_file = open(self._ticket_path(ticket), "a+", encoding="utf-8")
+                _lock(ticket_file)
+                f.seek(0)
+                f.truncate()
+                f.write(str(ticket + 1))
+                f.flush()
+            finally:
+                _unlock(f)
+        self._ticket = ticket
+        self._ticket_file = ticket_file
+        self._ahead = sum(1 for t in self._get_tickets() if t < ticket)
+
+    def _wait_for(self, ticket: int, timeout: float | None) -> None:
+        pth = self._ticket_path(ticket)
+        try:
+            f = open(pth, "r+", encoding="utf-8")
+        except OSError:
+            # already released and removed.
+            return
+        with f:
+            _lock(f, timeout)
+            f.seek(0)
+            if f.read() != _DONE:
+                # the owner ended without releasing its ticket.
+                self._stale += 1
+            _unlock(f)
+        _remove(pth)
+
+    def acquire(self, timeout: float | None = None) -> LockStats:
+        """
+        Waits until every waiter that arrived earlier has released the lock.
+
+        Args:
+            timeout (float, optional): Seconds to wait. Defaults to waiting until the lock is acquired.
+
+        Raises:
+            TimeoutError: If the lock is not acquired within ``timeout`` seconds. The ticket is given up.
+
+        Returns:
+            LockStats: Ticket and wait time.
+        """
+        with self._thread_lock:
+            if self._ticket_file is not None:
+                raise RuntimeError("InstallLock is already acquired")
+            start = time.perf_counter()
+            self._stale = 0
+            self._hold_time = 0.0
+            self._draw_ticket(timeout)
+            passed = set()
+            try:
+                while True:
+                    # files that could not be removed are only waited for once.
+                    earlier = [t for t in self._get_tickets() if t < self._ticket and t not in passed]
+                    if not earlier:
+                        break
+                    ticket = max(earlier)
+                    remaining = None if timeout is None else max(0.0, timeout - (time.perf_counter() - start))
+                    self._wait_for(ticket, remaining)
+                    passed.add(ticket)
+            except BaseException:
+                self._release_ticket()
+                raise
+            self._acquired_at = time.perf_counter()
+            self._wait_time = self._acquired_at - start
+            return self.stats
+
+    def release(self) -> LockStats:
+        """
+        Releases the lock and wakes up the next waiter.
+
+        Returns:
+            LockStats: Ticket, wait time and hold time.
+        """
+        with self._thread_lock:
+            if self._ticket_file is None:
+                return self.stats
+            self._hold_time = time.perf_counter() - self._acquired_at
+            self._release_ticket()
+            return self.stats
+
+    def _release_ticket(self) -> None:
+        f, self._ticket_file = self._ticket_file, None
+        if f is None:
+            return
+        try:
+            # marked while still locked so the next waiter knows the release was not a crash.
+            f.seek(0)
+            f.truncate()
+            f.write(_DONE)
+            f.flush()
+        except OSError:
+            pass
+        _unlock(f)
+        f.close()
+        _remove(self._ticket_path(self._ticket))
+
+    def __enter__(self) -> InstallLock:
+        self.acquire()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.release()
+
+    @property
+    def stats(self) -> LockStats:
+        """Gets the ticket and timing of the last acquire."""
+        return LockStats(
+            ticket=self._ticket,
+            ahead=self._ahead,
+            stale=self._stale,
+            wait_time=self._wait_time,
+            hold_time=self._hold_time,
+        )
+
+    @property
+    def is_locked(self) -> bool:
+        """Gets if this instance holds a ticket."""
+        return self._ticket_file is not None
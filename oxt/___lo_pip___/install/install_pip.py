@@ -1,12 +1,14 @@
 from __future__ import annotations
 import os
 import sys
-import subprocess
-from typing import Any, Dict
+from pathlib import Path
+from typing import Any, Dict, List
 
 from ..config import Config
 from ..oxt_logger import OxtLogger
 from .download import Download
+from .pip_detect import PipDetect
+from .pip_worker import run_cmd
 
 from .pip_installers.base_installer import STARTUP_INFO
 
@@ -52,18 +54,31 @@ class InstallPip:
         my_env["PYTHONPATH"] = py_path
         return my_env
 
+    def _run_pip_version(self, cmd: List[str]) -> int:
+        result = run_cmd(
+            cmd,
+            env=self._get_env(),
+            idle_timeout=self._config.pip_worker_idle_timeout,
+            startupinfo=STARTUP_INFO,
+        )
+        return result.returncode
+
     def is_pip_installed(self) -> bool:
-        """Check if PIP is installed."""
-        # cmd = self._cmd_pip("--version")
-        # cmd = '"{}" -m pip -V'.format(self.path_python)
-        cmd = [str(self._config.python_path), "-m", "pip", "-V"]
-        if STARTUP_INFO:
-            result = subprocess.run(
-                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=self._get_env(), startupinfo=STARTUP_INFO
-            )
-        else:
-            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=self._get_env())
-        return result.returncode == 0
+        """
+        Check if PIP is installed.
+
+        pip is looked up in-process first. ``python -m pip -V`` is only run when that is not conclusive.
+        """
+        cache_file = Path(self._config.session.user_profile, f"{self._config.lo_implementation_name}_pip_detect.json")
+        detect = PipDetect(
+            python_path=self._config.python_path,
+            search_path=sys.path,
+            cache_file=cache_file,
+            run=self._run_pip_version,
+        )
+        result = detect.is_installed()
+        self._logger.debug(f"is_pip_installed() {result} found by {detect.source}")
+        return result
 
     @property
     def is_internet(self) -> bool:
@@ -2,13 +2,13 @@ from __future__ import annotations
 import os
 
 import subprocess
-from typing import Any, Dict
+from typing import Any, Dict, List
 from pathlib import Path
-from importlib.metadata import PackageNotFoundError, version
 
 from ..config import Config
 from ..ver.rules.ver_rules import VerRules
 from ..oxt_logger import OxtLogger
+from .dist_index import DistIndex
 
 
 # https://docs.python.org/3.8/library/importlib.metadata.html#module-importlib.metadata
@@ -33,6 +33,7 @@ class InstallPkg:
         self.ver_rules = VerRules()
         self._logger = OxtLogger(log_name=__name__)
         self._flag_upgrade = flag_upgrade
+        self._skipped_shared: Dict[str, List[str]] = {}
 
     def install(self, req: Dict[str, str] | None = None, force: bool = False) -> bool:
         """
@@ -123,13 +124,17 @@ class InstallPkg:
         from .pkg_installers.install_pkg import InstallPkg
 
         installer = InstallPkg(ctx=self.ctx, flag_upgrade=self._flag_upgrade)
-        return installer.uninstall_pkg(pkg=pkg, target=target, remove_tracking_file=remove_tracking_file)
+        result = installer.uninstall_pkg(pkg=pkg, target=target, remove_tracking_file=remove_tracking_file)
+        self._skipped_shared.update(installer.skipped_shared)
+        return result
 
     def _uninstall_flatpak(self, pkg: str, target: str = "", remove_tracking_file: bool = False) -> bool:
         from .pkg_installers.install_pkg_flatpak import InstallPkgFlatpak
 
         installer = InstallPkgFlatpak(ctx=self.ctx, flag_upgrade=self._flag_upgrade)
-        return installer.uninstall_pkg(pkg=pkg, target=target, remove_tracking_file=remove_tracking_file)
+        result = installer.uninstall_pkg(pkg=pkg, target=target, remove_tracking_file=remove_tracking_file)
+        self._skipped_shared.update(installer.skipped_shared)
+        return result
 
     def _install_flatpak_file(self, pth: str | Path, force: bool = False) -> bool:
         from .pkg_installers.install_pkg_flatpak import InstallPkgFlatpak
@@ -147,7 +152,12 @@ class InstallPkg:
         Returns:
             str: The version of the package or an empty string if the package is not installed.
         """
-        try:
-            return version(package_name)
-        except PackageNotFoundError:
-            return ""
+        return DistIndex().get_version(package_name)
+
+    @property
+    def skipped_shared(self) -> Dict[str, List[str]]:
+        """
+        Gets the packages that :py:meth:`uninstall` did not remove because other extensions need them,
+        with the identifiers of those extensions.
+        """
+        return self._skipped_shared
@@ -0,0 +1,62 @@
+"""
+Files added by the pip installs of a session.
+
+Installers add the paths listed by the ``RECORD`` of each distribution pip reports as installed.
+Post install steps such as :py:class:`~.post.cpython_link.CPythonLink` use them instead of scanning site-packages.
+"""
+
+from __future__ import annotations
+from pathlib import Path
+from typing import Iterable, List
+import os
+import threading
+
+from ..meta.singleton import Singleton
+
+
+class InstalledFiles(metaclass=Singleton):
+    """Singleton class. Absolute paths of the files added by the pip installs of this session."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._files: List[str] = []
+        self._seen = set()
+
+    def add(self, root: str | Path, files: Iterable[str]) -> None:
+        """
+        Adds installed files.
+
+        Args:
+            root (str | Path): Install directory such as site-packages.
+            files (Iterable[str]): Paths relative to ``root`` such as the entries of a ``RECORD``.
+        """
+        root = os.path.abspath(root)
+        paths = [os.path.normpath(os.path.join(root, f)) for f in files]
+        with self._lock:
+            for pth in paths:
+                if pth not in self._seen:
+                    self._seen.add(pth)
+                    self._files.append(pth)
+
+    def get_files(self, suffix: str = "") -> List[Path]:
+        """
+        Gets installed files.
+
+        Args:
+            suffix (str, optional): Only get files whose name ends with suffix such as ``.so``.
+
+        Returns:
+            List[Path]: Files in the order they were added.
+        """
+        with self._lock:
+            return [Path(f) for f in self._files if f.endswith(suffix)]
+
+    def clear(self) -> None:
+        """Removes all files."""
+        with self._lock:
+            self._files.clear()
+            self._seen.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._files)
@@ -0,0 +1,212 @@
+"""
+Internet reachability probe.
+
+The probe only opens a TCP connection to the host of the test url, or to the configured proxy,
+so it never waits on a full HTTP request. Results are cached for a time to live and can be
+persisted to a file so the next session does not have to probe again. Failed probes are cached
+for a backoff period that doubles after each consecutive failure, up to the time to live.
+"""
+
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+from urllib.parse import urlsplit
+import json
+import os
+import socket
+import threading
+import time
+
+
+def get_target(url: str) -> Tuple[str, int]:
+    """
+    Gets the host and port a url is reached through.
+
+    If a proxy is configured for the url scheme then the proxy host and port are returned.
+
+    Args:
+        url (str): Url such as ``https://duckduckgo.com``
+
+    Returns:
+        Tuple[str, int]: Host and port. Host is an empty string if ``url`` has no host.
+    """
+    # urllib.request imports ssl and http.client, only import it when a probe is created.
+    from urllib.request import getproxies
+
+    parts = urlsplit(url)
+    scheme = parts.scheme or "https"
+    proxy = getproxies().get(scheme, "")
+    if proxy:
+        if "://" not in proxy:
+            proxy = f"http://{proxy}"
+        parts = urlsplit(proxy)
+    default_port = 443 if (parts.scheme or "https") == "https" else 80
+    try:
+        port = parts.port or default_port
+    except ValueError:
+        port = default_port
+    return parts.hostname or "", port
+
+
+class NetProbe:
+    """Checks if a host can be reached and caches the result."""
+
+    def __init__(
+        self,
+        url: str,
+        timeout: float = 2.0,
+        ttl: float = 300.0,
+        backoff: float = 5.0,
+        cache_file: str | Path | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize NetProbe
+
+        Args:
+            url (str): Test url such as ``https://duckduckgo.com``
+            timeout (float, optional): Connect timeout in seconds. Defaults to ``2.0``.
+            ttl (float, optional): Seconds a successful result is reused. Defaults to ``300``.
+            backoff (float, optional): Seconds a first failed result is reused. Doubled after each consecutive failure up to ``ttl``. Defaults to ``5``.
+            cache_file (str | Path, optional): File the result is persisted to so it is shared across sessions.
+            clock (Callable[[], float], optional): Gets the current time in seconds. Defaults to ``time.time``.
+        """
+        self._host, self._port = get_target(url)
+        self._timeout = timeout
+        self._ttl = ttl
+        self._backoff = backoff
+        self._cache_file = Path(cache_file) if cache_file else None
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._state: Dict[str, Any] | None = None
+
+    # region Cache
+    def _get_target_key(self) -> str:
+        return f"{self._host}:{self._port}"
+
+    def _read(self) -> Dict[str, Any] | None:
+        if self._cache_file is None:
+            return None
+        try:
+            with open(self._cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("target") != self._get_target_key():
+                return None
+            return {"ok": bool(data["ok"]), "time": float(data["time"]), "failures": int(data["failures"])}
+        except Exception:
+            return None
+
+    def _write(self, state: Dict[str, Any]) -> None:
+        if self._cache_file is None:
+            return
+        try:
+            data = {"target": self._get_target_key(), **state}
+            tmp = self._cache_file.with_name(f"{self._cache_file.name}.{os.getpid()}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, self._cache_file)
+        except Exception:
+            pass
+
+    def _get_max_age(self, state: Dict[str, Any]) -> float:
+        if state["ok"]:
+            return self._ttl
+        return min(self._ttl, self._backoff * 2 ** max(0, state["failures"] - 1))
+
+    def _is_fresh(self, state: Dict[str, Any] | None) -> bool:
+        if state is None:
+            return False
+        age = self._clock() - state["time"]
+        return 0 <= age < self._get_max_age(state)
+
+    def _get_cached(self) -> Dict[str, Any] | None:
+        if self._is_fresh(self._state):
+            return self._state
+        state = self._read()
+        if self._is_fresh(state):
+            self._state = state
+            return state
+        return None
+
+    def clear(self) -> None:
+        """Discards the cached result so the next check probes again."""
+        with self._lock:
+            self._state = None
+            if self._cache_file is not None:
+                try:
+                    self._cache_file.unlink()
+                except OSError:
+                    pass
+
+    # endregion Cache
+
+    # region Probe
+    def _connect(self) -> bool:
+        if not self._host:
+            return False
+        try:
+            with socket.create_connection((self._host, self._port), timeout=self._timeout):
+                return True
+        except OSError:
+            return False
+
+    def _probe(self) -> bool:
+        ok = self._connect()
+        with self._lock:
+            previous = self._state or self._read()
+            failures = 0 if ok else (0 if previous is None or previous["ok"] else previous["failures"]) + 1
+            self._state = {"ok": ok, "time": self._clock(), "failures": failures}
+            self._write(self._state)
+        return ok
+
+    def start(self) -> None:
+        """
+        Starts probing on a background thread unless a fresh result is cached or a probe is already running.
+
+        Call early so the result is ready by the time :py:meth:`is_reachable` is called.
+        """
+        with self._lock:
+            if self._get_cached() is not None:
+                return
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._probe, name="net_probe", daemon=True)
+            self._thread.start()
+
+    def is_reachable(self) -> bool:
+        """
+        Gets if the host can be reached.
+
+        Returns the cached result when it is fresh, waits for a probe started by :py:meth:`start`,
+        or probes now.
+
+        Returns:
+            bool: ``True`` if a connection to the host could be opened; Otherwise, ``False``.
+        """
+        with self._lock:
+            state = self._get_cached()
+            if state is not None:
+                return state["ok"]
+            thread = self._thread
+        if thread is not None and thread.is_alive():
+            thread.join()
+            with self._lock:
+                if self._state is not None:
+                    return self._state["ok"]
+        return self._probe()
+
+    # endregion Probe
+
+    # region Properties
+    @property
+    def host(self) -> str:
+        """Host that is probed."""
+        return self._host
+
+    @property
+    def port(self) -> int:
+        """Port that is probed."""
+        return self._port
+
+    # endregion Properties
@@ -0,0 +1,144 @@
+"""
+Detects if pip can be run by an interpreter without starting it when possible.
+
+``python -m pip -V`` is run with ``PYTHONPATH`` set to the paths of this process.
+pip is first looked up in-process on those same paths. A subprocess is only started when the
+in-process answer is ambiguous, such as a pip package without metadata or an interpreter other
+than the current one that may have pip on its own default paths. The subprocess verdict is cached,
+keyed by the interpreter path and the modified times of the search paths, so installing or removing
+packages invalidates it.
+"""
+
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence
+import importlib.machinery
+import importlib.metadata
+import json
+import os
+import subprocess
+import sys
+
+
+def _get_mtime(pth: str) -> int:
+    try:
+        return os.stat(pth).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _same_file(a: str, b: str) -> bool:
+    try:
+        return os.path.samefile(a, b)
+    except OSError:
+        return os.path.normcase(os.path.abspath(a)) == os.path.normcase(os.path.abspath(b))
+
+
+class PipDetect:
+    """Checks if pip is installed for an interpreter."""
+
+    def __init__(
+        self,
+        python_path: str | Path,
+        search_path: Sequence[str],
+        cache_file: str | Path | None = None,
+        run: Callable[[List[str]], int] | None = None,
+    ) -> None:
+        """
+        Initialize PipDetect
+
+        Args:
+            python_path (str | Path): Interpreter that runs pip.
+            search_path (Sequence[str]): ``PYTHONPATH`` entries the interpreter is started with, usually ``sys.path``.
+            cache_file (str | Path, optional): File the subprocess verdict is cached in.
+            run (Callable[[List[str]], int], optional): Runs a command and returns its exit code.
+                Defaults to ``subprocess.run`` with ``PYTHONPATH`` set to ``search_path``, discarding output.
+        """
+        self._python_path = str(python_path)
+        self._search_path = [p for p in search_path if p]
+        self._cache_file = Path(cache_file) if cache_file else None
+        self._run = run or self._run_cmd
+        self.source = ""
+        """How the last verdict was found: ``in_process``, ``cache`` or ``subprocess``."""
+
+    def _run_cmd(self, cmd: List[str]) -> int:
+        env = os.environ.copy()
+        env["PYTHONPATH"] = os.pathsep.join(self._search_path)
+        return subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=env).returncode
+
+    def get_pip_cmd(self) -> List[str]:
+        """Gets the command the subprocess check runs."""
+        return [self._python_path, "-m", "pip", "-V"]
+
+    def _is_current_interpreter(self) -> bool:
+        for exe in (sys.executable, getattr(sys, "_base_executable", "")):
+            if exe and _same_file(exe, self._python_path):
+                return True
+        return False
+
+    def find_in_process(self) -> bool | None:
+        """
+        Looks for pip on the search path without starting an interpreter.
+
+        Returns:
+            bool | None: ``True`` if a pip package with metadata is found, ``False`` if pip is not found
+            and the interpreter is the current one. ``None`` when the answer is ambiguous.
+        """
+        spec = importlib.machinery.PathFinder.find_spec("pip", self._search_path)
+        if spec is None or not spec.submodule_search_locations:
+            return False if self._is_current_interpreter() else None
+        pkg_dir = Path(list(spec.submodule_search_locations)[0])
+        if not (pkg_dir / "__main__.py").is_file():
+            return None
+        dists = list(importlib.metadata.distributions(name="pip", path=[str(pkg_dir.parent)]))
+        return True if dists else None
+
+    def _get_key(self) -> Dict[str, Any]:
+        return {
+            "python": self._python_path,
+            "mtimes": {p: _get_mtime(p) for p in self._search_path},
+        }
+
+    def _read_cache(self) -> bool | None:
+        if self._cache_file is None:
+            return None
+        try:
+            with open(self._cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("key") != self._get_key():
+                return None
+            return bool(data["installed"])
+        except Exception:
+            return None
+
+    def _write_cache(self, installed: bool) -> None:
+        if self._cache_file is None:
+            return
+        try:
+            with open(self._cache_file, "w", encoding="utf-8") as f:
+                json.dump({"key": self._get_key(), "installed": installed}, f)
+        except Exception:
+            pass
+
+    def is_installed(self) -> bool:
+        """
+        Gets if pip can be run by the interpreter.
+
+        Returns:
+            bool: ``True`` if pip is installed; Otherwise, ``False``.
+        """
+        result = self.find_in_process()
+        if result is not None:
+            self.source = "in_process"
+            return result
+        result = self._read_cache()
+        if result is not None:
+            self.source = "cache"
+            return result
+        self.source = "subprocess"
+        try:
+            result = self._run(self.get_pip_cmd()) == 0
+        except OSError:
+            result = False
+        self._write_cache(result)
+        return result
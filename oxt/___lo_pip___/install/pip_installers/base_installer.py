@@ -11,6 +11,8 @@ from typing import Any, List, Dict
 from ...config import Config
 from ...oxt_logger import OxtLogger
 from ..download import Download
+from ..pip_detect import PipDetect
+from ..pip_worker import run_cmd
 from ...lo_util.resource_resolver import ResourceResolver
 
 IS_WIN = platform.system() == "Windows"
@@ -55,14 +57,8 @@ class BaseInstaller:
         self._logger.info("Starting PIP installation…")
         try:
             cmd = self._get_pip_cmd(filename=filename)
-            if STARTUP_INFO:
-                process = subprocess.Popen(
-                    cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=self._get_env(), startupinfo=STARTUP_INFO
-                )
-            else:
-                process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=self._get_env())
-            _, stderr = process.communicate()
-            str_stderr = stderr.decode("utf-8")
+            process = self._run_cmd(cmd)
+            str_stderr = process.stderr
             if process.returncode != 0:
                 # "PIP installation has failed, see log"
                 self._logger.error("PIP installation has failed")
@@ -135,30 +131,46 @@ class BaseInstaller:
             cmd = self._cmd_pip(*[*cmd, "-r", f"{path}"])
             msg = "Install - Installing requirements success!"
             err_msg = "Install - Installing requirements failed!"
-        if STARTUP_INFO:
-            process = subprocess.run(
-                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=self._get_env(), startupinfo=STARTUP_INFO
-            )  # noqa: E501
-        else:
-            process = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=self._get_env())
+        process = self._run_cmd(cmd)
         if process.returncode == 0:
             self._logger.info(msg)
         else:
             self._logger.error(err_msg)
         return
 
+    def _run_cmd(self, cmd: List[str]) -> subprocess.CompletedProcess:
+        """
+        Runs a command and waits for it to finish.
+
+        pip commands and python files are run by the pip worker shared by the session
+        unless ``pip_worker_idle_timeout`` is ``0``.
+        """
+        return run_cmd(
+            cmd,
+            env=self._get_env(),
+            idle_timeout=self._config.pip_worker_idle_timeout,
+            startupinfo=STARTUP_INFO,
+        )
+
+    def _run_pip_version(self, cmd: List[str]) -> int:
+        return self._run_cmd(cmd).returncode
+
     def is_pip_installed(self) -> bool:
-        """Check if PIP is installed."""
-        # cmd = self._cmd_pip("--version")
-        # cmd = '"{}" -m pip -V'.format(self.path_python)
-        cmd = [str(self.path_python), "-m", "pip", "-V"]
-        if STARTUP_INFO:
-            result = subprocess.run(
-                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=self._get_env(), startupinfo=STARTUP_INFO
-            )
-        else:
-            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=self._get_env())
-        return result.returncode == 0
+        """
+        Check if PIP is installed.
+
+        pip is looked up in-process first. ``python -m pip -V`` is only run when that is not conclusive.
+        """
+        cache_file = Path(self._config.session.user_profile, f"{self._config.lo_implementation_name}_pip_detect.json")
+        detect = PipDetect(
+            python_path=self.path_python,
+            search_path=sys.path,
+            cache_file=cache_file,
+            run=self._run_pip_version,
+        )
+        result = detect.is_installed()
+        self._logger.debug(f"is_pip_installed() {result} found by {detect.source}")
+        return result
 
     @property
     def is_internet(self) -> bool:
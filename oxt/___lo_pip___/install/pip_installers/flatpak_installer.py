@@ -1,7 +1,6 @@
 from __future__ import annotations
 from typing import List
 import sys
-import subprocess
 from pathlib import Path
 
 from ...config import Config
@@ -69,9 +68,8 @@ class FlatpakInstaller(BaseInstaller):
         cfg = Config()
         try:
             cmd = self._get_pip_cmd(filename)
-            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=self._get_env())
-            _, stderr = process.communicate()
-            str_stderr = stderr.decode("utf-8")
+            process = self._run_cmd(cmd)
+            str_stderr = process.stderr
             if process.returncode != 0:
                 # "PIP installation has failed, see log"
                 self._logger.error("PIP installation has failed")
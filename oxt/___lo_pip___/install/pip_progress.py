@@ -0,0 +1,107 @@
+"""
+Progress of a pip command parsed from its output.
+
+pip writes a line when it starts each phase of an install such as::
+
+    Collecting verr
+      Downloading verr-1.1.2-py3-none-any.whl (11 kB)
+    Installing collected packages: verr
+    Successfully installed verr-1.1.2
+
+:py:func:`parse_line` turns those lines into :py:class:`PipProgressEvent` instances.
+"""
+
+from __future__ import annotations
+from typing import List, NamedTuple, Tuple
+import re
+
+
+class PipPhase(NamedTuple):
+    """Phases of a pip install."""
+
+    COLLECTING = "collecting"
+    """A requirement is being resolved."""
+    DOWNLOADING = "downloading"
+    """A distribution is being downloaded."""
+    CACHED = "cached"
+    """A distribution is used from the pip cache."""
+    SATISFIED = "satisfied"
+    """A requirement is already installed."""
+    BUILDING = "building"
+    """A wheel is being built from a source distribution."""
+    INSTALLING = "installing"
+    """The collected distributions are being installed."""
+    SUCCESS = "success"
+    """The distributions have been installed."""
+    ERROR = "error"
+    """pip reported an error."""
+
+
+class PipProgressEvent(NamedTuple):
+    phase: str
+    """Phase such as ``downloading``, see :py:class:`PipPhase`."""
+    package: str
+    """Package or comma separated packages the phase is about. Empty if unknown."""
+    detail: str
+    """Extra information such as a download size."""
+    line: str
+    """Output line the event was parsed from, stripped."""
+
+
+def _dist_name(filename: str) -> str:
+    # verr-1.1.2-py3-none-any.whl or verr-1.1.2.tar.gz
+    name = filename.rsplit("/", 1)[-1]
+    return name.split("-", 1)[0]
+
+
+def _req_name(req: str) -> str:
+    match = re.match(r"[A-Za-z0-9][A-Za-z0-9._-]*", req)
+    return match.group(0) if match else req
+
+
+_SIZE = r"(?:\s+\((?P<detail>[^)]*)\))?"
+_RULES: List[Tuple[str, "re.Pattern[str]", str]] = [
+    (PipPhase.COLLECTING, re.compile(r"^Collecting (?P<name>\S+)"), "req"),
+    (PipPhase.DOWNLOADING, re.compile(r"^Downloading (?P<name>\S+)" + _SIZE), "dist"),
+    (PipPhase.CACHED, re.compile(r"^Using cached (?P<name>\S+)" + _SIZE), "dist"),
+    (PipPhase.SATISFIED, re.compile(r"^Requirement already satisfied: (?P<name>\S+)"), "req"),
+    (PipPhase.BUILDING, re.compile(r"^Building wheel for (?P<name>\S+)(?:\s+\((?P<detail>[^)]*)\))?"), "raw"),
+    (PipPhase.INSTALLING, re.compile(r"^Installing collected packages: (?P<name>.+)$"), "raw"),
+    (PipPhase.SUCCESS, re.compile(r"^Successfully installed (?P<name>.+)$"), "raw"),
+    (PipPhase.ERROR, re.compile(r"^ERROR: (?P<detail>.+)$"), "raw"),
+]
+
+
+def parse_line(line: str) -> PipProgressEvent | None:
+    """
+    Parses a line of pip output.
+
+    Args:
+        line (str): Line of ``stdout`` or ``stderr``.
+
+    Returns:
+        PipProgressEvent | None: Event, or ``None`` if the line does not start a phase.
+    """
+    text = line.strip()
+    if not text:
+        return None
+    for phase, pattern, kind in _RULES:
+        match = pattern.match(text)
+        if match is None:
+            continue
+        groups = match.groupdict()
+        name = groups.get("name") or ""
+        if kind == "req":
+            name = _req_name(name)
+        elif kind == "dist":
+            name = _dist_name(name)
+        return PipProgressEvent(phase=phase, package=name, detail=groups.get("detail") or "", line=text)
+    return None
+
+
+def format_event(event: PipProgressEvent) -> str:
+    """Gets a short message for an event such as ``Downloading verr (11 kB)``."""
+    if event.phase == PipPhase.ERROR:
+        return event.line
+    msg = f"{event.phase.capitalize()} {event.package}".strip()
+    return f"{msg} ({event.detail})" if event.detail else msg
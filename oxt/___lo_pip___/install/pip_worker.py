@@ -0,0 +1,936 @@
+"""
+Long lived helper process that runs pip commands for the installers of a session.
+
+Starting an interpreter and importing pip is paid once per session instead of once per command.
+The client starts this module as a script with the LibreOffice Python and sends requests as JSON
+lines on the worker stdin. Each response is a JSON line on the worker stdout::
+
+    {"id": 1, "cmd": "pip", "args": ["install", "verr"], "env": {"PYTHONPATH": "..."}}
+    {"id": 1, "returncode": 0, "stdout": "...", "stderr": ""}
+
+Commands are ``pip``, run pip with ``args``, and ``script``, run the python file ``path`` with ``args``.
+
+Where ``os.fork`` is available each command runs in a child forked from the worker, which already has pip
+imported, so commands are isolated from one another and may run concurrently.
+Otherwise, such as on Windows, each command runs in a new python process started by the worker.
+A command whose ``env`` differs from the environment the worker was started with also runs in a new process,
+pip is imported once with the worker ``PYTHONPATH`` and would not see another one.
+pip does not support running ``main()`` more than once in a process, its logging setup, imported modules and
+cached distributions would carry over from one command to the next.
+The worker exits when no request has been received for the idle timeout.
+
+Commands may also stream their output. A request with ``"stream": true`` gets a JSON line for each
+line of output before its response, whose ``stdout`` and ``stderr`` are then empty. A running command is
+stopped with a ``cancel`` request::
+
+    {"id": 2, "cmd": "pip", "args": ["install", "numpy"], "stream": true}
+    {"id": 2, "stream": "stdout", "line": "Collecting numpy"}
+    {"id": 3, "cmd": "cancel", "target": 2}
+
+This module only uses the standard library so it can be run as a script.
+"""
+
+from __future__ import annotations
+from pathlib import Path
+from typing import IO, Any, Callable, Deque, Dict, List, Sequence, Set, Tuple
+from collections import deque
+import json
+import os
+import queue
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+
+class PipWorkerError(Exception):
+    """The worker process could not be started or stopped before responding."""
+
+    def __init__(self, msg: str, returncode: int | None = None, started: bool = False) -> None:
+        super().__init__(msg)
+        self.returncode = returncode
+        """Exit code of the worker if it exited."""
+        self.started = started
+        """``True`` if the worker received the request, the command may have run in part."""
+
+
+# region Server
+def _execute(req: Dict[str, Any]) -> int:
+    """Runs a request in the current process and gets its exit code."""
+    args = [str(a) for a in req.get("args", [])]
+    try:
+        if req.get("cmd") == "script":
+            import runpy
+
+            path = str(req["path"])
+            sys.argv = [path, *args]
+            # a script such as get-pip.py imports its own pip.
+            for name in [m for m in sys.modules if m == "pip" or m.startswith("pip.")]:
+                del sys.modules[name]
+            runpy.run_path(path, run_name="__main__")
+            return 0
+        if req.get("cmd") == "pip":
+            from pip._internal.cli.main import main as pip_main
+
+            return int(pip_main(args) or 0)
+        print(f"Unknown command: {req.get('cmd')}", file=sys.stderr)
+        return 2
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        if isinstance(e.code, int):
+            return e.code
+        print(e.code, file=sys.stderr)
+        return 1
+    except BaseException as e:
+        print(f"{type(e).__name__}: {e}", file=sys.stderr)
+        return 1
+
+
+def _get_cmd(req: Dict[str, Any]) -> List[str] | None:
+    """Gets the command line that runs a request in a new process of this interpreter."""
+    args = [str(a) for a in req.get("args", [])]
+    if req.get("cmd") == "pip":
+        return [sys.executable, "-m", "pip", *args]
+    if req.get("cmd") == "script":
+        return [sys.executable, str(req["path"]), *args]
+    return None
+
+
+def _exec(req: Dict[str, Any]) -> int:
+    """Replaces the current process with a new process of this interpreter that runs a request, in its environment."""
+    cmd = _get_cmd(req)
+    if cmd is None:
+        print(f"Unknown command: {req.get('cmd')}", file=sys.stderr)
+        return 2
+    env = dict(req["env"])
+    if req.get("stream"):
+        env["PYTHONUNBUFFERED"] = "1"
+    try:
+        # stdin is the request stream of the worker.
+        devnull = os.open(os.devnull, os.O_RDONLY)
+        os.dup2(devnull, 0)
+        os.execve(cmd[0], cmd, env)
+    except OSError as e:
+        print(f"{type(e).__name__}: {e}", file=sys.stderr)
+    return 1
+
+
+def _get_popen_kwargs() -> Dict[str, Any]:
+    if os.name == "nt":
+        # the worker has no console, without this flag each command would open one.
+        return {"creationflags": getattr(subprocess, "CREATE_NO_WINDOW", 0)}
+    # own process group so stopping a command also stops the processes pip starts.
+    return {"start_new_session": True}
+
+
+def _stop_process(proc: subprocess.Popen) -> None:
+    """Stops a command started with :py:func:`_get_popen_kwargs` and the processes it started."""
+    try:
+        if os.name == "nt":
+            subprocess.run(
+                ["taskkill", "/F", "/T", "/PID", str(proc.pid)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                **_get_popen_kwargs(),
+            )
+        else:
+            os.killpg(proc.pid, signal.SIGTERM)
+    except OSError:
+        try:
+            proc.kill()
+        except OSError:
+            pass
+
+
+def _redirect(out_fd: int, err_fd: int) -> None:
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.dup2(out_fd, 1)
+    os.dup2(err_fd, 2)
+
+
+def _get_exit_code(status: int) -> int:
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+def _read_output(f: IO[bytes]) -> str:
+    f.seek(0)
+    data = f.read().decode("utf-8", errors="replace")
+    f.close()
+    return data
+
+
+class _Server:
+    def __init__(self, idle_timeout: float) -> None:
+        self._idle_timeout = idle_timeout
+        # environment pip is imported with, such as its PYTHONPATH.
+        self._env = dict(os.environ)
+        # responses are written to a copy of the original stdout.
+        # stdout is pointed at devnull so nothing else can write into the protocol stream.
+        self._out = os.fdopen(os.dup(1), "w", encoding="utf-8")
+        devnull = os.open(os.devnull, os.O_RDWR)
+        os.dup2(devnull, 1)
+        os.close(devnull)
+        self._write_lock = threading.Lock()
+
+    def _write(self, msg: Dict[str, Any]) -> None:
+        line = json.dumps(msg)
+        with self._write_lock:
+            self._out.write(line + "\n")
+            self._out.flush()
+
+    def _respond(self, req_id: int, returncode: int, stdout: str, stderr: str) -> None:
+        self._write({"id": req_id, "returncode": returncode, "stdout": stdout, "stderr": stderr})
+
+    def _forward(self, req_id: int, stream: str, data: bytes, final: bool = False) -> bytes:
+        """Writes a message for each complete line of ``data`` and gets what is left of it."""
+        lines = data.split(b"\n")
+        rest = b"" if final else lines.pop()
+        for line in lines:
+            if line or not final:
+                text = line.rstrip(b"\r").decode("utf-8", errors="replace")
+                self._write({"id": req_id, "stream": stream, "line": text})
+        return rest
+
+    def _parse(self, line: bytes) -> Dict[str, Any] | None:
+        try:
+            return json.loads(line)
+        except Exception:
+            return None
+
+    def serve_fork(self) -> None:
+        import select
+
+        try:
+            # warm up, this is the import that every forked command would otherwise pay for.
+            import pip._internal.cli.main  # noqa: F401
+        except Exception:
+            pass
+
+        # pid: (request id, stdout file, stderr file, stream fds)
+        children: Dict[int, Tuple[Any, Any, Any, List[int]]] = {}
+        # stream fd: [request id, stream name, partial line]
+        streams: Dict[int, List[Any]] = {}
+        buf = b""
+        last = time.monotonic()
+
+        def close_stream(fd: int) -> None:
+            req_id, name, rest = streams.pop(fd)
+            self._forward(req_id, name, rest, final=True)
+            os.close(fd)
+
+        def read_stream(fd: int) -> None:
+            try:
+                data = os.read(fd, 65536)
+            except OSError:
+                data = b""
+            if data:
+                streams[fd][2] = self._forward(streams[fd][0], streams[fd][1], streams[fd][2] + data)
+            else:
+                close_stream(fd)
+
+        while True:
+            for pid in list(children):
+                done, status = os.waitpid(pid, os.WNOHANG)
+                if done:
+                    req_id, out_f, err_f, fds = children.pop(pid)
+                    # the child has exited, read what is left in its pipes.
+                    for fd in fds:
+                        while fd in streams:
+                            ready, _, _ = select.select([fd], [], [], 1.0)
+                            if ready:
+                                read_stream(fd)
+                            else:
+                                # a process started by the command still holds the pipe open.
+                                close_stream(fd)
+                    rc = _get_exit_code(status)
+                    stdout = _read_output(out_f) if out_f else ""
+                    stderr = _read_output(err_f) if err_f else ""
+                    self._respond(req_id, rc, stdout, stderr)
+                    last = time.monotonic()
+            if children:
+                timeout = 0.05
+            else:
+                timeout = self._idle_timeout - (time.monotonic() - last)
+                if timeout <= 0:
+                    return
+            ready, _, _ = select.select([0, *streams], [], [], timeout)
+            for fd in ready:
+                if fd != 0 and fd in streams:
+                    read_stream(fd)
+            if 0 not in ready:
+                continue
+            data = os.read(0, 65536)
+            if not data:
+                # client closed the pipe. Finish running commands then exit.
+                for pid in list(children):
+                    os.waitpid(pid, 0)
+                return
+            last = time.monotonic()
+            buf += data
+            while b"\n" in buf:
+                line, buf = buf.split(b"\n", 1)
+                req = self._parse(line)
+                if req is None:
+                    continue
+                if req.get("cmd") == "cancel":
+                    found = [pid for pid, child in children.items() if child[0] == req.get("target")]
+                    for pid in found:
+                        try:
+                            # the child leads its own group, processes started by pip are stopped as well.
+                            os.killpg(pid, signal.SIGTERM)
+                        except OSError:
+                            pass
+                    self._respond(req.get("id"), 0 if found else 1, "", "")
+                    continue
+                if req.get("stream"):
+                    out_r, out_w = os.pipe()
+                    err_r, err_w = os.pipe()
+                    out_f = err_f = None
+                else:
+                    out_f = tempfile.TemporaryFile()
+                    err_f = tempfile.TemporaryFile()
+                pid = os.fork()
+                if pid == 0:
+                    rc = 1
+                    try:
+                        os.setpgid(0, 0)
+                        self._out.close()
+                        if out_f is None:
+                            os.close(out_r)
+                            os.close(err_r)
+                            _redirect(out_w, err_w)
+                            sys.stdout.reconfigure(line_buffering=True)  # type: ignore
+                        else:
+                            _redirect(out_f.fileno(), err_f.fileno())
+                        # the imported pip does not see another environment, run the request as serve_spawn does.
+                        rc = _exec(req) if req.get("env") and req["env"] != self._env else _execute(req)
+                    finally:
+                        sys.stdout.flush()
+                        sys.stderr.flush()
+                        os._exit(rc)
+                try:
+                    # also set by the child, whichever runs first wins the race against a cancel request.
+                    os.setpgid(pid, pid)
+                except OSError:
+                    pass
+                fds: List[int] = []
+                if out_f is None:
+                    os.close(out_w)
+                    os.close(err_w)
+                    streams[out_r] = [req.get("id"), "stdout", b""]
+                    streams[err_r] = [req.get("id"), "stderr", b""]
+                    fds = [out_r, err_r]
+                children[pid] = (req.get("id"), out_f, err_f, fds)
+
+    def serve_spawn(self) -> None:
+        requests: queue.Queue = queue.Queue()
+
+        def reader() -> None:
+            for line in sys.stdin.buffer:
+                requests.put(line)
+            requests.put(None)
+
+        threading.Thread(target=reader, daemon=True).start()
+        # request id: process, None until it is started.
+        running: Dict[Any, subprocess.Popen | None] = {}
+        cancelled: Set[Any] = set()
+        lock = threading.Lock()
+        threads: List[threading.Thread] = []
+        last = time.monotonic()
+        while True:
+            try:
+                line = requests.get(timeout=0.1)
+            except queue.Empty:
+                threads = [t for t in threads if t.is_alive()]
+                if threads:
+                    last = time.monotonic()
+                elif time.monotonic() - last >= self._idle_timeout:
+                    return
+                continue
+            if line is None:
+                # client closed the pipe. Finish running commands then exit.
+                for t in threads:
+                    t.join()
+                return
+            last = time.monotonic()
+            req = self._parse(line)
+            if req is None:
+                continue
+            if req.get("cmd") == "cancel":
+                target = req.get("target")
+                with lock:
+                    found = target in running
+                    proc = running.get(target)
+                    if found:
+                        cancelled.add(target)
+                if proc is not None:
+                    _stop_process(proc)
+                self._respond(req.get("id"), 0 if found else 1, "", "")
+                continue
+            with lock:
+                running[req.get("id")] = None
+            t = threading.Thread(target=self._run_process, args=(req, running, cancelled, lock), daemon=True)
+            t.start()
+            threads.append(t)
+
+    def _pump(self, req_id: int, stream: str, f: IO[bytes]) -> None:
+        for raw in f:
+            text = raw.rstrip(b"\r\n").decode("utf-8", errors="replace")
+            self._write({"id": req_id, "stream": stream, "line": text})
+
+    def _run_process(
+        self,
+        req: Dict[str, Any],
+        running: Dict[Any, subprocess.Popen | None],
+        cancelled: Set[Any],
+        lock: threading.Lock,
+    ) -> None:
+        """Runs a request in a new process and responds with its exit code and output."""
+        req_id = req.get("id")
+        try:
+            rc, stdout, stderr = 1, "", ""
+            cmd = _get_cmd(req)
+            if cmd is None:
+                rc, stderr = 2, f"Unknown command: {req.get('cmd')}\n"
+                return
+            stream = bool(req.get("stream"))
+            env = req.get("env") or None
+            if stream:
+                env = dict(os.environ if env is None else env)
+                env["PYTHONUNBUFFERED"] = "1"
+            try:
+                proc = subprocess.Popen(
+                    cmd,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    env=env,
+                    **_get_popen_kwargs(),
+                )
+            except OSError as e:
+                stderr = f"{type(e).__name__}: {e}\n"
+                return
+            with lock:
+                running[req_id] = proc
+                stop = req_id in cancelled
+            if stop:
+                # cancelled before the process was started.
+                _stop_process(proc)
+            if stream:
+                pumps = [
+                    threading.Thread(target=self._pump, args=(req_id, "stdout", proc.stdout), daemon=True),
+                    threading.Thread(target=self._pump, args=(req_id, "stderr", proc.stderr), daemon=True),
+                ]
+                for t in pumps:
+                    t.start()
+                rc = proc.wait()
+                for t in pumps:
+                    # a process started by the command may still hold the pipe open.
+                    t.join(timeout=1.0)
+            else:
+                out, err = proc.communicate()
+                rc = proc.returncode
+                stdout = out.decode("utf-8", errors="replace")
+                stderr = err.decode("utf-8", errors="replace")
+        finally:
+            with lock:
+                running.pop(req_id, None)
+                cancelled.discard(req_id)
+            self._respond(req_id, rc, stdout, stderr)
+
+
+def serve(idle_timeout: float, use_fork: bool = True) -> None:
+    """Serves requests on stdin until stdin is closed or no request is received for ``idle_timeout`` seconds."""
+    server = _Server(idle_timeout)
+    if use_fork and hasattr(os, "fork"):
+        server.serve_fork()
+    else:
+        server.serve_spawn()
+
+
+# endregion Server
+
+
+# region Client
+LineCallback = Callable[[str, str], None]
+"""Called with the stream name, ``stdout`` or ``stderr``, and a line of output without its line break."""
+
+
+class _Tail:
+    """Keeps the last lines of each stream of a streamed command and passes every line on."""
+
+    def __init__(self, on_line: LineCallback, max_lines: int) -> None:
+        self._on_line = on_line
+        self._lines: Dict[str, Deque[str]] = {"stdout": deque(maxlen=max_lines), "stderr": deque(maxlen=max_lines)}
+
+    def __call__(self, stream: str, line: str) -> None:
+        self._lines.setdefault(stream, deque(maxlen=self._lines["stdout"].maxlen)).append(line)
+        self._on_line(stream, line)
+
+    def text(self, stream: str) -> str:
+        lines = self._lines.get(stream)
+        return "".join(f"{line}\n" for line in lines) if lines else ""
+
+
+class PipWorker:
+    """Client of a pip worker process. The process is started on first use and restarted after an idle exit."""
+
+    def __init__(
+        self,
+        python_path: str | Path,
+        idle_timeout: float = 60.0,
+        env: Dict[str, str] | None = None,
+        startupinfo: Any = None,  # noqa: ANN401
+        use_fork: bool = True,
+    ) -> None:
+        """
+        Initialize PipWorker
+
+        Args:
+            python_path (str | Path): Interpreter the worker runs with.
+            idle_timeout (float, optional): Seconds without a request before the worker exits. Defaults to ``60``.
+            env (Dict[str, str], optional): Environment the worker is started with. Defaults to this environment.
+            startupinfo (Any, optional): ``subprocess.STARTUPINFO`` used on Windows to hide the console.
+            use_fork (bool, optional): Run each command in a forked child when supported. Defaults to ``True``.
+        """
+        self._python_path = str(python_path)
+        self._use_fork = use_fork
+        self._idle_timeout = idle_timeout
+        self._env = env
+        self._startupinfo = startupinfo
+        self._lock = threading.Lock()
+        self._proc: subprocess.Popen | None = None
+        self._next_id = 0
+        self._pending: Dict[int, Dict[str, Any]] = {}
+        self._events: Dict[int, Tuple[threading.Event, subprocess.Popen]] = {}
+        self._callbacks: Dict[int, LineCallback] = {}
+
+    def _start(self) -> subprocess.Popen:
+        cmd = [self._python_path, str(Path(__file__)), "--serve", f"--idle-timeout={self._idle_timeout}"]
+        if not self._use_fork:
+            cmd.append("--no-fork")
+        kwargs: Dict[str, Any] = {}
+        if self._startupinfo is not None:
+            kwargs["startupinfo"] = self._startupinfo
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=self._env,
+            **kwargs,
+        )
+        threading.Thread(target=self._read_responses, args=(proc,), name="pip_worker_reader", daemon=True).start()
+        return proc
+
+    def _read_responses(self, proc: subprocess.Popen) -> None:
+        assert proc.stdout is not None
+        for line in proc.stdout:
+            try:
+                resp = json.loads(line)
+                req_id = int(resp["id"])
+            except Exception:
+                continue
+            if "line" in resp and "returncode" not in resp:
+                with self._lock:
+                    callback = self._callbacks.get(req_id)
+                if callback:
+                    try:
+                        callback(str(resp.get("stream", "stdout")), str(resp["line"]))
+                    except Exception:
+                        pass
+                continue
+            with self._lock:
+                waiter = self._events.get(req_id)
+                if waiter:
+                    self._pending[req_id] = resp
+            if waiter:
+                waiter[0].set()
+        proc.wait()
+        # wake up requests sent to this process that will never get a response.
+        with self._lock:
+            for req_id, (event, req_proc) in self._events.items():
+                if req_proc is proc and req_id not in self._pending:
+                    event.set()
+
+    def _write(self, proc: subprocess.Popen, msg: Dict[str, Any]) -> None:
+        # called with the lock held.
+        assert proc.stdin is not None
+        proc.stdin.write((json.dumps(msg) + "\n").encode("utf-8"))
+        proc.stdin.flush()
+
+    def _send(
+        self, req: Dict[str, Any], on_line: LineCallback | None = None, cancel: threading.Event | None = None
+    ) -> Dict[str, Any]:
+        with self._lock:
+            if self._proc is None or self._proc.poll() is not None:
+                try:
+                    self._proc = self._start()
+                except OSError as e:
+                    raise PipWorkerError(f"Unable to start pip worker: {e}") from e
+            proc = self._proc
+            self._next_id += 1
+            req_id = self._next_id
+            event = threading.Event()
+            self._events[req_id] = (event, proc)
+            if on_line:
+                self._callbacks[req_id] = on_line
+            try:
+                self._write(proc, {"id": req_id, **req, "stream": on_line is not None})
+            except OSError as e:
+                self._events.pop(req_id, None)
+                self._callbacks.pop(req_id, None)
+                raise PipWorkerError(f"Unable to send request to pip worker: {e}", proc.poll()) from e
+        if cancel is None:
+            event.wait()
+        else:
+            while not event.wait(0.1):
+                if cancel.is_set():
+                    with self._lock:
+                        self._next_id += 1
+                        try:
+                            self._write(proc, {"id": self._next_id, "cmd": "cancel", "target": req_id})
+                        except OSError:
+                            pass
+                    event.wait()
+        with self._lock:
+            self._events.pop(req_id, None)
+            self._callbacks.pop(req_id, None)
+            resp = self._pending.pop(req_id, None)
+        if resp is None:
+            raise PipWorkerError(
+                f"pip worker exited with code {proc.returncode} before responding", proc.returncode, started=True
+            )
+        return resp
+
+    def request(
+        self, req: Dict[str, Any], on_line: LineCallback | None = None, cancel: threading.Event | None = None
+    ) -> Dict[str, Any]:
+        """
+        Sends a request and waits for its response.
+
+        A request that is lost because the worker exited on idle timeout, before reading it, is sent again once.
+
+        Args:
+            req (Dict[str, Any]): Request such as ``{"cmd": "pip", "args": ["-V"]}``.
+            on_line (LineCallback, optional): Streams the output to this callback, called on the reader thread.
+                The response ``stdout`` and ``stderr`` are then empty.
+            cancel (threading.Event, optional): Stops the command when set.
+
+        Raises:
+            PipWorkerError: If the worker can not be started or exits before responding.
+
+        Returns:
+            Dict[str, Any]: Response with ``returncode``, ``stdout`` and ``stderr`` keys.
+        """
+        try:
+            return self._send(req, on_line, cancel)
+        except PipWorkerError as e:
+            # the worker exits with 0 only on idle timeout or when the client closes it.
+            if e.returncode != 0:
+                raise
+        return self._send(req, on_line, cancel)
+
+    def _to_completed(self, cmd: List[str], resp: Dict[str, Any]) -> subprocess.CompletedProcess:
+        return subprocess.CompletedProcess(
+            args=cmd,
+            returncode=int(resp.get("returncode", 1)),
+            stdout=str(resp.get("stdout", "")),
+            stderr=str(resp.get("stderr", "")),
+        )
+
+    def run_pip(
+        self,
+        args: Sequence[str],
+        env: Dict[str, str] | None = None,
+        on_line: LineCallback | None = None,
+        cancel: threading.Event | None = None,
+    ) -> subprocess.CompletedProcess:
+        """
+        Runs pip such as ``python -m pip <args>``.
+
+        Args:
+            args (Sequence[str]): pip arguments such as ``["install", "verr"]``.
+            env (Dict[str, str], optional): Environment of the command. Defaults to the worker environment.
+            on_line (LineCallback, optional): Streams the output to this callback instead of returning it.
+            cancel (threading.Event, optional): Stops the command when set.
+
+        Raises:
+            PipWorkerError: If the worker can not be started or exits before responding.
+
+        Returns:
+            subprocess.CompletedProcess: Result with text ``stdout`` and ``stderr``.
+        """
+        resp = self.request({"cmd": "pip", "args": list(args), "env": env}, on_line, cancel)
+        return self._to_completed([self._python_path, "-m", "pip", *args], resp)
+
+    def run_script(
+        self,
+        path: str | Path,
+        args: Sequence[str] = (),
+        env: Dict[str, str] | None = None,
+        on_line: LineCallback | None = None,
+        cancel: threading.Event | None = None,
+    ) -> subprocess.CompletedProcess:
+        """
+        Runs a python file such as ``python <path> <args>``.
+
+        Args:
+            path (str | Path): Python file such as ``get-pip.py``.
+            args (Sequence[str], optional): Arguments.
+            env (Dict[str, str], optional): Environment of the command. Defaults to the worker environment.
+            on_line (LineCallback, optional): Streams the output to this callback instead of returning it.
+            cancel (threading.Event, optional): Stops the command when set.
+
+        Raises:
+            PipWorkerError: If the worker can not be started or exits before responding.
+
+        Returns:
+            subprocess.CompletedProcess: Result with text ``stdout`` and ``stderr``.
+        """
+        resp = self.request({"cmd": "script", "path": str(path), "args": list(args), "env": env}, on_line, cancel)
+        return self._to_completed([self._python_path, str(path), *args], resp)
+
+    def run(
+        self,
+        cmd: Sequence[str],
+        env: Dict[str, str] | None = None,
+        on_line: LineCallback | None = None,
+        cancel: threading.Event | None = None,
+    ) -> subprocess.CompletedProcess:
+        """
+        Runs a pip command or python file of the worker interpreter.
+
+        Such as ``[python, "-m", "pip", "install", "verr"]`` or ``[python, "get-pip.py"]``.
+
+        Args:
+            cmd (Sequence[str]): Full command.
+            env (Dict[str, str], optional): Environment of the command. Defaults to the worker environment.
+            on_line (LineCallback, optional): Streams the output to this callback instead of returning it.
+            cancel (threading.Event, optional): Stops the command when set.
+
+        Raises:
+            ValueError: If the command is not a pip command or python file of the worker interpreter.
+            PipWorkerError: If the worker can not be started or exits before responding.
+
+        Returns:
+            subprocess.CompletedProcess: Result with text ``stdout`` and ``stderr``.
+        """
+        cmd = [str(c) for c in cmd]
+        if len(cmd) < 2 or cmd[0] != self._python_path:
+            raise ValueError(f"Not a command of {self._python_path}: {cmd}")
+        if cmd[1:3] == ["-m", "pip"]:
+            return self.run_pip(cmd[3:], env=env, on_line=on_line, cancel=cancel)
+        if cmd[1].endswith(".py") and os.path.isfile(cmd[1]):
+            return self.run_script(cmd[1], cmd[2:], env=env, on_line=on_line, cancel=cancel)
+        raise ValueError(f"Not a pip command or python file: {cmd}")
+
+    def close(self) -> None:
+        """Stops the worker. Running commands are finished first."""
+        with self._lock:
+            proc = self._proc
+            self._proc = None
+        if proc is None:
+            return
+        try:
+            if proc.stdin:
+                proc.stdin.close()
+            proc.wait(timeout=10)
+        except Exception:
+            proc.kill()
+
+    @property
+    def is_running(self) -> bool:
+        """Gets if the worker process is running."""
+        proc = self._proc
+        return proc is not None and proc.poll() is None
+
+    @property
+    def can_stream(self) -> bool:
+        """Gets if commands can stream their output and be cancelled. Forked and spawned commands both can."""
+        return True
+
+
+_WORKERS: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], PipWorker] = {}
+_WORKERS_LOCK = threading.Lock()
+
+
+def get_worker(
+    python_path: str | Path,
+    idle_timeout: float = 60.0,
+    startupinfo: Any = None,  # noqa: ANN401
+    env: Dict[str, str] | None = None,
+) -> PipWorker:
+    """
+    Gets the worker shared by all installers of this session for an interpreter and environment.
+
+    Args:
+        python_path (str | Path): Interpreter the worker runs with.
+        idle_timeout (float, optional): Seconds without a request before the worker exits. Defaults to ``60``.
+        startupinfo (Any, optional): ``subprocess.STARTUPINFO`` used on Windows to hide the console.
+        env (Dict[str, str], optional): Environment the worker is started with, such as the one of the installer.
+            Defaults to this environment.
+
+    Returns:
+        PipWorker: Shared worker.
+    """
+    key = (str(python_path), tuple(sorted(env.items())) if env else ())
+    with _WORKERS_LOCK:
+        worker = _WORKERS.get(key)
+        if worker is None:
+            worker = PipWorker(python_path, idle_timeout=idle_timeout, env=env, startupinfo=startupinfo)
+            _WORKERS[key] = worker
+        return worker
+
+
+def _kill(proc: subprocess.Popen) -> None:
+    # imported here, this module also runs as a script outside of the package.
+    from ..input_output.proc import kill_proc
+
+    try:
+        kill_proc(proc.pid)
+    except Exception:
+        proc.terminate()
+
+
+def _run_streamed(
+    cmd: List[str],
+    env: Dict[str, str] | None,
+    startupinfo: Any,  # noqa: ANN401
+    on_line: LineCallback,
+    cancel: threading.Event | None,
+) -> int:
+    env = dict(os.environ if env is None else env)
+    env["PYTHONUNBUFFERED"] = "1"
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        encoding="utf-8",
+        errors="replace",
+        text=True,
+        env=env,
+        startupinfo=startupinfo,
+        # own process group so cancelling also ends the processes pip starts such as build backends.
+        start_new_session=os.name != "nt",
+    )
+
+    def pump(name: str, f: IO[str]) -> None:
+        for line in f:
+            try:
+                on_line(name, line.rstrip("\r\n"))
+            except Exception:
+                pass
+
+    threads = [
+        threading.Thread(target=pump, args=("stdout", proc.stdout), daemon=True),
+        threading.Thread(target=pump, args=("stderr", proc.stderr), daemon=True),
+    ]
+    for t in threads:
+        t.start()
+    # a CancellationToken stops the process as soon as it is cancelled, a plain event is polled.
+    register_process = getattr(cancel, "register_process", None)
+    if register_process is not None:
+        unregister = register_process(proc.pid)
+        try:
+            proc.wait()
+        finally:
+            unregister()
+    else:
+        while True:
+            try:
+                proc.wait(timeout=0.1)
+                break
+            except subprocess.TimeoutExpired:
+                if cancel is not None and cancel.is_set():
+                    _kill(proc)
+                    cancel = None
+    for t in threads:
+        t.join()
+    return proc.returncode
+
+
+def run_cmd(
+    cmd: Sequence[str],
+    env: Dict[str, str] | None = None,
+    idle_timeout: float = 60.0,
+    startupinfo: Any = None,  # noqa: ANN401
+    on_line: LineCallback | None = None,
+    cancel: threading.Event | None = None,
+    max_lines: int = 1000,
+) -> subprocess.CompletedProcess:
+    """
+    Runs a command and waits for it to finish.
+
+    pip commands and python files run by the interpreter ``cmd[0]`` are sent to the shared worker of that interpreter
+    started with ``env``.
+    Other commands, or any command when the worker could not be started or did not receive it, are run with
+    ``subprocess``. A command is never run again after the worker received it, it may have changed packages
+    before the worker stopped. The result then has a non zero exit code and the error in ``stderr``.
+
+    When ``on_line`` is set the output is streamed line by line as the command runs and only the last
+    ``max_lines`` lines of each stream are kept for the result.
+
+    Args:
+        cmd (Sequence[str]): Full command such as ``[python, "-m", "pip", "install", "verr"]``.
+        env (Dict[str, str], optional): Environment of the command.
+        idle_timeout (float, optional): Seconds without a request before the worker exits. ``0`` to not use a worker.
+        startupinfo (Any, optional): ``subprocess.STARTUPINFO`` used on Windows to hide the console.
+        on_line (LineCallback, optional): Called with each line of output, from another thread.
+        cancel (threading.Event, optional): Stops the command when set. Only used with ``on_line``.
+        max_lines (int, optional): Lines of each stream kept when streaming. Defaults to ``1000``.
+
+    Returns:
+        subprocess.CompletedProcess: Result with text ``stdout`` and ``stderr``.
+    """
+    cmd = [str(c) for c in cmd]
+    tail = _Tail(on_line, max_lines) if on_line else None
+    if idle_timeout > 0 and cmd:
+        try:
+            worker = get_worker(cmd[0], idle_timeout, startupinfo, env)
+            result = worker.run(cmd, env=env, on_line=tail, cancel=cancel)
+            if tail:
+                result.stdout = tail.text("stdout")
+                result.stderr = tail.text("stderr")
+            return result
+        except ValueError:
+            pass
+        except PipWorkerError as e:
+            if e.started:
+                stdout = tail.text("stdout") if tail else ""
+                stderr = tail.text("stderr") if tail else ""
+                return subprocess.CompletedProcess(cmd, e.returncode or 1, stdout, f"{stderr}{e}\n")
+    if tail:
+        returncode = _run_streamed(cmd, env, startupinfo, tail, cancel)
+        return subprocess.CompletedProcess(cmd, returncode, tail.text("stdout"), tail.text("stderr"))
+    return subprocess.run(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        encoding="utf-8",
+        errors="replace",
+        text=True,
+        env=env,
+        startupinfo=startupinfo,
+    )
+
+
+# endregion Client
+
+
+if __name__ == "__main__":
+    # do not let the modules next to this file shadow the modules pip imports.
+    if sys.path and os.path.abspath(sys.path[0] or ".") == os.path.dirname(os.path.abspath(__file__)):
+        del sys.path[0]
+    _idle = 60.0
+    for _arg in sys.argv[1:]:
+        if _arg.startswith("--idle-timeout="):
+            _idle = float(_arg.split("=", 1)[1])
+    if "--serve" in sys.argv[1:]:
+        serve(_idle, use_fork="--no-fork" not in sys.argv[1:])
@@ -1,24 +1,37 @@
 from __future__ import annotations
 import os
 import sys
-import shutil
 import subprocess
-import glob
 import json
+import tempfile
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Set, Tuple
 
 
 # import pkg_resources
 import importlib.metadata
-from importlib.metadata import PackageNotFoundError, version
 from ...config import Config
+from ...events.args.event_args import EventArgs
+from ...events.lo_events import LoEvents
+from ...events.named_events.install_named_event import InstallNamedEvent
 from ...lo_util.resource_resolver import ResourceResolver
 from ...lo_util.target_path import TargetPath
 from ...oxt_logger import OxtLogger
-from ...ver.rules.ver_rules import VerRules, VerProto
+from ...thread.cancellation import CancellationToken, current_token
+from ...timing.phase_timer import StartupTimer
+from ...ver.rules.ver_rules import VerRules, VerSpec
+from ..dist_index import DistIndex, get_dependencies, normalize_name
 from ..download import Download
+from ..installed_files import InstalledFiles
+from ..pip_progress import format_event, parse_line
+from ..pip_worker import run_cmd
 from ..progress import Progress
+from ..progress_session import ProgressSession
+from ..record_tracker import RecordTracker, get_installed_names, merge_changes, new_changes, to_changes
+from ..shared_registry import SharedRegistry
+from ..uninstall_engine import UninstallEngine, UninstallManifest, UninstallReport
+from ..wheel_cache import WheelCache
+from ..wheelhouse import Wheelhouse
 from ..py_packages.packages import Packages
 
 
@@ -60,6 +73,12 @@ class InstallPkg:
         self._resource_resolver = ResourceResolver(ctx=self.ctx)
         self._target_path = TargetPath()
         self._no_pip_remove = self._config.no_pip_remove  # {"pip", "setuptools", "wheel"}
+        self._dist_index = DistIndex()
+        self._wheelhouse: Wheelhouse | None = None
+        # installs started in a KillableThread, or a token_scope, stop at the next package when it is cancelled.
+        self._cancel = current_token() or CancellationToken()
+        self._shared_registry: SharedRegistry | None = None
+        self._skipped_shared: Dict[str, List[str]] = {}
 
     def _get_logger(self) -> OxtLogger:
         return OxtLogger(log_name=__name__)
@@ -74,10 +93,7 @@ class InstallPkg:
         Returns:
             str: The version of the package or an empty string if the package is not installed.
         """
-        try:
-            return version(package_name)
-        except PackageNotFoundError:
-            return ""
+        return self._dist_index.get_version(package_name)
 
     def _cmd_pip(self, *args: str) -> List[str]:
         cmd: List[str] = [str(self._path_python), "-m", "pip", *args]
@@ -89,17 +105,16 @@ class InstallPkg:
             cmd.append(f"--log={log_file}")
         return cmd
 
-    def _install_pkg(self, pkg: str, ver: str, force: bool) -> bool:
+    def _get_install_args(self, pkg: str, force: bool) -> List[str]:
         """
-        Install a package.
+        Gets the pip ``install`` arguments, without the package, used to install a package.
 
         Args:
-            pkg (str): The name of the package to install.
-            ver (str): The version of the package to install.
+            pkg (str): The name of the package to install. Used to determine the install target.
             force (bool): Force install even if package is already installed.
 
         Returns:
-            bool: True if successful, False otherwise.
+            List[str]: Arguments such as ``["install", "--upgrade", "--user"]``.
         """
         auto_target = False
         if self.config.auto_install_in_site_packages:
@@ -125,6 +140,97 @@ class InstallPkg:
             cmd.append(f"--target={self._target_path.get_package_target(pkg)}")
         elif self.config.is_user_installed:
             cmd.append("--user")
+        return cmd
+
+    def _get_pkg_install_args(self, pkg: str, force: bool) -> List[str]:
+        """
+        Gets the pip ``install`` arguments, without the package, including the wheelhouse arguments when the package has been prefetched.
+
+        Args:
+            pkg (str): The name of the package to install.
+            force (bool): Force install even if package is already installed.
+
+        Returns:
+            List[str]: Arguments such as ``["install", "--upgrade", "--user", "--no-index", "--find-links=..."]``.
+        """
+        cmd = self._get_install_args(pkg, force)
+        if self._wheelhouse and self._wheelhouse.is_prefetched(pkg):
+            cmd.extend(self._wheelhouse.get_install_args())
+        return cmd
+
+    def _run_cmd(self, cmd: List[str]) -> subprocess.CompletedProcess:
+        """
+        Runs a command and waits for it to finish.
+
+        pip commands are run by the pip worker shared by the session unless ``pip_worker_idle_timeout`` is ``0``.
+
+        Args:
+            cmd (List[str]): Full command such as the result of ``_cmd_pip()``.
+
+        Returns:
+            subprocess.CompletedProcess: The completed process.
+        """
+        return run_cmd(
+            cmd,
+            env=self._get_env(),
+            idle_timeout=self.config.pip_worker_idle_timeout,
+            startupinfo=STARTUP_INFO,
+        )
+
+    def _on_pip_line(self, stream: str, line: str) -> None:
+        """Logs a line of streamed pip output and triggers ``InstallNamedEvent.PIP_PROGRESS`` when a phase starts."""
+        self._logger.debug("pip %s: %s", stream, line)
+        event = parse_line(line)
+        if event is None:
+            return
+        self._logger.info("pip %s", format_event(event))
+        event_args = EventArgs(self)
+        event_args.event_data = event
+        # progress is only reported, the pip output is not held up by the dialog.
+        LoEvents().trigger_async(InstallNamedEvent.PIP_PROGRESS, event_args)
+
+    def _run_pip(self, cmd: List[str]) -> subprocess.CompletedProcess:
+        """
+        Runs a pip command that changes installed packages and waits for it to finish.
+
+        The output is streamed to the log and parsed into ``InstallNamedEvent.PIP_PROGRESS`` events while pip runs.
+        The result only holds the last lines of output. The installed distribution index is invalidated when
+        the command finishes.
+
+        Args:
+            cmd (List[str]): Full command such as the result of ``_cmd_pip()``.
+
+        Returns:
+            subprocess.CompletedProcess: The completed process.
+        """
+        if self._cancel.is_cancelled:
+            self._logger.info("Install cancelled. Not running %s", cmd)
+            return subprocess.CompletedProcess(cmd, 1, "", "Install cancelled")
+        try:
+            return run_cmd(
+                cmd,
+                env=self._get_env(),
+                idle_timeout=self.config.pip_worker_idle_timeout,
+                startupinfo=STARTUP_INFO,
+                on_line=self._on_pip_line,
+                cancel=self._cancel,
+            )
+        finally:
+            self._dist_index.invalidate()
+
+    def _install_pkg(self, pkg: str, ver: str, force: bool) -> bool:
+        """
+        Install a package.
+
+        Args:
+            pkg (str): The name of the package to install.
+            ver (str): The version of the package to install.
+            force (bool): Force install even if package is already installed.
+
+        Returns:
+            bool: True if successful, False otherwise.
+        """
+        cmd = self._get_pkg_install_args(pkg, force)
 
         pkg_cmd = f"{pkg}{ver}" if ver else pkg
         cmd = self._cmd_pip(*[*cmd, pkg_cmd])
@@ -138,65 +244,13 @@ class InstallPkg:
             err_msg = f"Pip Install failed for: {pkg_cmd}"
 
         site_packages_dir = self._get_site_packages_dir(pkg)
-        if pkg in self.no_pip_remove:  # ignore pip
-            is_ignore = True
-            before_dirs = []
-            before_files = []
-            before_bin_files = []
-            before_lib_files = []
-            before_inc_files = []
-        else:
-            is_ignore = False
-            before_dirs = self._get_directory_names(site_packages_dir)
-            before_files = self._get_file_names(site_packages_dir)
-            before_bin_files = self._get_file_names(Path(site_packages_dir, "bin"))
-            before_lib_files = self._get_file_names(Path(site_packages_dir, "lib"))
-            before_inc_files = self._get_file_names(Path(site_packages_dir, "include"))
-
-        progress: Progress | None = None
-        if self._config.show_progress and self.show_progress:
-            # display a terminal window to show progress
-            self._logger.debug("Starting Progress Window")
-            msg = self.resource_resolver.resolve_string("msg08")
-            title = self.resource_resolver.resolve_string("title01") or self.config.lo_implementation_name
-            progress = Progress(start_msg=f"{msg}: {pkg}", title=title)
-            progress.start()
-        else:
-            self._logger.debug("Progress Window is disabled")
+        progress = self._start_progress(pkg)
 
-        process = subprocess.run(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            encoding="utf-8",
-            errors="replace",
-            text=True,
-            env=self._get_env(),
-            startupinfo=STARTUP_INFO,
-        )
+        process = self._run_pip(cmd)
 
         result = False
         if process.returncode == 0:
-            if not is_ignore:
-                self._delete_json_file(site_packages_dir, pkg)
-                after_dirs = self._get_directory_names(site_packages_dir)
-                after_files = self._get_file_names(site_packages_dir)
-                after_bin_files = self._get_file_names(Path(site_packages_dir, "bin"))
-                after_lib_files = self._get_file_names(Path(site_packages_dir, "lib"))
-                after_inc_files = self._get_file_names(Path(site_packages_dir, "include"))
-                changes = {
-                    "before_files": before_files,
-                    "before_dirs": before_dirs,
-                    "before_bin_files": before_bin_files,
-                    "before_lib_files": before_lib_files,
-                    "before_inc_files": before_inc_files,
-                    "after_files": after_files,
-                    "after_dirs": after_dirs,
-                    "after_bin_files": after_bin_files,
-                    "after_lib_files": after_lib_files,
-                    "after_inc_files": after_inc_files,
-                }
-                self._save_changed(pkg=pkg, pth=site_packages_dir, changes=changes)
+            self._save_changes(names=[pkg], pth=site_packages_dir, output=process.stdout)
             self._logger.info(msg)
             result = True
         else:
@@ -212,173 +266,310 @@ class InstallPkg:
 
         return result
 
-    def uninstall_pkg(self, pkg: str, target: str = "", remove_tracking_file: bool = False) -> bool:
+    def _install_pkg_batch(self, pkgs: Dict[str, str], force: bool) -> List[str]:
         """
-        Uninstall a package by manually removing its directory and dist-info folder from the target location.
+        Install several packages with a single pip call per install target.
+
+        Tracking files are still written per package. See ``_get_changes()``.
 
         Args:
-            pkg (str): The name of the package to uninstall.
-            target (str, optional): The target directory where the package is installed. Defaults to the extension target path.
-            remove_tracking_file (bool, optional): Remove the tracking file for the package. Defaults to False.
+            pkgs (Dict[str, str]): Package names as keys and pip version strings as values such as ``{"verr": ">=1.0.0"}``.
+            force (bool): Force install even if package is already installed.
 
         Returns:
-            bool: True if the package was uninstalled successfully, False otherwise.
+            List[str]: The names of the packages that were not installed. Empty list on success.
         """
-        if pkg in self.no_pip_remove:
-            self.log.debug("%s is in the no install list. Not Uninstalling and continuing.", pkg)
-            return True
+        # packages are grouped by the install arguments because on Windows isolated packages use another target.
+        groups: Dict[Tuple[str, ...], List[str]] = {}
+        for name in pkgs:
+            groups.setdefault(tuple(self._get_pkg_install_args(name, force)), []).append(name)
+
+        ProgressSession().add_steps(len(groups))
+        failed: List[str] = []
+        for args, names in groups.items():
+            if self._cancel.is_cancelled:
+                self._logger.info("Install cancelled. Not installing %s", ", ".join(names))
+                failed.extend(names)
+                continue
+            pkg_cmds = [f"{name}{pkgs[name]}" if pkgs[name] else name for name in names]
+            cmd = self._cmd_pip(*[*args, *pkg_cmds])
+            self._logger.debug(f"Running command {cmd}")
+            self._logger.info(f"Installing packages {', '.join(names)}")
 
-        def find_matching_files(directory: str, pattern: str) -> list:
-            search_pattern = os.path.join(directory, pattern)
-            return glob.glob(search_pattern)
+            site_packages_dir = self._get_site_packages_dir(names[0])
+            progress = self._start_progress(", ".join(names))
 
-        step = 1
-        self.log.debug(
-            "Attempting to uninstalling package via json package info for %s: Step %i",
-            pkg,
-            step,
-        )
-        site_packages_dir = self._get_site_packages_dir(pkg)
-        self._remove_changed(site_packages_dir, pkg)
+            process = self._run_pip(cmd)
 
-        if not target:
-            target = self._target_path.get_package_target(pkg)
-        if self.log.is_debug:
-            self.log.debug("uninstall_package() pkg: %s, target: %s", pkg, target)
-            if os.path.exists(target):
-                self.log.debug("uninstall_package() target: %s", target)
-            else:
-                self.log.debug("uninstall_package() target %s does not exist.", target)
+            if progress:
+                self._logger.debug("Ending Progress Window")
+                progress.kill()
 
-        package_dir = os.path.join(target, pkg)
-        self.log.debug("uninstall_package() package_dir: %s", package_dir)
-        dist_info_dir = self.find_dist_info(pkg, target)
-        self.log.debug("uninstall_package() dist_info_dir: %s", dist_info_dir)
+            if process.returncode != 0:
+                self._logger.error(f"Pip Install - Batch install failed for: {', '.join(pkg_cmds)}")
+                try:
+                    self._logger.error(process.stderr)
+                except Exception as err:
+                    self._logger.error("Error decoding stderr: %s", err)
+                failed.extend(names)
+                continue
 
-        success = True
-        step = 2
+            self._save_changes(names=names, pth=site_packages_dir, output=process.stdout)
+            self._logger.info(f"Pip Install - Batch install success for: {', '.join(pkg_cmds)}")
+        return failed
 
-        if dist_info_dir:
-            if os.path.exists(dist_info_dir):
-                try:
-                    shutil.rmtree(dist_info_dir)
-                    self.log.info(
-                        "uninstall_package() Successfully removed %s. Step %i",
-                        dist_info_dir,
-                        step,
-                    )
-                except Exception as e:
-                    self.log.exception(f"uninstall_package() Failed to remove {dist_info_dir}: {e}. Step {step}")
-                    success = False
-            else:
-                self.log.debug("uninstall_package() %s not found. Step %i", dist_info_dir, step)
-        else:
-            self.log.debug("uninstall_package() no dist-info found for %s. Step %i", pkg, step)
+    def _get_wheel_cache(self) -> WheelCache | None:
+        """Gets the wheel cache or ``None`` if the cache is disabled."""
+        if self.config.wheel_cache_size < 1:
+            return None
+        try:
+            return WheelCache(path=self.config.wheel_cache_dir, max_bytes=self.config.wheel_cache_size * 1024 * 1024)
+        except Exception as e:
+            self._logger.warning("Unable to use wheel cache: %s", e)
+        return None
 
-        step = 3
-        if not success:
-            self.log.error("uninstall_package() Incomplete removal for %s in step %i", pkg, step)
-            return False
+    def _update_wheel_cache(self, cache: WheelCache) -> None:
+        """Marks the cached files of installed packages as used and evicts the least recently used files."""
+        try:
+            installed = []
+            for entry in cache.entries():
+                if ver := self._dist_index.get_version(entry.name):
+                    installed.append((entry.name, ver))
+            cache.touch_installed(installed)
+            removed = cache.evict()
+            if removed:
+                self._logger.debug("Evicted %i files from wheel cache %s", len(removed), cache.path)
+        except Exception as e:
+            self._logger.warning("Unable to update wheel cache: %s", e)
+
+    def _prefetch(self, pkgs: Dict[str, str], pth: str, cache: WheelCache | None, workers: int) -> Wheelhouse:
+        """
+        Finds packages in the wheel cache and downloads the rest concurrently into a wheelhouse.
+
+        Args:
+            pkgs (Dict[str, str]): Package names as keys and pip version strings as values.
+            pth (str): Wheelhouse directory.
+            cache (WheelCache | None): Wheel cache. Downloaded files are added to the cache.
+            workers (int): Maximum number of concurrent downloads. ``0`` to not download.
 
-        if os.path.exists(package_dir):
+        Returns:
+            Wheelhouse: Wheelhouse. Packages that are not prefetched are installed from the index.
+        """
+        wheelhouse = Wheelhouse(
+            path=pth,
+            pip_cmd=self._cmd_pip(),
+            max_workers=workers,
+            run=self._run_cmd,
+            find_links=[cache.path] if cache else [],
+        )
+        if cache:
+            for name, ver in pkgs.items():
+                if entry := cache.find(name, ver):
+                    self._logger.debug("Found %s in wheel cache: %s", name, entry.path.name)
+                    wheelhouse.mark_prefetched(name)
+
+        missing = {name: ver for name, ver in pkgs.items() if not wheelhouse.is_prefetched(name)}
+        if not missing or workers < 1:
+            return wheelhouse
+
+        self._logger.info(f"Downloading packages {', '.join(missing)}")
+        failed = wheelhouse.prefetch(missing)
+        for name in failed:
+            self._logger.warning("Unable to download %s ahead of install. It will be installed from the index.", name)
+            self._logger.debug(wheelhouse.get_error(name))
+        if cache:
             try:
-                shutil.rmtree(package_dir)
-                self.log.info(
-                    "uninstall_package() Successfully removed %s from %s. Step %i",
-                    pkg,
-                    target,
-                    step,
-                )
+                cache.add_dir(pth)
             except Exception as e:
-                self.log.exception(
-                    "uninstall_package() Failed to remove %s from %s: %s. Step %i",
-                    pkg,
-                    target,
-                    e,
-                    step,
-                )
-                success = False
-        else:
-            self.log.debug("uninstall_package() %s not found in %s. Step %i", pkg, target, step)
+                self._logger.warning("Unable to add downloaded packages to wheel cache: %s", e)
+        return wheelhouse
 
-        # just in case there are multiple dist-info folders from previous bad uninstalls,
-        # we will remove all of them.
-        step = 4
-        if not success:
-            self.log.error("uninstall_package() Incomplete removal for %s in step %i", pkg, step)
-            return False
+    def _install_pkgs(self, pkgs: Dict[str, str], force: bool) -> bool:
+        """
+        Install packages.
 
-        patterns = (f"{pkg}-*.dist-info", f"{pkg.replace('-', '_')}*.dist-info")
-        for dist_info_pattern in patterns:
-            dist_info_dirs = find_matching_files(target, dist_info_pattern)
-            for dist_info_dir in dist_info_dirs:
-                if os.path.exists(dist_info_dir):
-                    try:
-                        shutil.rmtree(dist_info_dir)
-                        self.log.info(
-                            "uninstall_package() Successfully removed %s. Step %i",
-                            dist_info_dir,
-                            step,
-                        )
-                    except Exception as e:
-                        self.log.exception(
-                            "uninstall_package() Failed to remove %s: %s. Step %i",
-                            dist_info_dir,
-                            e,
-                            step,
-                        )
-                        success = False
-                else:
-                    self.log.debug("uninstall_package() %s not found. Step %i", dist_info_dir, step)
-            if self.log.is_debug:
-                self.log.debug(
-                    "uninstall_package() dist_info_dirs: %s. Step %i",
-                    dist_info_dirs,
-                    step,
-                )
-                if not dist_info_dirs:
-                    self.log.debug(
-                        "uninstall_package() dist_info_pattern: %s found no more dist-info folders. Step %i",
-                        dist_info_dir,
-                        step,
-                    )
+        Packages found in the wheel cache are installed from the cache.
+        When ``prefetch_workers`` is set, the other packages are first downloaded concurrently into a temporary wheelhouse.
+        Packages that fail to install from the cache or wheelhouse are installed from the index.
 
-        step = 5
-        if not success:
-            self.log.error("uninstall_package() Incomplete removal for %s in step %i", pkg, step)
-            return False
+        Args:
+            pkgs (Dict[str, str]): Package names as keys and pip version strings as values.
+            force (bool): Force install even if package is already installed.
 
-        if success and (pkg_dir := self.get_package_installation_dir(pkg)):
+        Returns:
+            bool: True if all packages were installed, False otherwise.
+        """
+        cache = self._get_wheel_cache()
+        workers = self.config.prefetch_workers if self.is_internet else 0
+        if cache is None and (workers < 1 or len(pkgs) < 2):
+            return not self._install_pending(pkgs, force)
+
+        with tempfile.TemporaryDirectory(prefix=f"{self.config.oxt_name}_wheelhouse_") as pth:
+            with StartupTimer().phase("prefetch", packages=list(pkgs)):
+                wheelhouse = self._prefetch(pkgs, pth, cache, workers)
+            self._wheelhouse = wheelhouse
             try:
-                shutil.rmtree(pkg_dir)
-                self.log.info(
-                    "uninstall_package() Successfully removed %s. Step %i",
-                    pkg_dir,
-                    step,
-                )
-            except Exception as e:
-                self.log.error(
-                    "uninstall_package() Failed to remove %s: %s. Not critical so will continue. Step %i",
-                    pkg_dir,
-                    e,
-                    step,
-                )
-                # this is not critical so we will continue
-        step = 6
-        if remove_tracking_file:
-            site_packages_dir = self._get_site_packages_dir(pkg)
-            self._delete_json_file(site_packages_dir, pkg)
-            self.log.info("uninstall_package() Removed tracking file for %s", pkg)
-            self.log.debug("uninstall_package() Removed tracking file for %s. Completed Step %i", pkg, step)
-        else:
-            self.log.debug("uninstall_package() Not removing tracking file for %s: skipping step %i", pkg, step)
+                failed = self._install_pending(pkgs, force)
+            finally:
+                self._wheelhouse = None
+
+        retry = [name for name in failed if wheelhouse.is_prefetched(name)]
+        if retry and self.is_internet:
+            self._logger.info("Installing %s from the index.", ", ".join(retry))
+            failed = [name for name in failed if name not in retry]
+            failed.extend(self._install_pending({name: pkgs[name] for name in retry}, force))
+        if cache:
+            self._update_wheel_cache(cache)
+        return not failed
+
+    def _install_pending(self, pkgs: Dict[str, str], force: bool) -> List[str]:
+        """
+        Install packages in a single batch when enabled, otherwise one at a time.
 
-        step = 7
-        if not success:
-            self.log.error("uninstall_package() Incomplete removal for %s in step %i", pkg, step)
-            return False
+        Packages of a batch that fails are installed one at a time.
+        Installing one at a time stops at the first package that fails.
 
-        return success
+        Args:
+            pkgs (Dict[str, str]): Package names as keys and pip version strings as values.
+            force (bool): Force install even if package is already installed.
+
+        Returns:
+            List[str]: The names of the packages that were not installed. Empty list on success.
+        """
+        timer = StartupTimer()
+        if self.config.batch_install and len(pkgs) > 1:
+            with timer.phase("install_batch", packages=list(pkgs)):
+                failed = self._install_pkg_batch(pkgs, force)
+            if not failed:
+                return []
+            if self._cancel.is_cancelled:
+                return failed
+            self._logger.warning("Batch install did not succeed. Installing %s one at a time.", ", ".join(failed))
+            pkgs = {name: pkgs[name] for name in failed}
+
+        names = list(pkgs)
+        ProgressSession().add_steps(len(names))
+        for i, name in enumerate(names):
+            if self._cancel.is_cancelled:
+                self._logger.info("Install cancelled. Not installing %s", ", ".join(names[i:]))
+                return names[i:]
+            with timer.phase("install_pkg", package=name):
+                result = self._install_pkg(name, pkgs[name], force)
+            if not result:
+                return names[i:]
+        return []
+
+    def _start_progress(self, name: str) -> Progress | None:
+        """Starts the progress window if it is enabled."""
+        if self._config.show_progress and self.show_progress:
+            # display a terminal window to show progress
+            self._logger.debug("Starting Progress Window")
+            msg = self.resource_resolver.resolve_string("msg08")
+            title = self.resource_resolver.resolve_string("title01") or self.config.lo_implementation_name
+            progress = Progress(start_msg=f"{msg}: {name}", title=title)
+            progress.start()
+            return progress
+        self._logger.debug("Progress Window is disabled")
+        return None
+
+    def uninstall_pkg(self, pkg: str, target: str = "", remove_tracking_file: bool = False) -> bool:
+        """
+        Uninstall a package by removing its files and dist-info folder from the target location.
+
+        Args:
+            pkg (str): The name of the package to uninstall.
+            target (str, optional): The target directory where the package is installed. Defaults to the extension target path.
+            remove_tracking_file (bool, optional): Remove the tracking file for the package. Defaults to False.
+
+        Returns:
+            bool: True if the package was uninstalled successfully, False otherwise.
+            Also True if the package was kept because other extensions need it, see :py:attr:`skipped_shared`.
+        """
+        if pkg in self.no_pip_remove:
+            self.log.debug("%s is in the no install list. Not Uninstalling and continuing.", pkg)
+            return True
+        if users := self._get_other_users(pkg):
+            self.log.info("%s is also required by %s. Not Uninstalling and continuing.", pkg, ", ".join(users))
+            self._skipped_shared[pkg] = users
+            return True
+        return self.uninstall_pkg_report(pkg=pkg, target=target, remove_tracking_file=remove_tracking_file).success
+
+    def uninstall_pkg_report(
+        self, pkg: str, target: str = "", remove_tracking_file: bool = False, dry_run: bool = False
+    ) -> UninstallReport:
+        """
+        Uninstall a package and get a report of what was removed.
+
+        Args:
+            pkg (str): The name of the package to uninstall.
+            target (str, optional): The target directory where the package is installed. Defaults to the extension target path.
+            remove_tracking_file (bool, optional): Remove the tracking file for the package. Defaults to False.
+            dry_run (bool, optional): Only report what would be removed. Defaults to False.
+
+        Returns:
+            UninstallReport: Removed files and directories and any errors.
+        """
+        try:
+            manifest = self.get_uninstall_manifest(pkg=pkg, target=target, remove_tracking_file=remove_tracking_file)
+            report = UninstallEngine(workers=self.config.uninstall_workers).run(manifest, dry_run=dry_run)
+        finally:
+            if not dry_run:
+                self._dist_index.invalidate()
+        self._log_uninstall_report(report)
+        return report
+
+    def get_uninstall_manifest(
+        self, pkg: str, target: str = "", remove_tracking_file: bool = False
+    ) -> UninstallManifest:
+        """
+        Gets the files and directories removed when a package is uninstalled.
+
+        The manifest is built from the tracking file written when the package was installed, the ``RECORD`` of the
+        package and any left over dist-info folders in the target directory, and the package directory.
+
+        Args:
+            pkg (str): The name of the package.
+            target (str, optional): The target directory where the package is installed. Defaults to the extension target path.
+            remove_tracking_file (bool, optional): Include the tracking file for the package. Defaults to False.
+
+        Returns:
+            UninstallManifest: Manifest.
+        """
+        site_packages_dir = self._get_site_packages_dir(pkg)
+        if not target:
+            target = site_packages_dir
+        manifest = UninstallManifest(pkg)
+        if os.path.isdir(site_packages_dir):
+            data = self._get_json_data(site_packages_dir, pkg).get("data", {})
+            manifest.add_tracking(site_packages_dir, data)
+            if remove_tracking_file:
+                manifest.add_file(site_packages_dir, f"{self._config.lo_implementation_name}_{pkg}.json")
+            manifest.add_tree(site_packages_dir, pkg.replace("-", "_"))
+            # dependencies in the tracking data may also be needed by the requirements of other extensions.
+            for name in set().union(*self._get_other_dependencies(site_packages_dir).values()):
+                manifest.keep_record(site_packages_dir, name)
+        if os.path.isdir(target):
+            manifest.add_record(target, pkg)
+            if target != site_packages_dir:
+                manifest.add_tree(target, pkg.replace("-", "_"))
+        if self.log.is_debug:
+            self.log.debug("get_uninstall_manifest() pkg: %s, target: %s, entries: %i", pkg, target, len(manifest))
+        return manifest
+
+    def _log_uninstall_report(self, report: UninstallReport) -> None:
+        action = "Would remove" if report.dry_run else "Removed"
+        self.log.info(
+            "uninstall_package() %s %i files and %i directories of %s in %.2f seconds",
+            action,
+            len(report.files),
+            len(report.dirs),
+            report.package,
+            report.duration,
+        )
+        for pth, err in report.errors:
+            self.log.error("uninstall_package() Failed to remove %s: %s", pth, err)
+        if not report.success:
+            self.log.error("uninstall_package() Incomplete removal for %s", report.package)
 
     def _get_env(self) -> Dict[str, str]:
         """
@@ -406,11 +597,13 @@ class InstallPkg:
         """
         self._logger.info("Installing packages…")
 
+        own: Dict[str, str] | None = None
         if req is None:
             packages = Packages()
 
-            req = self._config.requirements.copy()
-            req.update(packages.to_dict())
+            own = self._config.requirements.copy()
+            own.update(packages.to_dict())
+            req = self.share_requirements(own)
         else:
             self._logger.debug("Using requirements from parameter.")
 
@@ -418,19 +611,38 @@ class InstallPkg:
             self._logger.warning("No packages to install.")
             return False
 
-        result = True
+        result = self._install_req(req, force)
+        if not result and own is not None and req != own and not self._cancel.is_cancelled:
+            # a constraint of another extension may conflict with this one.
+            self._logger.warning("Requirements shared with other extensions were not installed. Installing own only.")
+            result = self._install_req(own, force)
+        self._logger.info("Installing packages Done!")
+        return result
+
+    def _install_req(self, req: Dict[str, str], force: bool) -> bool:
+        """
+        Install the packages of ``req`` that are not already installed or do not meet requirements.
+
+        Args:
+            req (Dict[str, str]): Package names as keys and version strings as values.
+            force (bool): Force install even if package is already installed.
+
+        Returns:
+            bool: True if all packages are installed successful, False otherwise.
+        """
+        pending: Dict[str, str] = {}
         for name, ver in req.items():
-            valid, rules = self._is_valid_version(name, ver, force)
+            valid, spec = self._is_valid_version(name, ver, force)
             if force:
                 valid = 0
             if valid == 1:
                 continue
 
-            if not self.is_internet:
-                self._logger.error("No internet connection!")
+            ver_lst: List[str] = list(spec.versions_str)
+            if not self.is_internet and not self._is_cached(name, ",".join(ver_lst)):
+                self._logger.error("No internet connection and %s is not in the wheel cache!", name)
                 break
 
-            ver_lst: List[str] = [rule.get_versions_str() for rule in rules]
             if self.config.uninstall_on_update:
                 pkg_ver = self.get_package_version(name)
                 if pkg_ver:
@@ -460,9 +672,85 @@ class InstallPkg:
                                 e,
                             )
                             return False
-            result = result and self._install_pkg(name, ",".join(ver_lst), force)
-        self._logger.info("Installing packages Done!")
-        return result
+            pending[name] = ",".join(ver_lst)
+
+        return self._install_pkgs(pending, force) if pending else True
+
+    # region Shared requirements
+    def share_requirements(self, req: Dict[str, str]) -> Dict[str, str]:
+        """
+        Records the requirements of this extension and gets the requirements of every extension that installs
+        packages to the same site-packages.
+
+        Requirements of a package needed by several extensions are combined so one install satisfies all of them.
+        Extensions that are no longer installed are removed from the record.
+        Packages installed to another target, such as ``isolate_windows`` packages, are not shared.
+
+        Args:
+            req (Dict[str, str]): Requirements of this extension.
+
+        Returns:
+            Dict[str, str]: Requirements to install. ``req`` if ``share_requirements`` is off or on error.
+        """
+        registry = self._get_shared_registry()
+        if registry is None:
+            return req
+        ext_id = self.config.lo_identifier
+        site = self.config.site_packages
+        try:
+            shared = {name: ver for name, ver in req.items() if self._get_site_packages_dir(name) == site}
+            registry.register(ext_id, site, shared)
+            if self._is_extension_installed(ext_id):
+                # when the extension manager cannot be queried nothing is known to be uninstalled.
+                for removed in registry.prune(self._is_extension_installed, keep=ext_id):
+                    self._logger.info("Extension %s is no longer installed. Removed its shared requirements.", removed)
+            combined = dict(req)
+            combined.update(registry.get_combined(site, first=ext_id))
+        except Exception as e:
+            self._logger.warning("Unable to share requirements with other extensions: %s", e)
+            return req
+        if others := [name for name in combined if name not in req]:
+            self._logger.info("Also installing %s required by other extensions.", ", ".join(others))
+        return combined
+
+    def _get_shared_registry(self) -> SharedRegistry | None:
+        """Gets the record of the requirements of all extensions or ``None`` if ``share_requirements`` is off."""
+        if not self.config.share_requirements or not self.config.site_packages:
+            return None
+        if self._shared_registry is None:
+            try:
+                self._shared_registry = SharedRegistry(self.config.shared_requirements_file)
+            except Exception as e:
+                self._logger.warning("Unable to read shared requirements: %s", e)
+        return self._shared_registry
+
+    def _get_other_dependencies(self, site: str) -> Dict[str, Set[str]]:
+        """
+        Gets the packages each other extension that installs to ``site`` needs, its requirements and everything
+        they depend on.
+        """
+        registry = self._get_shared_registry()
+        if registry is None or site != self.config.site_packages:
+            return {}
+        ext_id = self.config.lo_identifier
+        # another extension may have registered since the registry was read.
+        registry.reload()
+        return {
+            user: get_dependencies(names, site)
+            for user, names in registry.get_requirements(site).items()
+            if user != ext_id
+        }
+
+    def _get_other_users(self, pkg: str) -> List[str]:
+        """Gets the other extensions that need a package installed in the same site-packages, directly or not."""
+        key = normalize_name(pkg)
+        others = self._get_other_dependencies(self._get_site_packages_dir(pkg))
+        return sorted(user for user, names in others.items() if key in names)
+
+    def _is_extension_installed(self, ext_id: str) -> bool:
+        return bool(self.config.extension_info.get_extension_loc(ext_id))
+
+    # endregion Shared requirements
 
     def install_file(self, pth: str | Path, force: bool = False) -> bool:
         """
@@ -483,11 +771,31 @@ class InstallPkg:
             self._logger.error(f"Cannot install File. Does not exist: {pth}")
             return False
 
-        result = self._install_pkg(pkg=str(pth), ver="", force=force)
+        result = False
+        cache = self._get_wheel_cache()
+        if cache:
+            # dependencies of the file are installed from the wheel cache when possible.
+            self._wheelhouse = Wheelhouse(path=cache.path, pip_cmd=self._cmd_pip(), find_links=[cache.path])
+            self._wheelhouse.mark_prefetched(str(pth))
+            try:
+                result = self._install_pkg(pkg=str(pth), ver="", force=force)
+            finally:
+                self._wheelhouse = None
+            if not result and self.is_internet:
+                self._logger.info(f"Installing file package {pth.name} dependencies from the index.")
+        if not result and (cache is None or self.is_internet):
+            result = self._install_pkg(pkg=str(pth), ver="", force=force)
+        if cache:
+            self._update_wheel_cache(cache)
         self._logger.info(f"Install file package {pth.name} Done!")
         return result
 
-    def _is_valid_version(self, name: str, ver: str, force: bool) -> Tuple[int, List[VerProto]]:
+    def _is_cached(self, name: str, ver: str) -> bool:
+        """Gets if a package that meets the version constraint is in the wheel cache."""
+        cache = self._get_wheel_cache()
+        return bool(cache and cache.find(name, ver))
+
+    def _is_valid_version(self, name: str, ver: str, force: bool) -> Tuple[int, VerSpec]:
         """
         Check if the version of the package is valid.
 
@@ -497,34 +805,33 @@ class InstallPkg:
             force (bool, optional): Force the package to install even if it is already installed. Defaults to False.
 
         Returns:
-            Tuple[int, List[VerProto]]: int is 0 if valid, 1 if not valid, -1 if not installed
+            Tuple[int, VerSpec]: int is 0 if valid, 1 if not valid, -1 if not installed. VerSpec is the compiled constraint for ``ver``.
         """
         if not ver:
             # set default version to >=0.0.0
             ver = "==*"
         pkg_ver = self.get_package_version(name)
-        rules = self._ver_rules.get_matched_rules(ver)
+        spec = self._ver_rules.compile(ver)
         if not pkg_ver:
             self._logger.debug("Package %s not installed. Setting Install flags.", name)
-            return 0, rules
+            return 0, spec
 
         self._logger.debug("Found Package %s %s already installed ...", name, pkg_ver)
-        if not rules:
+        if not spec:
             if pkg_ver:
                 self._logger.info("Package %s %s already installed, no rules", name, pkg_ver)
             else:
                 self._logger.error("Unable to Install. Unable to find rules for %s %s", name, ver)
-            return 1, rules
+            return 1, spec
 
-        rules_pass = self._ver_rules.get_installed_is_valid_by_rules(rules=rules, check_version=pkg_ver)
-        if not rules_pass:
+        if not spec.is_valid(pkg_ver):
             self._logger.info(
                 "Package %s %s already installed. It does not meet requirements specified by: %s, but will be upgraded.",
                 name,
                 pkg_ver,
                 ver,
             )
-            return 0, rules
+            return 0, spec
         if not force:
             self._logger.info(
                 "Package %s %s already installed; However, it does not need to be installed to meet constraints: %s. It will be skipped.",
@@ -532,7 +839,7 @@ class InstallPkg:
                 pkg_ver,
                 ver,
             )
-        return 1, rules
+        return 1, spec
 
     def find_dist_info(self, pkg: str, target: str) -> str:
         """
@@ -550,17 +857,15 @@ class InstallPkg:
         def convert_to_local(pth: Path) -> Path:
             return Path(target, pth.name)
 
-        try:
-            dist = importlib.metadata.distribution(pkg)
-            location = dist.locate_file("")
-            dist_info_folder = f"{pkg.replace('-', '_')}-{dist.version}.dist-info"
-            dist_info_path = Path(str(location), dist_info_folder)
-            dist_info_path = convert_to_local(dist_info_path)
-            if dist_info_path.exists():
-                return str(dist_info_path)
-            return ""
-        except importlib.metadata.PackageNotFoundError:
+        dist = self._dist_index.get(pkg)
+        if dist is None:
             return ""
+        dist_info_folder = f"{pkg.replace('-', '_')}-{dist.version}.dist-info"
+        dist_info_path = Path(dist.location, dist_info_folder)
+        dist_info_path = convert_to_local(dist_info_path)
+        if dist_info_path.exists():
+            return str(dist_info_path)
+        return ""
 
     def get_package_installation_dir(self, pkg: str) -> str:
         """
@@ -585,57 +890,69 @@ class InstallPkg:
         """Get the site-packages directory."""
         return self._target_path.get_package_target(pkg)
 
-    def _get_file_names(self, path: str | Path) -> List[str]:
-        # only get the file names in the specified path
+    def _get_changes(self, names: List[str], pth: str, output: str) -> Dict[str, Dict[str, List[str]]]:
+        """
+        Gets the tracking data of installed packages from the ``RECORD`` of the distributions pip reports as installed.
 
-        pth = Path(path) if isinstance(path, str) else path
-        if not pth.exists():
-            return []
-        str_pth = str(pth)
-        return [name for name in os.listdir(str_pth) if os.path.isfile(os.path.join(str_pth, name))]
-
-    def _get_directory_names(self, path: str) -> List[str]:
-        """Get the directory names in the specified path."""
-        omits = {"bin", "lib", "include", "__pycache__"}
-        return [name for name in os.listdir(path) if name not in omits and os.path.isdir(os.path.join(path, name))]
-
-    def _save_changed(
-        self,
-        pkg: str,
-        pth: str,
-        changes: dict,
-        # before_files: List[str],
-        # before_bin_files: List[str],
-        # after_files: List[str],
-        # after_bin_files: List[str],
-        # before_dirs: List[str],
-        # after_dirs: List[str],
-    ) -> None:
-        """Save the new directory names to a JSON file."""
+        Each distribution is attributed to the package of the same name. Anything left over, such as dependencies,
+        is attributed to the first package, the same package that would have pulled it in when installing one
+        at a time.
+        Packages in ``no_pip_remove`` are not tracked. The files of all installed distributions are added to
+        ``InstalledFiles`` for the post install steps.
 
-        def _create_json() -> str:
-            """Create a JSON file with the file names."""
-            after_dirs: List[str] = changes.get("after_dirs", [])
-            before_dirs: List[str] = changes.get("before_dirs", [])
+        Args:
+            names (List[str]): The names of the packages installed by the pip command.
+            pth (str): The site-packages directory.
+            output (str): pip ``stdout``.
 
-            after_files: List[str] = changes.get("after_files", [])
-            before_files: List[str] = changes.get("before_files", [])
+        Returns:
+            Dict[str, Dict[str, List[str]]]: Tracking data of each tracked package.
+        """
+        tracked = [name for name in names if name not in self.no_pip_remove]
+        results = {name: new_changes() for name in tracked}
+        owners = {normalize_name(name): name for name in tracked}
+        ignored = {normalize_name(name) for name in names if name in self.no_pip_remove}
+        tracker = RecordTracker(pth)
+        for dist in get_installed_names(output):
+            files = tracker.get_files(dist)
+            InstalledFiles().add(pth, files)
+            key = normalize_name(dist)
+            if not tracked or key in ignored:
+                continue
+            changes = to_changes(files)
+            if not any(changes.values()):
+                self._logger.debug("_get_changes() No RECORD found for %s in %s", dist, pth)
+                continue
+            merge_changes(results[owners.get(key, tracked[0])], changes)
+        return results
 
-            after_bin_files: List[str] = changes.get("after_bin_files", [])
-            before_bin_files: List[str] = changes.get("before_bin_files", [])
+    def _save_changes(self, names: List[str], pth: str, output: str) -> None:
+        """
+        Save the tracking JSON file for each package installed by a pip command.
 
-            after_lib_files: List[str] = changes.get("after_lib_files", [])
-            before_lib_files: List[str] = changes.get("before_lib_files", [])
+        Args:
+            names (List[str]): The names of the packages installed by the pip command.
+            pth (str): The site-packages directory.
+            output (str): pip ``stdout``.
+        """
+        with StartupTimer().phase("track_changes", packages=len(names)):
+            for name, changes in self._get_changes(names=names, pth=pth, output=output or "").items():
+                self._delete_json_file(pth, name)
+                self._save_changed(pkg=name, pth=pth, changes=changes)
 
-            after_inc_files: List[str] = changes.get("after_inc_files", [])
-            before_inc_files: List[str] = changes.get("before_inc_files", [])
+    def _save_changed(self, pkg: str, pth: str, changes: Dict[str, List[str]]) -> None:
+        """
+        Save the new directory and file names to a JSON file.
 
-            new_dirs = list(set(after_dirs) - set(before_dirs))
-            new_files = list(set(after_files) - set(before_files))
-            new_bin_files = list(set(after_bin_files) - set(before_bin_files))
-            new_lib_files = list(set(after_lib_files) - set(before_lib_files))
-            new_inc_files = list(set(after_inc_files) - set(before_inc_files))
+        Args:
+            pkg (str): The name of the package.
+            pth (str): The site-packages directory.
+            changes (Dict[str, List[str]]): Tracking data with ``new_dirs``, ``new_files``, ``new_bin_files``,
+                ``new_lib_files`` and ``new_inc_files`` keys.
+        """
 
+        def _create_json() -> str:
+            """Create a JSON file with the file names."""
             try:
                 pkg_version = self.get_package_version(pkg)
             except Exception as e:
@@ -649,11 +966,11 @@ class InstallPkg:
                 "package_version": pkg_version,
                 "version": self._config.extension_version,
                 "data": {
-                    "new_dirs": new_dirs,
-                    "new_files": new_files,
-                    "new_bin_files": new_bin_files,
-                    "new_lib_files": new_lib_files,
-                    "new_inc_files": new_inc_files,
+                    "new_dirs": changes.get("new_dirs", []),
+                    "new_files": changes.get("new_files", []),
+                    "new_bin_files": changes.get("new_bin_files", []),
+                    "new_lib_files": changes.get("new_lib_files", []),
+                    "new_inc_files": changes.get("new_inc_files", []),
                 },
             }
             return json.dumps(data, indent=4)
@@ -688,82 +1005,17 @@ class InstallPkg:
 
         return j_contents
 
-    # check and see if there are any directories and files that need to be removed. Us the Json file to get the data
-    def _remove_changed(self, pth: str, pkg: str) -> None:
-        """Remove the new directories and files."""
-        data_dict = self._get_json_data(pth, pkg)
-        data: Dict[str, str] = data_dict.get("data", {})
-        new_dirs = set(data.get("new_dirs", []))
-        if "bin" in new_dirs:
-            new_dirs.remove("bin")
-
-        for d in new_dirs:
-            dir_path = os.path.join(pth, d)
-            try:
-                if os.path.exists(dir_path):
-                    shutil.rmtree(dir_path)
-                    self._logger.debug("_remove_changed() Removed directory: %s", d)
-                else:
-                    self._logger.debug("_remove_changed() Directory %s does not exist.", d)
-            except Exception as e:
-                self._logger.error("_remove_changed() Error removing directory %s: %s", d, e)
-
-        new_files = data.get("new_files", [])
-        for f in new_files:
-            file_path = Path(pth, f)
-            try:
-                if os.path.exists(file_path):
-                    file_path.unlink()
-                    self._logger.debug("_remove_changed() Removed file: %s", f)
-                else:
-                    self._logger.debug("_remove_changed() File %s does not exist.", f)
-            except Exception as e:
-                self._logger.error("_remove_changed() Error removing file %s: %s", f, e)
-
-        new_files = data.get("new_bin_files", [])
-        for f in new_files:
-            file_path = Path(pth, "bin", f)
-            try:
-                if file_path.exists():
-                    file_path.unlink()
-                    self._logger.debug("_remove_changed() Removed file from bin: %s", f)
-                else:
-                    self._logger.debug("_remove_changed() File %s does not exist in bin.", f)
-            except Exception as e:
-                self._logger.error("_remove_changed() Error removing file %s from bin: %s", f, e)
-
-        new_files = data.get("new_lib_files", [])
-        for f in new_files:
-            file_path = Path(pth, "lib", f)
-            try:
-                if file_path.exists():
-                    file_path.unlink()
-                    self._logger.debug("_remove_changed() Removed file from lib: %s", f)
-                else:
-                    self._logger.debug("_remove_changed() File %s does not exist in lib.", f)
-            except Exception as e:
-                self._logger.error("_remove_changed() Error removing file %s from lib: %s", f, e)
-
-        new_files = data.get("new_inc_files", [])
-        for f in new_files:
-            file_path = Path(pth, "include", f)
-            try:
-                if file_path.exists():
-                    file_path.unlink()
-                    self._logger.debug("_remove_changed() Removed file from include: %s", f)
-                else:
-                    self._logger.debug("_remove_changed() File %s does not exist in include.", f)
-            except Exception as e:
-                self._logger.error("_remove_changed() Error removing file %s from include: %s", f, e)
-
-        self._logger.info("_remove_changed() Removed new directories and files.")
-
     # endregion Json directory methods
 
     @property
     def config(self) -> Config:
         return self._config
 
+    @property
+    def skipped_shared(self) -> Dict[str, List[str]]:
+        """Gets the packages that were not uninstalled because other extensions need them, with those extensions."""
+        return self._skipped_shared
+
     @property
     def is_internet(self) -> bool:
         """Gets if there is an internet connection."""
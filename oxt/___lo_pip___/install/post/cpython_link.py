@@ -6,26 +6,33 @@ This class creates symlinks for all .so files in site-packages that match the cu
 
 For example a file named ``indexers.cpython-38-x86_64-linux-gnu.so`` would be symlinked to ``indexers.cpython-3.8.so``.
 This renaming allows the python interpreter to find the import.
+
+The first run scans all of site-packages and records the links it creates in a manifest.
+Later runs only link the files added by the installs of the session, see :py:class:`~..installed_files.InstalledFiles`.
 """
 
 from __future__ import annotations
-from typing import List
+from typing import Iterable, List
 from pathlib import Path
 from importlib import machinery
 import logging
+import os
 from ...config import Config
 from ...oxt_logger import OxtLogger
+from .link_scan import LinkManifest, get_file_suffix, scan_files
 
 
 class CPythonLink:
-    def __init__(self, overwrite: bool = False) -> None:
+    def __init__(self, overwrite: bool = False, workers: int = 4) -> None:
         """
         Constructor
 
         Args:
             overwrite (bool, optional): Override any existing sys links. Defaults to False.
+            workers (int, optional): Number of threads used when site-packages is scanned. Defaults to 4.
         """
         self._overwrite = overwrite
+        self._workers = workers
         self._logger = OxtLogger(log_name=self.__class__.__name__)
         self._current_suffix = self._get_current_suffix()
         self._logger.debug("CPythonLink.__init__")
@@ -33,9 +40,13 @@ class CPythonLink:
         self._config = Config()
         self._site_packages: Path | None = None
         self._file_suffix = ""
+        self._manifest = LinkManifest(
+            Path(self._config.session.user_profile, f"{self._config.lo_implementation_name}_cpython_links.json")
+        )
         if self._config.site_packages:
             self._site_packages = Path(self._config.site_packages)
-            self._file_suffix = self._find_current_installed_suffix(self._site_packages)
+            if self.has_manifest:
+                self._file_suffix = self._manifest.file_suffix
         self._logger.debug("CPythonLink.__init__ done")
 
     def _get_current_suffix(self) -> str:
@@ -58,9 +69,6 @@ class CPythonLink:
         count = suffix.count("-")
         return count <= 1
 
-    def _get_all_files(self, path: Path) -> List[Path]:
-        return [p for p in path.glob(f"**/*{self._file_suffix}.so") if p.is_file()]
-
     def _create_symlink(self, src: Path, dst: Path) -> None:
         log = self._config.log_level <= logging.DEBUG
         if dst.is_symlink():
@@ -87,44 +95,73 @@ class CPythonLink:
             str: suffix if found, otherwise empty string.
         """
         return next(
-            (str(p).rsplit(".", 2)[1] for p in path.glob("**/*.cpython-*.so") if not p.is_symlink()),
+            (suffix for p in scan_files(path, ".so", self._workers) if (suffix := get_file_suffix(p.name))),
             "",
         )
 
-    def link(self) -> None:
+    def _get_new_files(self, files: Iterable[str | Path]) -> List[Path]:
+        """Gets the ``.so`` files in site-packages of the files added by an install."""
+        assert self._site_packages is not None
+        root = Path(os.path.abspath(self._site_packages))
+        results: List[Path] = []
+        for f in files:
+            pth = Path(os.path.abspath(f))
+            if pth.name.endswith(".so") and root in pth.parents:
+                results.append(pth)
+        return results
+
+    def link(self, files: Iterable[str | Path] | None = None) -> None:
         """
-        Creates symlinks for all .so files in site-packages that match the current suffix.
+        Creates symlinks for .so files in site-packages that match the current suffix.
+
+        Args:
+            files (Iterable[str | Path], optional): Files added since the last run, such as those of ``InstalledFiles``.
+                Only these are linked when the manifest of an earlier full scan matches
+                and ``overwrite`` is ``False``. Otherwise all of site-packages is scanned.
         """
         self._logger.debug("CPythonLink.link starting")
         if not self._site_packages:
             self._logger.debug("No site-packages found")
             return
-        if not self._file_suffix:
-            self._logger.debug("No current file suffix found")
-            return
         if not self._site_packages.exists():
             self._logger.debug(f"Site-packages does not exist {self._site_packages}")
             return
+        if files is not None and self.has_manifest and not self._overwrite:
+            candidates = self._get_new_files(files)
+            self._logger.debug(f"Linking {len(candidates)} new files")
+        else:
+            self._logger.debug(f"Scanning {self._site_packages}")
+            candidates = scan_files(self._site_packages, ".so", self._workers)
+            self._file_suffix = next(
+                (suffix for p in candidates if not p.is_symlink() and (suffix := get_file_suffix(p.name))), ""
+            )
+            self._manifest.reset(self._site_packages, self._file_suffix, self._current_suffix)
+        if not self._file_suffix:
+            self._logger.debug("No current file suffix found")
+            return
         self._logger.debug(f"Python current suffix: {self._current_suffix}")
         self._logger.debug(f"Found file suffix: {self._file_suffix}")
-        files = self._get_all_files(self._site_packages)
-        if not files:
-            self._logger.debug(f"No files found in {self._site_packages}")
-            return
         cp_old = self._file_suffix
         cp_new = self._current_suffix
         if cp_old == cp_new:
             self._logger.debug(f"Suffixes match, no need to link: {cp_old} == {cp_new}")
+            self._manifest.save()
             return
 
-        for file in files:
+        links: List[Path] = []
+        for file in candidates:
+            if not file.name.endswith(f".{cp_old}.so") or file.is_symlink():
+                continue
             ln_name = file.name.replace(cp_old, cp_new)
             src = file
             if not src.is_absolute():
                 src = file.resolve()
             dst = src.parent / ln_name
             self._create_symlink(src, dst)
-        self._logger.debug("CPythonLink.link done")
+            links.append(dst)
+        self._manifest.add(links)
+        self._manifest.save()
+        self._logger.debug(f"CPythonLink.link done. {len(links)} links")
 
     # region Properties
     @property
@@ -153,6 +190,13 @@ class CPythonLink:
     @property
     def file_suffix(self) -> str:
         """Current Suffix such as ``cpython-38-x86_64-linux-gnu``"""
+        if not self._file_suffix and self._site_packages:
+            self._file_suffix = self._find_current_installed_suffix(self._site_packages)
         return self._file_suffix
 
+    @property
+    def has_manifest(self) -> bool:
+        """Gets if a full scan of site-packages has already been done for the current suffix."""
+        return self._site_packages is not None and self._manifest.is_match(self._site_packages, self._current_suffix)
+
     # endregion Properties
@@ -0,0 +1,149 @@
+"""
+Finding the extension modules that :py:class:`~.cpython_link.CPythonLink` links and remembering the links it created.
+
+A full scan of site-packages walks the top level directories concurrently with ``os.scandir``.
+The :py:class:`LinkManifest` records the suffixes and links of earlier runs so later runs only need the
+files added by an install.
+"""
+
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Set
+import json
+import os
+
+
+def get_file_suffix(name: str) -> str:
+    """
+    Gets the cpython suffix of an extension module file name.
+
+    Args:
+        name (str): File name such as ``indexers.cpython-38-x86_64-linux-gnu.so``.
+
+    Returns:
+        str: Suffix such as ``cpython-38-x86_64-linux-gnu`` or empty string if ``name`` has no cpython suffix.
+    """
+    parts = name.rsplit(".", 2)
+    if len(parts) == 3 and parts[2] == "so" and parts[1].startswith("cpython-"):
+        return parts[1]
+    return ""
+
+
+def _walk(top: str, suffix: str) -> List[str]:
+    results: List[str] = []
+    stack = [top]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.endswith(suffix) and entry.is_file(follow_symlinks=False):
+                            results.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return results
+
+
+def scan_files(root: str | Path, suffix: str, workers: int = 4) -> List[Path]:
+    """
+    Finds the files under a directory whose name ends with a suffix. Symbolic links are neither followed nor returned.
+
+    Args:
+        root (str | Path): Directory such as site-packages.
+        suffix (str): File name suffix such as ``.so``.
+        workers (int, optional): Number of threads walking the top level directories. Defaults to ``4``.
+
+    Returns:
+        List[Path]: Files, sorted.
+    """
+    results: List[str] = []
+    dirs: List[str] = []
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append(entry.path)
+                    elif entry.name.endswith(suffix) and entry.is_file(follow_symlinks=False):
+                        results.append(entry.path)
+                except OSError:
+                    continue
+    except OSError:
+        return []
+    if workers > 1 and len(dirs) > 1:
+        with ThreadPoolExecutor(max_workers=min(workers, len(dirs))) as executor:
+            for found in executor.map(lambda d: _walk(d, suffix), dirs):
+                results.extend(found)
+    else:
+        for d in dirs:
+            results.extend(_walk(d, suffix))
+    return [Path(p) for p in sorted(results)]
+
+
+class LinkManifest:
+    """Suffixes and links created by earlier runs for a site-packages directory."""
+
+    def __init__(self, pth: str | Path) -> None:
+        """
+        Initialize LinkManifest
+
+        Args:
+            pth (str | Path): Manifest JSON file.
+        """
+        self._pth = Path(pth)
+        self.site_packages = ""
+        self.file_suffix = ""
+        self.current_suffix = ""
+        self.links: Set[str] = set()
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self._pth, "r", encoding="utf-8") as f:
+                data: Dict[str, Any] = json.load(f)
+            self.site_packages = str(data["site_packages"])
+            self.file_suffix = str(data["file_suffix"])
+            self.current_suffix = str(data["current_suffix"])
+            self.links = set(data.get("links", []))
+        except Exception:
+            self.reset("", "", "")
+
+    def reset(self, site_packages: str | Path, file_suffix: str, current_suffix: str) -> None:
+        """Starts a new manifest for a full scan."""
+        self.site_packages = str(site_packages)
+        self.file_suffix = file_suffix
+        self.current_suffix = current_suffix
+        self.links = set()
+
+    def is_match(self, site_packages: str | Path, current_suffix: str) -> bool:
+        """Gets if the manifest was written by a full scan of ``site_packages`` for ``current_suffix``."""
+        return (
+            bool(self.file_suffix)
+            and self.site_packages == str(site_packages)
+            and self.current_suffix == current_suffix
+        )
+
+    def add(self, links: Iterable[str | Path]) -> None:
+        """Adds created links."""
+        self.links.update(str(ln) for ln in links)
+
+    def save(self) -> None:
+        """Writes the manifest. Errors are ignored, the next run then does a full scan."""
+        data = {
+            "site_packages": self.site_packages,
+            "file_suffix": self.file_suffix,
+            "current_suffix": self.current_suffix,
+            "links": sorted(self.links),
+        }
+        try:
+            tmp = self._pth.with_name(f"{self._pth.name}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, self._pth)
+        except OSError:
+            pass
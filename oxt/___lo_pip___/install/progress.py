@@ -1,44 +1,41 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
-import subprocess
-import os
-import signal
 
 from ..oxt_logger import OxtLogger
+from .progress_session import ProgressSession
 from .progress_window.progress_rules import ProgressRules
+from .progress_window.progress_t import ProgressT
 from ..config import Config
 
 
 class Progress:
+    """
+    Progress indicator for a single step.
+
+    When a :py:class:`~.progress_session.ProgressSession` is active the step is shown in the window of the session.
+    Otherwise a window is opened by ``start()`` and closed by ``kill()``.
+    """
+
     def __init__(self, start_msg: str, title: str = "Terminal"):
         self._start_msg = start_msg
         self._title = title
         self._config = Config()
         self._logger = OxtLogger(log_name=__name__)
-        rules = ProgressRules()
-        self._progress_obj = rules.get_progress()
+        self._session = ProgressSession()
+        self._progress_obj: ProgressT | None = None
 
     def start(self) -> None:
         """Start the progress indicator as a terminal window."""
+        if self._session.is_active:
+            self._session.step(self._start_msg)
+            return
+        self._progress_obj = ProgressRules().get_progress()
         if self._progress_obj is None:
             self._logger.debug("No terminal found. Progress indicator will not be shown.")
             return
         self._progress_obj.start(msg=self._start_msg, title=self._title)
 
     def kill(self) -> None:
+        """Stop the progress indicator. The window of a session stays open until the session ends."""
         if self._progress_obj:
             self._progress_obj.stop()
-
-    def _kill_linux(self) -> None:
-        # sourcery skip: extract-method
-
-        try:
-            cmd = 'ps -ef | grep "import time print(\'Installing:" | grep "sh -c" | grep -v grep | awk \'{print $2}\''
-            ps_command = subprocess.Popen(cmd, shell=True, stdout=subprocess.PIPE)
-            pid_str = ps_command.stdout.read()  # type: ignore
-            ret_code = ps_command.wait()
-            assert ret_code == 0, "ps command returned %d" % ret_code
-            os.kill(int(pid_str), signal.SIGTERM)
-        except Exception as err:
-            self._logger.error(f"Error killing progress indicator: {err}")
-            self._proc = None
+            self._progress_obj = None
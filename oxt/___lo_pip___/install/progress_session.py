@@ -0,0 +1,90 @@
+from __future__ import annotations
+import threading
+
+from ..meta.singleton import Singleton
+from ..oxt_logger import OxtLogger
+from .progress_window.progress_rules import ProgressRules
+from .progress_window.progress_t import ProgressT
+
+
+class ProgressSession(metaclass=Singleton):
+    """
+    Singleton class. One progress window for a whole install session.
+
+    While a session is active :py:class:`~.progress.Progress` reports its message as the next step of the session
+    instead of opening its own window. The window is opened on the first step and closed by :py:meth:`end`.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._logger = OxtLogger(log_name=__name__)
+        self._depth = 0
+        self._title = ""
+        self._step = 0
+        self._total = 0
+        self._progress: ProgressT | None = None
+        self._no_window = False
+
+    def begin(self, title: str) -> None:
+        """
+        Begins a session. Nested calls join the running session.
+
+        Args:
+            title (str): Title of the progress window.
+        """
+        with self._lock:
+            self._depth += 1
+            if self._depth == 1:
+                self._title = title
+                self._step = 0
+                self._total = 0
+                self._no_window = False
+
+    def add_steps(self, count: int) -> None:
+        """Sets the number of steps known to come next such as the packages about to be installed."""
+        with self._lock:
+            if self._depth:
+                self._total = max(self._total, self._step + count)
+
+    def step(self, msg: str) -> None:
+        """
+        Shows the next step. The window is opened on the first step.
+
+        Args:
+            msg (str): Message such as ``Installing: verr``.
+        """
+        with self._lock:
+            if not self._depth:
+                return
+            self._step += 1
+            self._total = max(self._total, self._step)
+            if self._no_window:
+                return
+            if self._progress is None:
+                self._progress = ProgressRules().get_progress()
+                if self._progress is None:
+                    self._logger.debug("No terminal found. Progress indicator will not be shown.")
+                    # do not look again for each step.
+                    self._no_window = True
+                    return
+                self._progress.start(msg=msg, title=self._title)
+            self._progress.update(msg, self._step, self._total)
+
+    def end(self) -> None:
+        """Ends a session. The window is closed when the outer session ends."""
+        with self._lock:
+            if self._depth == 0:
+                return
+            self._depth -= 1
+            if self._depth:
+                return
+            progress, self._progress = self._progress, None
+        if progress is not None:
+            self._logger.debug("Ending Progress Window")
+            progress.stop()
+
+    @property
+    def is_active(self) -> bool:
+        """Gets if a session has begun and has not ended."""
+        with self._lock:
+            return self._depth != 0
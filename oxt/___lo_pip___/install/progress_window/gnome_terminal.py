@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Any, List
+from typing import List
 import subprocess
 import os
 import signal
@@ -32,16 +32,13 @@ class GnomeTerminal(Term):
 
     def _get_command(self, msg: str, title: str) -> List[str]:
         # https://stackoverflow.com/questions/34659433/terminate-a-gnome-terminal-opened-with-subprocess
-        cmd = f'{self.config.python_path} -c "{self.get_code(msg)}"'
         return [
             "gnome-terminal",
             "--disable-factory",
             "--hide-menubar",
             f"--title={title}",
             "--",
-            "sh",
-            "-c",
-            cmd,
+            *self.get_host_cmd(msg),
         ]
 
     def start(self, msg: str, title: str = "Progress") -> None:
@@ -56,29 +53,20 @@ class GnomeTerminal(Term):
             self._pid = proc.pid
         except Exception as err:
             self.logger.error(f"Error starting progress indicator: {err}")
+            self.close_channel()
             self._pid = -1
 
     def stop(self) -> None:
         """Stop the terminal."""
+        # the host exits when the channel closes, the signal is for a host that never connected.
+        self.close_channel()
         if self._pid == -1:
             self.logger.debug("No terminal to stop.")
             return
         try:
             os.killpg(self._pid, signal.SIGINT)  # type: ignore
+        except ProcessLookupError:
+            pass
         except Exception as err:
             self.logger.error(f"Error stopping progress indicator: {err}")
         self._pid = -1
-
-    # def _kill_linux(self) -> None:
-    #     # sourcery skip: extract-method
-
-    #     try:
-    #         cmd = 'ps -ef | grep "import time print(\'Installing:" | grep "sh -c" | grep -v grep | awk \'{print $2}\''
-    #         ps_command = subprocess.Popen(cmd, shell=True, stdout=subprocess.PIPE)
-    #         pid_str = ps_command.stdout.read()  # type: ignore
-    #         ret_code = ps_command.wait()
-    #         assert ret_code == 0, "ps command returned %d" % ret_code
-    #         os.kill(int(pid_str), signal.SIGTERM)
-    #     except Exception as err:
-    #         self._logger.error(f"Error killing progress indicator: {err}")
-    #         self._proc = None
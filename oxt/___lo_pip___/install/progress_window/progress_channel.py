@@ -0,0 +1,155 @@
+"""
+Sends status updates to a progress host.
+
+A :py:class:`ProgressChannel` listens on ``127.0.0.1`` and accepts the first connection that sends its token.
+The host, see ``progress_host.py``, is started with the port and token of the channel as arguments.
+Updates sent before the host connects are not lost, the latest one is sent when it connects.
+"""
+
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Dict, List
+import json
+import secrets
+import socket
+import threading
+
+HOST_SCRIPT = Path(__file__).parent / "progress_host.py"
+"""Script run by terminals to show the progress of a session."""
+
+
+class ProgressChannel:
+    """Localhost socket a progress host connects to."""
+
+    def __init__(self, accept_timeout: float = 30.0) -> None:
+        """
+        Initialize ProgressChannel
+
+        Args:
+            accept_timeout (float, optional): Seconds to wait for the host to connect. Defaults to ``30.0``.
+        """
+        self._lock = threading.Lock()
+        self._token = secrets.token_hex(16)
+        self._conn: socket.socket | None = None
+        self._last: Dict[str, Any] | None = None
+        self._closed = False
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.bind(("127.0.0.1", 0))
+        self._server.listen(1)
+        self._server.settimeout(accept_timeout)
+        self._port: int = self._server.getsockname()[1]
+        self._thread = threading.Thread(target=self._accept, daemon=True)
+        self._thread.start()
+
+    def get_host_args(self, msg: str = "") -> List[str]:
+        """Gets the script and arguments that start a host for this channel."""
+        args = [str(HOST_SCRIPT), str(self.port), self._token]
+        if msg:
+            args.append(msg)
+        return args
+
+    def _accept(self) -> None:
+        while True:
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                # timed out or closed, updates are dropped from now on.
+                self._close_server()
+                return
+            if self._read_token(conn):
+                break
+            conn.close()
+        with self._lock:
+            if self._closed:
+                self._send_close(conn)
+                return
+            self._conn = conn
+            if self._last is not None:
+                self._send(self._last)
+        self._close_server()
+
+    def _read_token(self, conn: socket.socket) -> bool:
+        expected = f"{self._token}\n".encode("utf-8")
+        data = b""
+        try:
+            conn.settimeout(5.0)
+            while len(data) < len(expected) and not data.endswith(b"\n"):
+                chunk = conn.recv(len(expected) - len(data))
+                if not chunk:
+                    return False
+                data += chunk
+            conn.settimeout(None)
+        except OSError:
+            return False
+        return secrets.compare_digest(data, expected)
+
+    def _close_server(self) -> None:
+        try:
+            # shutdown wakes up a pending accept on Linux, close alone does not.
+            self._server.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        try:
+            self._server.close()
+        except OSError:
+            pass
+
+    def _send(self, data: Dict[str, Any]) -> None:
+        # lock is held by caller.
+        if self._conn is None:
+            return
+        try:
+            self._conn.sendall((json.dumps(data) + "\n").encode("utf-8"))
+        except OSError:
+            self._conn.close()
+            self._conn = None
+
+    def _send_close(self, conn: socket.socket) -> None:
+        try:
+            conn.sendall(b'{"cmd": "close"}\n')
+        except OSError:
+            pass
+        finally:
+            conn.close()
+
+    def send(self, msg: str, step: int = 0, total: int = 0) -> None:
+        """
+        Sends a status to the host.
+
+        Args:
+            msg (str): Message such as ``Installing: verr``.
+            step (int, optional): Current step starting at ``1``. ``0`` shows the message without a count.
+            total (int, optional): Number of steps known so far.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._last = {"msg": msg, "step": step, "total": total}
+            self._send(self._last)
+
+    def close(self) -> None:
+        """Tells the host to exit and closes the channel."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            conn, self._conn = self._conn, None
+        if conn is not None:
+            self._send_close(conn)
+        self._close_server()
+
+    @property
+    def port(self) -> int:
+        """Gets the port on ``127.0.0.1``."""
+        return self._port
+
+    @property
+    def token(self) -> str:
+        """Gets the token the host must send first."""
+        return self._token
+
+    @property
+    def is_connected(self) -> bool:
+        """Gets if a host is connected."""
+        with self._lock:
+            return self._conn is not None
@@ -1,11 +1,17 @@
 from __future__ import annotations
-import time
+from typing import Any
 import threading
 import uno
 
 from ...dialog.infinite_progress import InfiniteProgressDialog
-from ...thread.runners import run_in_thread
+from ...thread.cancellation import CancelledError, check_cancelled, sleep
+from ...thread.killable_thread import KillableThread
+from ...events.args.event_args import EventArgs
+from ...events.lo_events import LoEvents
+from ...events.named_events.install_named_event import InstallNamedEvent
 from ...events.startup.startup_monitor import StartupMonitor
+from ..pip_progress import format_event
+from .progress_host import format_status
 
 
 class ProgressDialog:
@@ -13,9 +19,17 @@ class ProgressDialog:
 
     def __init__(self) -> None:
         """Initialize the progress dialog object."""
-        self._is_stopped = False
+        self._thread: KillableThread | None = None
         self._lock = threading.Lock()
         self._startup_monitor = StartupMonitor()
+        self._detail = ""
+        self._msg = ""
+
+        def on_pip_progress(source: object, event: EventArgs) -> None:
+            with self._lock:
+                self._detail = format_event(event.event_data)
+
+        self._fn_on_pip_progress = on_pip_progress
 
     def get_is_match(self) -> bool:
         """Check if the terminal is a match"""
@@ -25,25 +39,43 @@ class ProgressDialog:
     def start(self, msg: str, title: str = "Progress") -> None:
         """Start the terminal."""
 
-        @run_in_thread
-        def show_some_progress(ctx, s_title: str, s_msg: str) -> None:
-            # from ___lo_pip___.dialog.infinite_progress import InfiniteProgress
+        def show_some_progress(ctx: Any, s_title: str, s_msg: str) -> None:  # noqa: ANN401
             ellipsis = 0
             in_progress = InfiniteProgressDialog(ctx, title=s_title, msg=s_msg)
-            while True:
-                with self._lock:
-                    if self._is_stopped:
-                        break
-                ellipsis += 1
-                in_progress.dialog.setVisible(True)
-                in_progress.update(f"{s_msg} {'.' * ellipsis}")
-                if ellipsis == 300:
-                    ellipsis = 0
-                time.sleep(1)
-            in_progress.dialog.dispose()
-
-        show_some_progress(uno.getComponentContext(), title, msg)
+            try:
+                while True:
+                    # stop() kills the thread, the dialog closes right away instead of after the next tick.
+                    check_cancelled()
+                    with self._lock:
+                        detail = self._detail
+                        s_msg = self._msg
+                    ellipsis += 1
+                    in_progress.dialog.setVisible(True)
+                    text = f"{s_msg} {'.' * ellipsis}"
+                    in_progress.update(f"{text}\n{detail}" if detail else text)
+                    if ellipsis == 300:
+                        ellipsis = 0
+                    sleep(1)
+            except CancelledError:
+                pass
+            finally:
+                in_progress.dialog.dispose()
+
+        # the latest pip phase, such as the package being downloaded, is shown below the message.
+        LoEvents().on(InstallNamedEvent.PIP_PROGRESS, self._fn_on_pip_progress)
+        with self._lock:
+            self._msg = msg
+        self._thread = KillableThread(target=show_some_progress, args=(uno.getComponentContext(), title, msg))
+        self._thread.start()
+
+    def update(self, msg: str, step: int = 0, total: int = 0) -> None:
+        """Update the message of the dialog."""
+        with self._lock:
+            self._msg = format_status({"msg": msg, "step": step, "total": total})
+            self._detail = ""
 
     def stop(self) -> None:
         """Stop the terminal."""
-        self._is_stopped = True
+        LoEvents().remove(InstallNamedEvent.PIP_PROGRESS, self._fn_on_pip_progress)
+        if self._thread is not None:
+            self._thread.kill()
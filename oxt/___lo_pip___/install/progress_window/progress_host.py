@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""
+Progress host run in a terminal window for a whole install session.
+
+Usage::
+
+    python progress_host.py <port> <token> [message]
+
+The host connects to the :py:class:`~.progress_channel.ProgressChannel` listening on ``127.0.0.1:<port>``,
+sends ``token`` and then prints each status it receives, one JSON object per line::
+
+    {"msg": "Installing: verr", "step": 2, "total": 3}
+    {"cmd": "close"}
+
+A dot is printed every second while a step runs. The host exits on ``close`` or when the connection is lost,
+so it never outlives the process that started it.
+
+This module only uses the standard library. It is run as a script and is not imported by the extension.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, List
+import json
+import os
+import socket
+import sys
+
+
+def format_status(data: Dict[str, Any]) -> str:
+    """Gets the text of a status such as ``[2/3] Installing: verr``."""
+    msg = str(data.get("msg", ""))
+    step = int(data.get("step", 0) or 0)
+    total = int(data.get("total", 0) or 0)
+    if step < 1:
+        return msg
+    return f"[{step}/{max(step, total)}] {msg}"
+
+
+def _write(text: str) -> None:
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
+def run(port: int, token: str, msg: str = "", tick: float = 1.0) -> int:
+    """
+    Shows the status sent by the channel until it closes.
+
+    Args:
+        port (int): Port of the channel on ``127.0.0.1``.
+        token (str): Token the channel expects as first line.
+        msg (str, optional): Message shown until the first status arrives.
+        tick (float, optional): Seconds between dots. Defaults to ``1.0``.
+
+    Returns:
+        int: Exit code.
+    """
+    try:
+        sock = socket.create_connection(("127.0.0.1", port), timeout=10)
+    except OSError as err:
+        _write(f"Unable to connect to installer: {err}\n")
+        return 1
+    with sock:
+        sock.sendall(f"{token}\n".encode("utf-8"))
+        sock.settimeout(tick)
+        if msg:
+            _write(f"{msg} ")
+        buffer = b""
+        while True:
+            try:
+                chunk = sock.recv(4096)
+            except socket.timeout:
+                _write(".")
+                continue
+            except OSError:
+                break
+            if not chunk:
+                break
+            buffer += chunk
+            lines: List[bytes] = buffer.split(b"\n")
+            buffer = lines.pop()
+            for line in lines:
+                try:
+                    data = json.loads(line.decode("utf-8"))
+                except ValueError:
+                    continue
+                if data.get("cmd") == "close":
+                    _write("\n")
+                    return 0
+                _write(f"\n{format_status(data)} ")
+    _write("\n")
+    return 0
+
+
+def main(argv: List[str]) -> int:
+    if len(argv) < 2:
+        _write("Usage: progress_host.py <port> <token> [message]\n")
+        return 2
+    if sys.stdout.isatty():
+        os.system("cls" if os.name == "nt" else "clear")
+    return run(int(argv[0]), argv[1], argv[2] if len(argv) > 2 else "")
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
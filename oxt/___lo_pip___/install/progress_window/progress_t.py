@@ -17,6 +17,10 @@ class ProgressT(Protocol):
         """Start the progress window."""
         ...
 
+    def update(self, msg: str, step: int = 0, total: int = 0) -> None:
+        """Update the message of a started progress window."""
+        ...
+
     def stop(self) -> None:
         """Stop the progress window."""
         ...
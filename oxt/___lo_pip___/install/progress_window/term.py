@@ -1,6 +1,8 @@
 from __future__ import annotations
+from typing import List
 from ...config import Config
 from ...oxt_logger import OxtLogger
+from .progress_channel import ProgressChannel
 
 
 class Term:
@@ -9,17 +11,28 @@ class Term:
     def __init__(self) -> None:
         self._config = Config()
         self._logger = OxtLogger(log_name=__name__)
+        self._channel: ProgressChannel | None = None
 
-    def get_code(self, msg: str) -> str:
-        """Get the code to run in the terminal."""
-        code = f"""
-import time
-print('{msg} ', flush=True, end='')
-while True:
-    print('.', flush=True, end='')
-    time.sleep(1)
-"""
-        return code.strip()
+    def get_host_cmd(self, msg: str) -> List[str]:
+        """
+        Get the command that runs the progress host in the terminal.
+
+        A new channel is opened for the host. See ``progress_host.py``.
+        """
+        self.close_channel()
+        self._channel = ProgressChannel()
+        return [str(self.config.python_path), *self._channel.get_host_args(msg)]
+
+    def update(self, msg: str, step: int = 0, total: int = 0) -> None:
+        """Update the message shown by the terminal."""
+        if self._channel is not None:
+            self._channel.send(msg, step, total)
+
+    def close_channel(self) -> None:
+        """Tell the progress host to exit. The host exits as well when this process ends."""
+        if self._channel is not None:
+            self._channel.close()
+            self._channel = None
 
     @property
     def config(self) -> Config:
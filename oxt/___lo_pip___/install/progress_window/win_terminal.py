@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Any, List
+from typing import List
 import subprocess
 from ...input_output.proc import kill_proc
 
@@ -22,23 +22,30 @@ class WindowsTerminal(Term):
 
     def _get_command(self, msg: str, title: str) -> List[str]:
         """Get the list of versions."""
-        return [str(self.config.python_path), "-c", self.get_code(msg)]
+        return self.get_host_cmd(msg)
 
     def start(self, msg: str, title: str = "Progress") -> None:
         """Start the terminal."""
         try:
             proc_cmd = self._get_command(msg, title)
-            proc = proc = subprocess.Popen(
+            proc = subprocess.Popen(
                 proc_cmd,
                 creationflags=subprocess.CREATE_NEW_CONSOLE | subprocess.CREATE_NEW_PROCESS_GROUP,
             )
             self._pid = proc.pid
         except Exception as err:
             self.logger.error(f"Error starting progress indicator: {err}")
+            self.close_channel()
             self._pid = -1
 
     def stop(self) -> None:
         """Stop the terminal."""
+        # the host exits when the channel closes, killing is for a host that never connected.
+        connected = self._channel is not None and self._channel.is_connected
+        self.close_channel()
+        if connected:
+            self._pid = -1
+            return
         if self._pid == -1:
             self.logger.debug("No terminal to stop.")
             return
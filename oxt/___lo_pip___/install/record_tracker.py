@@ -0,0 +1,185 @@
+"""
+Tracks the files a pip install adds to a directory from the ``RECORD`` of the installed distributions.
+
+The names of the installed distributions are read from the ``Successfully installed`` line of the pip output.
+Only the ``RECORD`` files of those distributions are read, so the cost scales with the size of the installed
+packages instead of the size of the site-packages directory and files written by other processes are not tracked.
+
+The changes use the keys of the ``data`` section of the JSON tracking file written for each package:
+``new_dirs``, ``new_files``, ``new_bin_files``, ``new_lib_files`` and ``new_inc_files``.
+"""
+
+from __future__ import annotations
+from pathlib import Path
+from typing import Dict, Iterable, List
+import csv
+import os
+
+from .dist_index import normalize_name
+
+TRACKED_SUB_DIRS = {"bin": "new_bin_files", "lib": "new_lib_files", "include": "new_inc_files"}
+"""Sub directories whose files are tracked one by one, mapped to their key in the tracking data."""
+
+_DIST_INFO = ".dist-info"
+
+
+def new_changes() -> Dict[str, List[str]]:
+    """Gets empty tracking data."""
+    return {"new_dirs": [], "new_files": [], "new_bin_files": [], "new_lib_files": [], "new_inc_files": []}
+
+
+def merge_changes(changes: Dict[str, List[str]], other: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """
+    Adds the entries of ``other`` to ``changes``, without duplicates.
+
+    Args:
+        changes (Dict[str, List[str]]): Tracking data that is updated.
+        other (Dict[str, List[str]]): Tracking data to add.
+
+    Returns:
+        Dict[str, List[str]]: ``changes``.
+    """
+    for key, values in other.items():
+        current = changes.setdefault(key, [])
+        seen = set(current)
+        current.extend(v for v in values if v not in seen)
+    return changes
+
+
+def get_installed_names(output: str) -> List[str]:
+    """
+    Gets the distributions a pip install reports as installed.
+
+    Args:
+        output (str): pip ``stdout`` such as ``Successfully installed six-1.16.0 verr-1.1.2``.
+
+    Returns:
+        List[str]: Distribution names in the order pip reports them such as ``["six", "verr"]``.
+    """
+    prefix = "Successfully installed "
+    results: List[str] = []
+    for line in output.splitlines():
+        line = line.strip()
+        if not line.startswith(prefix):
+            continue
+        for item in line[len(prefix) :].split():
+            name = item.rsplit("-", 1)[0] if "-" in item else item
+            if name and name not in results:
+                results.append(name)
+    return results
+
+
+def to_changes(files: Iterable[str]) -> Dict[str, List[str]]:
+    """
+    Converts ``RECORD`` paths to tracking data.
+
+    Directories in the install directory are tracked by their top level name, files directly in it by name,
+    and files directly in ``bin``, ``lib`` and ``include`` by name. Paths outside of the directory are ignored.
+
+    Args:
+        files (Iterable[str]): Paths relative to the install directory, using ``/``.
+
+    Returns:
+        Dict[str, List[str]]: Tracking data.
+    """
+    changes = new_changes()
+    dirs = set()
+    names = set()
+    for file in files:
+        parts = [p for p in file.split("/") if p and p != "."]
+        if not parts or parts[0] == ".." or os.path.isabs(file):
+            continue
+        if len(parts) == 1:
+            names.add(parts[0])
+        elif parts[0] in TRACKED_SUB_DIRS:
+            if len(parts) == 2:
+                changes[TRACKED_SUB_DIRS[parts[0]]].append(parts[1])
+        elif parts[0] != "__pycache__":
+            dirs.add(parts[0])
+    changes["new_dirs"] = sorted(dirs)
+    changes["new_files"] = sorted(names)
+    return changes
+
+
+class RecordTracker:
+    """Gets the tracking data of distributions installed into a directory from their ``RECORD``."""
+
+    def __init__(self, pth: str | Path) -> None:
+        """
+        Initialize RecordTracker
+
+        Args:
+            pth (str | Path): Directory the distributions are installed into such as site-packages.
+        """
+        self._pth = str(pth)
+        self._dist_infos: Dict[str, List[str]] | None = None
+
+    def _get_dist_infos(self) -> Dict[str, List[str]]:
+        # a single directory read, names only, for all the lookups of an install.
+        if self._dist_infos is None:
+            self._dist_infos = {}
+            try:
+                names = os.listdir(self._pth)
+            except OSError:
+                names = []
+            for name in names:
+                if name.endswith(_DIST_INFO):
+                    key = normalize_name(name[: -len(_DIST_INFO)].rsplit("-", 1)[0])
+                    self._dist_infos.setdefault(key, []).append(name)
+        return self._dist_infos
+
+    def find_dist_info(self, name: str) -> str:
+        """
+        Finds the ``.dist-info`` directory of a distribution.
+
+        Args:
+            name (str): Distribution name such as ``ooo-dev-tools``.
+
+        Returns:
+            str: Directory name such as ``ooo_dev_tools-0.11.0.dist-info`` or empty string if not found.
+        """
+        names = self.find_dist_infos(name)
+        return names[0] if names else ""
+
+    def find_dist_infos(self, name: str) -> List[str]:
+        """
+        Finds all the ``.dist-info`` directories of a distribution, including any left over by a failed uninstall.
+
+        Args:
+            name (str): Distribution name such as ``ooo-dev-tools``.
+
+        Returns:
+            List[str]: Directory names. Empty list if not found.
+        """
+        return list(self._get_dist_infos().get(normalize_name(name), []))
+
+    def get_files(self, name: str) -> List[str]:
+        """
+        Gets the paths listed by the ``RECORD`` of each ``.dist-info`` directory of a distribution.
+
+        Args:
+            name (str): Distribution name.
+
+        Returns:
+            List[str]: Paths relative to the directory, using ``/``. Empty list if no ``RECORD`` is found.
+        """
+        results: List[str] = []
+        for dist_info in self.find_dist_infos(name):
+            try:
+                with open(os.path.join(self._pth, dist_info, "RECORD"), "r", encoding="utf-8", newline="") as f:
+                    results.extend(row[0].replace("\\", "/") for row in csv.reader(f) if row and row[0])
+            except OSError:
+                continue
+        return results
+
+    def get_changes(self, name: str) -> Dict[str, List[str]]:
+        """
+        Gets the tracking data of a distribution.
+
+        Args:
+            name (str): Distribution name.
+
+        Returns:
+            Dict[str, List[str]]: Tracking data. All lists are empty if no ``RECORD`` is found.
+        """
+        return to_changes(self.get_files(name))
@@ -6,12 +6,11 @@ No Internet needed.
 
 from __future__ import annotations
 
-from importlib.metadata import PackageNotFoundError, version
-
 from ..config import Config
 from ..ver.rules.ver_rules import VerRules
 from ..oxt_logger import OxtLogger
 from ..meta.singleton import Singleton
+from .dist_index import DistIndex
 from .py_packages.packages import Packages
 from .py_packages.py_package import PyPackage
 
@@ -38,17 +37,14 @@ class RequirementsCheck(metaclass=Singleton):
             self._logger.debug("Requirements not met.")
             return False
 
-        ver_rules = VerRules()
-
         def check_installed_valid(pkg: PyPackage) -> bool:
-            nonlocal ver_rules
             ver_str = self._get_package_version(pkg.name)
             if not ver_str:
                 self._logger.debug("Package %s not installed ...", pkg.name)
                 return False
             try:
                 _, pkg_ver = pkg.name_version
-                return ver_rules.get_installed_is_valid(vstr=pkg_ver, check_version=ver_str)
+                return self._ver_rules.compile(pkg_ver).is_valid(ver_str)
             except Exception as e:
                 self._logger.error(e)
             return False
@@ -74,10 +70,7 @@ class RequirementsCheck(metaclass=Singleton):
         Returns:
             str: The version of the package or an empty string if the package is not installed.
         """
-        try:
-            return version(package_name)
-        except PackageNotFoundError:
-            return ""
+        return DistIndex().get_version(package_name)
 
     def _is_valid_version(self, name: str, ver: str) -> int:
         """
@@ -98,17 +91,16 @@ class RequirementsCheck(metaclass=Singleton):
         if not ver:
             # set default version to >=0.0.0
             ver = "==*"
-        rules = self._ver_rules.get_matched_rules(ver)
+        spec = self._ver_rules.compile(ver)
         self._logger.debug("Found Package %s %s already installed ...", name, pkg_ver)
-        if not rules:
+        if not spec:
             if pkg_ver:
                 self._logger.info("Package %s %s already installed, no rules", name, pkg_ver)
             else:
                 self._logger.error("Unable to find rules for %s %s", name, ver)
             return -1
 
-        rules_pass = self._ver_rules.get_installed_is_valid_by_rules(rules=rules, check_version=pkg_ver)
-        if rules_pass is False:
+        if not spec.is_valid(pkg_ver):
             self._logger.info(
                 "Package %s %s already installed. It does not meet requirements specified by: %s",
                 name,
@@ -0,0 +1,110 @@
+"""
+Fingerprint of the state in which requirements were last found to be met.
+
+When the fingerprint stored in the user profile matches the current fingerprint
+there is no need to walk the installed package metadata to check requirements.
+"""
+
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Dict, List
+import json
+import sys
+
+from ..config import Config
+from ..oxt_logger import OxtLogger
+from ..meta.singleton import Singleton
+from ..lo_util.target_path import TargetPath
+from .py_packages.package_config import PackageConfig
+from .fingerprint_data import compute_fingerprint, get_dir_dists, get_locations, get_mtimes
+
+
+class RequirementsFingerprint(metaclass=Singleton):
+    """Singleton class. Persists the fingerprint of met requirements in the user profile."""
+
+    def __init__(self) -> None:
+        self._logger = OxtLogger(log_name=__name__)
+        self._config = Config()
+        self._file = Path(
+            self._config.session.user_profile, f"{self._config.lo_implementation_name}_req_fingerprint.json"
+        )
+
+    def _get_dirs(self) -> List[str]:
+        """Gets the directories packages are found in, in ``sys.path`` order, then the install directories."""
+        return [*sys.path, self._config.site_packages, TargetPath().target]
+
+    def _get_data(self) -> Dict[str, Any]:
+        """Gets the data the fingerprint is computed from."""
+        requirements = self._config.requirements
+        py_packages = PackageConfig().py_packages
+        names = [*requirements.keys(), *(pkg.get("name", "") for pkg in py_packages)]
+        dirs = self._get_dirs()
+        dir_dists = get_dir_dists(dirs)
+        return {
+            "requirements": requirements,
+            "py_packages": py_packages,
+            "extension_version": self._config.extension_version,
+            "python_version": sys.version,
+            "python_path": str(self._config.python_path),
+            "dirs": get_mtimes(dirs),
+            "dists": dir_dists,
+            "locations": get_locations(names, dir_dists),
+        }
+
+    def get_fingerprint(self) -> str:
+        """
+        Gets the current fingerprint.
+
+        The fingerprint is a hash of the requirements, the extension version, the interpreter version,
+        the modified times and the ``*.dist-info`` names of the ``sys.path`` and install directories,
+        and the ``*.dist-info`` each requirement is found at. No distribution metadata is read.
+
+        Returns:
+            str: Hex digest of the fingerprint.
+        """
+        return compute_fingerprint(self._get_data())
+
+    def _read(self) -> str:
+        if not self._file.exists():
+            return ""
+        with open(self._file, "r", encoding="utf-8") as f:
+            return str(json.load(f).get("fingerprint", ""))
+
+    def is_match(self) -> bool:
+        """
+        Gets if the stored fingerprint matches the current fingerprint.
+
+        Returns:
+            bool: ``True`` if requirements were met the last time the fingerprint was saved
+            and nothing it depends on has changed since; Otherwise, ``False``.
+        """
+        try:
+            stored = self._read()
+            if not stored:
+                self._logger.debug("is_match() No stored fingerprint.")
+                return False
+            result = stored == self.get_fingerprint()
+            self._logger.debug("is_match() Fingerprint match: %s", result)
+            return result
+        except Exception as e:
+            self._logger.warning("is_match() Unable to check fingerprint: %s", e)
+        return False
+
+    def save(self) -> None:
+        """Saves the current fingerprint. Call only when requirements are met."""
+        try:
+            data = {"id": f"{self._config.oxt_name}_req_fingerprint", "fingerprint": self.get_fingerprint()}
+            with open(self._file, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=4)
+            self._logger.debug("save() Saved fingerprint to %s", self._file)
+        except Exception as e:
+            self._logger.warning("save() Unable to save fingerprint: %s", e)
+
+    def clear(self) -> None:
+        """Removes the stored fingerprint, forcing the next requirements check to walk package metadata."""
+        try:
+            if self._file.exists():
+                self._file.unlink()
+                self._logger.debug("clear() Removed fingerprint %s", self._file)
+        except Exception as e:
+            self._logger.warning("clear() Unable to remove fingerprint: %s", e)
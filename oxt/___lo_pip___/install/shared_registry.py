@@ -0,0 +1,186 @@
+"""
+Requirements of all extensions that install packages into the same site-packages.
+
+Extensions built from this template share the site-packages of the LibreOffice user profile. Each extension records
+its requirements in one JSON file in the profile. An install then covers the requirements of every extension at once,
+with the constraints of all extensions on the same package combined, and a package is only uninstalled when no other
+extension needs it.
+
+The file is replaced atomically so readers never see a partial file and it is only written when an extension's
+requirements change. Changes are made while holding a lock file next to the registry and the registry is read again
+under the lock, so extensions that start at the same time do not drop each other's entries.
+"""
+
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+import json
+import os
+
+from .dist_index import normalize_name
+from .install_lock import file_lock
+
+
+class SharedRegistry:
+    """Requirements of each extension and the site-packages they are installed to."""
+
+    def __init__(self, pth: str | Path) -> None:
+        """
+        Initialize SharedRegistry
+
+        Args:
+            pth (str | Path): Registry JSON file.
+        """
+        self._pth = Path(pth)
+        self._lock_pth = self._pth.with_name(f"{self._pth.name}.lock")
+        self._extensions: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self._pth, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            extensions = data["extensions"]
+            self._extensions = {
+                str(ext_id): {
+                    "site_packages": str(entry["site_packages"]),
+                    "requirements": {str(k): str(v) for k, v in entry["requirements"].items()},
+                }
+                for ext_id, entry in extensions.items()
+            }
+        except Exception:
+            self._extensions = {}
+
+    def _save(self) -> None:
+        data = {"version": 1, "extensions": self._extensions}
+        self._pth.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self._pth.with_name(f"{self._pth.name}.{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        os.replace(tmp, self._pth)
+
+    def register(self, ext_id: str, site_packages: str | Path, requirements: Dict[str, str]) -> bool:
+        """
+        Records the requirements of an extension. The file is only written when something changed.
+
+        Args:
+            ext_id (str): Extension identifier such as ``org.openoffice.extensions.ooopip``.
+            site_packages (str | Path): Directory the extension installs packages to.
+            requirements (Dict[str, str]): Package names as keys and version strings as values.
+
+        Returns:
+            bool: ``True`` if the registry was written.
+        """
+        entry = {"site_packages": str(site_packages), "requirements": dict(requirements)}
+        with file_lock(self._lock_pth):
+            self._load()
+            if self._extensions.get(ext_id) == entry:
+                return False
+            self._extensions[ext_id] = entry
+            self._save()
+        return True
+
+    def unregister(self, ext_id: str) -> bool:
+        """Removes an extension. Returns ``True`` if it was registered."""
+        with file_lock(self._lock_pth):
+            self._load()
+            if self._extensions.pop(ext_id, None) is None:
+                return False
+            self._save()
+        return True
+
+    def reload(self) -> None:
+        """Reads the registry again to see the changes made by other extensions."""
+        self._load()
+
+    def prune(self, is_installed: Callable[[str], bool], keep: str = "") -> List[str]:
+        """
+        Removes the extensions that are no longer installed.
+
+        Args:
+            is_installed (Callable[[str], bool]): Gets if an extension identifier is installed.
+            keep (str, optional): Identifier that is never removed, usually the calling extension.
+
+        Returns:
+            List[str]: Identifiers that were removed.
+        """
+        with file_lock(self._lock_pth):
+            self._load()
+            removed = [ext_id for ext_id in self._extensions if ext_id != keep and not is_installed(ext_id)]
+            for ext_id in removed:
+                del self._extensions[ext_id]
+            if removed:
+                self._save()
+        return removed
+
+    def get_users(self, name: str, site_packages: str | Path) -> List[str]:
+        """
+        Gets the extensions that need a package.
+
+        Args:
+            name (str): Package name, compared normalized.
+            site_packages (str | Path): Only extensions that install to this directory are included.
+
+        Returns:
+            List[str]: Extension identifiers, sorted.
+        """
+        key = normalize_name(name)
+        site = str(site_packages)
+        return sorted(
+            ext_id
+            for ext_id, entry in self._extensions.items()
+            if entry["site_packages"] == site and any(normalize_name(n) == key for n in entry["requirements"])
+        )
+
+    def get_requirements(self, site_packages: str | Path) -> Dict[str, List[str]]:
+        """
+        Gets the package names required by each extension that installs to a directory.
+
+        Args:
+            site_packages (str | Path): Install directory.
+
+        Returns:
+            Dict[str, List[str]]: Extension identifiers as keys and package names as values.
+        """
+        site = str(site_packages)
+        return {
+            ext_id: list(entry["requirements"])
+            for ext_id, entry in self._extensions.items()
+            if entry["site_packages"] == site
+        }
+
+    def get_combined(self, site_packages: str | Path, first: str = "") -> Dict[str, str]:
+        """
+        Gets the requirements of all extensions that install to a directory.
+
+        The version strings of a package required by several extensions are joined with ``,``
+        so the installed version satisfies all of them.
+
+        Args:
+            site_packages (str | Path): Install directory.
+            first (str, optional): Extension whose package names are used when names differ only by normalization.
+
+        Returns:
+            Dict[str, str]: Package names as keys and version strings as values.
+        """
+        site = str(site_packages)
+        names: Dict[str, str] = {}
+        specs: Dict[str, List[str]] = {}
+        ordered = sorted(self._extensions.items(), key=lambda item: (item[0] != first, item[0]))
+        for _, entry in ordered:
+            if entry["site_packages"] != site:
+                continue
+            for name, ver in entry["requirements"].items():
+                key = normalize_name(name)
+                names.setdefault(key, name)
+                lst = specs.setdefault(key, [])
+                for part in ver.split(","):
+                    part = part.strip()
+                    if part and part not in lst:
+                        lst.append(part)
+        return {names[key]: ",".join(specs[key]) for key in names}
+
+    @property
+    def extensions(self) -> List[str]:
+        """Gets the registered extension identifiers, sorted."""
+        return sorted(self._extensions)
@@ -0,0 +1,255 @@
+"""
+Removes the files of an installed package from a single deletion manifest.
+
+The manifest is built from the ``RECORD`` of the package distribution, any left over ``.dist-info`` directories,
+the JSON tracking data written when the package was installed and the package directory. Files are deleted
+concurrently by a bounded thread pool and directories are then removed bottom-up.
+
+Nothing outside of the install directory, nor the install directory itself, is ever removed.
+"""
+
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Set, Tuple
+import os
+import time
+
+from .record_tracker import RecordTracker, TRACKED_SUB_DIRS
+
+
+class UninstallReport(NamedTuple):
+    package: str
+    """Name of the uninstalled package."""
+    dry_run: bool
+    """``True`` if nothing was removed and the report lists what would be removed."""
+    files: List[str]
+    """Removed files."""
+    dirs: List[str]
+    """Removed directories."""
+    errors: List[Tuple[str, str]]
+    """Paths that could not be removed and the reason."""
+    duration: float
+    """Duration in seconds."""
+
+    @property
+    def success(self) -> bool:
+        """Gets if every path of the manifest was removed."""
+        return not self.errors
+
+
+def _is_within(root: str, pth: str) -> bool:
+    return pth != root and pth.startswith(root + os.sep)
+
+
+class UninstallManifest:
+    """Files and directories to remove for a package."""
+
+    def __init__(self, package: str) -> None:
+        """
+        Initialize UninstallManifest
+
+        Args:
+            package (str): Name of the package.
+        """
+        self.package = package
+        self._files: Set[str] = set()
+        self._dirs: Set[str] = set()
+        self._optional_dirs: Set[str] = set()
+        self._kept: Set[str] = set()
+        self._kept_dirs: Set[str] = set()
+
+    def add_file(self, root: str | Path, name: str) -> None:
+        """
+        Adds a file, or a symbolic link, to remove.
+
+        Args:
+            root (str | Path): Install directory such as site-packages.
+            name (str): Path relative to ``root``.
+        """
+        root = os.path.abspath(root)
+        pth = os.path.normpath(os.path.join(root, name))
+        if _is_within(root, pth):
+            self._files.add(pth)
+
+    def add_tree(self, root: str | Path, name: str) -> None:
+        """
+        Adds a directory and everything in it to remove.
+
+        Args:
+            root (str | Path): Install directory such as site-packages.
+            name (str): Directory name relative to ``root``.
+        """
+        root = os.path.abspath(root)
+        top = os.path.normpath(os.path.join(root, name))
+        if not _is_within(root, top):
+            return
+        if os.path.islink(top) or not os.path.isdir(top):
+            self._files.add(top)
+            return
+        for dirpath, dirnames, filenames in os.walk(top):
+            self._dirs.add(dirpath)
+            for d in dirnames:
+                if os.path.islink(os.path.join(dirpath, d)):
+                    # not followed by os.walk, removed as a file.
+                    self._files.add(os.path.join(dirpath, d))
+            self._files.update(os.path.join(dirpath, f) for f in filenames)
+
+    def add_record(self, root: str | Path, name: str) -> None:
+        """
+        Adds the files listed by the ``RECORD`` of a distribution and all its ``.dist-info`` directories.
+
+        Parent directories of the files are removed only if they end up empty.
+
+        Args:
+            root (str | Path): Install directory the distribution is installed into.
+            name (str): Distribution name.
+        """
+        root = os.path.abspath(root)
+        tracker = RecordTracker(root)
+        for file in tracker.get_files(name):
+            pth = os.path.normpath(os.path.join(root, file))
+            if not _is_within(root, pth):
+                continue
+            self._files.add(pth)
+            parent = os.path.dirname(pth)
+            while _is_within(root, parent) and parent not in self._optional_dirs:
+                self._optional_dirs.add(parent)
+                parent = os.path.dirname(parent)
+        for dist_info in tracker.find_dist_infos(name):
+            self.add_tree(root, dist_info)
+
+    def add_tracking(self, root: str | Path, data: Dict[str, List[str]]) -> None:
+        """
+        Adds the directories and files of the JSON tracking data written when the package was installed.
+
+        Args:
+            root (str | Path): Install directory the tracking file is in.
+            data (Dict[str, List[str]]): ``data`` section of the tracking file.
+        """
+        for d in data.get("new_dirs", []):
+            if d not in TRACKED_SUB_DIRS:
+                self.add_tree(root, d)
+        for f in data.get("new_files", []):
+            self.add_file(root, f)
+        for sub_dir, key in TRACKED_SUB_DIRS.items():
+            for f in data.get(key, []):
+                self.add_file(root, os.path.join(sub_dir, f))
+
+    def keep_record(self, root: str | Path, name: str) -> None:
+        """
+        Keeps the files listed by the ``RECORD`` of a distribution, and its ``.dist-info`` directories,
+        such as a dependency another extension still needs. Directories holding kept files are not removed.
+
+        Args:
+            root (str | Path): Install directory the distribution is installed into.
+            name (str): Distribution name.
+        """
+        root = os.path.abspath(root)
+        tracker = RecordTracker(root)
+        kept = [os.path.normpath(os.path.join(root, file)) for file in tracker.get_files(name)]
+        for dist_info in tracker.find_dist_infos(name):
+            for dirpath, _, filenames in os.walk(os.path.join(root, dist_info)):
+                kept.append(dirpath)
+                kept.extend(os.path.join(dirpath, f) for f in filenames)
+        for pth in kept:
+            if not _is_within(root, pth):
+                continue
+            self._kept.add(pth)
+            parent = os.path.dirname(pth)
+            while _is_within(root, parent) and parent not in self._kept_dirs:
+                self._kept_dirs.add(parent)
+                parent = os.path.dirname(parent)
+
+    @property
+    def files(self) -> List[str]:
+        """Files to remove, sorted."""
+        return sorted(self._files - self._kept)
+
+    @property
+    def dirs(self) -> List[str]:
+        """Directories to remove, deepest first."""
+        dirs = (self._dirs | self._optional_dirs) - self._kept - self._kept_dirs
+        return sorted(dirs, key=lambda d: (-d.count(os.sep), d))
+
+    def is_optional(self, pth: str) -> bool:
+        """Gets if a directory is only removed when it is empty."""
+        return pth in self._optional_dirs and pth not in self._dirs
+
+    def __len__(self) -> int:
+        return len(self.files) + len(self.dirs)
+
+
+class UninstallEngine:
+    """Removes the files and directories of an :py:class:`UninstallManifest`."""
+
+    def __init__(self, workers: int = 4) -> None:
+        """
+        Initialize UninstallEngine
+
+        Args:
+            workers (int, optional): Number of threads deleting files. Defaults to ``4``.
+        """
+        self._workers = max(1, workers)
+
+    def _unlink(self, pth: str) -> str:
+        try:
+            os.unlink(pth)
+        except FileNotFoundError:
+            return "missing"
+        except OSError as e:
+            return str(e) or e.__class__.__name__
+        return ""
+
+    def _run_dry(self, manifest: UninstallManifest) -> Tuple[List[str], List[str]]:
+        files = [f for f in manifest.files if os.path.lexists(f)]
+        removed = set(files)
+        dirs: List[str] = []
+        for d in manifest.dirs:
+            try:
+                entries = os.listdir(d)
+            except OSError:
+                continue
+            if all(os.path.join(d, e) in removed for e in entries):
+                removed.add(d)
+                dirs.append(d)
+        return files, dirs
+
+    def run(self, manifest: UninstallManifest, dry_run: bool = False) -> UninstallReport:
+        """
+        Removes the files and directories of a manifest.
+
+        Args:
+            manifest (UninstallManifest): Manifest.
+            dry_run (bool, optional): Only report what would be removed. Defaults to ``False``.
+
+        Returns:
+            UninstallReport: Report. Paths that are already gone are neither reported as removed nor as errors.
+        """
+        start = time.perf_counter()
+        errors: List[Tuple[str, str]] = []
+        if dry_run:
+            files, dirs = self._run_dry(manifest)
+            return UninstallReport(manifest.package, True, files, dirs, errors, time.perf_counter() - start)
+
+        all_files = manifest.files
+        files: List[str] = []
+        if all_files:
+            with ThreadPoolExecutor(max_workers=min(self._workers, len(all_files))) as executor:
+                for pth, err in zip(all_files, executor.map(self._unlink, all_files)):
+                    if not err:
+                        files.append(pth)
+                    elif err != "missing":
+                        errors.append((pth, err))
+
+        dirs: List[str] = []
+        for d in manifest.dirs:
+            try:
+                os.rmdir(d)
+                dirs.append(d)
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                if not manifest.is_optional(d):
+                    errors.append((d, str(e) or e.__class__.__name__))
+        return UninstallReport(manifest.package, False, files, dirs, errors, time.perf_counter() - start)
@@ -0,0 +1,215 @@
+"""
+Local cache of downloaded wheels shared across LibreOffice profiles and extension upgrades.
+
+Files are kept in a single flat directory so the cache can be passed to pip as ``--find-links``.
+Each file is keyed by the name, version and tags encoded in its file name.
+The least recently used files are evicted when the cache grows beyond its size limit.
+
+No Internet needed.
+"""
+
+from __future__ import annotations
+from pathlib import Path
+from typing import Iterable, Iterator, List, NamedTuple, Set, Tuple
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+
+from packaging.tags import Tag, sys_tags
+from packaging.utils import canonicalize_name, parse_sdist_filename, parse_wheel_filename
+from packaging.version import Version
+
+from ..ver.rules.ver_rules import VerRules
+
+
+class CacheEntry(NamedTuple):
+    name: str
+    """Canonical package name such as ``ooo-dev-tools``."""
+    version: str
+    """Package version such as ``1.2.3``."""
+    path: Path
+    """Path of the cached file."""
+    tags: frozenset
+    """Wheel tags. Empty for source distributions."""
+
+
+def _sha256(pth: Path) -> str:
+    h = hashlib.sha256()
+    with open(pth, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class WheelCache:
+    """Size bounded, least recently used cache of wheel and source distribution files."""
+
+    def __init__(self, path: str | Path, max_bytes: int) -> None:
+        """
+        Initialize WheelCache
+
+        Args:
+            path (str | Path): Cache directory. Created when the first file is added.
+            max_bytes (int): Maximum total size of the cached files.
+        """
+        self._path = Path(path)
+        self._max_bytes = max_bytes
+        self._ver_rules = VerRules()
+        self._tags: Set[Tag] | None = None
+
+    def _get_tags(self) -> Set[Tag]:
+        if self._tags is None:
+            self._tags = set(sys_tags())
+        return self._tags
+
+    def _parse(self, pth: Path) -> CacheEntry | None:
+        """Gets the cache entry for a file or ``None`` if the file is not a distribution."""
+        try:
+            if pth.name.endswith(".whl"):
+                name, ver, _, tags = parse_wheel_filename(pth.name)
+                return CacheEntry(name=str(name), version=str(ver), path=pth, tags=tags)
+            if pth.name.endswith((".tar.gz", ".zip")):
+                name, ver = parse_sdist_filename(pth.name)
+                return CacheEntry(name=str(name), version=str(ver), path=pth, tags=frozenset())
+        except Exception:
+            pass
+        return None
+
+    def entries(self) -> Iterator[CacheEntry]:
+        """Iterates the cached files."""
+        if not self._path.is_dir():
+            return
+        for pth in self._path.iterdir():
+            if pth.is_file() and (entry := self._parse(pth)):
+                yield entry
+
+    def add(self, pth: str | Path) -> Path | None:
+        """
+        Adds a file to the cache.
+
+        If a file with the same name is already cached and has the same content it is kept.
+        The file is written atomically so other processes never see a partial file.
+
+        Args:
+            pth (str | Path): Wheel or source distribution file.
+
+        Returns:
+            Path | None: Path of the cached file or ``None`` if ``pth`` is not a distribution file.
+        """
+        src = Path(pth)
+        if self._parse(src) is None:
+            return None
+        dst = self._path / src.name
+        if dst.exists() and dst.stat().st_size == src.stat().st_size and _sha256(dst) == _sha256(src):
+            self.touch(dst)
+            return dst
+        self._path.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self._path, suffix=".part")
+        os.close(fd)
+        try:
+            shutil.copyfile(src, tmp)
+            os.replace(tmp, dst)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        return dst
+
+    def add_dir(self, pth: str | Path) -> List[Path]:
+        """
+        Adds all distribution files found in a directory and its sub directories to the cache.
+
+        Args:
+            pth (str | Path): Directory such as a wheelhouse.
+
+        Returns:
+            List[Path]: Paths of the cached files.
+        """
+        results: List[Path] = []
+        for src in sorted(Path(pth).rglob("*")):
+            if src.is_file() and (dst := self.add(src)):
+                results.append(dst)
+        return results
+
+    def find(self, name: str, ver: str = "") -> CacheEntry | None:
+        """
+        Finds the newest cached file for a package that meets a version constraint and is compatible with this interpreter.
+
+        Wheels are preferred over source distributions of the same version.
+
+        Args:
+            name (str): The name of the package such as ``verr``
+            ver (str, optional): pip version string such as ``>=1.0.0``. Any version if omitted.
+
+        Returns:
+            CacheEntry | None: Matching entry or ``None``.
+        """
+        key = str(canonicalize_name(name))
+        spec = self._ver_rules.compile(ver or "==*")
+        best: CacheEntry | None = None
+        best_rank = None
+        for entry in self.entries():
+            if entry.name != key or not spec.is_valid(entry.version):
+                continue
+            if entry.tags and not (entry.tags & self._get_tags()):
+                continue
+            rank = (Version(entry.version), bool(entry.tags))
+            if best_rank is None or rank > best_rank:
+                best, best_rank = entry, rank
+        if best:
+            self.touch(best.path)
+        return best
+
+    def touch(self, pth: str | Path) -> None:
+        """Marks a cached file as used."""
+        try:
+            now = time.time()
+            os.utime(pth, (now, now))
+        except OSError:
+            pass
+
+    def touch_installed(self, installed: Iterable[Tuple[str, str]]) -> None:
+        """
+        Marks the cached files of installed packages as used.
+
+        Args:
+            installed (Iterable[Tuple[str, str]]): Installed ``(name, version)`` pairs.
+        """
+        keys = {(str(canonicalize_name(name)), str(Version(ver))) for name, ver in installed}
+        for entry in self.entries():
+            if (entry.name, entry.version) in keys:
+                self.touch(entry.path)
+
+    def evict(self) -> List[Path]:
+        """
+        Removes the least recently used files until the cache is no larger than its size limit.
+
+        Returns:
+            List[Path]: Removed files.
+        """
+        files = []
+        total = 0
+        for entry in self.entries():
+            try:
+                st = entry.path.stat()
+            except OSError:
+                continue
+            files.append((st.st_mtime, st.st_size, entry.path))
+            total += st.st_size
+        removed: List[Path] = []
+        for _, size, pth in sorted(files):
+            if total <= self._max_bytes:
+                break
+            try:
+                pth.unlink()
+                total -= size
+                removed.append(pth)
+            except OSError:
+                continue
+        return removed
+
+    @property
+    def path(self) -> Path:
+        """Cache directory."""
+        return self._path
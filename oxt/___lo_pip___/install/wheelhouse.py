@@ -0,0 +1,149 @@
+"""
+Local wheelhouse used to download pending packages concurrently before they are installed.
+
+Each package is downloaded with ``pip download`` into its own sub directory, so concurrent downloads
+of a shared dependency never write the same file. Packages are then installed with
+``--no-index`` and a ``--find-links`` for each sub directory.
+"""
+
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Sequence
+import re
+import subprocess
+
+
+def _run(cmd: List[str]) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        encoding="utf-8",
+        errors="replace",
+        text=True,
+    )
+
+
+class Wheelhouse:
+    """Downloads packages into a local directory so they can be installed without an index."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        pip_cmd: Sequence[str],
+        download_args: Sequence[str] = (),
+        max_workers: int = 4,
+        run: Callable[[List[str]], subprocess.CompletedProcess] | None = None,
+        find_links: Sequence[str | Path] = (),
+    ) -> None:
+        """
+        Initialize Wheelhouse
+
+        Args:
+            path (str | Path): Directory packages are downloaded into.
+            pip_cmd (Sequence[str]): Command that runs pip such as ``["python", "-m", "pip"]``.
+            download_args (Sequence[str], optional): Extra ``pip download`` arguments such as ``["--index-url", "http://localhost:8000/simple"]``.
+            max_workers (int, optional): Maximum number of concurrent downloads. Defaults to ``4``.
+            run (Callable[[List[str]], CompletedProcess], optional): Runs a command and waits for it to finish.
+                Defaults to ``subprocess.run`` capturing output.
+            find_links (Sequence[str | Path], optional): Other local directories, such as a wheel cache, that packages are installed from.
+        """
+        self._path = Path(path)
+        self._pip_cmd = list(pip_cmd)
+        self._download_args = list(download_args)
+        self._max_workers = max(1, max_workers)
+        self._run = run or _run
+        self._find_links = [Path(pth) for pth in find_links]
+        self._prefetched: Dict[str, Path | None] = {}
+        self._errors: Dict[str, str] = {}
+
+    def _get_pkg_dir(self, name: str) -> Path:
+        return self._path / re.sub(r"[^A-Za-z0-9_.-]+", "_", name)
+
+    def get_download_cmd(self, name: str, ver: str = "") -> List[str]:
+        """
+        Gets the ``pip download`` command for a package.
+
+        Args:
+            name (str): The name of the package such as ``verr``
+            ver (str, optional): pip version string such as ``>=1.0.0``.
+
+        Returns:
+            List[str]: Full command.
+        """
+        pkg_cmd = f"{name}{ver}" if ver else name
+        return [
+            *self._pip_cmd,
+            "download",
+            "--dest",
+            str(self._get_pkg_dir(name)),
+            *self._download_args,
+            *(f"--find-links={pth}" for pth in self._find_links),
+            pkg_cmd,
+        ]
+
+    def _download(self, name: str, ver: str) -> subprocess.CompletedProcess:
+        self._get_pkg_dir(name).mkdir(parents=True, exist_ok=True)
+        return self._run(self.get_download_cmd(name, ver))
+
+    def prefetch(self, pkgs: Dict[str, str]) -> List[str]:
+        """
+        Downloads packages and their dependencies concurrently.
+
+        Args:
+            pkgs (Dict[str, str]): Package names as keys and pip version strings as values such as ``{"verr": ">=1.0.0"}``.
+                Packages that are already prefetched are skipped.
+
+        Returns:
+            List[str]: The names of the packages that were not downloaded. Empty list on success.
+        """
+        pkgs = {name: ver for name, ver in pkgs.items() if name not in self._prefetched}
+        if not pkgs:
+            return []
+        workers = min(self._max_workers, len(pkgs))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="wheelhouse") as executor:
+            futures = {name: executor.submit(self._download, name, ver) for name, ver in pkgs.items()}
+
+        failed: List[str] = []
+        for name, future in futures.items():
+            try:
+                process = future.result()
+                if process.returncode == 0:
+                    self._prefetched[name] = self._get_pkg_dir(name)
+                    self._errors.pop(name, None)
+                    continue
+                self._errors[name] = process.stderr or ""
+            except Exception as e:
+                self._errors[name] = str(e)
+            failed.append(name)
+        return failed
+
+    def get_install_args(self) -> List[str]:
+        """
+        Gets the pip ``install`` arguments that install from the wheelhouse instead of the index.
+
+        Returns:
+            List[str]: Arguments such as ``["--no-index", "--find-links=..."]``. Empty list if nothing has been prefetched.
+        """
+        if not self._prefetched:
+            return []
+        dirs = [*self._find_links, *(pth for pth in self._prefetched.values() if pth)]
+        return ["--no-index", *(f"--find-links={pth}" for pth in dirs)]
+
+    def mark_prefetched(self, name: str) -> None:
+        """Marks a package as available in one of the ``find_links`` directories so it is not downloaded."""
+        self._prefetched[name] = None
+
+    def is_prefetched(self, name: str) -> bool:
+        """Gets if a package has been downloaded into the wheelhouse or is available in one of the ``find_links`` directories."""
+        return name in self._prefetched
+
+    def get_error(self, name: str) -> str:
+        """Gets the error output of a failed download or an empty string."""
+        return self._errors.get(name, "")
+
+    @property
+    def path(self) -> Path:
+        """Directory packages are downloaded into."""
+        return self._path
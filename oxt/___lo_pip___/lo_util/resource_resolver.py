@@ -1,8 +1,12 @@
 from __future__ import annotations
+import contextlib
 import uno
-from typing import Any, cast, TYPE_CHECKING
+from pathlib import Path
+from typing import Any, Dict, cast, TYPE_CHECKING
 
 from ..config import Config
+from ..input_output.string_resources import load_strings
+from ..meta.singleton import Singleton
 from ..oxt_logger import OxtLogger
 
 from com.sun.star.lang import Locale
@@ -13,29 +17,83 @@ if TYPE_CHECKING:
     from com.sun.star.resource import StringResourceWithLocation  # service
 
 
-class ResourceResolver:
-    """Resource Resolver for localized strings"""
+def _get_env_locale(ctx: Any) -> Locale:  # noqa: ANN401
+    """Get interface locale"""
+    ps = cast(
+        "PathSubstitution",
+        ctx.getServiceManager().createInstanceWithContext("com.sun.star.util.PathSubstitution", ctx),
+    )
+    v_lang = ps.getSubstituteVariableValue("vlang")
+    a_lang = v_lang.split("-") + 2 * [""]
+    return Locale(*a_lang[:3])
 
-    def __init__(self, ctx: Any):
+
+def _get_default_locale(config: Config) -> Locale:
+    """Get the default locale of the extension"""
+    # config.default_locale can be 1 to 3 parts
+    locale_parts = config.default_locale + 2 * [""]
+    return Locale(*locale_parts[:3])
+
+
+class ResourceCache(metaclass=Singleton):
+    """
+    Singleton Class. Localized strings of the extension.
+
+    The ``.properties`` files of the current and the default locale are read once per process from the
+    extension folder, see ``input_output.string_resources``.
+    """
+
+    def __init__(self, ctx: Any) -> None:
         self._config = Config()
         self._logger = OxtLogger(log_name=__name__)
+        self.ctx = ctx
+        self.locale = _get_env_locale(ctx)
+        self.default_locale = _get_default_locale(self._config)
+        self._strings: Dict[str, str] = {}
         try:
-            self.ctx = ctx
-            self.service_manager = self.ctx.getServiceManager()
-            self.locale = self._get_env_locale()
-            self.resource_resolver = self._get_resource_resolver(self.locale)
-            self.version = self._get_ext_ver()
-            self._default_resource_resolver: StringResourceWithLocation | None = None
+            pth = Path(self._config.package_location, self._config.resource_dir_name)
+            self._strings = load_strings(
+                pth,
+                self._config.resource_properties_prefix,
+                (self.locale.Language, self.locale.Country, self.locale.Variant),
+                (self.default_locale.Language, self.default_locale.Country, self.default_locale.Variant),
+            )
+            self._logger.debug(f"ResourceCache: loaded {len(self._strings)} strings from {pth}")
+        except Exception as err:
+            self._logger.error(f"ResourceCache: unable to read string resources: {err}", exc_info=True)
 
-            # config.default_locale can be 1 to 3 parts
-            locale_parts = self._config.default_locale + 2 * [""]
-            self._default_locale = Locale(*locale_parts[:3])
+    @property
+    def strings(self) -> Dict[str, str]:
+        """Gets the strings by resource id. Empty if the resource files could not be read."""
+        return self._strings
 
-            if not self._is_default_locale():
-                self._logger.debug(f"ResourceResolver.__init__: locale={self.locale}")
-                self._default_resource_resolver = self._get_resource_resolver(self._default_locale)
+
+class ResourceResolver:
+    """
+    Resource Resolver for localized strings
+
+    Strings are served from the :py:class:`ResourceCache` shared by all instances.
+    ``StringResourceWithLocation`` services are only created for dialogs, see :py:attr:`resource_resolver`,
+    or when the resource files could not be read.
+    """
+
+    def __init__(self, ctx: Any):
+        self._config = Config()
+        self._logger = OxtLogger(log_name=__name__)
+        self.ctx = ctx
+        self._resource_resolver: StringResourceWithLocation | None = None
+        self._default_resource_resolver: StringResourceWithLocation | None = None
+        self._cache: ResourceCache | None = None
+        # set before the cache so strings are still resolved with uno if the cache fails.
+        self._default_locale = _get_default_locale(self._config)
+        self.locale = self._default_locale
+        try:
+            self._cache = ResourceCache(ctx)
+            self.locale = self._cache.locale
         except Exception as err:
             self._logger.error(f"ResourceResolver.__init__: {err}", exc_info=True)
+            with contextlib.suppress(Exception):
+                self.locale = _get_env_locale(ctx)
 
     def _is_default_locale(self) -> bool:
         """Check if the current locale is the default locale"""
@@ -54,31 +112,48 @@ class ResourceResolver:
         except Exception:
             return "0.0.0"
 
-    def _get_env_locale(self):
-        """Get interface locale"""
-        ps = cast(
-            "PathSubstitution",
-            self.service_manager.createInstanceWithContext("com.sun.star.util.PathSubstitution", self.ctx),
-        )
-        v_lang = ps.getSubstituteVariableValue("vlang")
-        # self._logger.debug(f"ResourceResolver._get_env_locale: v_lang={v_lang}")
-        a_lang = v_lang.split("-") + 2 * [""]
-        # self._logger.debug(f"ResourceResolver._get_env_locale: a_lang={a_lang}")
-        return Locale(*a_lang[:3])
-
     def _get_resource_resolver(self, locale: Locale) -> StringResourceWithLocation:
         # url = self._get_ext_path() + "python"
         url = f"vnd.sun.star.extension://{self._config.lo_identifier}/{self._config.resource_dir_name}"
-        handler = self.service_manager.createInstanceWithContext("com.sun.star.task.InteractionHandler", self.ctx)
+        service_manager = self.ctx.getServiceManager()
+        handler = service_manager.createInstanceWithContext("com.sun.star.task.InteractionHandler", self.ctx)
         return cast(
             "StringResourceWithLocation",
-            self.service_manager.createInstanceWithArgumentsAndContext(
+            service_manager.createInstanceWithArgumentsAndContext(
                 "com.sun.star.resource.StringResourceWithLocation",
                 (url, False, locale, self._config.resource_properties_prefix, "", handler),
                 self.ctx,
             ),
         )
 
+    @property
+    def resource_resolver(self) -> StringResourceWithLocation:
+        """Gets the ``StringResourceWithLocation`` of the current locale, such as for a dialog model."""
+        if self._resource_resolver is None:
+            self._resource_resolver = self._get_resource_resolver(self.locale)
+        return self._resource_resolver
+
+    @property
+    def version(self) -> str:
+        """Gets the version of the extension."""
+        try:
+            return self._version
+        except AttributeError:
+            self._version = self._get_ext_ver()
+        return self._version
+
+    def _resolve_uno(self, id: str) -> str:
+        try:
+            return self.resource_resolver.resolveString(id)
+        except MissingResourceException:
+            # resource is not in the current locale get it from the default locale
+            if not self._is_default_locale():
+                if self._default_resource_resolver is None:
+                    self._default_resource_resolver = self._get_resource_resolver(self._default_locale)
+                return self._default_resource_resolver.resolveString(id)
+        self._logger.error(f"ResourceResolver.resolve_string missing resource for: {id}")
+        return id
+
     def resolve_string(self, id: str) -> str:
         """Resolve localized string
 
@@ -90,12 +165,13 @@ class ResourceResolver:
         """
         if id == "empty":
             return ""
+        strings = self._cache.strings if self._cache is not None else {}
         try:
-            return self.resource_resolver.resolveString(id)
-        except MissingResourceException:
-            # resource is not in the current locale get it from the default locale
-            if self._default_resource_resolver:
-                return self._default_resource_resolver.resolveString(id)
+            if strings:
+                return strings[id]
+            return self._resolve_uno(id)
+        except KeyError:
+            pass
         except Exception as err:
             self._logger.error(f"ResourceResolver.resolve_string: {err}", exc_info=True)
             return id
@@ -0,0 +1,49 @@
+"""
+Lazy constructors for UNO implementations.
+
+``unohelper.ImplementationHelper.addImplementation()`` only needs a callable that creates the
+component from the component context. Registering a :py:class:`LazyImpl` instead of the class
+means the module that defines the class is not imported until LibreOffice instantiates the service.
+"""
+
+from __future__ import annotations
+from typing import Any
+import importlib
+import threading
+
+
+class LazyImpl:
+    """Callable that imports a class on first use and then creates instances of it."""
+
+    def __init__(self, module_name: str, class_name: str) -> None:
+        """
+        Initialize LazyImpl
+
+        Args:
+            module_name (str): Absolute name of the module that defines the class such as ``___lo_pip___.dialog.handler.options``.
+            class_name (str): Name of the class such as ``OptionsDialogHandler``.
+        """
+        self._module_name = module_name
+        self._class_name = class_name
+        self._cls: Any = None
+        self._lock = threading.Lock()
+
+    def get_class(self) -> type:
+        """Imports the module, if not already imported, and gets the class."""
+        if self._cls is None:
+            with self._lock:
+                if self._cls is None:
+                    module = importlib.import_module(self._module_name)
+                    self._cls = getattr(module, self._class_name)
+        return self._cls
+
+    def __call__(self, *args: object, **kwargs: object) -> object:
+        return self.get_class()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._module_name!r}, {self._class_name!r})"
+
+    @property
+    def is_loaded(self) -> bool:
+        """Gets if the class has been imported."""
+        return self._cls is not None
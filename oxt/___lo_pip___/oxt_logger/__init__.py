@@ -1,3 +1,17 @@
-from .oxt_logger import OxtLogger
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .oxt_logger import OxtLogger
+
+
+def __getattr__(name: str) -> type:
+    # OxtLogger is imported on first use so log_backend can be imported without LibreOffice.
+    if name == "OxtLogger":
+        from .oxt_logger import OxtLogger
+
+        return OxtLogger
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["OxtLogger"]
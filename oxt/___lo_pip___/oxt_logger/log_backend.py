@@ -0,0 +1,220 @@
+"""
+Shared logging backend for :py:class:`~.oxt_logger.OxtLogger`.
+
+Loggers do not own handlers. Each logger gets a :py:class:`logging.handlers.QueueHandler` that is shared by all
+loggers with the same settings. The message of a record is merged with its arguments on the calling thread, then
+the record is put on one queue and a single listener thread formats and writes it.
+The listener writes the records that are waiting as a batch and flushes each file once per batch.
+
+There is one file handler per log file and one console handler. When a logger asks for a different level or format,
+the handler is updated in place instead of opening the file a second time.
+
+The records that are waiting are written when ``LogNamedEvent.LOGGING_FLUSH`` is triggered,
+and the listener is stopped and the queue drained when the process exits.
+"""
+
+from __future__ import annotations
+from logging.handlers import QueueHandler, TimedRotatingFileHandler
+from typing import Dict, List, Set, Tuple
+import atexit
+import logging
+import queue
+import sys
+import threading
+
+from ..meta.singleton import Singleton
+
+_Route = Tuple[str, str, int, bool]
+
+
+class _BatchFileHandler(TimedRotatingFileHandler):
+    """Rotating file handler that is flushed by the listener once per batch instead of once per record."""
+
+    def flush(self) -> None:
+        # called by emit() for each record.
+        pass
+
+    def flush_batch(self) -> None:
+        super().flush()
+
+    def close(self) -> None:
+        self.flush_batch()
+        super().close()
+
+
+class _RouteQueueHandler(QueueHandler):
+    """Puts records on the shared queue tagged with the handlers they are written to."""
+
+    def __init__(self, backend_queue: queue.Queue, route: _Route) -> None:
+        super().__init__(backend_queue)
+        self._route = route
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        self.queue.put_nowait((self._route, record))
+
+
+class LogBackend(metaclass=Singleton):
+    """Singleton class. Owns the file and console handlers of all loggers and the thread that writes to them."""
+
+    def __init__(self, batch_size: int = 256) -> None:
+        """
+        Initialize LogBackend
+
+        Args:
+            batch_size (int, optional): Maximum number of records written before files are flushed.
+        """
+        self._lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue()
+        self._batch_size = max(1, batch_size)
+        self._queue_handlers: Dict[_Route, QueueHandler] = {}
+        self._routes: Dict[_Route, List[logging.Handler]] = {}
+        self._handlers: Dict[Tuple[str, str], logging.Handler] = {}
+        self._thread: threading.Thread | None = None
+        self._stopped = False
+        atexit.register(self.stop)
+
+    # region Handlers
+    def get_handler(self, log_file: str, log_format: str, level: int, add_console: bool = False) -> logging.Handler:
+        """
+        Gets the handler for a logger.
+
+        Args:
+            log_file (str): Log file. Empty for no file.
+            log_format (str): Format of a record.
+            level (int): Log level.
+            add_console (bool, optional): Also write to ``stdout``.
+
+        Returns:
+            logging.Handler: Handler shared by all loggers with the same arguments.
+            A :py:class:`logging.NullHandler` if there is nothing to write to.
+        """
+        route: _Route = (log_file, log_format, level, add_console)
+        with self._lock:
+            # the targets are looked up even for a known route, that applies its level and format to them again.
+            targets: List[logging.Handler] = []
+            if log_file and level >= logging.DEBUG:
+                targets.append(self._get_target("file", log_file, log_format, level))
+            if add_console and level > 0:
+                targets.append(self._get_target("console", "", log_format, level))
+            if not targets:
+                return logging.NullHandler()
+            handler = self._queue_handlers.get(route)
+            if handler is not None:
+                return handler
+            handler = _RouteQueueHandler(_DirectQueue(targets) if self._stopped else self._queue, route)
+            handler.setLevel(level)
+            self._routes[route] = targets
+            self._queue_handlers[route] = handler
+            self._start()
+            return handler
+
+    def _get_target(self, kind: str, log_file: str, log_format: str, level: int) -> logging.Handler:
+        # lock is held by caller.
+        # keyed by file only, two handlers on one file would both try to rotate it.
+        key = (kind, log_file)
+        handler = self._handlers.get(key)
+        if handler is None:
+            if kind == "file":
+                handler = _BatchFileHandler(
+                    log_file, when="W0", interval=1, backupCount=3, encoding="utf8", delay=True
+                )
+            else:
+                handler = logging.StreamHandler(sys.stdout)
+            self._handlers[key] = handler
+        if handler.formatter is None or handler.formatter._fmt != log_format:
+            handler.setFormatter(logging.Formatter(log_format))
+        handler.setLevel(level)
+        return handler
+
+    # endregion Handlers
+
+    # region Listener
+    def _start(self) -> None:
+        # lock is held by caller.
+        if self._thread is not None or self._stopped:
+            return
+        self._thread = threading.Thread(target=self._run, name="OxtLogBackend", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = self._write(batch)
+            for _ in batch:
+                self._queue.task_done()
+            if stop:
+                return
+
+    def _write(self, batch: list) -> bool:
+        stop = False
+        written: Set[logging.Handler] = set()
+        for item in batch:
+            if item is None:
+                stop = True
+                continue
+            route, record = item
+            for handler in self._routes.get(route, ()):
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+                    written.add(handler)
+        for handler in written:
+            try:
+                if isinstance(handler, _BatchFileHandler):
+                    handler.flush_batch()
+                else:
+                    handler.flush()
+            except Exception:
+                pass
+        return stop
+
+    def flush(self) -> None:
+        """Waits until all records logged so far are written."""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+
+    def stop(self) -> None:
+        """Writes the records that are waiting, stops the listener and closes the files."""
+        with self._lock:
+            if self._stopped:
+                return
+            self._stopped = True
+            thread = self._thread
+            # records logged from now on are written on the caller thread.
+            for route, handler in self._queue_handlers.items():
+                handler.queue = _DirectQueue(self._routes[route])
+        if thread is not None and thread.is_alive():
+            self._queue.put_nowait(None)
+            thread.join(timeout=5.0)
+        with self._lock:
+            for target in self._handlers.values():
+                try:
+                    target.close()
+                except Exception:
+                    pass
+
+    # endregion Listener
+
+    @property
+    def is_running(self) -> bool:
+        """Gets if the listener thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+
+class _DirectQueue:
+    """Stand in for the queue once the listener stopped."""
+
+    def __init__(self, handlers: List[logging.Handler]) -> None:
+        self._handlers = handlers
+
+    def put_nowait(self, item: tuple) -> None:
+        _, record = item
+        for handler in self._handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+                if isinstance(handler, _BatchFileHandler):
+                    handler.flush_batch()
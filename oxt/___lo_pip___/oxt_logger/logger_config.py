@@ -9,6 +9,7 @@ from ..input_output import file_util
 from ..events.lo_events import LoEvents
 from ..events.args import EventArgs
 from ..events.named_events.log_named_event import LogNamedEvent
+from .log_backend import LogBackend
 
 
 if TYPE_CHECKING:
@@ -31,6 +32,10 @@ class LoggerConfig(metaclass=Singleton):
         self._log_level = self._get_log_level(log_level)
         self._log_ready_event_raised = False
         self._log_add_console = bool(configuration_settings["LogAddConsole"])
+        LoEvents().on(LogNamedEvent.LOGGING_FLUSH, self._on_logging_flush)
+
+    def _on_logging_flush(self, source: object, event_args: EventArgs) -> None:
+        LogBackend().flush()
 
     def _get_settings(self) -> Dict[str, Any]:
         # sourcery skip: dict-assign-update-to-union
@@ -1,9 +1,8 @@
 import logging
-import sys
 from logging import Logger
-from logging.handlers import TimedRotatingFileHandler
 
 # from .. import config
+from .log_backend import LogBackend
 from .logger_config import LoggerConfig
 
 
@@ -33,7 +32,6 @@ class OxtLogger(Logger):
             None: None
         """
         self._config = LoggerConfig()  # config.Config()
-        self.formatter = logging.Formatter(self._config.log_format)
         if not log_file:
             log_file = self._config.log_file
         self._log_file = log_file
@@ -44,18 +42,15 @@ class OxtLogger(Logger):
         # Logger.__init__(self, name=log_name, level=cfg.log_level)
         super().__init__(name=log_name, level=self._config.log_level)
 
-        has_handler = False
-
-        if self._log_file and self._config.log_level >= 10:  # DEBUG
-            self.addHandler(self._get_file_handler())
-            has_handler = True
-
-        if self._config.log_add_console and self._config.log_level > 0:
-            self.addHandler(self._get_console_handler())
-            has_handler = True
-
-        if not has_handler:
-            self.addHandler(self._get_null_handler())
+        # handlers are shared by all loggers and written to by a single background thread.
+        self.addHandler(
+            LogBackend().get_handler(
+                log_file=self._log_file,
+                log_format=self._config.log_format,
+                level=self._config.log_level,
+                add_console=self._config.log_add_console,
+            )
+        )
 
         # with this pattern, it's rarely necessary to propagate the| error up to parent
         self.propagate = False
@@ -64,25 +59,6 @@ class OxtLogger(Logger):
         if trigger:
             self._config.trigger_log_ready_event()
 
-    def _get_console_handler(self):
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setFormatter(self.formatter)
-        console_handler.setLevel(self._config.log_level)
-        return console_handler
-
-    def _get_null_handler(self):
-        return logging.NullHandler()
-
-    def _get_file_handler(self):
-        log_file = self._log_file
-        file_handler = TimedRotatingFileHandler(
-            log_file, when="W0", interval=1, backupCount=3, encoding="utf8", delay=True
-        )
-        # file_handler = logging.FileHandler(log_file, mode="w", encoding="utf8", delay=True)
-        file_handler.setFormatter(self.formatter)
-        file_handler.setLevel(self._config.log_level)
-        return file_handler
-
     @property
     def log_file(self):
         """Log file path."""
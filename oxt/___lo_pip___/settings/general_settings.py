@@ -9,22 +9,10 @@ class GeneralSettings(metaclass=Singleton):
     """Singleton Class. Manages Settings for the extension."""
 
     def __init__(self) -> None:
-        settings = Settings()
+        # values are read from Settings on each access so changes saved after start are seen.
+        self._settings = Settings()
         self._configuration = Configuration()
-        self._node_value = f"/{settings.lo_implementation_name}.Settings/GeneralSettings"
-        self._lo_implementation_name = str(settings.current_settings.get("LoImplementationName", ""))
-        self._lo_identifier = str(settings.current_settings.get("LoIdentifier", ""))
-        self._publisher_url = str(settings.current_settings.get("PublisherUrl", ""))
-        self._update_url_xml = str(settings.current_settings.get("UpdateUrlXml", ""))
-        self._update_url_oxt = str(settings.current_settings.get("UpdateUrlOxt", ""))
-        self._url_pip = str(settings.current_settings.get("UrlPip", ""))
-        self._pip_wheel_url = str(settings.current_settings.get("UrlPipWheel", ""))
-        self._test_internet_url = str(settings.current_settings.get("UrlTestInternet", ""))
-        self._platform = str(settings.current_settings.get("Platform", ""))
-        self._log_pip_installs = bool(settings.current_settings.get("LogPipInstalls", False))
-        self._show_progress = bool(settings.current_settings.get("ShowProgress", False))
-        self._startup_event = str(settings.current_settings.get("StartupEvent", ""))
-        self._delay_startup = bool(settings.current_settings.get("DelayStartup", True))
+        self._node_value = f"/{self._settings.lo_implementation_name}.Settings/GeneralSettings"
 
     # region Properties
     @property
@@ -32,54 +20,54 @@ class GeneralSettings(metaclass=Singleton):
         """
         Gets the flag indicating if the startup should be delayed.
         """
-        return self._delay_startup
+        return self._settings.get_bool("DelayStartup", True)
 
     @property
     def log_pip_installs(self) -> bool:
         """
         Gets the flag indicating if pip installs should be logged.
         """
-        return self._log_pip_installs
+        return self._settings.get_bool("LogPipInstalls")
 
     @property
     def lo_implementation_name(self) -> str:
         """Gets the name of the LibreOffice extension implementation."""
-        return self._lo_implementation_name
+        return self._settings.get_str("LoImplementationName")
 
     @property
     def lo_identifier(self) -> str:
         """Gets the identifier of the LibreOffice extension."""
-        return self._lo_identifier
+        return self._settings.get_str("LoIdentifier")
 
     @property
     def publisher_url(self) -> str:
         """Gets the publisher url of the LibreOffice extension."""
-        return self._publisher_url
+        return self._settings.get_str("PublisherUrl")
 
     @property
     def update_url_xml(self) -> str:
         """Gets the XML update url of the LibreOffice extension."""
-        return self._update_url_xml
+        return self._settings.get_str("UpdateUrlXml")
 
     @property
     def url_pip(self) -> str:
         """Gets the url to ``get-pip.py`` that installs pip."""
-        return self._url_pip
+        return self._settings.get_str("UrlPip")
 
     @property
     def pip_wheel_url(self) -> str:
         """Gets the url to the pip wheel."""
-        return self._pip_wheel_url
+        return self._settings.get_str("UrlPipWheel")
 
     @property
     def platform(self) -> str:
         """Gets the platform of the LibreOffice extension is targeted for."""
-        return self._platform
+        return self._settings.get_str("Platform")
 
     @property
     def show_progress(self) -> bool:
         """Gets the flag indicating if the terminal should be shown."""
-        return self._show_progress
+        return self._settings.get_bool("ShowProgress")
 
     @property
     def startup_event(self) -> str:
@@ -91,7 +79,7 @@ class GeneralSettings(metaclass=Singleton):
         Returns:
             str: The startup event of the extension.
         """
-        return self._startup_event
+        return self._settings.get_str("StartupEvent")
 
     @property
     def test_internet_url(self) -> str:
@@ -100,6 +88,6 @@ class GeneralSettings(metaclass=Singleton):
 
         The value for this property can be set in pyproject.toml (tool.oxt.token.test_internet_url)
         """
-        return self._test_internet_url
+        return self._settings.get_str("UrlTestInternet")
 
     # endregion Properties
@@ -9,11 +9,10 @@ class Options(metaclass=Singleton):
     """Singleton Class. Manages Load Settings for the extension."""
 
     def __init__(self) -> None:
-        settings = Settings()
+        # values are read from Settings on each access so changes saved in the options dialog are seen.
+        self._settings = Settings()
         self._configuration = Configuration()
-        self._node_value = f"/{settings.lo_implementation_name}.Settings/Options"
-        self._load_ooo_dev = bool(settings.current_settings.get("OptionLoadOooDev", False))
-        self._package_requirement = str(settings.current_settings.get("PackageRequirement", ""))
+        self._node_value = f"/{self._settings.lo_implementation_name}.Settings/Options"
 
     # region Properties
     @property
@@ -21,13 +20,13 @@ class Options(metaclass=Singleton):
         """
         Gets if OOO Dev Tools should be imported when LibreOffice starts.
         """
-        return self._load_ooo_dev
+        return self._settings.get_bool("OptionLoadOooDev")
 
     @property
     def package_requirement(self) -> str:
         """
         Gets the Package Requirement.
         """
-        return self._package_requirement
+        return self._settings.get_str("PackageRequirement")
 
     # endregion Properties
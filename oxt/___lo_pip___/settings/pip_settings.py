@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import cast, Tuple
+from typing import Tuple
 
 from .settings import Settings
 from ..meta.singleton import Singleton
@@ -11,11 +11,10 @@ class PipSettings(metaclass=Singleton):
     """Singleton Class. Manages Settings for the extension."""
 
     def __init__(self) -> None:
-        settings = Settings()
+        self._settings = Settings()
         self._config = Config()
         self._configuration = Configuration()
-        self._installed_local_pips = cast(Tuple, settings.current_settings.get("InstalledLocalPips", ()))
-        self._node_value = f"/{settings.lo_implementation_name}.Settings/PipInfo"
+        self._node_value = f"/{self._settings.lo_implementation_name}.Settings/PipInfo"
 
     def append_installed_local_pip(self, pip_name: str) -> None:
         """Appends a pip to the installed local pips."""
@@ -30,11 +29,10 @@ class PipSettings(metaclass=Singleton):
     @property
     def installed_local_pips(self) -> Tuple[str, ...]:
         """Gets/Sets the installed local pips."""
-        return self._installed_local_pips
+        return self._settings.get_str_tuple("InstalledLocalPips")
 
     @installed_local_pips.setter
     def installed_local_pips(self, value: Tuple[str, ...]) -> None:
         self._configuration.save_configuration_str_lst(
             node_value=self._node_value, name="InstalledLocalPips", value=value
         )
-        self._installed_local_pips = value
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Any, Dict, cast, TYPE_CHECKING
+from typing import Any, Dict, Tuple, cast, TYPE_CHECKING
 import uno
 
 from ..lo_util.configuration import Configuration
@@ -10,13 +10,20 @@ from ..basic_config import BasicConfig
 from ..events.lo_events import Events
 from ..events.args import EventArgs
 from ..events.named_events import ConfigurationNamedEvent, LogNamedEvent
+from .settings_cache import SettingsCache, get_accessor_name
 
 if TYPE_CHECKING:
     from com.sun.star.configuration import ConfigurationAccess
+    from ..adapter.changes_listener import ChangesListener
 
 
 class Settings(metaclass=Singleton):
-    """Singleton Class. Manages Settings for the extension."""
+    """
+    Singleton Class. Manages Settings for the extension.
+
+    All settings groups are read once. A changes listener on the settings node patches the keys that change,
+    including changes committed by other code such as the options dialog.
+    """
 
     def __init__(self) -> None:
         self._logger: OxtLogger | None = None
@@ -24,20 +31,30 @@ class Settings(metaclass=Singleton):
         cfg = BasicConfig()
         self._lo_identifier = cfg.lo_identifier
         self._lo_implementation_name = cfg.lo_implementation_name
-        self._current_settings = self.get_settings()
+        self._reader = self._get_reader()
+        self._cache = SettingsCache(self._read_settings(self._reader))
+        self._changes_listener: ChangesListener | None = None
         self._events = Events(source=self)
         self._set_events()
+        self._add_changes_listener()
 
     def _set_events(self) -> None:
         def on_configuration_saved(src: Any, event_args: EventArgs) -> None:
-            if self._logger:
-                self._logger.debug("Settings. Configuration saved. Updating settings..")
-            self._update_settings()
+            data = event_args.event_data or {}
+            try:
+                settings = data["settings"]
+                changes = dict(zip(settings["names"], settings["values"]))
+            except (KeyError, TypeError):
+                changes = None
+            self._on_saved(str(data.get("node_value", "")) if isinstance(data, dict) else "", changes)
 
         def on_configuration_str_lst_saved(src: Any, event_args: EventArgs) -> None:
-            if self._logger:
-                self._logger.debug("Settings. Configuration str lst saved. Updating settings..")
-            self._update_settings()
+            data = event_args.event_data or {}
+            try:
+                changes = {str(data["name"]): data["value"]}
+            except (KeyError, TypeError):
+                changes = None
+            self._on_saved(str(data.get("node_value", "")) if isinstance(data, dict) else "", changes)
 
         def on_logging_ready(src: Any, event_args: EventArgs) -> None:
             # this class may be called before the logger is ready,
@@ -58,10 +75,66 @@ class Settings(metaclass=Singleton):
         )
         self._events.on(event_name=LogNamedEvent.LOGGING_READY, callback=on_logging_ready)
 
-    def get_settings(self) -> Dict[str, Any]:
-        # sourcery skip: dict-assign-update-to-union
+    def _add_changes_listener(self) -> None:
+        """Listens for committed changes to the settings node. Saves are still applied from events if this fails."""
+        if not TYPE_CHECKING:
+            from ..adapter.changes_listener import ChangesListener
+
+        def on_changes(src: object, event_args: EventArgs) -> None:
+            self._on_changes(event_args.event_data)
+
+        def on_disposing(src: object, event_args: EventArgs) -> None:
+            self._changes_listener = None
+            self._reader = None
+
+        # keep callbacks in scope
+        self._fn_on_changes = on_changes
+        self._fn_on_disposing = on_disposing
+        try:
+            listener = ChangesListener(self._reader)
+            listener.on("changesOccurred", on_changes)
+            listener.on("disposing", on_disposing)
+            self._changes_listener = listener
+        except Exception as err:
+            if self._logger:
+                self._logger.warning(f"Settings. Unable to listen for configuration changes: {err}")
+
+    def _on_changes(self, event: Any) -> None:  # noqa: ANN401
+        changes: Dict[str, Any] = {}
+        try:
+            for change in event.Changes:
+                name = get_accessor_name(str(change.Accessor))
+                if not name:
+                    raise ValueError(f"Unknown accessor: {change.Accessor}")
+                changes[name] = change.Element
+        except Exception as err:
+            if self._logger:
+                self._logger.debug(f"Settings. Reading all settings, unable to apply changes: {err}")
+            self._update_settings()
+            return
+        changed = self._cache.patch(changes)
+        if changed and self._logger:
+            self._logger.debug(f"Settings. Changed: {', '.join(changed)}")
+
+    def _on_saved(self, node_value: str, changes: Dict[str, Any] | None) -> None:
+        if not node_value.startswith(f"/{self.lo_implementation_name}.Settings"):
+            return
+        if changes is None:
+            if self._logger:
+                self._logger.debug("Settings. Configuration saved. Updating settings..")
+            self._update_settings()
+            return
+        # the changes listener reports the same values, patching twice is harmless.
+        changed = self._cache.patch(changes)
+        if changed and self._logger:
+            self._logger.debug(f"Settings. Saved: {', '.join(changed)}")
+
+    def _get_reader(self) -> ConfigurationAccess:
         key = f"/{self.lo_implementation_name}.Settings"
-        reader = cast("ConfigurationAccess", self._configuration.get_configuration_access(key))
+        return cast("ConfigurationAccess", self._configuration.get_configuration_access(key))
+
+    def _read_settings(self, reader: ConfigurationAccess) -> Dict[str, Any]:
+        # sourcery skip: dict-assign-update-to-union
         group_names = reader.getElementNames()
         settings = {}
         for groupname in group_names:
@@ -74,9 +147,32 @@ class Settings(metaclass=Singleton):
             self._logger.debug(f"Returning {self.lo_implementation_name} settings.")
         return settings
 
+    def get_settings(self) -> Dict[str, Any]:
+        """Reads all settings from the configuration."""
+        return self._read_settings(self._reader or self._get_reader())
+
     def _update_settings(self) -> None:
         """Updates the current settings"""
-        self._current_settings = self.get_settings()
+        self._cache.replace(self.get_settings())
+
+    # region Typed Accessors
+    def get_bool(self, name: str, default: bool = False) -> bool:
+        """Gets a setting as ``bool``."""
+        return self._cache.get_bool(name, default)
+
+    def get_int(self, name: str, default: int = 0) -> int:
+        """Gets a setting as ``int``."""
+        return self._cache.get_int(name, default)
+
+    def get_str(self, name: str, default: str = "") -> str:
+        """Gets a setting as ``str``."""
+        return self._cache.get_str(name, default)
+
+    def get_str_tuple(self, name: str, default: Tuple[str, ...] = ()) -> Tuple[str, ...]:
+        """Gets a string list setting as ``tuple``."""
+        return self._cache.get_str_tuple(name, default)
+
+    # endregion Typed Accessors
 
     @property
     def lo_identifier(self) -> str:
@@ -88,7 +184,7 @@ class Settings(metaclass=Singleton):
 
     @property
     def current_settings(self) -> Dict[str, Any]:
-        return self._current_settings
+        return self._cache.values
 
     @property
     def configuration(self) -> Configuration:
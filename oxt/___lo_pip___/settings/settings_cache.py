@@ -0,0 +1,107 @@
+"""
+Values of the extension settings with typed accessors.
+
+:py:class:`~.settings.Settings` reads every settings group once and patches the keys that change.
+A converted value is kept until its key changes, so reading a setting is a dictionary lookup.
+"""
+
+from __future__ import annotations
+from typing import Any, Callable, Dict, List, Tuple, TypeVar
+import re
+
+_T = TypeVar("_T")
+_MISSING = object()
+_QUOTED = re.compile(r"""\[\s*(['"])(.*)\1\s*\]$""")
+
+
+def get_accessor_name(accessor: str) -> str:
+    """
+    Gets the setting name of the ``Accessor`` of a configuration ``ElementChange``.
+
+    Args:
+        accessor (str): Path relative to the node that is listened to such as ``GeneralSettings/ShowProgress``
+            or ``GeneralSettings/['ShowProgress']``.
+
+    Returns:
+        str: Setting name such as ``ShowProgress``. Empty string if ``accessor`` is empty.
+    """
+    name = accessor.rstrip("/").rsplit("/", 1)[-1].strip()
+    if m := _QUOTED.search(name):
+        return m.group(2)
+    return name
+
+
+class SettingsCache:
+    """Setting values by name."""
+
+    def __init__(self, values: Dict[str, Any] | None = None) -> None:
+        self._values: Dict[str, Any] = dict(values or {})
+        self._typed: Dict[Tuple[str, str], Any] = {}
+
+    def replace(self, values: Dict[str, Any]) -> None:
+        """Replaces all values."""
+        self._values.clear()
+        self._values.update(values)
+        self._typed.clear()
+
+    def patch(self, changes: Dict[str, Any]) -> List[str]:
+        """
+        Updates the values that changed.
+
+        Args:
+            changes (Dict[str, Any]): New values by setting name.
+
+        Returns:
+            List[str]: Names of the settings whose value changed.
+        """
+        changed: List[str] = []
+        for name, value in changes.items():
+            if self._values.get(name, _MISSING) == value:
+                continue
+            self._values[name] = value
+            changed.append(name)
+        if changed:
+            names = set(changed)
+            self._typed = {k: v for k, v in self._typed.items() if k[0] not in names}
+        return changed
+
+    def _get_typed(self, name: str, kind: str, default: _T, convert: Callable[[Any], _T]) -> _T:
+        key = (name, kind)
+        try:
+            return self._typed[key]
+        except KeyError:
+            pass
+        value = self._values.get(name, _MISSING)
+        if value is _MISSING or value is None:
+            return default
+        try:
+            result = convert(value)
+        except (TypeError, ValueError):
+            return default
+        self._typed[key] = result
+        return result
+
+    def get(self, name: str, default: Any = None) -> Any:  # noqa: ANN401
+        """Gets a value as stored."""
+        return self._values.get(name, default)
+
+    def get_bool(self, name: str, default: bool = False) -> bool:
+        """Gets a value as ``bool``."""
+        return self._get_typed(name, "bool", default, bool)
+
+    def get_int(self, name: str, default: int = 0) -> int:
+        """Gets a value as ``int``."""
+        return self._get_typed(name, "int", default, int)
+
+    def get_str(self, name: str, default: str = "") -> str:
+        """Gets a value as ``str``."""
+        return self._get_typed(name, "str", default, str)
+
+    def get_str_tuple(self, name: str, default: Tuple[str, ...] = ()) -> Tuple[str, ...]:
+        """Gets a string list value as ``tuple``."""
+        return self._get_typed(name, "str_tuple", default, lambda value: tuple(str(v) for v in value))
+
+    @property
+    def values(self) -> Dict[str, Any]:
+        """Gets the values. The dictionary is updated in place when settings change."""
+        return self._values
@@ -0,0 +1,172 @@
+"""
+Cooperative cancellation.
+
+Work that can be cancelled is given a :py:class:`CancellationToken` and checks it at safe points such as between
+packages. Nothing is interrupted in the middle of a step, so files and state are never left half written.
+Work that runs in a subprocess registers the process with :py:meth:`CancellationToken.register_process` so
+cancelling terminates the process instead of waiting for it.
+
+Code running in a :py:class:`~.killable_thread.KillableThread`, or in a :py:func:`token_scope`, can call
+:py:func:`check_cancelled` and :py:func:`sleep` without being passed the token. Installers take the token of
+the thread they run in, so an install started in a ``KillableThread`` stops at its next package when the thread
+is killed.
+"""
+
+from __future__ import annotations
+from typing import Callable, Dict, Iterator
+import contextlib
+import threading
+import time
+
+
+class CancelledError(Exception):
+    """Raised at a safe point after cancellation was requested."""
+
+    pass
+
+
+class CancellationToken(threading.Event):
+    """
+    Event that is set when work should stop.
+
+    The token is a :py:class:`threading.Event` so it can be passed where an event is expected,
+    such as the ``cancel`` argument of ``install.pip_worker.run_cmd()``.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._cb_lock = threading.Lock()
+        self._callbacks: Dict[int, Callable[[], None]] = {}
+        self._next_id = 0
+
+    def set(self) -> None:
+        """Requests cancellation and runs the registered callbacks once."""
+        with self._cb_lock:
+            if self.is_set():
+                return
+            super().set()
+            callbacks = list(self._callbacks.values())
+            self._callbacks.clear()
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                pass
+
+    def cancel(self) -> None:
+        """Requests cancellation. Same as :py:meth:`set`."""
+        self.set()
+
+    def raise_if_cancelled(self) -> None:
+        """
+        Checks the token at a safe point.
+
+        Raises:
+            CancelledError: If cancellation was requested.
+        """
+        if self.is_set():
+            raise CancelledError()
+
+    def register(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """
+        Registers a callback that is run when the token is cancelled.
+
+        The callback is run right away if the token is already cancelled.
+
+        Args:
+            callback (Callable[[], None]): Callback such as one that stops a process. Errors are ignored.
+
+        Returns:
+            Callable[[], None]: Function that unregisters the callback. Call it when the work is done.
+        """
+        with self._cb_lock:
+            if not self.is_set():
+                key = self._next_id
+                self._next_id += 1
+                self._callbacks[key] = callback
+
+                def unregister() -> None:
+                    with self._cb_lock:
+                        self._callbacks.pop(key, None)
+
+                return unregister
+        try:
+            callback()
+        except Exception:
+            pass
+        return lambda: None
+
+    def register_process(self, pid: int) -> Callable[[], None]:
+        """
+        Terminates a process and its children when the token is cancelled.
+
+        The process must have its own process group, such as one started with ``start_new_session=True``,
+        because the whole group is terminated. See ``input_output.proc.kill_proc()``.
+
+        Args:
+            pid (int): Process id.
+
+        Returns:
+            Callable[[], None]: Function that unregisters the process. Call it when the process has ended.
+        """
+
+        def kill() -> None:
+            from ..input_output.proc import kill_proc
+
+            kill_proc(pid)
+
+        return self.register(kill)
+
+    @property
+    def is_cancelled(self) -> bool:
+        """Gets if cancellation was requested."""
+        return self.is_set()
+
+
+_local = threading.local()
+
+
+def current_token() -> CancellationToken | None:
+    """Gets the token of the current thread, if any. See :py:func:`token_scope`."""
+    return getattr(_local, "token", None)
+
+
+def check_cancelled() -> None:
+    """
+    Checks the token of the current thread at a safe point. Does nothing if the thread has no token.
+
+    Raises:
+        CancelledError: If cancellation was requested.
+    """
+    token = current_token()
+    if token is not None:
+        token.raise_if_cancelled()
+
+
+def sleep(seconds: float) -> None:
+    """
+    Sleeps like :py:func:`time.sleep` but wakes up as soon as the token of the current thread is cancelled.
+
+    Args:
+        seconds (float): Seconds to sleep.
+
+    Raises:
+        CancelledError: If cancellation was requested before or while sleeping.
+    """
+    token = current_token()
+    if token is None:
+        time.sleep(seconds)
+        return
+    if token.wait(seconds):
+        raise CancelledError()
+
+
+@contextlib.contextmanager
+def token_scope(token: CancellationToken) -> Iterator[CancellationToken]:
+    """Makes ``token`` the token of the current thread while in the context."""
+    previous = current_token()
+    _local.token = token
+    try:
+        yield token
+    finally:
+        _local.token = previous
@@ -1,12 +1,24 @@
 from __future__ import annotations
-from typing import Any, Callable, Optional, Union
+from typing import Any, Callable
 import sys
 import threading
 
+from .cancellation import CancellationToken, CancelledError, token_scope
+
 
 class KillableThread(threading.Thread):
     """
-    A Thread that can be killed.
+    A Thread that can be stopped.
+
+    Stopping is cooperative. :py:meth:`kill` cancels the :py:attr:`token` of the thread and the target stops at its
+    next call to :py:func:`~.cancellation.check_cancelled` or :py:func:`~.cancellation.sleep`, which ends the thread
+    quietly. Unlike tracing every line, this adds no overhead to the code run by the thread.
+
+    Note:
+        Before cancellation tokens, ``kill()`` stopped the target at its next line by tracing every line it ran.
+        A target that never checks the token, such as a ``while True`` loop around ``time.sleep()``, no longer
+        stops and ``join()`` waits for it forever. Add the checks to such a target, or create the thread with
+        ``traced=True`` to keep the old behavior and its overhead.
 
     Example:
 
@@ -21,8 +33,9 @@ class KillableThread(threading.Thread):
 
             def log_runner(logger) -> None:
                 while True:
+                    check_cancelled()
                     logger.debug("running log_runner")
-                    time.sleep(1)
+                    sleep(1)  # thread.cancellation.sleep(), wakes up when the thread is killed.
 
             @run_in_thread
             def actual_log_progress() -> None:
@@ -42,28 +55,50 @@ class KillableThread(threading.Thread):
             g_exportedScripts = (log_progress,)
     """
 
-    # https://www.geeksforgeeks.org/python-different-ways-to-kill-a-thread/
-    def __init__(self, *args: Any, **keywords: Any) -> None:
-        threading.Thread.__init__(self, *args, **keywords)
-        self.killed = False
+    def __init__(self, *args: Any, traced: bool = False, **keywords: Any) -> None:
+        """
+        Initialize KillableThread
 
-    def start(self) -> None:
-        self.__run_backup = self.run
-        self.run = self.__run
-        threading.Thread.start(self)
+        Args:
+            args (Any): Arguments of :py:class:`threading.Thread`.
+            traced (bool, optional): Also stop the target at its next line, for targets that do not check the token.
+                Every line run by the thread is then several times slower. Defaults to ``False``.
+            keywords (Any): Keyword arguments of :py:class:`threading.Thread`.
+        """
+        threading.Thread.__init__(self, *args, **keywords)
+        self._token = CancellationToken()
+        self._traced = traced
 
-    def __run(self):
-        sys.settrace(self.global_trace)
-        self.__run_backup()
-        self.run = self.__run_backup
+    def run(self) -> None:
+        with token_scope(self._token):
+            try:
+                if self._traced:
+                    sys.settrace(self._global_trace)
+                threading.Thread.run(self)
+            except (CancelledError, SystemExit):
+                pass
+            finally:
+                if self._traced:
+                    sys.settrace(None)
 
-    def global_trace(self, frame: Any, event: str, arg: Any) -> Optional[Union[Callable, None]]:  # type: ignore[override] # pylint: disable=line-too-long
-        return self.local_trace if event == "call" else None
+    def _global_trace(self, frame: Any, event: str, arg: Any) -> Callable | None:
+        return self._local_trace if event == "call" else None
 
-    def local_trace(self, frame: Any, event: str, arg: Any) -> Optional[Union[Callable, None]]:
-        if event == "line" and self.killed:
+    def _local_trace(self, frame: Any, event: str, arg: Any) -> Callable | None:
+        if event == "line" and self._token.is_cancelled:
             raise SystemExit()
-        return self.local_trace
+        return self._local_trace
 
     def kill(self) -> None:
-        self.killed = True
+        """Requests the thread to stop at its next safe point, or its next line when ``traced``."""
+        self._token.cancel()
+
+    @property
+    def killed(self) -> bool:
+        """Gets if :py:meth:`kill` has been called."""
+        return self._token.is_cancelled
+
+    @property
+    def token(self) -> CancellationToken:
+        """Gets the cancellation token of the thread."""
+        return self._token
@@ -17,6 +17,13 @@ def run_in_thread(fn: Callable[..., Any]) -> Callable[..., threading.Thread]:
 
         .. code-block:: python
 
+            def log_runner(logger) -> None:
+                while True:
+                    # KillableThread stops at check_cancelled() and sleep(), see thread.cancellation.
+                    check_cancelled()
+                    logger.debug("running log_runner")
+                    sleep(1)
+
             @run_in_thread
             def actual_log_progress() -> None:
                 logger = OxtLogger(log_name=__name__)
@@ -0,0 +1,222 @@
+"""
+Per phase timing of the startup job.
+
+Each run records the start and duration of its phases such as the requirements check or the
+install of a package. Records are appended to a JSON lines trace file, one object per phase::
+
+    {"run": "3f2a...", "phase": "requirements_check", "start": 1700000000.123, "duration": 0.042, "args": {}}
+
+:py:func:`summarize` aggregates a trace file into percentiles across runs.
+"""
+
+from __future__ import annotations
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Sequence
+import json
+import math
+import os
+import threading
+import time
+import uuid
+
+from ..meta.singleton import Singleton
+
+
+class PhaseRecord(NamedTuple):
+    run: str
+    """Id of the run the phase belongs to."""
+    phase: str
+    """Phase name such as ``requirements_check``."""
+    start: float
+    """Start time in seconds since the epoch."""
+    duration: float
+    """Duration in seconds."""
+    args: Dict[str, Any]
+    """Extra details such as the name of an installed package."""
+
+
+class PhaseTimer:
+    """Records the duration of the phases of a run."""
+
+    def __init__(self, max_bytes: int = 1024 * 1024) -> None:
+        """
+        Initialize PhaseTimer
+
+        Args:
+            max_bytes (int, optional): Size a trace file may grow to before it is rotated. Defaults to 1 MB.
+        """
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._run = uuid.uuid4().hex
+        self._records: List[PhaseRecord] = []
+
+    @contextmanager
+    def phase(self, name: str, **args: object) -> Iterator[None]:
+        """
+        Context manager that records the duration of the code it wraps.
+
+        Args:
+            name (str): Phase name such as ``requirements_check``.
+            args (Any): Extra details to record, must be JSON serializable.
+        """
+        start = time.time()
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - t0, start=start, **args)
+
+    def record(self, name: str, duration: float, start: float | None = None, **args: object) -> None:
+        """
+        Records a phase that has already been timed.
+
+        Args:
+            name (str): Phase name.
+            duration (float): Duration in seconds.
+            start (float, optional): Start time in seconds since the epoch. Defaults to now less ``duration``.
+            args (Any): Extra details to record, must be JSON serializable.
+        """
+        if start is None:
+            start = time.time() - duration
+        with self._lock:
+            self._records.append(PhaseRecord(self._run, name, start, duration, args))
+
+    def write(self, pth: str | Path) -> int:
+        """
+        Appends the records of the current run to a JSON lines trace file and starts a new run.
+
+        When the file is larger than ``max_bytes`` it is first renamed with a ``.1`` suffix.
+
+        Args:
+            pth (str | Path): Trace file.
+
+        Returns:
+            int: Number of records written.
+        """
+        with self._lock:
+            records = self._records
+            self._records = []
+            self._run = uuid.uuid4().hex
+        if not records:
+            return 0
+        pth = Path(pth)
+        try:
+            if pth.stat().st_size > self._max_bytes:
+                os.replace(pth, pth.with_name(f"{pth.name}.1"))
+        except OSError:
+            pass
+        lines = "".join(json.dumps(r._asdict(), default=str) + "\n" for r in records)
+        with open(pth, "a", encoding="utf-8") as f:
+            f.write(lines)
+        return len(records)
+
+    @property
+    def run(self) -> str:
+        """Id of the current run."""
+        return self._run
+
+    @property
+    def records(self) -> List[PhaseRecord]:
+        """Records of the current run."""
+        with self._lock:
+            return list(self._records)
+
+
+class StartupTimer(PhaseTimer, metaclass=Singleton):
+    """Singleton class. Phase timer shared by the startup job and the installers it runs."""
+
+    pass
+
+
+def read_trace(pth: str | Path) -> List[PhaseRecord]:
+    """
+    Reads a JSON lines trace file. Lines that can not be parsed are skipped.
+
+    Args:
+        pth (str | Path): Trace file.
+
+    Returns:
+        List[PhaseRecord]: Records in file order.
+    """
+    results: List[PhaseRecord] = []
+    with open(pth, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                data = json.loads(line)
+                results.append(
+                    PhaseRecord(
+                        run=str(data["run"]),
+                        phase=str(data["phase"]),
+                        start=float(data["start"]),
+                        duration=float(data["duration"]),
+                        args=dict(data.get("args", {})),
+                    )
+                )
+            except Exception:
+                continue
+    return results
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """
+    Gets a percentile of values using linear interpolation between the closest ranks.
+
+    Args:
+        values (Sequence[float]): Values, need not be sorted.
+        pct (float): Percentile from ``0`` to ``100``.
+
+    Returns:
+        float: Percentile value. ``0.0`` if ``values`` is empty.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct / 100
+    lo = math.floor(k)
+    hi = math.ceil(k)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+def summarize(
+    records: Iterable[PhaseRecord] | str | Path, percentiles: Sequence[float] = (50, 90, 99)
+) -> Dict[str, Dict[str, float]]:
+    """
+    Aggregates phase durations across runs.
+
+    The durations of a phase that occurs more than once in a run, such as ``install_pkg``, are summed per run.
+
+    Args:
+        records (Iterable[PhaseRecord] | str | Path): Records or a trace file.
+        percentiles (Sequence[float], optional): Percentiles to report. Defaults to ``(50, 90, 99)``.
+
+    Returns:
+        Dict[str, Dict[str, float]]: Phase names as keys. Values have ``runs``, ``mean``, ``max`` and ``p<N>`` keys.
+    """
+    if isinstance(records, (str, Path)):
+        records = read_trace(records)
+    per_run: Dict[str, Dict[str, float]] = {}
+    for r in records:
+        runs = per_run.setdefault(r.phase, {})
+        runs[r.run] = runs.get(r.run, 0.0) + r.duration
+    results: Dict[str, Dict[str, float]] = {}
+    for phase, runs in per_run.items():
+        values = list(runs.values())
+        stats = {"runs": float(len(values)), "mean": sum(values) / len(values), "max": max(values)}
+        for pct in percentiles:
+            stats[f"p{pct:g}"] = percentile(values, pct)
+        results[phase] = stats
+    return results
+
+
+def format_summary(summary: Dict[str, Dict[str, float]]) -> str:
+    """Formats a :py:func:`summarize` result as a table sorted by the largest mean duration, in milliseconds."""
+    if not summary:
+        return ""
+    keys = [k for k in next(iter(summary.values())) if k != "runs"]
+    width = max(len(phase) for phase in summary)
+    lines = [f"{'phase':<{width}}  {'runs':>5}" + "".join(f"  {k:>9}" for k in keys)]
+    for phase, stats in sorted(summary.items(), key=lambda item: item[1]["mean"], reverse=True):
+        row = "".join(f"  {stats[k] * 1000:9.1f}" for k in keys)
+        lines.append(f"{phase:<{width}}  {int(stats['runs']):>5}{row}")
+    return "\n".join(lines)
@@ -11,6 +11,7 @@ from .not_equals import NotEquals
 from .tilde import Tilde
 from .tilde_eq import TildeEq
 from .ver_proto import VerProto
+from .ver_spec import VerSpec, compile_spec
 from .wildcard import Wildcard
 
 # https://www.darius.page/pipdev/
@@ -119,13 +120,22 @@ class VerRules:
         Returns:
             List[VerProto]: List of matched rules
         """
-        ver_strings = self.split_and_strip(vstr)
+        return list(self.compile(vstr).rules)
 
-        results: List[VerProto] = []
+    def compile(self, vstr: str) -> VerSpec:
+        """
+        Compiles a version string into a constraint that can check any version in one call.
 
-        for ver_str in ver_strings:
-            results.extend(self.get_partial_matched_rules(ver_str))
-        return results
+        Compiled constraints are cached by version string and the registered rules,
+        so compiling the same string again returns the same instance.
+
+        Args:
+            vstr (str): Version in string form, e.g. ``==1.2.3`` or ``>=1.2.3,<2.0.0``
+
+        Returns:
+            VerSpec: Compiled constraint.
+        """
+        return compile_spec(vstr, tuple(self._rules))
 
     def get_installed_is_valid(self, vstr: str, check_version: str) -> bool:
         """
@@ -138,8 +148,7 @@ class VerRules:
         Returns:
             bool: True if the installed version is valid, False otherwise.
         """
-        rules = self.get_matched_rules(vstr)
-        return self.get_installed_is_valid_by_rules(rules, check_version)
+        return self.compile(vstr).is_valid(check_version)
 
     def get_installed_is_valid_by_rules(self, rules: Iterable[VerProto], check_version: str) -> bool:
         """
@@ -0,0 +1,150 @@
+from __future__ import annotations
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple, Type
+import operator
+
+from packaging.version import Version
+
+from .ver_proto import VerProto
+from .wildcard import Wildcard
+
+_OPERATORS: Dict[str, Callable[[Version, Version], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<>": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+_Clause = Tuple[Callable[[Version, Version], bool], Version]
+
+
+class VerSpec:
+    """
+    Immutable, hashable version constraint compiled from a version string such as ``>=1.2.3,<2.0.0``.
+
+    The string is matched against rules and each rule is reduced to its version clauses once.
+    Checking a version against the constraint parses the version once and compares it against the clauses.
+
+    Note:
+        Instances are usually obtained from ``VerRules.compile()`` which caches them by version string.
+    """
+
+    __slots__ = ("_vstr", "_rules", "_clauses", "_versions_str", "_hash")
+
+    def __init__(self, vstr: str, rules: Tuple[VerProto, ...]) -> None:
+        """
+        Initialize VerSpec
+
+        Args:
+            vstr (str): Version in string form, e.g. ``==1.2.3`` or ``>=1.2.3,<2.0.0``
+            rules (Tuple[VerProto, ...]): Rules matched for ``vstr``.
+        """
+        self._vstr = vstr
+        self._rules = rules
+        clauses = tuple(self._get_clauses(rule) for rule in rules)
+        self._clauses: Optional[Tuple[_Clause, ...]] = None
+        if rules and all(c is not None for c in clauses):
+            self._clauses = tuple(c for rule_clauses in clauses for c in rule_clauses)  # type: ignore
+        self._versions_str = tuple(rule.get_versions_str() for rule in rules)
+        self._hash = hash((VerSpec, vstr, tuple(type(rule) for rule in rules)))
+
+    def _get_clauses(self, rule: VerProto) -> Optional[Tuple[_Clause, ...]]:
+        """Gets the clauses for a rule or ``None`` if the rule can not be satisfied."""
+        try:
+            versions = rule.get_versions()
+        except Exception:
+            return None
+        if not versions:
+            return None
+        if isinstance(rule, Wildcard) and len(versions) == 1:
+            # ``==*`` matches any version.
+            return ()
+        results = []
+        for ver in versions:
+            op = _OPERATORS.get(ver.prefix)
+            if op is None:
+                return None
+            results.append((op, Version(str(ver))))
+        return tuple(results)
+
+    def __repr__(self) -> str:
+        return f"<VerSpec('{self._vstr}')>"
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, VerSpec):
+            return self._vstr == other._vstr and self._hash == other._hash
+        return NotImplemented
+
+    def __bool__(self) -> bool:
+        return len(self._rules) > 0
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if hasattr(self, "_hash"):
+            raise AttributeError(f"{self.__class__.__name__} is immutable")
+        object.__setattr__(self, name, value)
+
+    def is_valid(self, check_version: str) -> bool:
+        """
+        Gets if a version is valid when compared to this constraint.
+
+        Args:
+            check_version (str): The version to check. Eg: ``1.2.3``
+
+        Returns:
+            bool: ``True`` if the version meets every rule; Otherwise, ``False``.
+                Also ``False`` when there are no rules or ``check_version`` is not a valid version.
+        """
+        if self._clauses is None:
+            return False
+        check_version = check_version.strip()
+        if not check_version[:1].isdigit():
+            # rules parse the version with an ``==`` prefix, anything before the first digit is invalid.
+            return False
+        try:
+            ver = Version(check_version)
+        except Exception:
+            return False
+        return all(op(ver, clause_ver) for op, clause_ver in self._clauses)
+
+    @property
+    def vstr(self) -> str:
+        """Get the version string the constraint was compiled from."""
+        return self._vstr
+
+    @property
+    def rules(self) -> Tuple[VerProto, ...]:
+        """Get the rules matched for the version string."""
+        return self._rules
+
+    @property
+    def versions_str(self) -> Tuple[str, ...]:
+        """Get the pip version strings of each rule such as ``('>=1.2.0, <2.0.0',)``."""
+        return self._versions_str
+
+
+@lru_cache(maxsize=256)
+def compile_spec(vstr: str, rule_types: Tuple[Type[VerProto], ...]) -> VerSpec:
+    """
+    Compiles a version string into a cached ``VerSpec``.
+
+    Args:
+        vstr (str): Version in string form, e.g. ``==1.2.3`` or ``>=1.2.3,<2.0.0``
+        rule_types (Tuple[Type[VerProto], ...]): Rules to match each part of ``vstr`` against.
+
+    Returns:
+        VerSpec: Compiled constraint.
+    """
+    clean_str = vstr.replace(";", ",")
+    rules = []
+    for ver_str in (s.strip() for s in clean_str.split(",")):
+        for rule in rule_types:
+            inst = rule(vstr=ver_str)
+            if inst.get_is_match():
+                rules.append(inst)
+    return VerSpec(vstr=vstr, rules=tuple(rules))
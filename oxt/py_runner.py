@@ -23,6 +23,7 @@ if TYPE_CHECKING:
     from .___lo_pip___.oxt_logger import OxtLogger  # type: ignore
     from .___lo_pip___.lo_util import Session, RegisterPathKind, UnRegisterPathKind  # type: ignore
     from .___lo_pip___.install.requirements_check import RequirementsCheck  # type: ignore
+    from .___lo_pip___.install.requirements_fingerprint import RequirementsFingerprint  # type: ignore
     from .___lo_pip___.lo_util.resource_resolver import ResourceResolver  # type: ignore
 else:
     RegisterPathKind = object
@@ -39,26 +40,36 @@ def add_local_path_to_sys_path() -> None:
 add_local_path_to_sys_path()
 
 if TYPE_CHECKING:
-    from .___lo_pip___.dialog.handler import logger_options
+    from .___lo_pip___.meta.lazy_impl import LazyImpl
+    from .___lo_pip___.dialog.handler import impl_names
     from .___lo_pip___.config import Config
+    from .___lo_pip___.install.install_lock import InstallLock
     from .___lo_pip___.install.install_pip import InstallPip
+    from .___lo_pip___.install.py_packages.packages import Packages
+    from .___lo_pip___.install.shared_registry import SharedRegistry
+    from .___lo_pip___.lo_util.target_path import TargetPath
+    from .___lo_pip___.install.progress_session import ProgressSession
     from .___lo_pip___.lo_util.util import Util
     from .___lo_pip___.adapter.top_window_listener import TopWindowListener
     from .___lo_pip___.events.lo_events import LoEvents
     from .___lo_pip___.events.args.event_args import EventArgs
     from .___lo_pip___.events.startup.startup_monitor import StartupMonitor
     from .___lo_pip___.events.named_events.startup_events import StartupNamedEvent
+    from .___lo_pip___.events.named_events.log_named_event import LogNamedEvent
+    from .___lo_pip___.timing.phase_timer import StartupTimer
 
 else:
-    from ___lo_pip___.dialog.handler import logger_options
+    # InstallPip, TopWindowListener and the dialog handlers are imported when they are first needed.
+    from ___lo_pip___.meta.lazy_impl import LazyImpl
+    from ___lo_pip___.dialog.handler import impl_names
     from ___lo_pip___.config import Config
-    from ___lo_pip___.install.install_pip import InstallPip
     from ___lo_pip___.lo_util.util import Util
-    from ___lo_pip___.adapter.top_window_listener import TopWindowListener
     from ___lo_pip___.events.lo_events import LoEvents
     from ___lo_pip___.events.args.event_args import EventArgs
     from ___lo_pip___.events.startup.startup_monitor import StartupMonitor
     from ___lo_pip___.events.named_events.startup_events import StartupNamedEvent
+    from ___lo_pip___.events.named_events.log_named_event import LogNamedEvent
+    from ___lo_pip___.timing.phase_timer import StartupTimer
 # endregion imports
 
 # region Constants
@@ -76,6 +87,7 @@ class ___lo_implementation_name___(unohelper.Base, XJob):
     # region Init
 
     def __init__(self, ctx):
+        self._timer = StartupTimer()
         self._this_pth = os.path.dirname(__file__)
         self._error_msg = ""
         self._job_event_name = ""
@@ -86,6 +98,7 @@ class ___lo_implementation_name___(unohelper.Base, XJob):
         self._start_time = 0.0
         self._window_timer: threading.Timer | None = None
         self._thread_lock = threading.Lock()
+        self._startup_ready = False
         self._events = LoEvents()
         self._startup_monitor = StartupMonitor()  # start the singleton startup monitor
         # logger.debug("___lo_implementation_name___ Init")
@@ -109,7 +122,8 @@ class ___lo_implementation_name___(unohelper.Base, XJob):
             RegisterPathKind = InitRegisterPathKind
             UnRegisterPathKind = InitUnRegisterPathKind
 
-        self._config = Config()
+        with self._timer.phase("config_init"):
+            self._config = Config()
         self._delay_start = self._config.delay_startup
         self._logger = self._get_local_logger()
 
@@ -136,11 +150,14 @@ class ___lo_implementation_name___(unohelper.Base, XJob):
             # must be after self._add_py_req_pkgs_to_sys_path()
             try:
                 from ___lo_pip___.install.requirements_check import RequirementsCheck
+                from ___lo_pip___.install.requirements_fingerprint import RequirementsFingerprint
             except Exception as err:
                 self._logger.error(err, exc_info=True)
         self._requirements_check = RequirementsCheck()
-        self._add_site_package_dir_to_sys_path()
-        self._init_isolated()
+        self._requirements_fingerprint = RequirementsFingerprint()
+        with self._timer.phase("sys_path"):
+            self._add_site_package_dir_to_sys_path()
+            self._init_isolated()
 
     # endregion Init
 
@@ -159,23 +176,35 @@ class ___lo_implementation_name___(unohelper.Base, XJob):
             self._logger.info(f"Valid job event names: {self._valid_job_event_names}")
             return
         self._logger.debug(f"Job event name: {self._job_event_name}")
+        if self._config.async_startup:
+            self._logger.debug("Async startup. Running startup on a background thread.")
+            self._startup_thread = threading.Thread(target=self._execute_startup, daemon=True)
+            self._startup_thread.start()
+            return
+        self._execute_startup()
+
+    def _execute_startup(self) -> None:
         try:
-            self._add_py_pkgs_to_sys_path()
-            self._add_py_req_pkgs_to_sys_path()
-            self._add_pure_pkgs_to_sys_path()
+            with self._timer.phase("sys_path"):
+                self._add_py_pkgs_to_sys_path()
+                self._add_py_req_pkgs_to_sys_path()
+                self._add_pure_pkgs_to_sys_path()
 
             if self._config.log_level < 20:  # Less than INFO
                 self._show_extra_debug_info()
                 # self._config.extension_info.log_extensions(self._logger)
 
             requirements_met = False
-            if self._requirements_check.check_requirements() is True and not self._config.has_locals:
+            with self._timer.phase("requirements_check"):
+                requirements_check = self._check_requirements()
+            if requirements_check is True and not self._config.has_locals:
                 requirements_met = True
 
             if requirements_met:
                 self._logger.debug("Requirements are met. Nothing more to do.")
                 self._import_on_load()
                 self._log_ex_time(self._start_time)
+                self._set_startup_ready()
                 return
 
             if self._config.py_pkg_dir:
@@ -198,6 +227,9 @@ class ___lo_implementation_name___(unohelper.Base, XJob):
 
                 self._fn_on_window_opened = _on_window_opened
 
+                if not TYPE_CHECKING:
+                    from ___lo_pip___.adapter.top_window_listener import TopWindowListener
+
                 self._twl = TopWindowListener()
                 self._start_window_timer()
                 self._twl.on("windowOpened", _on_window_opened)
@@ -206,6 +238,7 @@ class ___lo_implementation_name___(unohelper.Base, XJob):
             if self._logger:
                 self._logger.error(err)
             self._log_ex_time(self._start_time)
+            self._set_startup_ready()
             return
         finally:
             # self._remove_local_path_from_sys_path()
@@ -215,38 +248,40 @@ class ___lo_implementation_name___(unohelper.Base, XJob):
         self._real_execute(start_time=self._start_time, has_window=False)
 
     def _real_execute(self, start_time: float, has_window: bool = False) -> None:
-        if has_window:
-            # LibreOffice runs extension in parallel, so we need to wait in line
-            wait_count = 0
-            while os.environ.get("OOOPIP_RUNNER_WAIT_IN_LINE", ""):
-                wait_count += 1
-                if wait_count == 1:
-                    self._logger.info("Waiting in line. Other Installers are working...")
-                time.sleep(0.5)
-            if wait_count > 0:
-                # reset the time and don't include wait time.
-                start_time = time.time()
-                self._logger.info("Done waiting in line.")
-            else:
-                self._logger.debug("No other Installers are running. Starting...")
-
+        # LibreOffice runs extensions in parallel, installs of all extensions that share the user profile
+        # take turns in the order they arrived.
+        install_lock = self._acquire_install_lock()
+        if install_lock is not None and install_lock.stats.ahead > 0:
+            # reset the time and don't include wait time.
+            start_time = time.time()
+
+        progress_session = False
         try:
-            with self._thread_lock:
-                os.environ["OOOPIP_RUNNER_WAIT_IN_LINE"] = "1"
             if not TYPE_CHECKING:
                 # run time
-                self._logger.debug("Imported InstallPip")
+                from ___lo_pip___.install.install_pip import InstallPip
                 from ___lo_pip___.install.install_pkg import InstallPkg
+                from ___lo_pip___.install.progress_session import ProgressSession
+
+                self._logger.debug("Imported InstallPip")
+            if self._config.show_progress:
+                # every step of this run is shown in one progress window that is opened on the first step.
+                title = self.resource_resolver.resolve_string("title01") or self._config.lo_implementation_name
+                ProgressSession().begin(title)
+                progress_session = True
             pip_installer = InstallPip(self.ctx)
             self._logger.debug("Created InstallPip instance")
-            if pip_installer.is_pip_installed():
+            with self._timer.phase("pip_check"):
+                is_pip_installed = pip_installer.is_pip_installed()
+            if is_pip_installed:
                 self._logger.info("Pip is already installed")
             else:
                 self._logger.info("Pip is not installed. Attempting to install")
                 if not pip_installer.is_internet:
                     self._logger.error("No internet connection!")
                     return
-                pip_installer.install_pip()
+                with self._timer.phase("install_pip"):
+                    pip_installer.install_pip()
                 if pip_installer.is_pip_installed():
                     self._logger.info("Pip has been installed")
                 else:
@@ -254,18 +289,22 @@ class ___lo_implementation_name___(unohelper.Base, XJob):
                     return
 
             # install wheel if needed
-            self._install_wheel()
+            with self._timer.phase("install_wheel"):
+                self._install_wheel()
 
             # install any packages that are not installed
             if self._config.has_locals:
                 self._install_locals()
             pkg_installer = InstallPkg(ctx=self.ctx)
             self._logger.debug("Created InstallPkg instance")
-            pkg_installer.install()
+            with self._timer.phase("install"):
+                pkg_installer.install()
 
-            self._handel_bz2()
+            with self._timer.phase("bz2"):
+                self._handel_bz2()
 
-            self._post_install()
+            with self._timer.phase("link_cpython"):
+                self._post_install()
 
             if has_window:
                 self._display_complete_dialog()
@@ -278,10 +317,100 @@ class ___lo_implementation_name___(unohelper.Base, XJob):
                 self._logger.error(err)
         finally:
             # self._remove_local_path_from_sys_path()
-            with self._thread_lock:
-                del os.environ["OOOPIP_RUNNER_WAIT_IN_LINE"]
+            if progress_session:
+                ProgressSession().end()
+            if install_lock is not None:
+                stats = install_lock.release()
+                self._logger.debug(f"Released install lock after {stats.hold_time:.2f} seconds.")
             self._remove_py_req_pkgs_from_sys_path()
             self._log_ex_time(start_time)
+            self._set_startup_ready()
+
+    def _acquire_install_lock(self) -> InstallLock | None:
+        """
+        Waits for the installers of other extensions and LibreOffice processes that arrived earlier.
+
+        Returns:
+            InstallLock | None: The acquired lock, or ``None`` if the lock could not be used.
+        """
+        if not TYPE_CHECKING:
+            from ___lo_pip___.install.install_lock import InstallLock
+        install_lock = InstallLock(self._config.install_queue_dir)
+        try:
+            with self._timer.phase("wait_in_line"):
+                stats = install_lock.acquire()
+        except Exception as err:
+            self._logger.warning(f"Unable to acquire install lock, not waiting in line: {err}")
+            return None
+        if stats.ahead > 0:
+            self._logger.info(
+                f"Done waiting in line behind {stats.ahead} installer(s) for {stats.wait_time:.2f} seconds."
+            )
+        else:
+            self._logger.debug("No other Installers are running. Starting...")
+        if stats.stale > 0:
+            self._logger.warning(f"Skipped {stats.stale} install lock ticket(s) left by installers that ended.")
+        return install_lock
+
+    def _check_requirements(self) -> bool:
+        """
+        Checks if requirements are met.
+
+        The metadata walk of ``RequirementsCheck`` is skipped when the stored fingerprint matches.
+        """
+        if self._requirements_fingerprint.is_match():
+            self._logger.debug("Requirements fingerprint matches. Skipping requirements check.")
+            return True
+        # probe for internet while requirements are checked, it is needed if anything must be installed.
+        self._start_internet_check()
+        result = self._requirements_check.check_requirements()
+        if result:
+            self._requirements_fingerprint.save()
+            self._register_shared_requirements()
+        return result
+
+    def _register_shared_requirements(self) -> None:
+        """
+        Records the requirements of this extension when they are met without installing anything,
+        so other extensions that share the site-packages do not uninstall packages it needs.
+        """
+        if not self._config.share_requirements or not self._config.site_packages:
+            return
+        try:
+            if not TYPE_CHECKING:
+                from ___lo_pip___.install.py_packages.packages import Packages
+                from ___lo_pip___.install.shared_registry import SharedRegistry
+                from ___lo_pip___.lo_util.target_path import TargetPath
+
+            site = self._config.site_packages
+            target = TargetPath()
+            req = self._config.requirements.copy()
+            req.update(Packages().to_dict())
+            req = {name: ver for name, ver in req.items() if target.get_package_target(name) == site}
+            registry = SharedRegistry(self._config.shared_requirements_file)
+            if registry.register(self._config.lo_identifier, site, req):
+                self._logger.debug("Registered shared requirements.")
+        except Exception as err:
+            self._logger.warning(f"Unable to register shared requirements: {err}")
+
+    def _start_internet_check(self) -> None:
+        try:
+            from ___lo_pip___.install.download import Download  # type: ignore
+
+            Download().start_internet_check()
+        except Exception as err:
+            self._logger.warning(f"Unable to start internet check: {err}")
+
+    def _set_startup_ready(self) -> None:
+        """Triggers the startup ready event once so ``StartupMonitor().wait_ready()`` returns."""
+        with self._thread_lock:
+            if self._startup_ready:
+                return
+            self._startup_ready = True
+        self._logger.debug("Triggering startup ready event.")
+        self._events.trigger(StartupNamedEvent.STARTUP_READY, EventArgs(self))
+        # the job is done, write what it logged instead of waiting for the process to exit.
+        self._events.trigger(LogNamedEvent.LOGGING_FLUSH, EventArgs(self))
 
     # endregion execute
 
@@ -290,6 +419,8 @@ class ___lo_implementation_name___(unohelper.Base, XJob):
         if self._added_packaging and "packaging" in sys.modules:
             del sys.modules["packaging"]
         if self._config.unload_after_install and "___lo_pip___" in sys.modules:
+            with contextlib.suppress(Exception):
+                self._events.trigger(LogNamedEvent.LOGGING_FLUSH, EventArgs(self))
             # clean up by removing the ___lo_pip___ module from sys.modules
             # module still can be imported if needed.
             del sys.modules["___lo_pip___"]
@@ -412,6 +543,7 @@ class ___lo_implementation_name___(unohelper.Base, XJob):
             with contextlib.suppress(Exception):
                 title = self.resource_resolver.resolve_string("title01") or self._config.lo_implementation_name
                 self._display_message(msg=self._error_msg, title=title, suppress_error=False)
+            self._set_startup_ready()
             return
         self._ex_thread = threading.Thread(target=self._real_execute, args=(self._start_time, True))
         self._ex_thread.start()
@@ -497,6 +629,19 @@ class ___lo_implementation_name___(unohelper.Base, XJob):
         end_time = time.time()
         total_time = end_time - start_time
         self._logger.info(f"{self._config.lo_implementation_name} execution time: {total_time:.3f} seconds")
+        self._timer.record("total", total_time, start=start_time)
+        self._write_trace()
+
+    def _write_trace(self) -> None:
+        """Appends the phase timings of this run to a ``.trace.jsonl`` file next to the log file."""
+        if not self._logger.log_file or self._config.log_level <= 0:
+            return
+        try:
+            pth = Path(self._logger.log_file).with_suffix(".trace.jsonl")
+            count = self._timer.write(pth)
+            self._logger.debug(f"Wrote {count} phase timings to {pth}")
+        except Exception as err:
+            self._logger.warning(f"Unable to write phase timings: {err}")
 
     def _get_user_profile_path(self, as_sys_path: bool = True, ctx: Any = None) -> str:
         """
@@ -630,13 +775,19 @@ class ___lo_implementation_name___(unohelper.Base, XJob):
 
         try:
             if TYPE_CHECKING:
+                from .___lo_pip___.install.installed_files import InstalledFiles
                 from .___lo_pip___.install.post.cpython_link import CPythonLink
                 from .___lo_pip___.install.progress import Progress
             else:
+                from ___lo_pip___.install.installed_files import InstalledFiles
                 from ___lo_pip___.install.post.cpython_link import CPythonLink
                 from ___lo_pip___.install.progress import Progress
 
             link = CPythonLink()
+            new_files = InstalledFiles().get_files(".so")
+            if link.has_manifest and not new_files:
+                self._logger.debug("No new extension modules installed. Skipping post install.")
+                return
             if self._config.is_mac or self._config._is_app_image:
                 self._logger.debug("Mac or AppImage, linking needed.")
             else:
@@ -656,7 +807,7 @@ class ___lo_implementation_name___(unohelper.Base, XJob):
                 title = self.resource_resolver.resolve_string("title03")
                 progress = Progress(start_msg=msg, title=title)
                 progress.start()
-            link.link()
+            link.link(new_files)
         except Exception as err:
             self._logger.error(err, exc_info=True)
             return
@@ -689,24 +840,25 @@ class ___lo_implementation_name___(unohelper.Base, XJob):
 
     # region Import on Load
     def _import_on_load(self) -> None:
-        try:
-            if TYPE_CHECKING:
-                from .___lo_pip___.settings.options import Options
-            else:
-                from ___lo_pip___.settings.options import Options
+        with self._timer.phase("import_on_load"):
+            try:
+                if TYPE_CHECKING:
+                    from .___lo_pip___.settings.options import Options
+                else:
+                    from ___lo_pip___.settings.options import Options
 
-            self._logger.debug("Starting _import_on_load")
+                self._logger.debug("Starting _import_on_load")
 
-            settings = Options()
+                settings = Options()
 
-            if settings.load_ooo_dev:
-                with contextlib.suppress(ImportError):
-                    import ooodev  # type: ignore
+                if settings.load_ooo_dev:
+                    with contextlib.suppress(ImportError):
+                        import ooodev  # type: ignore
 
-                    self._logger.debug("Imported ooodev")
-        except Exception as err:
-            self._logger.error(err, exc_info=True)
-        self._logger.debug("Finished _import_on_load")
+                        self._logger.debug("Imported ooodev")
+            except Exception as err:
+                self._logger.error(err, exc_info=True)
+            self._logger.debug("Finished _import_on_load")
 
     # endregion Import on Load
 
@@ -754,7 +906,8 @@ class ___lo_implementation_name___(unohelper.Base, XJob):
         except AttributeError:
             from ___lo_pip___.install.download import Download  # type: ignore
 
-            self._has_internet_connection = Download().is_internet
+            with self._timer.phase("internet_check"):
+                self._has_internet_connection = Download().is_internet
         return self._has_internet_connection
 
     # endregion Properties
@@ -772,25 +925,24 @@ g_ImplementationHelper = unohelper.ImplementationHelper()
 # which the loader uses to register/instantiate the component.
 g_ImplementationHelper.addImplementation(___lo_implementation_name___, implementation_name, implementation_services)
 
+# dialog handlers are registered with lazy constructors so their modules are only imported
+# when LibreOffice opens the dialog.
 g_ImplementationHelper.addImplementation(
-    logger_options.OptionsDialogHandler, logger_options.IMPLEMENTATION_NAME, (logger_options.IMPLEMENTATION_NAME,)
+    LazyImpl("___lo_pip___.dialog.handler.logger_options", "OptionsDialogHandler"),
+    impl_names.LOGGING_OPTIONS_PAGE,
+    (impl_names.LOGGING_OPTIONS_PAGE,),
 )
 
-if TYPE_CHECKING:
-    from .___lo_pip___.dialog.handler import options as dialog_options
-    from .___lo_pip___.dialog.handler import uninstall as dialog_uninstall
-else:
-    from ___lo_pip___.dialog.handler import options as dialog_options
-    from ___lo_pip___.dialog.handler import uninstall as dialog_uninstall
-
 g_ImplementationHelper.addImplementation(
-    dialog_options.OptionsDialogHandler, dialog_options.IMPLEMENTATION_NAME, (dialog_options.IMPLEMENTATION_NAME,)
+    LazyImpl("___lo_pip___.dialog.handler.options", "OptionsDialogHandler"),
+    impl_names.OPTIONS_PAGE,
+    (impl_names.OPTIONS_PAGE,),
 )
 
 g_ImplementationHelper.addImplementation(
-    dialog_uninstall.OptionsDialogUninstallHandler,
-    dialog_uninstall.IMPLEMENTATION_NAME,
-    (dialog_uninstall.IMPLEMENTATION_NAME,),
+    LazyImpl("___lo_pip___.dialog.handler.uninstall", "OptionsDialogUninstallHandler"),
+    impl_names.UNINSTALL_PAGE,
+    (impl_names.UNINSTALL_PAGE,),
 )
 
 # endregion Implementation
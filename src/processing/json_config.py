@@ -89,6 +89,51 @@ class JsonConfig(metaclass=Singleton):
         except Exception:
             self._unload_after_install = True
 
+        try:
+            self._async_startup = cast(bool, self._cfg["tool"]["oxt"]["config"]["async_startup"])
+        except Exception:
+            self._async_startup = False
+
+        try:
+            self._batch_install = cast(bool, self._cfg["tool"]["oxt"]["config"]["batch_install"])
+        except Exception:
+            self._batch_install = True
+
+        try:
+            self._pip_worker_idle_timeout = int(self._cfg["tool"]["oxt"]["config"]["pip_worker_idle_timeout"])
+        except Exception:
+            self._pip_worker_idle_timeout = 60
+
+        try:
+            self._prefetch_workers = int(self._cfg["tool"]["oxt"]["config"]["prefetch_workers"])
+        except Exception:
+            self._prefetch_workers = 4
+
+        try:
+            self._uninstall_workers = int(self._cfg["tool"]["oxt"]["config"]["uninstall_workers"])
+        except Exception:
+            self._uninstall_workers = 4
+
+        try:
+            self._wheel_cache_dir = cast(str, self._cfg["tool"]["oxt"]["config"]["wheel_cache_dir"])
+        except Exception:
+            self._wheel_cache_dir = ""
+
+        try:
+            self._wheel_cache_size = int(self._cfg["tool"]["oxt"]["config"]["wheel_cache_size"])
+        except Exception:
+            self._wheel_cache_size = 512
+
+        try:
+            self._share_requirements = cast(bool, self._cfg["tool"]["oxt"]["config"]["share_requirements"])
+        except Exception:
+            self._share_requirements = True
+
+        try:
+            self._internet_check_ttl = int(self._cfg["tool"]["oxt"]["config"]["internet_check_ttl"])
+        except Exception:
+            self._internet_check_ttl = 300
+
         try:
             self._extension_version = cast(str, self._cfg["project"]["version"])
         except Exception:
@@ -132,6 +177,15 @@ class JsonConfig(metaclass=Singleton):
         json_config["sym_link_cpython"] = self._sym_link_cpython
         json_config["uninstall_on_update"] = self._uninstall_on_update
         json_config["unload_after_install"] = self._unload_after_install
+        json_config["async_startup"] = self._async_startup
+        json_config["batch_install"] = self._batch_install
+        json_config["pip_worker_idle_timeout"] = self._pip_worker_idle_timeout
+        json_config["prefetch_workers"] = self._prefetch_workers
+        json_config["uninstall_workers"] = self._uninstall_workers
+        json_config["wheel_cache_dir"] = self._wheel_cache_dir
+        json_config["wheel_cache_size"] = self._wheel_cache_size
+        json_config["share_requirements"] = self._share_requirements
+        json_config["internet_check_ttl"] = self._internet_check_ttl
         # json_config["log_pip_installs"] = self._log_pip_installs
         # update the requirements
         json_config["requirements"] = self._requirements
@@ -169,6 +223,20 @@ class JsonConfig(metaclass=Singleton):
         assert len(self._resource_properties_prefix) > 0, "resource_properties_prefix must not be an empty string"
         assert isinstance(self._sym_link_cpython, bool), "sym_link_cpython must be a bool"
         assert isinstance(self._unload_after_install, bool), "unload_after_install must be a bool"
+        assert isinstance(self._async_startup, bool), "async_startup must be a bool"
+        assert isinstance(self._batch_install, bool), "batch_install must be a bool"
+        assert isinstance(self._pip_worker_idle_timeout, int), "pip_worker_idle_timeout must be an int"
+        assert self._pip_worker_idle_timeout >= 0, "pip_worker_idle_timeout must be 0 or greater"
+        assert isinstance(self._prefetch_workers, int), "prefetch_workers must be an int"
+        assert self._prefetch_workers >= 0, "prefetch_workers must be 0 or greater"
+        assert isinstance(self._uninstall_workers, int), "uninstall_workers must be an int"
+        assert self._uninstall_workers >= 1, "uninstall_workers must be 1 or greater"
+        assert isinstance(self._wheel_cache_dir, str), "wheel_cache_dir must be a string"
+        assert isinstance(self._wheel_cache_size, int), "wheel_cache_size must be an int"
+        assert isinstance(self._share_requirements, bool), "share_requirements must be a bool"
+        assert isinstance(self._internet_check_ttl, int), "internet_check_ttl must be an int"
+        assert self._internet_check_ttl >= 0, "internet_check_ttl must be 0 or greater"
+        assert self._wheel_cache_size >= 0, "wheel_cache_size must be 0 or greater"
         assert isinstance(self._no_pip_remove, list), "no_pip_remove must be a list"
         assert isinstance(
             self._install_on_no_uninstall_permission, bool
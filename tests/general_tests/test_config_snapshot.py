@@ -0,0 +1,72 @@
+from __future__ import annotations
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.___lo_pip___.config_snapshot import ConfigSnapshot, get_key
+else:
+    from oxt.___lo_pip___.config_snapshot import ConfigSnapshot, get_key
+
+VALUES = {
+    "package_location": "/profile/uno_packages/ext.oxt",
+    "python_path": "/usr/bin/python3",
+    "site_packages": "/home/user/.local/lib/python3.11/site-packages",
+    "is_user_installed": True,
+    "is_shared_installed": False,
+    "is_bundled_installed": False,
+}
+
+
+def test_save_load(tmp_path: Path) -> None:
+    pth = tmp_path / "snapshot.json"
+    key = get_key("1.0.0", str(tmp_path))
+    snapshot = ConfigSnapshot(pth, key)
+    assert snapshot.load() is None
+    assert snapshot.save(VALUES)
+    assert list(tmp_path.iterdir()) == [pth]
+    assert ConfigSnapshot(pth, get_key("1.0.0", str(tmp_path))).load() == VALUES
+
+
+@pytest.mark.parametrize(
+    "version,profile",
+    [("1.0.1", ""), ("1.0.0", "/other/profile")],
+)
+def test_key_mismatch(tmp_path: Path, version: str, profile: str) -> None:
+    pth = tmp_path / "snapshot.json"
+    ConfigSnapshot(pth, get_key("1.0.0", str(tmp_path))).save(VALUES)
+    assert ConfigSnapshot(pth, get_key(version, profile or str(tmp_path))).load() is None
+
+
+def test_key_install_layer(tmp_path: Path) -> None:
+    # installed as shared after the snapshot was saved for the user install, the install flags must not be reused.
+    pth = tmp_path / "snapshot.json"
+    ConfigSnapshot(pth, get_key("1.0.0", str(tmp_path), VALUES["package_location"])).save(VALUES)
+    shared = get_key("1.0.0", str(tmp_path), "/opt/libreoffice/share/uno_packages/cache/ext.oxt")
+    assert ConfigSnapshot(pth, shared).load() is None
+    assert ConfigSnapshot(pth, get_key("1.0.0", str(tmp_path), VALUES["package_location"])).load() == VALUES
+
+
+def test_key_lo_build(tmp_path: Path) -> None:
+    pth = tmp_path / "snapshot.json"
+    key = get_key("1.0.0", str(tmp_path))
+    ConfigSnapshot(pth, key).save(VALUES)
+    other = dict(key, lo_build="/opt/libreoffice/program/uno.py|1")
+    assert ConfigSnapshot(pth, other).load() is None
+
+
+def test_invalid_and_clear(tmp_path: Path) -> None:
+    pth = tmp_path / "snapshot.json"
+    key = get_key("1.0.0", str(tmp_path))
+    pth.write_text("{not json")
+    snapshot = ConfigSnapshot(pth, key)
+    assert snapshot.load() is None
+    pth.write_text(json.dumps({"key": key, "values": []}))
+    assert snapshot.load() is None
+    snapshot.clear()
+    assert not pth.exists()
+    snapshot.clear()
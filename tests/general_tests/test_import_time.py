@@ -0,0 +1,88 @@
+"""
+Import time report of the runtime modules that do not need LibreOffice.
+
+Run with ``pytest -s tests/general_tests/test_import_time.py`` to see the report.
+"""
+
+from __future__ import annotations
+from pathlib import Path
+from typing import Dict, List, Tuple, TYPE_CHECKING
+import subprocess
+import sys
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.___lo_pip___.meta.lazy_impl import LazyImpl
+else:
+    from oxt.___lo_pip___.meta.lazy_impl import LazyImpl
+
+ROOT = Path(__file__).parent.parent.parent
+
+
+def get_import_times(module: str) -> Dict[str, Tuple[int, int]]:
+    """Gets the ``-X importtime`` self and cumulative microseconds of each module imported by ``module``."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    times: Dict[str, Tuple[int, int]] = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def format_report(module: str, times: Dict[str, Tuple[int, int]], top: int = 10) -> str:
+    lines: List[str] = [f"{module}: {times[module][1] / 1000:.1f} ms cumulative"]
+    for name, (self_us, _) in sorted(times.items(), key=lambda item: item[1][0], reverse=True)[:top]:
+        lines.append(f"  {self_us / 1000:8.2f} ms  {name}")
+    return "\n".join(lines)
+
+
+@pytest.mark.parametrize(
+    "module,not_imported",
+    [
+        pytest.param(
+            "oxt.___lo_pip___.meta.lazy_impl",
+            ["oxt.___lo_pip___.dialog", "oxt.___lo_pip___.install"],
+            id="lazy_impl",
+        ),
+        pytest.param("oxt.___lo_pip___.install.dist_index", ["packaging"], id="dist_index"),
+        pytest.param("oxt.___lo_pip___.install.net_probe", ["ssl", "concurrent.futures"], id="net_probe"),
+        pytest.param("oxt.___lo_pip___.ver.rules.ver_rules", ["oxt.___lo_pip___.install"], id="ver_rules"),
+    ],
+)
+def test_import_time(module: str, not_imported: List[str]) -> None:
+    times = get_import_times(module)
+    assert module in times
+    print(format_report(module, times))
+    for name in times:
+        for prefix in not_imported:
+            assert not (name == prefix or name.startswith(f"{prefix}.")), f"{module} imports {name}"
+
+
+def test_lazy_impl(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "lazy_impl_target.py").write_text(
+        "class Handler:\n    def __init__(self, ctx):\n        self.ctx = ctx\n", encoding="utf-8"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "lazy_impl_target", raising=False)
+
+    ctor = LazyImpl("lazy_impl_target", "Handler")
+    assert not ctor.is_loaded
+    assert "lazy_impl_target" not in sys.modules
+
+    inst = ctor("ctx")
+    assert inst.ctx == "ctx"
+    assert ctor.is_loaded
+    assert ctor.get_class() is type(inst)
+    monkeypatch.delitem(sys.modules, "lazy_impl_target")
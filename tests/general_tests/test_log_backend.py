@@ -0,0 +1,156 @@
+from __future__ import annotations
+import logging
+from pathlib import Path
+from typing import Any, Generator, List, TYPE_CHECKING
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.___lo_pip___.meta.singleton import Singleton
+    from ...oxt.___lo_pip___.oxt_logger.log_backend import LogBackend, _BatchFileHandler
+else:
+    from oxt.___lo_pip___.meta.singleton import Singleton
+    from oxt.___lo_pip___.oxt_logger.log_backend import LogBackend, _BatchFileHandler
+
+LOG_FORMAT = "%(levelname)s %(message)s"
+
+
+@pytest.fixture
+def backend() -> Generator[LogBackend, None, None]:
+    # a new backend for each test, the singleton is restored afterwards.
+    saved = Singleton._instances.pop(LogBackend, None)
+    result = LogBackend(batch_size=4)
+    yield result
+    result.stop()
+    Singleton._instances.pop(LogBackend, None)
+    if saved is not None:
+        Singleton._instances[LogBackend] = saved
+
+
+def _get_logger(name: str, handler: logging.Handler, level: int = logging.DEBUG) -> logging.Logger:
+    logger = logging.Logger(name, level=level)
+    logger.propagate = False
+    logger.addHandler(handler)
+    return logger
+
+
+def _lines(pth: Path) -> List[str]:
+    return pth.read_text(encoding="utf8").splitlines()
+
+
+def _count_flushes(handler: _BatchFileHandler) -> List[int]:
+    counts = [0]
+    flush_batch = handler.flush_batch
+
+    def counting() -> None:
+        counts[0] += 1
+        flush_batch()
+
+    handler.flush_batch = counting  # type: ignore[method-assign]
+    return counts
+
+
+def test_flush(backend: LogBackend, tmp_path: Path) -> None:
+    log_file = tmp_path / "ext.log"
+    logger = _get_logger("flush", backend.get_handler(str(log_file), LOG_FORMAT, logging.DEBUG))
+    for i in range(20):
+        logger.info("line %d", i)
+    backend.flush()
+    assert backend.is_running
+    assert _lines(log_file) == [f"INFO line {i}" for i in range(20)]
+
+
+def test_batching(backend: LogBackend, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    log_file = tmp_path / "ext.log"
+    # records are queued before the listener starts so the batches are known.
+    monkeypatch.setattr(backend, "_start", lambda: None)
+    handler = backend.get_handler(str(log_file), LOG_FORMAT, logging.DEBUG)
+    target = backend._handlers[("file", str(log_file))]
+    assert isinstance(target, _BatchFileHandler)
+    counts = _count_flushes(target)
+    logger = _get_logger("batch", handler)
+    for i in range(10):
+        logger.info("line %d", i)
+    assert not backend.is_running
+    monkeypatch.undo()
+    with backend._lock:
+        backend._start()
+    backend.flush()
+    assert _lines(log_file) == [f"INFO line {i}" for i in range(10)]
+    # batch size is 4, the file is flushed once per batch.
+    assert counts[0] == 3
+
+
+def test_args_merged_on_caller(backend: LogBackend, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    log_file = tmp_path / "ext.log"
+    monkeypatch.setattr(backend, "_start", lambda: None)
+    logger = _get_logger("args", backend.get_handler(str(log_file), LOG_FORMAT, logging.DEBUG))
+    d = {"k": 1}
+    logger.info("val %s", d)
+    d["k"] = 2
+    monkeypatch.undo()
+    with backend._lock:
+        backend._start()
+    backend.flush()
+    assert _lines(log_file) == ["INFO val {'k': 1}"]
+
+
+def test_exception(backend: LogBackend, tmp_path: Path) -> None:
+    log_file = tmp_path / "ext.log"
+    logger = _get_logger("exc", backend.get_handler(str(log_file), LOG_FORMAT, logging.DEBUG))
+    try:
+        raise ValueError("bad")
+    except ValueError:
+        logger.exception("failed")
+    backend.flush()
+    text = log_file.read_text(encoding="utf8")
+    assert text.startswith("ERROR failed\nTraceback")
+    assert "ValueError: bad" in text
+
+
+def test_stop_and_direct(backend: LogBackend, tmp_path: Path) -> None:
+    log_file = tmp_path / "ext.log"
+    handler = backend.get_handler(str(log_file), LOG_FORMAT, logging.DEBUG)
+    logger = _get_logger("stop", handler)
+    for i in range(5):
+        logger.info("line %d", i)
+    backend.stop()
+    # waiting records are written before the listener stops.
+    assert not backend.is_running
+    assert _lines(log_file) == [f"INFO line {i}" for i in range(5)]
+
+    # after stop records are written on the caller thread.
+    logger.info("after")
+    assert _lines(log_file)[-1] == "INFO after"
+    other = _get_logger("other", backend.get_handler(str(log_file), LOG_FORMAT, logging.WARNING), logging.WARNING)
+    other.warning("direct")
+    assert _lines(log_file)[-1] == "WARNING direct"
+    assert not backend.is_running
+
+
+def test_level_change(backend: LogBackend, tmp_path: Path) -> None:
+    log_file = tmp_path / "ext.log"
+    debug_handler = backend.get_handler(str(log_file), LOG_FORMAT, logging.DEBUG)
+    assert backend.get_handler(str(log_file), LOG_FORMAT, logging.DEBUG) is debug_handler
+    info_handler = backend.get_handler(str(log_file), "%(message)s", logging.INFO)
+    assert info_handler is not debug_handler
+    # one file handler per file, updated in place.
+    file_handlers = [h for h in backend._handlers.values() if isinstance(h, _BatchFileHandler)]
+    assert len(file_handlers) == 1
+    target = file_handlers[0]
+    assert target.level == logging.INFO
+    assert target.formatter is not None and target.formatter._fmt == "%(message)s"
+
+    logger = _get_logger("level", info_handler, logging.INFO)
+    logger.debug("hidden")
+    logger.info("shown")
+    backend.flush()
+    assert _lines(log_file) == ["shown"]
+
+
+def test_null_handler(backend: LogBackend) -> None:
+    handler: Any = backend.get_handler("", LOG_FORMAT, logging.DEBUG)
+    assert isinstance(handler, logging.NullHandler)
+    assert not backend.is_running
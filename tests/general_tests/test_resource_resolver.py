@@ -0,0 +1,30 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+MOD = "oxt.___lo_pip___.lo_util.resource_resolver"
+
+
+def test_resolve_without_cache(mocker: MockerFixture) -> None:
+    mock_config = mocker.patch(f"{MOD}.Config")
+    mock_config.return_value.default_locale = ["en", "US"]
+    _ = mocker.patch(f"{MOD}.OxtLogger")
+    _ = mocker.patch(f"{MOD}.ResourceCache", side_effect=RuntimeError("no resource files"))
+    _ = mocker.patch(f"{MOD}._get_env_locale", side_effect=RuntimeError("no path substitution"))
+
+    from oxt.___lo_pip___.lo_util.resource_resolver import ResourceResolver
+
+    get_resource_resolver = mocker.patch.object(ResourceResolver, "_get_resource_resolver")
+    get_resource_resolver.return_value.resolveString.return_value = "Installing"
+    resolver = ResourceResolver(ctx=mocker.MagicMock())
+    # the string comes from uno instead of the resource id being returned.
+    assert resolver.resolve_string("msg01") == "Installing"
+    assert resolver.resolve_string("empty") == ""
+    # falls back to the default locale.
+    get_resource_resolver.assert_called_once_with(resolver._default_locale)
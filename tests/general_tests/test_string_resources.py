@@ -0,0 +1,88 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import TYPE_CHECKING
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.___lo_pip___.input_output.string_resources import (
+        get_locale_chain,
+        get_locale_files,
+        load_strings,
+        parse_properties,
+    )
+else:
+    from oxt.___lo_pip___.input_output.string_resources import (
+        get_locale_chain,
+        get_locale_files,
+        load_strings,
+        parse_properties,
+    )
+
+RESOURCES = Path(__file__).parent.parent.parent / "oxt" / "resources"
+
+
+def test_parse_properties() -> None:
+    text = "\n".join(
+        [
+            "# comment",
+            "! other comment",
+            "",
+            "a=one",
+            "b : two",
+            "c three",
+            "d=\\u0041\\u00fc\\nx",
+            "e=multi \\",
+            "    line",
+            "f\\=g=h",
+            "empty=",
+            "path=C:\\\\temp",
+        ]
+    )
+    assert parse_properties(text) == {
+        "a": "one",
+        "b": "two",
+        "c": "three",
+        "d": "A\u00fc\nx",
+        "e": "multi line",
+        "f=g": "h",
+        "empty": "",
+        "path": "C:\\temp",
+    }
+
+
+@pytest.mark.parametrize(
+    "locale,expected",
+    [
+        (["en", "US", ""], ["en_US"]),
+        (["de", "AT", ""], ["de"]),
+        (["en", "GB", ""], ["en_US"]),
+        (["pt", "BR", "x"], ["pt_BR", "pt"]),
+        (["xx", "", ""], []),
+        ([], []),
+    ],
+)
+def test_get_locale_chain(locale: list, expected: list) -> None:
+    assert get_locale_chain(locale, ["", "de", "en_US", "pt", "pt_BR"]) == expected
+
+
+def test_load_strings_fallback(tmp_path: Path) -> None:
+    (tmp_path / "s_en_US.properties").write_text("a=A\nb=B\nc=C\n", encoding="utf-8")
+    (tmp_path / "s_de.properties").write_text("a=\u00c4\n", encoding="utf-8")
+    (tmp_path / "s.properties").write_text("z=Z\n", encoding="utf-8")
+    (tmp_path / "other_de.properties").write_text("a=no\n", encoding="utf-8")
+
+    assert set(get_locale_files(tmp_path, "s")) == {"", "de", "en_US"}
+    strings = load_strings(tmp_path, "s", ["de", "DE", ""], ["en", "US"])
+    assert strings == {"a": "\u00c4", "b": "B", "c": "C", "z": "Z"}
+    assert load_strings(tmp_path / "missing", "s", ["de"], ["en", "US"]) == {}
+
+
+def test_extension_resources() -> None:
+    en = load_strings(RESOURCES, "pipstrings", ["en", "US"], ["en", "US"])
+    de = load_strings(RESOURCES, "pipstrings", ["de", "DE"], ["en", "US"])
+    assert en["log01"] == "Log Level"
+    assert set(en) <= set(de)
+    assert de["ex04"].startswith("Ausf\u00fchrbare")
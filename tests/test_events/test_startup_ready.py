@@ -0,0 +1,154 @@
+"""
+The startup job sets the ``StartupMonitor`` ready event on every path of ``_execute_startup``.
+
+``py_runner`` imports the runtime as the top level ``___lo_pip___`` package, the same as LibreOffice does.
+``config.json`` is only filled in when the extension is built, so the ``BasicConfig`` instance is set by the tests.
+"""
+
+from __future__ import annotations
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Iterator
+import importlib
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+OXT_DIR = Path(__file__).parent.parent.parent / "oxt"
+
+
+@pytest.fixture
+def py_runner(mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch) -> Iterator[ModuleType]:
+    monkeypatch.syspath_prepend(str(OXT_DIR))
+    config_meta = importlib.import_module("___lo_pip___.basic_config").ConfigMeta
+    if config_meta._instance is None:
+        monkeypatch.setattr(config_meta, "_instance", mocker.Mock(lo_implementation_name="test_impl"))
+    _ = mocker.patch("___lo_pip___.events.startup.startup_monitor.OxtLogger")
+    singleton = importlib.import_module("___lo_pip___.meta.singleton").Singleton
+
+    module = importlib.import_module("oxt.py_runner")
+    # a new monitor for each test, the callbacks of the previous monitor are weak references.
+    singleton._instances.pop(module.StartupMonitor, None)
+    yield module
+    singleton._instances.pop(module.StartupMonitor, None)
+
+
+def _get_runner(py_runner: ModuleType, mocker: MockerFixture, requirements_met: bool) -> Any:  # noqa: ANN401
+    """Gets a startup job without running ``__init__``, which needs LibreOffice."""
+    cls = py_runner.___lo_implementation_name___
+    runner = cls.__new__(cls)
+    runner._timer = mocker.MagicMock()
+    runner._thread_lock = py_runner.threading.Lock()
+    runner._startup_ready = False
+    runner._events = py_runner.LoEvents()
+    runner._startup_monitor = py_runner.StartupMonitor()
+    runner._logger = mocker.MagicMock()
+    runner._config = mocker.MagicMock(
+        log_level=20, has_locals=False, py_pkg_dir="", show_progress=False, unload_after_install=False
+    )
+    runner._added_packaging = False
+    runner._start_time = 0.0
+    runner._delay_start = False
+    runner._error_msg = ""
+    for name in (
+        "_add_py_pkgs_to_sys_path",
+        "_add_py_req_pkgs_to_sys_path",
+        "_add_pure_pkgs_to_sys_path",
+        "_remove_py_req_pkgs_from_sys_path",
+        "_import_on_load",
+        "_log_ex_time",
+        "_install_wheel",
+        "_handel_bz2",
+        "_post_install",
+    ):
+        mocker.patch.object(runner, name)
+    mocker.patch.object(runner, "_check_requirements", return_value=requirements_met)
+    mocker.patch.object(runner, "_acquire_install_lock", return_value=None)
+    mocker.patch.object(cls, "has_internet_connection", new_callable=mocker.PropertyMock, return_value=True)
+    return runner
+
+
+def test_ready_requirements_met(py_runner: ModuleType, mocker: MockerFixture) -> None:
+    runner = _get_runner(py_runner, mocker, requirements_met=True)
+    real_execute = mocker.patch.object(runner, "_real_execute")
+    monitor = py_runner.StartupMonitor()
+    assert monitor.wait_ready(0) is False
+
+    runner._execute_startup()
+    assert monitor.wait_ready(0) is True
+    assert monitor.ready_event.is_set()
+    real_execute.assert_not_called()
+
+
+def test_ready_installed(py_runner: ModuleType, mocker: MockerFixture) -> None:
+    runner = _get_runner(py_runner, mocker, requirements_met=False)
+    mock_pip = mocker.patch("___lo_pip___.install.install_pip.InstallPip")
+    mock_pip.return_value.is_pip_installed.return_value = True
+    mock_pkg = mocker.patch("___lo_pip___.install.install_pkg.InstallPkg")
+    monitor = py_runner.StartupMonitor()
+
+    runner._execute_startup()
+    mock_pkg.return_value.install.assert_called_once()
+    runner._import_on_load.assert_called_once()
+    assert monitor.wait_ready(0) is True
+
+
+def test_ready_check_failed(py_runner: ModuleType, mocker: MockerFixture) -> None:
+    runner = _get_runner(py_runner, mocker, requirements_met=False)
+    runner._check_requirements.side_effect = RuntimeError("broken metadata")
+    real_execute = mocker.patch.object(runner, "_real_execute")
+    monitor = py_runner.StartupMonitor()
+
+    runner._execute_startup()
+    assert monitor.wait_ready(0) is True
+    real_execute.assert_not_called()
+
+
+def test_ready_install_failed(py_runner: ModuleType, mocker: MockerFixture) -> None:
+    runner = _get_runner(py_runner, mocker, requirements_met=False)
+    mock_pip = mocker.patch("___lo_pip___.install.install_pip.InstallPip")
+    mock_pip.return_value.is_pip_installed.return_value = True
+    mock_pkg = mocker.patch("___lo_pip___.install.install_pkg.InstallPkg")
+    mock_pkg.return_value.install.side_effect = RuntimeError("pip failed")
+    monitor = py_runner.StartupMonitor()
+
+    runner._execute_startup()
+    runner._import_on_load.assert_not_called()
+    assert monitor.wait_ready(0) is True
+
+
+def test_ready_no_pip(py_runner: ModuleType, mocker: MockerFixture) -> None:
+    runner = _get_runner(py_runner, mocker, requirements_met=False)
+    mock_pip = mocker.patch("___lo_pip___.install.install_pip.InstallPip")
+    mock_pip.return_value.is_pip_installed.return_value = False
+    mock_pip.return_value.is_internet = False
+    mock_pkg = mocker.patch("___lo_pip___.install.install_pkg.InstallPkg")
+    monitor = py_runner.StartupMonitor()
+
+    # returns early from _real_execute.
+    runner._execute_startup()
+    mock_pkg.assert_not_called()
+    assert monitor.wait_ready(0) is True
+
+
+def test_ready_triggered_once(py_runner: ModuleType, mocker: MockerFixture) -> None:
+    runner = _get_runner(py_runner, mocker, requirements_met=True)
+    trigger = mocker.spy(runner._events, "trigger")
+    runner._execute_startup()
+    runner._set_startup_ready()
+    ready = [c for c in trigger.call_args_list if c.args[0] == py_runner.StartupNamedEvent.STARTUP_READY]
+    assert len(ready) == 1
+
+
+def test_ready_flushes_log(py_runner: ModuleType, mocker: MockerFixture) -> None:
+    runner = _get_runner(py_runner, mocker, requirements_met=True)
+    trigger = mocker.spy(runner._events, "trigger")
+    runner._execute_startup()
+    names = [c.args[0] for c in trigger.call_args_list]
+    # written once the job is done, after the handlers of the ready event logged.
+    assert names.count(py_runner.LogNamedEvent.LOGGING_FLUSH) == 1
+    assert names.index(py_runner.StartupNamedEvent.STARTUP_READY) < names.index(py_runner.LogNamedEvent.LOGGING_FLUSH)
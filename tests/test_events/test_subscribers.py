@@ -0,0 +1,279 @@
+"""
+Event subscriber and dispatcher tests.
+
+``test_benchmark_trigger`` compares the old list based trigger loop with the tuple based one.
+Run with ``pytest -s tests/test_events/test_subscribers.py`` to see the report.
+"""
+
+from __future__ import annotations
+from typing import Any, Callable, Dict, List, TYPE_CHECKING
+from weakref import ReferenceType, ref
+import gc
+import logging
+import threading
+import time
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.___lo_pip___.events import event_dispatcher
+    from ...oxt.___lo_pip___.events.event_dispatcher import EventDispatcher, log_exception
+    from ...oxt.___lo_pip___.events.subscribers import Subscribers, WeakRefs, make_ref
+else:
+    from oxt.___lo_pip___.events import event_dispatcher
+    from oxt.___lo_pip___.events.event_dispatcher import EventDispatcher, log_exception
+    from oxt.___lo_pip___.events.subscribers import Subscribers, WeakRefs, make_ref
+
+
+class _Handler:
+    def __init__(self) -> None:
+        self.calls: List[Any] = []
+
+    def on_event(self, source: object, args: object) -> None:
+        self.calls.append(args)
+
+
+class _Args:
+    def __init__(self) -> None:
+        self.source = None
+        self._event_name = ""
+        self._event_source = None
+
+
+def _call(subscribers: Subscribers, name: str, args: object) -> None:
+    for r in subscribers.get(name):
+        callback = r()
+        if callback is not None:
+            callback(None, args)
+
+
+def test_bound_method_lives_with_instance() -> None:
+    subscribers = Subscribers()
+    handler = _Handler()
+    # a plain ref to a bound method is dead right away.
+    plain = ref(handler.on_event)
+    assert plain() is None
+    subscribers.add("a", handler.on_event)
+    _call(subscribers, "a", 1)
+    assert handler.calls == [1]
+
+    assert subscribers.remove("a", handler.on_event)
+    assert not subscribers.remove("a", handler.on_event)
+    _call(subscribers, "a", 2)
+    assert handler.calls == [1]
+
+    subscribers.add("a", handler.on_event)
+    del handler
+    gc.collect()
+    assert len(subscribers.get("a")) == 1
+    subscribers.prune("a")
+    assert "a" not in subscribers
+    assert subscribers.get("a") == ()
+
+
+def test_make_ref() -> None:
+    def fn() -> None:
+        pass
+
+    handler = _Handler()
+    assert make_ref(fn)() is fn
+    assert make_ref(handler.on_event)() == handler.on_event
+    assert make_ref(handler)() is handler
+
+
+def test_copy_on_write() -> None:
+    refs = WeakRefs()
+    calls: List[str] = []
+
+    def second() -> None:
+        calls.append("second")
+
+    def first() -> None:
+        calls.append("first")
+        # changes while iterating take effect from the next iteration.
+        refs.remove(second)
+        refs.add(third)
+
+    def third() -> None:
+        calls.append("third")
+
+    refs.add(first)
+    refs.add(second)
+    snapshot = refs.refs
+    for r in snapshot:
+        r()()
+    assert calls == ["first", "second"]
+    assert len(snapshot) == 2
+    assert [r() for r in refs.refs] == [first, third]
+
+
+def test_dispatcher_order() -> None:
+    dispatcher = EventDispatcher()
+    results: Dict[str, List[int]] = {"a": [], "b": []}
+    threads: Dict[str, set] = {"a": set(), "b": set()}
+    running: Dict[str, int] = {"a": 0, "b": 0}
+    overlap: List[str] = []
+    lock = threading.Lock()
+
+    def job(key: str, i: int) -> int:
+        with lock:
+            running[key] += 1
+            if running[key] > 1:
+                overlap.append(key)
+        time.sleep(0.0005)
+        results[key].append(i)
+        threads[key].add(threading.current_thread().name)
+        with lock:
+            running[key] -= 1
+        return i
+
+    futures = []
+    for i in range(50):
+        futures.append(dispatcher.submit("a", job, "a", i))
+        futures.append(dispatcher.submit("b", job, "b", i))
+    assert dispatcher.wait(timeout=10)
+    assert dispatcher.pending == 0
+    assert results["a"] == list(range(50))
+    assert results["b"] == list(range(50))
+    assert not overlap
+    assert [f.result() for f in futures[::2]] == list(range(50))
+    assert all(name.startswith("OxtEvents") for name in threads["a"] | threads["b"])
+
+
+def test_dispatcher_error() -> None:
+    dispatcher = EventDispatcher()
+    calls: List[int] = []
+    failed = dispatcher.submit("err", lambda: 1 / 0)
+    ok = dispatcher.submit("err", calls.append, 1)
+    assert isinstance(failed.exception(timeout=10), ZeroDivisionError)
+    ok.result(timeout=10)
+    # a failed job does not stop the jobs after it.
+    assert calls == [1]
+
+
+def test_dispatcher_log_exception(monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture) -> None:
+    logger = logging.getLogger("test_dispatcher_log_exception")
+    monkeypatch.setattr(event_dispatcher, "_get_logger", lambda: logger)
+    dispatcher = EventDispatcher()
+    with caplog.at_level(logging.ERROR, logger=logger.name):
+        failed = dispatcher.submit("log", lambda: 1 / 0)
+        failed.add_done_callback(log_exception)
+        ok = dispatcher.submit("log", lambda: 1)
+        ok.add_done_callback(log_exception)
+        assert dispatcher.wait(timeout=10)
+    records = [r for r in caplog.records if r.name == logger.name]
+    assert len(records) == 1
+    assert "Event handler failed: division by zero" in records[0].getMessage()
+    assert records[0].exc_info is not None
+
+
+class _ListEvents:
+    """The trigger loop before subscribers were held in tuples."""
+
+    def __init__(self) -> None:
+        self._callbacks: Dict[str, List[ReferenceType]] = {}
+
+    def on(self, event_name: str, callback: Callable[..., Any]) -> None:
+        self._callbacks.setdefault(event_name, []).append(ref(callback))
+
+    def _set_event_args(self, event_name: str, event_args: _Args | None) -> None:
+        if event_args is None:
+            return
+        event_args._event_name = event_name
+        event_args._event_source = self
+
+    def trigger(self, event_name: str, event_args: _Args) -> None:
+        if event_name in self._callbacks:
+            cleanup = None
+            for i, callback in enumerate(self._callbacks[event_name]):
+                if callback() is None:
+                    if cleanup is None:
+                        cleanup = []
+                    cleanup.append(i)
+                    continue
+                self._set_event_args(event_name=event_name, event_args=event_args)
+                if callable(callback()):
+                    try:
+                        callback()(event_args.source, event_args)
+                    except AttributeError:
+                        callback()(self, None)
+
+
+class _TupleEvents:
+    """The trigger loop of ``lo_events._event_base``."""
+
+    def __init__(self) -> None:
+        self._callbacks = Subscribers()
+
+    def on(self, event_name: str, callback: Callable[..., Any]) -> None:
+        self._callbacks.add(event_name, callback)
+
+    def _set_event_args(self, event_name: str, event_args: _Args | None) -> None:
+        if event_args is None:
+            return
+        event_args._event_name = event_name
+        event_args._event_source = self
+
+    def trigger(self, event_name: str, event_args: _Args) -> None:
+        refs = self._callbacks.get(event_name)
+        if not refs:
+            return
+        self._set_event_args(event_name=event_name, event_args=event_args)
+        dead = False
+        for r in refs:
+            callback = r()
+            if callback is None:
+                dead = True
+                continue
+            if event_args is None:
+                callback(self, None)
+            else:
+                callback(event_args.source, event_args)
+        if dead:
+            self._callbacks.prune(event_name)
+
+
+def _time_trigger(events: _ListEvents | _TupleEvents, triggers: int) -> float:
+    args = _Args()
+    start = time.perf_counter()
+    for _ in range(triggers):
+        events.trigger("evt", args)
+    return time.perf_counter() - start
+
+
+def test_benchmark_trigger() -> None:
+    n = 20_000
+    subscribers = 10
+    count = [0]
+
+    def callback(source: object, args: object) -> None:
+        count[0] += 1
+
+    # functions are kept alive by this list, events only hold weak refs.
+    callbacks = [lambda s, a: callback(s, a) for _ in range(subscribers)]
+    old, new = _ListEvents(), _TupleEvents()
+    for cb in callbacks:
+        old.on("evt", cb)
+        new.on("evt", cb)
+    old_time = min(_time_trigger(old, n) for _ in range(3))
+    new_time = min(_time_trigger(new, n) for _ in range(3))
+    assert count[0] == 2 * 3 * n * subscribers
+
+    dispatcher = EventDispatcher()
+    args = _Args()
+    start = time.perf_counter()
+    for _ in range(n):
+        dispatcher.submit("evt", new.trigger, "evt", args)
+    submitted = time.perf_counter() - start
+    assert dispatcher.wait(timeout=60)
+    dispatched = time.perf_counter() - start
+    print(
+        f"\ntrigger, {n} triggers of {subscribers} callbacks:"
+        f"\n  list      {n / old_time:10.0f} triggers/s"
+        f"\n  tuple     {n / new_time:10.0f} triggers/s"
+        f"\n  async     {n / submitted:10.0f} submits/s, {n / dispatched:10.0f} triggers/s"
+    )
+    # one deref and one event args update per trigger instead of three derefs and one update per callback.
+    assert new_time < old_time
@@ -0,0 +1,129 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import TYPE_CHECKING, List
+import importlib.metadata
+import zipfile
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.___lo_pip___.install.dist_index import DistIndex, get_dependencies, normalize_name
+else:
+    from oxt.___lo_pip___.install.dist_index import DistIndex, get_dependencies, normalize_name
+
+
+def _make_dist(site: Path, name: str, ver: str, requires: str = "") -> None:
+    dist_info = site / f"{name.replace('-', '_')}-{ver}.dist-info"
+    dist_info.mkdir(parents=True)
+    metadata = f"Metadata-Version: 2.1\nName: {name}\nVersion: {ver}\n{requires}"
+    (dist_info / "METADATA").write_text(metadata, encoding="utf-8")
+
+
+@pytest.mark.parametrize(
+    "name,expected",
+    [
+        ("verr", "verr"),
+        ("Ooo_Dev.Tools", "ooo-dev-tools"),
+        ("ooo-dev__tools", "ooo-dev-tools"),
+    ],
+)
+def test_normalize_name(name: str, expected: str) -> None:
+    assert normalize_name(name) == expected
+
+
+def test_get_version(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _make_dist(tmp_path, "Spam_Eggs", "1.2.3")
+    index = DistIndex()
+    assert index.get_version("spam-eggs") == ""
+
+    # registering a path is detected without invalidation.
+    monkeypatch.syspath_prepend(str(tmp_path))
+    assert index.get_version("spam-eggs") == "1.2.3"
+    assert index.get_version("SPAM.EGGS") == "1.2.3"
+    assert index.get_location("spam_eggs") == str(tmp_path)
+    assert index.get_version("no-such-package-installed") == ""
+
+
+def test_invalidate(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.syspath_prepend(str(tmp_path))
+    index = DistIndex()
+    assert index.get("ham") is None
+
+    _make_dist(tmp_path, "ham", "0.1")
+    assert index.get("ham") is None
+    index.invalidate()
+    info = index.get("ham")
+    assert info is not None
+    assert info.name == "ham"
+    assert info.version == "0.1"
+
+
+def test_first_path_wins(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    _make_dist(first, "bacon", "2.0")
+    _make_dist(second, "bacon", "1.0")
+    monkeypatch.syspath_prepend(str(second))
+    monkeypatch.syspath_prepend(str(first))
+    assert DistIndex().get_version("bacon") == "2.0"
+
+
+def test_only_looked_up_read(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    for i in range(20):
+        _make_dist(tmp_path, f"pkg{i}", "1.0")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    read: List[str] = []
+    read_text = importlib.metadata.PathDistribution.read_text
+
+    def spy(self: importlib.metadata.PathDistribution, filename: str) -> str | None:
+        read.append(Path(str(self._path)).name)  # type: ignore[attr-defined]
+        return read_text(self, filename)
+
+    monkeypatch.setattr(importlib.metadata.PathDistribution, "read_text", spy)
+    index = DistIndex()
+    assert index.get_version("pkg3") == "1.0"
+    assert index.get_location("pkg3") == str(tmp_path)
+    assert index.get("pkg-not-installed") is None
+    assert set(read) == {"pkg3-1.0.dist-info"}
+    # looked up once.
+    count = len(read)
+    assert index.get_version("PKG3") == "1.0"
+    assert len(read) == count
+
+
+def test_broken_metadata(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    (first / "bacon-2.0.dist-info").mkdir(parents=True)
+    _make_dist(second, "bacon", "1.0")
+    monkeypatch.syspath_prepend(str(second))
+    monkeypatch.syspath_prepend(str(first))
+    # the first install has no METADATA, the next one on sys.path is used.
+    assert DistIndex().get_version("bacon") == "1.0"
+
+
+def test_zip(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    pth = tmp_path / "pkgs.zip"
+    with zipfile.ZipFile(pth, "w") as zf:
+        zf.writestr("eggs/__init__.py", "")
+        zf.writestr("eggs-3.1.dist-info/METADATA", "Metadata-Version: 2.1\nName: eggs\nVersion: 3.1\n")
+    monkeypatch.syspath_prepend(str(pth))
+    assert DistIndex().get_version("eggs") == "3.1"
+
+
+def test_get_dependencies(tmp_path: Path) -> None:
+    _make_dist(tmp_path, "Ooo_Dev", "1.0", "Requires-Dist: Spam.Eggs>=1.0\nRequires-Dist: numpy; extra == 'np'\n")
+    _make_dist(tmp_path, "spam-eggs", "1.0", "Requires-Dist: six (>=1.0)\nRequires-Dist: ooo-dev\n")
+    _make_dist(tmp_path, "six", "1.16.0")
+    _make_dist(tmp_path, "unrelated", "1.0", "Requires-Dist: pandas\n")
+    # markers are not evaluated, numpy is not installed so it is not followed.
+    assert get_dependencies(["ooo-dev", "missing"], str(tmp_path)) == {
+        "ooo-dev",
+        "spam-eggs",
+        "six",
+        "numpy",
+        "missing",
+    }
+    assert get_dependencies([], str(tmp_path)) == set()
@@ -0,0 +1,31 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+MOD = "oxt.___lo_pip___.install.download"
+
+
+def test_is_internet_once(mocker: MockerFixture) -> None:
+    _ = mocker.patch(f"{MOD}.OxtLogger")
+    _ = mocker.patch(f"{MOD}.Config")
+    check = mocker.patch(f"{MOD}.Download.check_internet_connection", return_value=True)
+
+    from oxt.___lo_pip___.install.download import Download
+    from oxt.___lo_pip___.meta.singleton import Singleton
+
+    _ = Singleton._instances.pop(Download, None)
+    try:
+        download = Download()
+        assert download.is_internet
+        check.return_value = False
+        # checked once for the session, the probe TTL does not apply.
+        assert download.is_internet
+        assert check.call_count == 1
+    finally:
+        _ = Singleton._instances.pop(Download, None)
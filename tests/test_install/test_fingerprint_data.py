@@ -0,0 +1,144 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List
+import importlib.metadata
+import shutil
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.___lo_pip___.install.fingerprint_data import (
+        compute_fingerprint,
+        get_dir_dists,
+        get_locations,
+        get_mtimes,
+    )
+else:
+    from oxt.___lo_pip___.install.fingerprint_data import compute_fingerprint, get_dir_dists, get_locations, get_mtimes
+
+
+def _make_dist(site: Path, name: str, ver: str) -> Path:
+    dist_info = site / f"{name.replace('-', '_')}-{ver}.dist-info"
+    dist_info.mkdir(parents=True)
+    (dist_info / "METADATA").write_text(f"Metadata-Version: 2.1\nName: {name}\nVersion: {ver}\n", encoding="utf-8")
+    return dist_info
+
+
+def _get_data(requirements: Dict[str, str], dirs: List[Path]) -> Dict[str, Any]:
+    names = [str(d) for d in dirs]
+    dir_dists = get_dir_dists(names)
+    return {
+        "requirements": requirements,
+        "dirs": get_mtimes(names),
+        "dists": dir_dists,
+        "locations": get_locations(requirements, dir_dists),
+    }
+
+
+def _fingerprint(requirements: Dict[str, str], *dirs: Path) -> str:
+    return compute_fingerprint(_get_data(requirements, list(dirs)))
+
+
+@pytest.fixture
+def site(tmp_path: Path) -> Path:
+    result = tmp_path / "site"
+    result.mkdir()
+    return result
+
+
+@pytest.fixture(autouse=True)
+def no_metadata(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The fingerprint is computed from directory listings only, reading metadata fails the test."""
+
+    def read_text(*args: object, **kwargs: object) -> None:
+        raise AssertionError("metadata read")
+
+    monkeypatch.setattr(importlib.metadata.PathDistribution, "read_text", read_text)
+
+
+def test_get_dir_dists(site: Path, tmp_path: Path) -> None:
+    _make_dist(site, "Spam_Eggs", "1.2.3")
+    (site / "spam_eggs").mkdir()
+    (site / "ham-0.1-py3.8.egg-info").mkdir()
+    missing = tmp_path / "missing"
+    result = get_dir_dists([str(site), "", str(missing), str(site)])
+    assert list(result) == [str(site), str(missing)]
+    assert result[str(site)] == ["Spam_Eggs-1.2.3.dist-info", "ham-0.1-py3.8.egg-info"]
+    assert result[str(missing)] == []
+
+
+def test_get_locations(site: Path, tmp_path: Path) -> None:
+    other = tmp_path / "other"
+    _make_dist(site, "Spam_Eggs", "1.2.3")
+    _make_dist(other, "spam-eggs", "2.0")
+    dir_dists = get_dir_dists([str(site), str(other)])
+    result = get_locations(["spam-eggs", "no-such-package-installed", ""], dir_dists)
+    # first directory wins.
+    assert result == {
+        "spam-eggs": str(site / "Spam_Eggs-1.2.3.dist-info"),
+        "no-such-package-installed": "",
+    }
+
+
+def test_get_mtimes(tmp_path: Path) -> None:
+    result = get_mtimes([str(tmp_path), "", str(tmp_path / "missing")])
+    assert result[str(tmp_path)] > 0
+    assert result[str(tmp_path / "missing")] == 0
+    assert "" not in result
+
+
+def test_hit(site: Path) -> None:
+    _make_dist(site, "ham", "1.0")
+    requirements = {"ham": ">=1.0"}
+    first = _fingerprint(requirements, site)
+    assert first == _fingerprint(requirements, site)
+    # key order does not matter.
+    data = _get_data(requirements, [site])
+    assert compute_fingerprint(data) == compute_fingerprint(dict(reversed(list(data.items()))))
+
+
+def test_miss(site: Path) -> None:
+    _make_dist(site, "ham", "1.0")
+    first = _fingerprint({"ham": ">=1.0"}, site)
+    assert first != _fingerprint({"ham": ">=1.1"}, site)
+    assert first != _fingerprint({"ham": ">=1.0", "eggs": ">=1.0"}, site)
+
+
+def test_package_removed(site: Path) -> None:
+    dist_info = _make_dist(site, "ham", "1.0")
+    requirements = {"ham": ">=1.0"}
+    first = _fingerprint(requirements, site)
+    shutil.rmtree(dist_info)
+    assert first != _fingerprint(requirements, site)
+
+
+def test_package_added(site: Path) -> None:
+    requirements = {"ham": ">=1.0"}
+    first = _fingerprint(requirements, site)
+    _make_dist(site, "ham", "1.0")
+    assert first != _fingerprint(requirements, site)
+
+
+def test_dependency_upgraded(site: Path) -> None:
+    # a dependency that is not a requirement is only in the directory listing.
+    _make_dist(site, "ham", "1.0")
+    dist_info = _make_dist(site, "six", "1.15.0")
+    requirements = {"ham": ">=1.0"}
+    first = _fingerprint(requirements, site)
+    shutil.rmtree(dist_info)
+    _make_dist(site, "six", "1.16.0")
+    assert first != _fingerprint(requirements, site)
+
+
+@pytest.mark.parametrize("ver", ["1.0", "2.0"])
+def test_package_shadowed(site: Path, tmp_path: Path, ver: str) -> None:
+    # a package installed into a directory earlier on sys.path, such as the user site, shadows the package in site.
+    other = tmp_path / "other"
+    other.mkdir()
+    _make_dist(site, "ham", "1.0")
+    requirements: Dict[str, str] = {"ham": ">=1.0"}
+    first = _fingerprint(requirements, other, site)
+    _make_dist(other, "ham", ver)
+    assert first != _fingerprint(requirements, other, site)
@@ -0,0 +1,206 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import List, TYPE_CHECKING
+import errno
+import os
+import subprocess
+import sys
+import threading
+import time
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.___lo_pip___.install import install_lock
+    from ...oxt.___lo_pip___.install.install_lock import InstallLock, file_lock
+else:
+    from oxt.___lo_pip___.install import install_lock
+    from oxt.___lo_pip___.install.install_lock import InstallLock, file_lock
+
+ROOT = Path(__file__).parent.parent.parent
+
+WAITER = """
+import sys, time
+from oxt.___lo_pip___.install.install_lock import InstallLock
+lock = InstallLock(sys.argv[1])
+stats = lock.acquire()
+with open(sys.argv[2], "a") as f:
+    f.write(f"{sys.argv[3]} {time.time()} {stats.ahead} {stats.stale}\\n")
+if sys.argv[4] == "crash":
+    import os
+    os._exit(0)
+lock.release()
+"""
+
+
+def _start_waiter(queue_dir: Path, out: Path, name: str, mode: str = "release") -> subprocess.Popen:
+    return subprocess.Popen([sys.executable, "-c", WAITER, str(queue_dir), str(out), name, mode], cwd=ROOT)
+
+
+def _wait_tickets(queue_dir: Path, count: int) -> None:
+    for _ in range(200):
+        if len(list(queue_dir.glob("*.ticket"))) >= count:
+            return
+        time.sleep(0.02)
+    raise AssertionError("waiter did not draw a ticket")
+
+
+def test_acquire_release(tmp_path: Path) -> None:
+    queue_dir = tmp_path / "queue"
+    lock = InstallLock(queue_dir)
+    stats = lock.acquire()
+    assert lock.is_locked
+    assert stats.ahead == 0
+    assert stats.stale == 0
+    with pytest.raises(RuntimeError):
+        lock.acquire()
+    time.sleep(0.05)
+    stats = lock.release()
+    assert not lock.is_locked
+    assert stats.hold_time >= 0.05
+    assert list(queue_dir.glob("*.ticket")) == []
+
+    with InstallLock(queue_dir) as other:
+        assert other.stats.ticket == stats.ticket + 1
+
+
+def test_fifo_processes(tmp_path: Path) -> None:
+    queue_dir = tmp_path / "queue"
+    out = tmp_path / "out.txt"
+    holder = InstallLock(queue_dir)
+    holder.acquire()
+    names = ["a", "b", "c", "d"]
+    procs = []
+    try:
+        for i, name in enumerate(names):
+            procs.append(_start_waiter(queue_dir, out, name))
+            # each waiter has its ticket before the next one starts.
+            _wait_tickets(queue_dir, i + 2)
+        released = time.time()
+        holder.release()
+        for proc in procs:
+            assert proc.wait(timeout=30) == 0
+    finally:
+        for proc in procs:
+            proc.kill()
+    rows = [line.split() for line in out.read_text().splitlines()]
+    assert [row[0] for row in rows] == names
+    assert [int(row[2]) for row in rows] == [1, 2, 3, 4]
+    # woken by the release, not by polling.
+    assert float(rows[0][1]) - released < 0.5
+    assert list(queue_dir.glob("*.ticket")) == []
+
+
+def test_stale_ticket(tmp_path: Path) -> None:
+    queue_dir = tmp_path / "queue"
+    out = tmp_path / "out.txt"
+    proc = _start_waiter(queue_dir, out, "crash", "crash")
+    assert proc.wait(timeout=30) == 0
+    assert len(list(queue_dir.glob("*.ticket"))) == 1
+
+    lock = InstallLock(queue_dir)
+    stats = lock.acquire()
+    assert stats.ahead == 1
+    assert stats.stale == 1
+    lock.release()
+    assert list(queue_dir.glob("*.ticket")) == []
+
+
+def test_fifo_threads(tmp_path: Path) -> None:
+    queue_dir = tmp_path / "queue"
+    holder = InstallLock(queue_dir)
+    holder.acquire()
+    order: List[int] = []
+
+    def wait(i: int) -> None:
+        with InstallLock(queue_dir):
+            order.append(i)
+
+    threads = []
+    for i in range(5):
+        t = threading.Thread(target=wait, args=(i,))
+        t.start()
+        threads.append(t)
+        _wait_tickets(queue_dir, i + 2)
+    holder.release()
+    for t in threads:
+        t.join(timeout=30)
+    assert order == list(range(5))
+
+
+def test_acquire_timeout(tmp_path: Path) -> None:
+    queue_dir = tmp_path / "queue"
+    holder = InstallLock(queue_dir)
+    holder.acquire()
+    lock = InstallLock(queue_dir)
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        lock.acquire(timeout=0.2)
+    assert 0.2 <= time.monotonic() - start < 2.0
+    # the ticket is given up, the next waiter is not held up by it.
+    assert not lock.is_locked
+    assert len(list(queue_dir.glob("*.ticket"))) == 1
+    holder.release()
+    assert lock.acquire(timeout=1.0).stale == 0
+    lock.release()
+
+
+def test_file_lock_timeout(tmp_path: Path) -> None:
+    pth = tmp_path / "registry.lock"
+    with file_lock(pth), pytest.raises(TimeoutError), file_lock(pth, timeout=0.1):
+        pass
+    with file_lock(pth, timeout=0.1):
+        pass
+
+
+class _FakeMsvcrt:
+    """``msvcrt`` that fails ``locking()`` with the given error numbers, then succeeds."""
+
+    LK_NBLCK = 2
+    LK_UNLCK = 0
+
+    def __init__(self, errors: List[int]) -> None:
+        self.errors = errors
+        self.calls = 0
+
+    def locking(self, fd: int, mode: int, nbytes: int) -> None:
+        self.calls += 1
+        if self.errors:
+            err = self.errors.pop(0)
+            raise OSError(err, os.strerror(err))
+
+
+@pytest.fixture
+def fake_nt(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(install_lock.os, "name", "nt")
+    monkeypatch.setattr(install_lock.time, "sleep", lambda seconds: None)
+
+
+@pytest.mark.usefixtures("fake_nt")
+def test_windows_lock_contention(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    msvcrt = _FakeMsvcrt([errno.EACCES, errno.EDEADLK])
+    monkeypatch.setattr(install_lock, "msvcrt", msvcrt, raising=False)
+    with open(tmp_path / "lock", "a+", encoding="utf-8") as f:
+        install_lock._lock(f)
+    assert msvcrt.calls == 3
+
+
+@pytest.mark.usefixtures("fake_nt")
+def test_windows_lock_error(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # an error that waiting does not resolve is raised at once.
+    msvcrt = _FakeMsvcrt([errno.EBADF, errno.EBADF])
+    monkeypatch.setattr(install_lock, "msvcrt", msvcrt, raising=False)
+    with open(tmp_path / "lock", "a+", encoding="utf-8") as f, pytest.raises(OSError) as err:
+        install_lock._lock(f)
+    assert err.value.errno == errno.EBADF
+    assert msvcrt.calls == 1
+
+
+@pytest.mark.usefixtures("fake_nt")
+def test_windows_lock_timeout(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    msvcrt = _FakeMsvcrt([errno.EACCES] * 1_000_000)
+    monkeypatch.setattr(install_lock, "msvcrt", msvcrt, raising=False)
+    with open(tmp_path / "lock", "a+", encoding="utf-8") as f, pytest.raises(TimeoutError):
+        install_lock._lock(f, timeout=0.05)
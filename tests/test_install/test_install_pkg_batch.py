@@ -0,0 +1,178 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List
+import json
+import subprocess
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+    from ...oxt.___lo_pip___.install.pkg_installers.install_pkg import InstallPkg
+
+MOD = "oxt.___lo_pip___.install.pkg_installers.install_pkg"
+IMPL = "test_impl"
+
+
+def _make_dist(site: Path, name: str, ver: str, files: List[str]) -> None:
+    dist_info = f"{name}-{ver}.dist-info"
+    info = site / dist_info
+    info.mkdir(parents=True)
+    lines = [f"{f},sha256=abc,1" for f in files]
+    lines.append(f"{dist_info}/RECORD,,")
+    (info / "RECORD").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def _pkgs_of(cmd: List[str]) -> List[str]:
+    """Gets the packages of a pip install command such as ``["ham", "eggs"]``."""
+    names = []
+    for arg in cmd[cmd.index("install") + 1 :]:
+        if arg.startswith("-"):
+            continue
+        names.append(arg.split(">")[0].split("=")[0])
+    return names
+
+
+def _read_tracking(site: Path, pkg: str) -> Dict[str, List[str]]:
+    with open(site / f"{IMPL}_{pkg}.json", "r", encoding="utf-8") as f:
+        return json.load(f)["data"]
+
+
+@pytest.fixture
+def site(tmp_path: Path) -> Path:
+    result = tmp_path / "site"
+    result.mkdir()
+    return result
+
+
+@pytest.fixture
+def installer(site: Path, mocker: MockerFixture) -> InstallPkg:
+    mock_config = mocker.patch(f"{MOD}.Config")
+    config = mock_config.return_value
+    config.python_path = "python"
+    config.lo_implementation_name = IMPL
+    config.oxt_name = "test"
+    config.extension_version = "1.0"
+    config.no_pip_remove = {"pip", "setuptools", "wheel"}
+    config.batch_install = True
+    config.show_progress = False
+    config.log_pip_installs = False
+    config.auto_install_in_site_packages = False
+    config.is_win = False
+    config.is_user_installed = True
+    _ = mocker.patch(f"{MOD}.OxtLogger")
+    _ = mocker.patch(f"{MOD}.ResourceResolver")
+    _ = mocker.patch(f"{MOD}.ProgressSession")
+    mock_target = mocker.patch(f"{MOD}.TargetPath")
+    mock_target.return_value.get_package_target.return_value = str(site)
+
+    from oxt.___lo_pip___.install.pkg_installers.install_pkg import InstallPkg
+
+    return InstallPkg(ctx=None, show_progress=False)
+
+
+def _mock_run_pip(
+    installer: InstallPkg, mocker: MockerFixture, site: Path, fail: List[str] | None = None
+) -> List[List[str]]:
+    """
+    Mocks ``_run_pip``. Each install adds the packages to ``site`` and reports them as installed the same way pip does.
+
+    Commands that install any package in ``fail`` exit with an error, when installing more than one package.
+    """
+    fail = fail or []
+    calls: List[List[str]] = []
+
+    def run_pip(cmd: List[str]) -> subprocess.CompletedProcess:
+        calls.append(cmd)
+        names = _pkgs_of(cmd)
+        if len(names) > 1 and any(name in fail for name in names):
+            return subprocess.CompletedProcess(cmd, 1, "", "ResolutionImpossible")
+        installed = []
+        for name in names:
+            if not (site / f"{name}-1.0.dist-info").exists():
+                _make_dist(site, name, "1.0", [f"{name}/__init__.py", f"bin/{name}"])
+            installed.append(f"{name}-1.0")
+        if "ham" in names and not (site / "six-1.16.0.dist-info").exists():
+            # dependency of ham
+            _make_dist(site, "six", "1.16.0", ["six.py"])
+            installed.insert(0, "six-1.16.0")
+        return subprocess.CompletedProcess(cmd, 0, f"Successfully installed {' '.join(installed)}\n", "")
+
+    mocker.patch.object(installer, "_run_pip", side_effect=run_pip)
+    return calls
+
+
+def test_install_batch(installer: InstallPkg, site: Path, mocker: MockerFixture) -> None:
+    calls = _mock_run_pip(installer, mocker, site)
+    pkgs = {"ham": ">=1.0", "eggs": "", "pip": ">=24.0"}
+    assert installer._install_pending(pkgs, force=False) == []
+    assert len(calls) == 1
+    cmd = calls[0]
+    assert cmd[:5] == ["python", "-m", "pip", "install", "--upgrade"]
+    assert cmd[-3:] == ["ham>=1.0", "eggs", "pip>=24.0"]
+
+
+def test_install_batch_tracking(installer: InstallPkg, site: Path, mocker: MockerFixture) -> None:
+    _ = _mock_run_pip(installer, mocker, site)
+    assert installer._install_pkg_batch({"ham": ">=1.0", "eggs": "", "pip": ""}, force=False) == []
+
+    # each package gets its own files, dependencies go to the first package.
+    ham = _read_tracking(site, "ham")
+    assert sorted(ham["new_dirs"]) == ["ham", "ham-1.0.dist-info", "six-1.16.0.dist-info"]
+    assert ham["new_files"] == ["six.py"]
+    assert ham["new_bin_files"] == ["ham"]
+    eggs = _read_tracking(site, "eggs")
+    assert eggs["new_dirs"] == ["eggs", "eggs-1.0.dist-info"]
+    assert eggs["new_files"] == []
+    assert eggs["new_bin_files"] == ["eggs"]
+    # packages in no_pip_remove are not tracked.
+    assert not (site / f"{IMPL}_pip.json").exists()
+
+
+def test_install_batch_groups(installer: InstallPkg, site: Path, mocker: MockerFixture) -> None:
+    calls = _mock_run_pip(installer, mocker, site)
+
+    def get_install_args(pkg: str, force: bool) -> List[str]:
+        return ["install", f"--target={site}"] if pkg == "eggs" else ["install", "--user"]
+
+    mocker.patch.object(installer, "_get_install_args", side_effect=get_install_args)
+    assert installer._install_pkg_batch({"ham": "", "eggs": "", "spam": ""}, force=False) == []
+    assert [_pkgs_of(cmd) for cmd in calls] == [["ham", "spam"], ["eggs"]]
+    assert (site / f"{IMPL}_spam.json").exists()
+
+
+def test_install_batch_fallback(installer: InstallPkg, site: Path, mocker: MockerFixture) -> None:
+    calls = _mock_run_pip(installer, mocker, site, fail=["eggs"])
+    assert installer._install_pending({"ham": "", "eggs": ">=1.0"}, force=False) == []
+    assert [_pkgs_of(cmd) for cmd in calls] == [["ham", "eggs"], ["ham"], ["eggs"]]
+    assert _read_tracking(site, "ham")["new_files"] == ["six.py"]
+    assert _read_tracking(site, "eggs")["new_dirs"] == ["eggs", "eggs-1.0.dist-info"]
+
+
+def test_install_one_at_a_time_stops(installer: InstallPkg, site: Path, mocker: MockerFixture) -> None:
+    calls: List[List[str]] = []
+
+    def run_pip(cmd: List[str]) -> subprocess.CompletedProcess:
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 1, "", "No matching distribution")
+
+    mocker.patch.object(installer, "_run_pip", side_effect=run_pip)
+    assert installer._install_pending({"ham": "", "eggs": "", "spam": ""}, force=False) == ["ham", "eggs", "spam"]
+    # the batch, then the first package.
+    assert [_pkgs_of(cmd) for cmd in calls] == [["ham", "eggs", "spam"], ["ham"]]
+
+
+def test_install_batch_disabled(installer: InstallPkg, site: Path, mocker: MockerFixture) -> None:
+    calls = _mock_run_pip(installer, mocker, site)
+    installer.config.batch_install = False
+    assert installer._install_pending({"ham": "", "eggs": ""}, force=False) == []
+    assert [_pkgs_of(cmd) for cmd in calls] == [["ham"], ["eggs"]]
+
+
+def test_install_batch_cancelled(installer: InstallPkg, site: Path, mocker: MockerFixture) -> None:
+    calls = _mock_run_pip(installer, mocker, site)
+    installer._cancel.cancel()
+    assert installer._install_pending({"ham": "", "eggs": ""}, force=False) == ["ham", "eggs"]
+    assert calls == []
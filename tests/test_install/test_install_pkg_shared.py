@@ -0,0 +1,105 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import TYPE_CHECKING, List
+import json
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+    from ...oxt.___lo_pip___.install.pkg_installers.install_pkg import InstallPkg
+    from ...oxt.___lo_pip___.install.shared_registry import SharedRegistry
+else:
+    from oxt.___lo_pip___.install.shared_registry import SharedRegistry
+
+MOD = "oxt.___lo_pip___.install.pkg_installers.install_pkg"
+IMPL = "test_impl"
+
+
+def _make_dist(site: Path, name: str, ver: str, files: List[str], requires: List[str] | None = None) -> None:
+    dist_info = f"{name}-{ver}.dist-info"
+    info = site / dist_info
+    info.mkdir(parents=True)
+    lines = ["Metadata-Version: 2.1", f"Name: {name}", f"Version: {ver}"]
+    lines.extend(f"Requires-Dist: {req}" for req in requires or [])
+    (info / "METADATA").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    records = [f"{f},sha256=abc,1" for f in files]
+    records.extend([f"{dist_info}/METADATA,,", f"{dist_info}/RECORD,,"])
+    (info / "RECORD").write_text("\n".join(records) + "\n", encoding="utf-8")
+    for f in files:
+        (site / f).parent.mkdir(parents=True, exist_ok=True)
+        (site / f).write_text("x", encoding="utf-8")
+
+
+@pytest.fixture
+def site(tmp_path: Path) -> Path:
+    result = tmp_path / "site"
+    # ham was installed by this extension, six came with it as a dependency.
+    _make_dist(result, "ham", "1.0", ["ham/__init__.py"], ["six>=1.0"])
+    _make_dist(result, "six", "1.16.0", ["six.py"])
+    # eggs was installed by another extension, it also depends on six which was already installed.
+    _make_dist(result, "eggs", "1.0", ["eggs/__init__.py"], ['six; python_version >= "3"'])
+    data = {"new_dirs": ["ham", "ham-1.0.dist-info", "six-1.16.0.dist-info"], "new_files": ["six.py"]}
+    (result / f"{IMPL}_ham.json").write_text(json.dumps({"data": data}), encoding="utf-8")
+    return result
+
+
+@pytest.fixture
+def installer(site: Path, tmp_path: Path, mocker: MockerFixture) -> InstallPkg:
+    registry = tmp_path / "shared.json"
+    SharedRegistry(registry).register("ext.a", str(site), {"ham": ""})
+    SharedRegistry(registry).register("ext.b", str(site), {"eggs": ""})
+    mock_config = mocker.patch(f"{MOD}.Config")
+    config = mock_config.return_value
+    config.python_path = "python"
+    config.lo_implementation_name = IMPL
+    config.lo_identifier = "ext.a"
+    config.no_pip_remove = {"pip", "setuptools", "wheel"}
+    config.share_requirements = True
+    config.site_packages = str(site)
+    config.shared_requirements_file = str(registry)
+    config.uninstall_workers = 2
+    _ = mocker.patch(f"{MOD}.OxtLogger")
+    _ = mocker.patch(f"{MOD}.ResourceResolver")
+    mock_target = mocker.patch(f"{MOD}.TargetPath")
+    mock_target.return_value.get_package_target.return_value = str(site)
+
+    from oxt.___lo_pip___.install.pkg_installers.install_pkg import InstallPkg
+
+    return InstallPkg(ctx=None, show_progress=False)
+
+
+def _remaining(site: Path) -> set:
+    return {p.relative_to(site).as_posix() for p in site.rglob("*")}
+
+
+def test_transitive_dependency_kept(installer: InstallPkg, site: Path) -> None:
+    assert installer.uninstall_pkg("ham", remove_tracking_file=True)
+    # six is in the tracking data of ham but eggs of the other extension needs it.
+    assert _remaining(site) == {
+        "eggs",
+        "eggs/__init__.py",
+        "eggs-1.0.dist-info",
+        "eggs-1.0.dist-info/METADATA",
+        "eggs-1.0.dist-info/RECORD",
+        "six.py",
+        "six-1.16.0.dist-info",
+        "six-1.16.0.dist-info/METADATA",
+        "six-1.16.0.dist-info/RECORD",
+    }
+
+
+def test_transitive_dependency_skipped(installer: InstallPkg, site: Path) -> None:
+    assert installer.uninstall_pkg("six")
+    assert installer.skipped_shared == {"six": ["ext.b"]}
+    assert (site / "six.py").exists()
+
+
+def test_dependency_removed_when_unused(installer: InstallPkg, site: Path, tmp_path: Path) -> None:
+    assert SharedRegistry(tmp_path / "shared.json").unregister("ext.b")
+    assert installer.uninstall_pkg("ham", remove_tracking_file=True)
+    assert not (site / "six.py").exists()
+    assert not (site / "six-1.16.0.dist-info").exists()
+    assert (site / "eggs").exists()
@@ -0,0 +1,78 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import TYPE_CHECKING
+import os
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.___lo_pip___.install.installed_files import InstalledFiles
+    from ...oxt.___lo_pip___.install.post.link_scan import LinkManifest, get_file_suffix, scan_files
+else:
+    from oxt.___lo_pip___.install.installed_files import InstalledFiles
+    from oxt.___lo_pip___.install.post.link_scan import LinkManifest, get_file_suffix, scan_files
+
+
+@pytest.mark.parametrize(
+    "name,expected",
+    [
+        ("indexers.cpython-38-x86_64-linux-gnu.so", "cpython-38-x86_64-linux-gnu"),
+        ("indexers.cpython-3.8.so", ""),
+        ("indexers.abi3.so", ""),
+        ("indexers.py", ""),
+        ("so", ""),
+    ],
+)
+def test_get_file_suffix(name: str, expected: str) -> None:
+    # link names such as cpython-3.8 are never reported as a file suffix.
+    assert get_file_suffix(name) == expected
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_scan_files(tmp_path: Path, workers: int) -> None:
+    files = ["top.so", "a/x.so", "a/b/c/y.so", "d/z.so", "d/readme.txt"]
+    for f in files:
+        (tmp_path / f).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / f).write_text("x", encoding="utf-8")
+    if os.name != "nt":
+        (tmp_path / "d" / "link.so").symlink_to(tmp_path / "d" / "z.so")
+        (tmp_path / "loop").symlink_to(tmp_path, target_is_directory=True)
+
+    result = scan_files(tmp_path, ".so", workers=workers)
+    assert [p.relative_to(tmp_path).as_posix() for p in result] == ["a/b/c/y.so", "a/x.so", "d/z.so", "top.so"]
+    assert scan_files(tmp_path / "missing", ".so") == []
+
+
+def test_link_manifest(tmp_path: Path) -> None:
+    pth = tmp_path / "links.json"
+    manifest = LinkManifest(pth)
+    assert not manifest.is_match("/site", "cpython-3.8")
+
+    manifest.reset("/site", "cpython-38-x86_64-linux-gnu", "cpython-3.8")
+    manifest.add(["/site/a/x.cpython-3.8.so"])
+    manifest.save()
+
+    loaded = LinkManifest(pth)
+    assert loaded.is_match("/site", "cpython-3.8")
+    assert not loaded.is_match("/other", "cpython-3.8")
+    assert not loaded.is_match("/site", "cpython-3.9")
+    assert loaded.file_suffix == "cpython-38-x86_64-linux-gnu"
+    assert loaded.links == {"/site/a/x.cpython-3.8.so"}
+
+    pth.write_text("not json", encoding="utf-8")
+    assert not LinkManifest(pth).is_match("/site", "cpython-3.8")
+
+
+def test_installed_files(tmp_path: Path) -> None:
+    files = InstalledFiles()
+    files.clear()
+    try:
+        files.add(tmp_path, ["pkg/a.cpython-38-x86_64-linux-gnu.so", "pkg/__init__.py"])
+        files.add(tmp_path, ["pkg/__init__.py"])
+        assert len(files) == 2
+        assert files.get_files(".so") == [tmp_path / "pkg" / "a.cpython-38-x86_64-linux-gnu.so"]
+        assert InstalledFiles() is files
+    finally:
+        files.clear()
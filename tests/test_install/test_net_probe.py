@@ -0,0 +1,113 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
+import json
+import socket
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.___lo_pip___.install.net_probe import NetProbe, get_target
+else:
+    from oxt.___lo_pip___.install.net_probe import NetProbe, get_target
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def no_proxy(monkeypatch: pytest.MonkeyPatch) -> None:
+    for name in ("http_proxy", "https_proxy", "HTTP_PROXY", "HTTPS_PROXY", "all_proxy", "ALL_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+
+
+@pytest.fixture
+def listening() -> Iterator[int]:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        sock.listen()
+        yield sock.getsockname()[1]
+
+
+@pytest.fixture
+def closed() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_get_target(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert get_target("https://duckduckgo.com") == ("duckduckgo.com", 443)
+    assert get_target("http://localhost:8000/simple") == ("localhost", 8000)
+    assert get_target("") == ("", 443)
+    monkeypatch.setenv("https_proxy", "proxy.local:3128")
+    assert get_target("https://duckduckgo.com") == ("proxy.local", 3128)
+
+
+def test_reachable(listening: int, closed: int) -> None:
+    assert NetProbe(f"http://127.0.0.1:{listening}").is_reachable()
+    assert not NetProbe(f"http://127.0.0.1:{closed}").is_reachable()
+    assert not NetProbe("").is_reachable()
+
+
+def test_start(listening: int) -> None:
+    probe = NetProbe(f"http://127.0.0.1:{listening}")
+    probe.start()
+    assert probe.is_reachable()
+
+
+def test_ttl_cache_file(tmp_path: Path, listening: int) -> None:
+    cache_file = tmp_path / "probe.json"
+    clock = Clock()
+    url = f"http://127.0.0.1:{listening}"
+    assert NetProbe(url, ttl=60, cache_file=cache_file, clock=clock).is_reachable()
+    data = json.loads(cache_file.read_text())
+    assert data["ok"] is True
+    assert data["target"] == f"127.0.0.1:{listening}"
+
+    # a new session reuses the result without probing.
+    probe =NetProbe(url, ttl=60, cache_file=cache_file, clock=clock)
+    probe._connect = lambda: False  # type: ignore[method-assign]
+    assert probe.is_reachable()
+
+    # expired results are probed again.
+    clock.now += 60
+    assert not probe.is_reachable()
+    probe.clear()
+    assert not cache_file.exists()
+
+
+def test_negative_backoff(tmp_path: Path, closed: int) -> None:
+    cache_file = tmp_path / "probe.json"
+    clock = Clock()
+    probe = NetProbe(f"http://127.0.0.1:{closed}", ttl=60, backoff=5, cache_file=cache_file, clock=clock)
+    calls = []
+    connect = probe._connect
+
+    def counting_connect() -> bool:
+        calls.append(clock.now)
+        return connect()
+
+    probe._connect = counting_connect  # type: ignore[method-assign]
+    assert not probe.is_reachable()
+    clock.now += 4
+    assert not probe.is_reachable()
+    assert len(calls) == 1
+
+    # second failure doubles the backoff.
+    clock.now += 1
+    assert not probe.is_reachable()
+    assert json.loads(cache_file.read_text())["failures"] == 2
+    clock.now += 9
+    assert not probe.is_reachable()
+    assert len(calls) == 2
+    clock.now += 1
+    assert not probe.is_reachable()
+    assert len(calls) == 3
@@ -0,0 +1,80 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import TYPE_CHECKING, List
+import sys
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.___lo_pip___.install.pip_detect import PipDetect
+else:
+    from oxt.___lo_pip___.install.pip_detect import PipDetect
+
+
+def _make_pip(site: Path, metadata: bool = True) -> None:
+    pkg = site / "pip"
+    pkg.mkdir(parents=True)
+    (pkg / "__init__.py").write_text("", encoding="utf-8")
+    (pkg / "__main__.py").write_text("", encoding="utf-8")
+    if metadata:
+        dist_info = site / "pip-23.2.1.dist-info"
+        dist_info.mkdir()
+        (dist_info / "METADATA").write_text("Metadata-Version: 2.1\nName: pip\nVersion: 23.2.1\n", encoding="utf-8")
+
+
+class Runner:
+    def __init__(self, returncode: int) -> None:
+        self.returncode = returncode
+        self.cmds: List[List[str]] = []
+
+    def __call__(self, cmd: List[str]) -> int:
+        self.cmds.append(cmd)
+        return self.returncode
+
+
+def test_found_in_process(tmp_path: Path) -> None:
+    _make_pip(tmp_path)
+    runner = Runner(1)
+    detect = PipDetect("/other/python", [str(tmp_path)], run=runner)
+    assert detect.is_installed()
+    assert detect.source == "in_process"
+    assert runner.cmds == []
+
+
+def test_not_found_current_interpreter(tmp_path: Path) -> None:
+    runner = Runner(0)
+    detect = PipDetect(sys.executable, [str(tmp_path)], run=runner)
+    assert detect.find_in_process() is False
+    assert not detect.is_installed()
+    assert runner.cmds == []
+
+
+@pytest.mark.parametrize("metadata", [True, False])
+def test_ambiguous_uses_subprocess(tmp_path: Path, metadata: bool) -> None:
+    site = tmp_path / "site"
+    site.mkdir()
+    if not metadata:
+        _make_pip(site, metadata=False)
+    cache_file = tmp_path / "pip_detect.json"
+    runner = Runner(0)
+    detect = PipDetect("/other/python", [str(site)], cache_file=cache_file, run=runner)
+    assert detect.find_in_process() is None
+    assert detect.is_installed()
+    assert detect.source == "subprocess"
+    assert runner.cmds == [["/other/python", "-m", "pip", "-V"]]
+
+    # the verdict is cached until the search path changes.
+    assert PipDetect("/other/python", [str(site)], cache_file=cache_file, run=runner).is_installed()
+    assert len(runner.cmds) == 1
+    (site / "new_pkg").mkdir()
+    runner.returncode = 1
+    detect = PipDetect("/other/python", [str(site)], cache_file=cache_file, run=runner)
+    assert not detect.is_installed()
+    assert detect.source == "subprocess"
+
+    # another interpreter does not share the verdict.
+    detect = PipDetect("/another/python", [str(site)], cache_file=cache_file, run=runner)
+    detect.is_installed()
+    assert detect.source == "subprocess"
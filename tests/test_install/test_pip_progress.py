@@ -0,0 +1,49 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.___lo_pip___.install.pip_progress import PipPhase, format_event, parse_line
+else:
+    from oxt.___lo_pip___.install.pip_progress import PipPhase, format_event, parse_line
+
+
+@pytest.mark.parametrize(
+    "line,phase,package,detail",
+    [
+        ("Collecting verr", PipPhase.COLLECTING, "verr", ""),
+        ("Collecting ooo-dev-tools>=0.11.0 (from -r req.txt (line 1))", PipPhase.COLLECTING, "ooo-dev-tools", ""),
+        ("  Downloading verr-1.1.2-py3-none-any.whl (11 kB)", PipPhase.DOWNLOADING, "verr", "11 kB"),
+        ("  Downloading https://x.org/p/numpy-1.26.0.tar.gz (15.6 MB)", PipPhase.DOWNLOADING, "numpy", "15.6 MB"),
+        ("  Using cached six-1.16.0-py2.py3-none-any.whl (11 kB)", PipPhase.CACHED, "six", "11 kB"),
+        ("Requirement already satisfied: six in ./site (1.16.0)", PipPhase.SATISFIED, "six", ""),
+        ("  Building wheel for odfpy (setup.py) ... done", PipPhase.BUILDING, "odfpy", "setup.py"),
+        ("Installing collected packages: six, verr", PipPhase.INSTALLING, "six, verr", ""),
+        ("Successfully installed six-1.16.0 verr-1.1.2", PipPhase.SUCCESS, "six-1.16.0 verr-1.1.2", ""),
+        ("ERROR: No matching distribution for nope", PipPhase.ERROR, "", "No matching distribution for nope"),
+    ],
+)
+def test_parse_line(line: str, phase: str, package: str, detail: str) -> None:
+    event = parse_line(line)
+    assert event is not None
+    assert event.phase == phase
+    assert event.package == package
+    assert event.detail == detail
+    assert event.line == line.strip()
+
+
+@pytest.mark.parametrize("line", ["", "   ", "  Preparing metadata (setup.py) ... done", "[notice] A new release"])
+def test_parse_line_none(line: str) -> None:
+    assert parse_line(line) is None
+
+
+def test_format_event() -> None:
+    event = parse_line("  Downloading verr-1.1.2-py3-none-any.whl (11 kB)")
+    assert event is not None
+    assert format_event(event) == "Downloading verr (11 kB)"
+    event = parse_line("ERROR: boom")
+    assert event is not None
+    assert format_event(event) == "ERROR: boom"
@@ -0,0 +1,257 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Tuple
+import os
+import sys
+import threading
+import time
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.___lo_pip___.install.pip_worker import PipWorker, PipWorkerError, get_worker, run_cmd
+    from ...oxt.___lo_pip___.thread.cancellation import CancellationToken
+else:
+    from oxt.___lo_pip___.install.pip_worker import PipWorker, PipWorkerError, get_worker, run_cmd
+    from oxt.___lo_pip___.thread.cancellation import CancellationToken
+
+
+@pytest.fixture
+def slow_script(tmp_path: Path) -> Path:
+    pth = tmp_path / "slow.py"
+    pth.write_text(
+        "import sys, time\nfor i in range(20):\n    print('line', i)\n    time.sleep(0.1)\n"
+        "print('done', file=sys.stderr)\n",
+        encoding="utf-8",
+    )
+    return pth
+
+
+@pytest.fixture
+def script(tmp_path: Path) -> Path:
+    pth = tmp_path / "hello.py"
+    pth.write_text(
+        "import sys\nprint('hello', *sys.argv[1:])\nprint('oops', file=sys.stderr)\nsys.exit(3)\n", encoding="utf-8"
+    )
+    return pth
+
+
+@pytest.mark.parametrize("use_fork", [True, False])
+def test_run_pip(use_fork: bool) -> None:
+    worker = PipWorker(sys.executable, idle_timeout=30, use_fork=use_fork)
+    try:
+        result = worker.run_pip(["-V"])
+        assert result.returncode == 0
+        assert result.stdout.startswith("pip ")
+        assert worker.is_running
+        assert worker.run([sys.executable, "-m", "pip", "-V"]).returncode == 0
+    finally:
+        worker.close()
+    assert not worker.is_running
+
+
+@pytest.mark.parametrize("use_fork", [True, False])
+def test_run_script(script: Path, use_fork: bool) -> None:
+    worker = PipWorker(sys.executable, idle_timeout=30, use_fork=use_fork)
+    try:
+        result = worker.run([sys.executable, str(script), "world"], env={"PIP_WORKER_TEST": "1"})
+        assert result.returncode == 3
+        assert result.stdout.strip() == "hello world"
+        assert result.stderr.strip() == "oops"
+        assert result.args == [sys.executable, str(script), "world"]
+    finally:
+        worker.close()
+
+
+def test_serial_fresh_process(tmp_path: Path) -> None:
+    # pip can not run twice in one process, without fork each command gets a new process.
+    pth = tmp_path / "pid.py"
+    pth.write_text("import os, sys\nprint(os.getpid(), 'pip' in sys.modules)\n", encoding="utf-8")
+    worker = PipWorker(sys.executable, idle_timeout=30, use_fork=False)
+    try:
+        assert worker.run_pip(["list", "--disable-pip-version-check"]).returncode == 0
+        first = worker.run([sys.executable, str(pth)]).stdout.split()
+        second = worker.run([sys.executable, str(pth)]).stdout.split()
+        assert first[1] == second[1] == "False"
+        assert first[0] != second[0]
+        assert worker.run_pip(["-V"]).stdout.startswith("pip ")
+    finally:
+        worker.close()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+def test_worker_env(tmp_path: Path) -> None:
+    # pip is imported once by the worker, a request with another environment runs in a new process.
+    # tempfile is imported by the worker, not by a new interpreter.
+    pth = tmp_path / "env.py"
+    pth.write_text(
+        "import os, sys\nprint(os.environ.get('PYTHONPATH'), 'tempfile' in sys.modules)\n", encoding="utf-8"
+    )
+    env = {**os.environ, "PYTHONPATH": str(tmp_path / "one")}
+    other = {**os.environ, "PYTHONPATH": str(tmp_path / "two")}
+    worker = PipWorker(sys.executable, idle_timeout=30, env=env)
+    try:
+        same = worker.run([sys.executable, str(pth)], env=env).stdout.split()
+        assert same == [str(tmp_path / "one"), "True"]
+        changed = worker.run([sys.executable, str(pth)], env=other).stdout.split()
+        assert changed == [str(tmp_path / "two"), "False"]
+        streamed: List[str] = []
+        result = worker.run([sys.executable, str(pth)], env=other, on_line=lambda s, line: streamed.append(line))
+        assert result.returncode == 0
+        assert streamed[0].split() == [str(tmp_path / "two"), "False"]
+    finally:
+        worker.close()
+
+
+def test_get_worker_env() -> None:
+    env = {**os.environ, "PYTHONPATH": "one"}
+    worker = get_worker(sys.executable, env=dict(env))
+    assert get_worker(sys.executable, env=env) is worker
+    assert get_worker(sys.executable, env={**env, "PYTHONPATH": "two"}) is not worker
+    assert get_worker(sys.executable) is not worker
+
+
+def test_restart_after_idle() -> None:
+    worker = PipWorker(sys.executable, idle_timeout=0.5)
+    try:
+        assert worker.run_pip(["-V"]).returncode == 0
+        time.sleep(2.0)
+        assert not worker.is_running
+        assert worker.run_pip(["-V"]).returncode == 0
+    finally:
+        worker.close()
+
+
+def test_run_not_supported(tmp_path: Path) -> None:
+    worker = PipWorker(sys.executable)
+    with pytest.raises(ValueError):
+        worker.run([sys.executable, "-c", "pass"])
+    with pytest.raises(ValueError):
+        worker.run(["other-python", "-m", "pip", "-V"])
+    assert not worker.is_running
+
+
+def test_run_cmd_fallback(script: Path) -> None:
+    result = run_cmd([sys.executable, "-c", "print('direct')"])
+    assert result.returncode == 0
+    assert result.stdout.strip() == "direct"
+
+    result = run_cmd([sys.executable, str(script)], idle_timeout=0)
+    assert result.returncode == 3
+    assert result.stdout.strip() == "hello"
+
+
+@pytest.mark.parametrize("idle_timeout", [30, 0])
+def test_run_cmd_stream(slow_script: Path, idle_timeout: float) -> None:
+    lines: List[Tuple[float, str, str]] = []
+    start = time.monotonic()
+    result = run_cmd(
+        [sys.executable, str(slow_script)],
+        idle_timeout=idle_timeout,
+        on_line=lambda stream, line: lines.append((time.monotonic() - start, stream, line)),
+        max_lines=5,
+    )
+    assert result.returncode == 0
+    assert [line for _, stream, line in lines if stream == "stdout"] == [f"line {i}" for i in range(20)]
+    assert [line for _, stream, line in lines if stream == "stderr"] == ["done"]
+    # lines arrive while the command runs, not all at the end.
+    assert lines[0][0] < lines[-1][0] - 1.0
+    assert result.stdout == "".join(f"line {i}\n" for i in range(15, 20))
+    assert result.stderr == "done\n"
+
+
+@pytest.mark.parametrize("use_fork", [True, False])
+def test_worker_stream_cancel(slow_script: Path, use_fork: bool) -> None:
+    worker = PipWorker(sys.executable, idle_timeout=30, use_fork=use_fork)
+    lines: List[str] = []
+    cancel = threading.Event()
+
+    def on_line(stream: str, line: str) -> None:
+        lines.append(line)
+        if len(lines) == 3:
+            cancel.set()
+
+    try:
+        result = worker.run([sys.executable, str(slow_script)], on_line=on_line, cancel=cancel)
+        assert result.returncode != 0
+        assert 3 <= len(lines) < 20
+        # the worker keeps serving after a cancelled command.
+        assert worker.run_pip(["-V"]).returncode == 0
+    finally:
+        worker.close()
+
+
+@pytest.mark.skipif(os.name == "nt", reason="the token stops the process group on posix")
+def test_run_cmd_stream_token(slow_script: Path) -> None:
+    # the process is stopped by the token callback instead of polling.
+    token = CancellationToken()
+    lines: List[str] = []
+    timer = threading.Timer(0.5, token.cancel)
+    timer.start()
+    start = time.monotonic()
+    result = run_cmd(
+        [sys.executable, str(slow_script)], idle_timeout=0, on_line=lambda s, line: lines.append(line), cancel=token
+    )
+    timer.join()
+    assert result.returncode != 0
+    assert time.monotonic() - start < 1.5
+    assert len(lines) < 20
+
+
+def test_run_cmd_stream_cancel(slow_script: Path) -> None:
+    cancel = threading.Event()
+    cancel.set()
+    start = time.monotonic()
+    result = run_cmd([sys.executable, str(slow_script)], idle_timeout=0, on_line=lambda s, line: None, cancel=cancel)
+    assert result.returncode != 0
+    assert time.monotonic() - start < 1.5
+
+
+@pytest.mark.parametrize("use_fork", [True, False])
+def test_worker_stream(slow_script: Path, use_fork: bool) -> None:
+    worker = PipWorker(sys.executable, idle_timeout=30, use_fork=use_fork)
+    lines: List[Tuple[float, str]] = []
+    start = time.monotonic()
+    try:
+        assert worker.can_stream
+        result = worker.run(
+            [sys.executable, str(slow_script)], on_line=lambda s, line: lines.append((time.monotonic() - start, line))
+        )
+        assert result.returncode == 0
+        assert result.stdout == ""
+        assert [line for _, line in lines] == [*(f"line {i}" for i in range(20)), "done"]
+        assert lines[0][0] < lines[-1][0] - 1.0
+    finally:
+        worker.close()
+
+
+@pytest.mark.skipif(os.name == "nt", reason="the script stops the worker with a POSIX signal")
+@pytest.mark.parametrize("use_fork", [True, False])
+def test_worker_exits_while_running(tmp_path: Path, use_fork: bool) -> None:
+    runs = tmp_path / "runs.txt"
+    pth = tmp_path / "stop_worker.py"
+    pth.write_text(
+        "import os, signal, sys, time\n"
+        f"with open({str(runs)!r}, 'a') as f:\n"
+        "    f.write('run\\n')\n"
+        "if os.getppid() != int(sys.argv[1]):\n"
+        "    os.kill(os.getppid(), signal.SIGKILL)\n"
+        "time.sleep(0.5)\n",
+        encoding="utf-8",
+    )
+    worker = PipWorker(sys.executable, idle_timeout=30, use_fork=use_fork)
+    try:
+        with pytest.raises(PipWorkerError) as err:
+            worker.run([sys.executable, str(pth), str(os.getpid())])
+        assert err.value.started
+    finally:
+        worker.close()
+
+    # run_cmd reports the error instead of running the command a second time.
+    runs.unlink()
+    result = run_cmd([sys.executable, str(pth), str(os.getpid())], on_line=lambda s, line: None)
+    assert result.returncode != 0
+    assert "before responding" in result.stderr
+    assert runs.read_text() == "run\n"
@@ -0,0 +1,106 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import socket
+import subprocess
+import sys
+import time
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.___lo_pip___.install.progress_window.progress_channel import ProgressChannel
+    from ...oxt.___lo_pip___.install.progress_window.progress_host import format_status
+else:
+    from oxt.___lo_pip___.install.progress_window.progress_channel import ProgressChannel
+    from oxt.___lo_pip___.install.progress_window.progress_host import format_status
+
+
+def _start_host(channel: ProgressChannel, msg: str = "") -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, *channel.get_host_args(msg)], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+    )
+
+
+def _wait_connected(channel: ProgressChannel) -> None:
+    for _ in range(100):
+        if channel.is_connected:
+            return
+        time.sleep(0.05)
+    raise AssertionError("host did not connect")
+
+
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        ({"msg": "Installing: verr", "step": 2, "total": 3}, "[2/3] Installing: verr"),
+        ({"msg": "Installing: verr", "step": 4, "total": 3}, "[4/4] Installing: verr"),
+        ({"msg": "Installing: verr"}, "Installing: verr"),
+    ],
+)
+def test_format_status(data: dict, expected: str) -> None:
+    assert format_status(data) == expected
+
+
+def test_host_session() -> None:
+    channel = ProgressChannel()
+    # sent before the host connects, must not be lost.
+    channel.send("Installing PIP", 1, 3)
+    proc = _start_host(channel, "Starting")
+    try:
+        _wait_connected(channel)
+        channel.send("Installing: verr", 2, 3)
+        channel.send("Linking", 3, 3)
+        channel.close()
+        out, _ = proc.communicate(timeout=10)
+    finally:
+        proc.kill()
+    assert proc.returncode == 0
+    lines = [line.rstrip(" .") for line in out.splitlines()]
+    assert lines == ["Starting", "[1/3] Installing PIP", "[2/3] Installing: verr", "[3/3] Linking"]
+
+
+def test_host_exits_when_connection_lost() -> None:
+    channel = ProgressChannel()
+    proc = _start_host(channel)
+    try:
+        _wait_connected(channel)
+        # simulates the installer process going away without closing the channel.
+        conn = channel._conn
+        assert conn is not None
+        conn.shutdown(socket.SHUT_RDWR)
+        proc.communicate(timeout=10)
+    finally:
+        proc.kill()
+        channel.close()
+    assert proc.returncode == 0
+
+
+def test_wrong_token() -> None:
+    channel = ProgressChannel()
+    try:
+        with socket.create_connection(("127.0.0.1", channel.port), timeout=5) as sock:
+            sock.sendall(b"nope\n")
+            sock.settimeout(5)
+            assert sock.recv(100) == b""
+        assert not channel.is_connected
+        proc = _start_host(channel)
+        _wait_connected(channel)
+    finally:
+        channel.close()
+    proc.communicate(timeout=10)
+    assert proc.returncode == 0
+
+
+def test_host_no_channel() -> None:
+    channel = ProgressChannel()
+    port = channel.port
+    channel.close()
+    result = subprocess.run(
+        [sys.executable, *channel.get_host_args()[:1], str(port), channel.token],
+        capture_output=True,
+        text=True,
+        timeout=20,
+    )
+    assert result.returncode == 1
@@ -0,0 +1,86 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import TYPE_CHECKING, List
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.___lo_pip___.install.record_tracker import (
+        RecordTracker,
+        get_installed_names,
+        merge_changes,
+        new_changes,
+    )
+else:
+    from oxt.___lo_pip___.install.record_tracker import RecordTracker, get_installed_names, merge_changes, new_changes
+
+
+def _make_dist(site: Path, dist_info: str, files: List[str]) -> None:
+    info = site / dist_info
+    info.mkdir(parents=True)
+    lines = [f"{f},sha256=abc,1" for f in files]
+    lines.append(f"{dist_info}/RECORD,,")
+    (info / "RECORD").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+@pytest.mark.parametrize(
+    "output,expected",
+    [
+        pytest.param("Successfully installed six-1.16.0 verr-1.1.2\n", ["six", "verr"], id="two"),
+        pytest.param(
+            "Collecting ooo-dev-tools\n  Downloading x.whl\nSuccessfully installed ooo_dev_tools-0.11.0\n",
+            ["ooo_dev_tools"],
+            id="mixed output",
+        ),
+        pytest.param("Requirement already satisfied: verr in ./site\n", [], id="none"),
+        pytest.param("", [], id="empty"),
+    ],
+)
+def test_get_installed_names(output: str, expected: List[str]) -> None:
+    assert get_installed_names(output) == expected
+
+
+def test_get_changes(tmp_path: Path) -> None:
+    _make_dist(
+        tmp_path,
+        "ooo_dev_tools-0.11.0.dist-info",
+        [
+            "ooodev/__init__.py",
+            "ooodev/utils/lo.py",
+            "ooo_dev_tools-0.11.0.dist-info/METADATA",
+            "__pycache__/single.cpython-311.pyc",
+            "single.py",
+            "bin/odt",
+            "lib/libfoo.so",
+            "include/foo/foo.h",
+            "../../../bin/odt",
+        ],
+    )
+    (tmp_path / "unrelated").mkdir()
+
+    tracker = RecordTracker(tmp_path)
+    assert tracker.find_dist_info("OOO-Dev.Tools") == "ooo_dev_tools-0.11.0.dist-info"
+    changes = tracker.get_changes("ooo-dev-tools")
+    assert changes == {
+        "new_dirs": ["ooo_dev_tools-0.11.0.dist-info", "ooodev"],
+        "new_files": ["single.py"],
+        "new_bin_files": ["odt"],
+        "new_lib_files": ["libfoo.so"],
+        "new_inc_files": [],
+    }
+
+
+def test_get_changes_not_found(tmp_path: Path) -> None:
+    tracker = RecordTracker(tmp_path / "missing")
+    assert tracker.find_dist_info("verr") == ""
+    assert tracker.get_changes("verr") == new_changes()
+
+
+def test_merge_changes() -> None:
+    changes = new_changes()
+    changes["new_dirs"] = ["a"]
+    merge_changes(changes, {"new_dirs": ["a", "b"], "new_files": ["c.py"]})
+    assert changes["new_dirs"] == ["a", "b"]
+    assert changes["new_files"] == ["c.py"]
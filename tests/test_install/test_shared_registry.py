@@ -0,0 +1,103 @@
+from __future__ import annotations
+import json
+import threading
+from pathlib import Path
+from typing import List, TYPE_CHECKING
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.___lo_pip___.install.shared_registry import SharedRegistry
+else:
+    from oxt.___lo_pip___.install.shared_registry import SharedRegistry
+
+SITE = "/profile/site-packages"
+
+
+def test_register_and_reload(tmp_path: Path) -> None:
+    pth = tmp_path / "shared.json"
+    reg = SharedRegistry(pth)
+    assert reg.register("ext.a", SITE, {"verr": ">=1.0"})
+    assert not reg.register("ext.a", SITE, {"verr": ">=1.0"})
+    # no temporary file is left behind, only the registry and its lock file.
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["shared.json", "shared.json.lock"]
+
+    reg = SharedRegistry(pth)
+    assert reg.extensions == ["ext.a"]
+    assert reg.get_users("verr", SITE) == ["ext.a"]
+
+
+def test_combined(tmp_path: Path) -> None:
+    reg = SharedRegistry(tmp_path / "shared.json")
+    reg.register("ext.b", SITE, {"Ooo_Dev": ">=0.10", "numpy": ""})
+    reg.register("ext.a", SITE, {"ooo-dev": ">=0.9,<1.0", "verr": ">=1.0"})
+    reg.register("ext.c", "/other/site-packages", {"pandas": ">=2.0"})
+
+    combined = reg.get_combined(SITE, first="ext.a")
+    assert combined == {"ooo-dev": ">=0.9,<1.0,>=0.10", "verr": ">=1.0", "numpy": ""}
+    assert reg.get_users("ooo_dev", SITE) == ["ext.a", "ext.b"]
+    assert reg.get_users("pandas", SITE) == []
+
+
+def test_unregister_and_prune(tmp_path: Path) -> None:
+    pth = tmp_path / "shared.json"
+    reg = SharedRegistry(pth)
+    reg.register("ext.a", SITE, {"verr": ""})
+    reg.register("ext.b", SITE, {"verr": ""})
+    reg.register("ext.c", SITE, {"numpy": ""})
+
+    assert reg.prune(lambda ext_id: False, keep="ext.a") == ["ext.b", "ext.c"]
+    assert reg.get_users("verr", SITE) == ["ext.a"]
+    assert reg.unregister("ext.a")
+    assert not reg.unregister("ext.a")
+    assert json.loads(pth.read_text())["extensions"] == {}
+
+
+def test_invalid_file(tmp_path: Path) -> None:
+    pth = tmp_path / "shared.json"
+    pth.write_text("{not json")
+    reg = SharedRegistry(pth)
+    assert reg.extensions == []
+    reg.register("ext.a", SITE, {"verr": ""})
+    assert SharedRegistry(pth).extensions == ["ext.a"]
+
+
+def test_stale_instances(tmp_path: Path) -> None:
+    pth = tmp_path / "shared.json"
+    # both read the empty registry before either registers, like two extensions starting together.
+    reg_a = SharedRegistry(pth)
+    reg_b = SharedRegistry(pth)
+    reg_a.register("ext.a", SITE, {"verr": ""})
+    reg_b.register("ext.b", SITE, {"numpy": ""})
+    assert SharedRegistry(pth).extensions == ["ext.a", "ext.b"]
+
+    reg_a.unregister("ext.a")
+    reg_b.register("ext.c", SITE, {"verr": ""})
+    assert SharedRegistry(pth).extensions == ["ext.b", "ext.c"]
+    reg_a.reload()
+    assert reg_a.get_users("verr", SITE) == ["ext.c"]
+
+
+def test_concurrent_register(tmp_path: Path) -> None:
+    pth = tmp_path / "shared.json"
+    count = 16
+    start = threading.Barrier(count)
+    errors: List[BaseException] = []
+
+    def register(i: int) -> None:
+        try:
+            reg = SharedRegistry(pth)
+            start.wait()
+            reg.register(f"ext.{i:02d}", SITE, {f"pkg{i}": ""})
+        except BaseException as err:
+            errors.append(err)
+
+    threads = [threading.Thread(target=register, args=(i,)) for i in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors
+    assert SharedRegistry(pth).extensions == [f"ext.{i:02d}" for i in range(count)]
@@ -0,0 +1,122 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import TYPE_CHECKING
+import os
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.___lo_pip___.install.uninstall_engine import UninstallEngine, UninstallManifest
+else:
+    from oxt.___lo_pip___.install.uninstall_engine import UninstallEngine, UninstallManifest
+
+
+@pytest.fixture
+def site(tmp_path: Path) -> Path:
+    site = tmp_path / "site"
+    files = [
+        "verr/__init__.py",
+        "verr/sub/mod.py",
+        "verr-1.1.2.dist-info/METADATA",
+        "verr-1.1.2.dist-info/RECORD",
+        "bin/verr",
+        "verr_helper.py",
+    ]
+    for f in files:
+        (site / f).parent.mkdir(parents=True, exist_ok=True)
+        (site / f).write_text("x", encoding="utf-8")
+    (site / "verr-1.1.2.dist-info" / "RECORD").write_text(
+        "verr/__init__.py,,\nverr/sub/mod.py,,\nverr_helper.py,,\nbin/verr,,\n../outside.py,,\n"
+        "verr-1.1.2.dist-info/METADATA,,\nverr-1.1.2.dist-info/RECORD,,\n",
+        encoding="utf-8",
+    )
+    # left over by an earlier failed uninstall
+    (site / "verr-1.0.0.dist-info").mkdir()
+    (site / "verr-1.0.0.dist-info" / "METADATA").write_text("x", encoding="utf-8")
+    # not part of the package
+    (site / "bin" / "other").write_text("x", encoding="utf-8")
+    (site / "six.py").write_text("x", encoding="utf-8")
+    (tmp_path / "outside.py").write_text("x", encoding="utf-8")
+    return site
+
+
+def _remaining(site: Path) -> set:
+    return {p.relative_to(site).as_posix() for p in site.rglob("*")}
+
+
+def test_uninstall(site: Path) -> None:
+    manifest = UninstallManifest("verr")
+    manifest.add_record(site, "verr")
+    report = UninstallEngine(workers=3).run(manifest)
+
+    assert report.success
+    assert not report.dry_run
+    assert _remaining(site) == {"bin", "bin/other", "six.py"}
+    assert (site.parent / "outside.py").exists()
+    assert str(site / "verr" / "sub" / "mod.py") in report.files
+    assert report.dirs.index(str(site / "verr" / "sub")) < report.dirs.index(str(site / "verr"))
+
+
+def test_dry_run(site: Path) -> None:
+    before = _remaining(site)
+    manifest = UninstallManifest("verr")
+    manifest.add_record(site, "verr")
+    dry = UninstallEngine().run(manifest, dry_run=True)
+    assert dry.dry_run
+    assert _remaining(site) == before
+
+    report = UninstallEngine().run(manifest)
+    assert sorted(dry.files) == sorted(report.files)
+    assert sorted(dry.dirs) == sorted(report.dirs)
+
+
+def test_tracking(site: Path) -> None:
+    (site / "verr" / "__pycache__").mkdir()
+    (site / "verr" / "__pycache__" / "x.pyc").write_text("x", encoding="utf-8")
+    manifest = UninstallManifest("verr")
+    manifest.add_tracking(
+        site,
+        {
+            "new_dirs": ["verr", "bin", "../site"],
+            "new_files": ["verr_helper.py", "missing.py"],
+            "new_bin_files": ["verr"],
+        },
+    )
+    report = UninstallEngine().run(manifest)
+    assert report.success
+    assert _remaining(site) == {
+        "bin",
+        "bin/other",
+        "six.py",
+        "verr-1.0.0.dist-info",
+        "verr-1.0.0.dist-info/METADATA",
+        "verr-1.1.2.dist-info",
+        "verr-1.1.2.dist-info/METADATA",
+        "verr-1.1.2.dist-info/RECORD",
+    }
+    assert str(site / "missing.py") not in report.files
+
+
+def test_optional_dir_kept(site: Path) -> None:
+    # written after install, not in RECORD, keeps its directory.
+    (site / "verr" / "sub" / "cache.dat").write_text("x", encoding="utf-8")
+    manifest = UninstallManifest("verr")
+    manifest.add_record(site, "verr")
+    report = UninstallEngine().run(manifest)
+    assert report.success
+    assert _remaining(site) == {"bin", "bin/other", "six.py", "verr", "verr/sub", "verr/sub/cache.dat"}
+
+
+@pytest.mark.skipif(os.name == "nt" or os.geteuid() == 0, reason="permissions are not enforced")
+def test_errors(site: Path) -> None:
+    manifest = UninstallManifest("verr")
+    manifest.add_tree(site, "verr")
+    os.chmod(site / "verr" / "sub", 0o555)
+    try:
+        report = UninstallEngine().run(manifest)
+    finally:
+        os.chmod(site / "verr" / "sub", 0o755)
+    assert not report.success
+    assert str(site / "verr" / "sub" / "mod.py") in [pth for pth, _ in report.errors]
@@ -0,0 +1,80 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import TYPE_CHECKING
+import os
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.___lo_pip___.install.wheel_cache import WheelCache
+else:
+    from oxt.___lo_pip___.install.wheel_cache import WheelCache
+
+
+def _make_file(dest: Path, name: str, size: int = 10, mtime: float = 0) -> Path:
+    dest.mkdir(parents=True, exist_ok=True)
+    pth = dest / name
+    pth.write_bytes(b"x" * size)
+    if mtime:
+        os.utime(pth, (mtime, mtime))
+    return pth
+
+
+def test_add(tmp_path: Path) -> None:
+    cache = WheelCache(tmp_path / "cache", max_bytes=1000)
+    src = _make_file(tmp_path / "src", "spam-1.0-py3-none-any.whl")
+    dst = cache.add(src)
+    assert dst == cache.path / "spam-1.0-py3-none-any.whl"
+    assert dst.read_bytes() == src.read_bytes()
+    # adding again keeps the file
+    assert cache.add(src) == dst
+    assert cache.add(_make_file(tmp_path / "src", "readme.txt")) is None
+    assert [p.name for p in cache.path.iterdir()] == ["spam-1.0-py3-none-any.whl"]
+
+
+def test_add_dir(tmp_path: Path) -> None:
+    wheelhouse = tmp_path / "wheelhouse"
+    _make_file(wheelhouse / "spam", "spam-1.0-py3-none-any.whl")
+    _make_file(wheelhouse / "eggs", "eggs-2.0.tar.gz")
+    _make_file(wheelhouse / "eggs", "notes.txt")
+    cache = WheelCache(tmp_path / "cache", max_bytes=1000)
+    added = cache.add_dir(wheelhouse)
+    assert sorted(p.name for p in added) == ["eggs-2.0.tar.gz", "spam-1.0-py3-none-any.whl"]
+
+
+def test_find(tmp_path: Path) -> None:
+    cache = WheelCache(tmp_path, max_bytes=1000)
+    _make_file(tmp_path, "Spam_Eggs-1.0-py3-none-any.whl")
+    _make_file(tmp_path, "spam_eggs-1.5.tar.gz")
+    _make_file(tmp_path, "spam_eggs-1.5-py3-none-any.whl")
+    _make_file(tmp_path, "spam_eggs-2.0-py3-none-any.whl")
+    _make_file(tmp_path, "spam_eggs-3.0-cp27-cp27m-win32.whl")
+
+    entry = cache.find("Spam.Eggs")
+    assert entry is not None
+    assert entry.version == "2.0"
+
+    entry = cache.find("spam-eggs", ">=1.0, <2.0")
+    assert entry is not None
+    assert entry.path.name == "spam_eggs-1.5-py3-none-any.whl"
+
+    entry = cache.find("spam-eggs", "<1.5")
+    assert entry is not None
+    assert entry.version == "1.0"
+
+    assert cache.find("spam-eggs", ">=3.0") is None
+    assert cache.find("ham") is None
+
+
+def test_evict(tmp_path: Path) -> None:
+    cache = WheelCache(tmp_path, max_bytes=25)
+    _make_file(tmp_path, "a-1.0-py3-none-any.whl", mtime=1000)
+    _make_file(tmp_path, "b-1.0-py3-none-any.whl", mtime=2000)
+    _make_file(tmp_path, "c-1.0-py3-none-any.whl", mtime=3000)
+    cache.touch_installed([("A", "1.0")])
+
+    removed = cache.evict()
+    assert [p.name for p in removed] == ["b-1.0-py3-none-any.whl"]
+    assert sorted(e.name for e in cache.entries()) == ["a", "c"]
@@ -0,0 +1,100 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import TYPE_CHECKING
+import sys
+import zipfile
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.___lo_pip___.install.wheelhouse import Wheelhouse
+else:
+    from oxt.___lo_pip___.install.wheelhouse import Wheelhouse
+
+
+def _make_wheel(dest: Path, name: str, ver: str) -> Path:
+    dest.mkdir(parents=True, exist_ok=True)
+    whl = dest / f"{name}-{ver}-py3-none-any.whl"
+    dist_info = f"{name}-{ver}.dist-info"
+    with zipfile.ZipFile(whl, "w") as zf:
+        zf.writestr(f"{name}/__init__.py", "")
+        zf.writestr(f"{dist_info}/METADATA", f"Metadata-Version: 2.1\nName: {name}\nVersion: {ver}\n")
+        zf.writestr(
+            f"{dist_info}/WHEEL", "Wheel-Version: 1.0\nGenerator: test\nRoot-Is-Purelib: true\nTag: py3-none-any\n"
+        )
+        zf.writestr(f"{dist_info}/RECORD", "")
+    return whl
+
+
+@pytest.fixture
+def index_dir(tmp_path: Path) -> Path:
+    index = tmp_path / "index"
+    _make_wheel(index, "spam", "1.0")
+    _make_wheel(index, "spam", "1.1")
+    _make_wheel(index, "eggs", "2.0")
+    return index
+
+
+def _get_wheelhouse(pth: Path, index: Path) -> Wheelhouse:
+    return Wheelhouse(
+        path=pth,
+        pip_cmd=[sys.executable, "-m", "pip", "--disable-pip-version-check"],
+        download_args=["--no-index", f"--find-links={index}"],
+        max_workers=2,
+    )
+
+
+def test_prefetch(tmp_path: Path, index_dir: Path) -> None:
+    wh = _get_wheelhouse(tmp_path / "wheelhouse", index_dir)
+    assert wh.get_install_args() == []
+
+    failed = wh.prefetch({"spam": "<1.1", "eggs": ""})
+    assert failed == []
+    assert wh.is_prefetched("spam")
+    assert wh.is_prefetched("eggs")
+    assert [f.name for f in (wh.path / "spam").iterdir()] == ["spam-1.0-py3-none-any.whl"]
+    assert [f.name for f in (wh.path / "eggs").iterdir()] == ["eggs-2.0-py3-none-any.whl"]
+
+    args = wh.get_install_args()
+    assert args[0] == "--no-index"
+    assert set(args[1:]) == {f"--find-links={wh.path / 'spam'}", f"--find-links={wh.path / 'eggs'}"}
+
+
+def test_prefetch_failed(tmp_path: Path, index_dir: Path) -> None:
+    wh = _get_wheelhouse(tmp_path / "wheelhouse", index_dir)
+    failed = wh.prefetch({"spam": "", "ham": ""})
+    assert failed == ["ham"]
+    assert wh.is_prefetched("spam")
+    assert not wh.is_prefetched("ham")
+    assert wh.get_error("ham")
+
+
+def test_get_download_cmd(tmp_path: Path) -> None:
+    wh = Wheelhouse(path=tmp_path, pip_cmd=["python", "-m", "pip"])
+    assert wh.get_download_cmd("spam", ">=1.0") == [
+        "python",
+        "-m",
+        "pip",
+        "download",
+        "--dest",
+        str(tmp_path / "spam"),
+        "spam>=1.0",
+    ]
+
+
+def test_prefetch_find_links(tmp_path: Path, index_dir: Path) -> None:
+    cache = tmp_path / "cache"
+    wh = Wheelhouse(
+        path=tmp_path / "wheelhouse",
+        pip_cmd=[sys.executable, "-m", "pip", "--disable-pip-version-check"],
+        download_args=["--no-index", f"--find-links={index_dir}"],
+        find_links=[cache],
+    )
+    wh.mark_prefetched("spam")
+    assert wh.get_install_args() == ["--no-index", f"--find-links={cache}"]
+
+    assert wh.prefetch({"spam": "", "eggs": ""}) == []
+    assert not (wh.path / "spam").exists()
+    assert wh.get_install_args() == ["--no-index", f"--find-links={cache}", f"--find-links={wh.path / 'eggs'}"]
@@ -188,3 +188,36 @@ def test_expect_not_equal(installed_str: str, vstr: str, expected_result: bool)
 def test_meet_requirements(check_ver: str, vstr: str, result: bool) -> None:
     vr = VerRules()
     assert vr.get_installed_is_valid(vstr=vstr, check_version=check_ver) == result
+
+
+@pytest.mark.parametrize(
+    "check_ver,vstr",
+    [
+        ("1.2.5", "^1.2.4"),
+        ("1.1.1", "!=1.1.0, ^1.2.4"),
+        ("1.1.2", "<1.1.5, >1.1.1, !=1.1.2"),
+        ("1.5.2", "~=1.5; <2"),
+        ("2.0", "==1.*"),
+        ("0.0.0a1", "==*"),
+        ("bad", "==*"),
+        ("1.0", "junk"),
+    ],
+)
+def test_compile_matches_rules(check_ver: str, vstr: str) -> None:
+    vr = VerRules()
+    rules = vr.split_and_strip(vstr)
+    matched = [rule for part in rules for rule in vr.get_partial_matched_rules(part)]
+    spec = vr.compile(vstr)
+    assert spec.is_valid(check_ver) == vr.get_installed_is_valid_by_rules(matched, check_ver)
+    assert spec.versions_str == tuple(rule.get_versions_str() for rule in matched)
+
+
+def test_compile_cached() -> None:
+    vr = VerRules()
+    spec = vr.compile(">=1.2, <2")
+    assert spec is VerRules().compile(">=1.2, <2")
+    assert spec in {spec}
+    assert spec.vstr == ">=1.2, <2"
+    assert not vr.compile("")
+    with pytest.raises(AttributeError):
+        spec._vstr = "==1.0"  # type: ignore
@@ -0,0 +1,61 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.___lo_pip___.settings.settings_cache import SettingsCache, get_accessor_name
+else:
+    from oxt.___lo_pip___.settings.settings_cache import SettingsCache, get_accessor_name
+
+
+@pytest.mark.parametrize(
+    "accessor,expected",
+    [
+        ("GeneralSettings/ShowProgress", "ShowProgress"),
+        ("GeneralSettings/['ShowProgress']", "ShowProgress"),
+        ('PipInfo/["InstalledLocalPips"]', "InstalledLocalPips"),
+        ("ShowProgress", "ShowProgress"),
+        ("", ""),
+    ],
+)
+def test_get_accessor_name(accessor: str, expected: str) -> None:
+    assert get_accessor_name(accessor) == expected
+
+
+def test_typed() -> None:
+    cache = SettingsCache({"ShowProgress": True, "LogLevel": "10", "Pips": ["a", "b"], "Empty": None})
+    assert cache.get_bool("ShowProgress") is True
+    assert cache.get_int("LogLevel") == 10
+    assert cache.get_str("LogLevel") == "10"
+    assert cache.get_str_tuple("Pips") == ("a", "b")
+    assert cache.get_str("Empty", "x") == "x"
+    assert cache.get_bool("Missing", True) is True
+    assert cache.get_int("ShowProgress") == 1
+    assert cache.get_int("Pips", 5) == 5
+
+
+def test_patch() -> None:
+    cache = SettingsCache({"ShowProgress": False, "UrlPip": "a"})
+    values = cache.values
+    assert cache.get_bool("ShowProgress") is False
+    assert cache.get_str("UrlPip") == "a"
+
+    assert cache.patch({"ShowProgress": True, "UrlPip": "a", "New": 1}) == ["ShowProgress", "New"]
+    assert cache.get_bool("ShowProgress") is True
+    assert cache.get_str("UrlPip") == "a"
+    assert cache.get_int("New") == 1
+    # dictionaries handed out earlier see the changes.
+    assert values["ShowProgress"] is True
+    assert cache.patch({"ShowProgress": True}) == []
+
+
+def test_replace() -> None:
+    cache = SettingsCache({"ShowProgress": True})
+    values = cache.values
+    assert cache.get_bool("ShowProgress") is True
+    cache.replace({"UrlPip": "b"})
+    assert cache.get_bool("ShowProgress") is False
+    assert values == {"UrlPip": "b"}
@@ -0,0 +1,207 @@
+"""
+Cancellation tests.
+
+``test_benchmark_traced_thread`` compares the old ``sys.settrace`` based killable thread with the cooperative one.
+Run with ``pytest -s tests/test_thread/test_cancellation.py`` to see the report.
+Timings depend on the machine and its load so they are only reported, not asserted.
+"""
+
+from __future__ import annotations
+from types import FrameType
+from typing import Any, Callable, List, TYPE_CHECKING
+import os
+import subprocess
+import sys
+import threading
+import time
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.___lo_pip___.thread.cancellation import (
+        CancellationToken,
+        CancelledError,
+        check_cancelled,
+        current_token,
+        sleep,
+        token_scope,
+    )
+    from ...oxt.___lo_pip___.thread.killable_thread import KillableThread
+else:
+    from oxt.___lo_pip___.thread.cancellation import (
+        CancellationToken,
+        CancelledError,
+        check_cancelled,
+        current_token,
+        sleep,
+        token_scope,
+    )
+    from oxt.___lo_pip___.thread.killable_thread import KillableThread
+
+
+def test_token() -> None:
+    token = CancellationToken()
+    calls: List[str] = []
+    token.register(lambda: calls.append("a"))
+    unregister = token.register(lambda: calls.append("b"))
+    token.register(lambda: 1 / 0)  # errors are ignored
+    unregister()
+    assert not token.is_cancelled
+    token.raise_if_cancelled()
+
+    token.cancel()
+    token.cancel()
+    assert token.is_cancelled
+    assert token.is_set()
+    assert calls == ["a"]
+    with pytest.raises(CancelledError):
+        token.raise_if_cancelled()
+    # registered after cancel runs right away.
+    token.register(lambda: calls.append("c"))
+    assert calls == ["a", "c"]
+
+
+def test_token_scope() -> None:
+    assert current_token() is None
+    check_cancelled()
+    token = CancellationToken()
+    with token_scope(token):
+        assert current_token() is token
+        check_cancelled()
+        token.cancel()
+        with pytest.raises(CancelledError):
+            check_cancelled()
+    assert current_token() is None
+
+
+def test_killable_thread() -> None:
+    counts: List[int] = []
+
+    def work() -> None:
+        while True:
+            check_cancelled()
+            counts.append(1)
+            time.sleep(0.01)
+
+    thread = KillableThread(target=work)
+    thread.start()
+    time.sleep(0.1)
+    assert not thread.killed
+    thread.kill()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert thread.killed
+    assert counts
+
+
+def test_killable_thread_sleep() -> None:
+    def work() -> None:
+        while True:
+            sleep(30)
+
+    thread = KillableThread(target=work)
+    thread.start()
+    time.sleep(0.1)
+    start = time.monotonic()
+    thread.kill()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    # sleep() wakes up on kill instead of finishing.
+    assert time.monotonic() - start < 1.0
+    sleep(0.01)  # no token, a plain sleep.
+
+
+def test_killable_thread_traced() -> None:
+    counts: List[int] = []
+
+    def work() -> None:
+        # never checks the token.
+        while True:
+            counts.append(1)
+            time.sleep(0.01)
+
+    thread = KillableThread(target=work, traced=True, daemon=True)
+    thread.start()
+    time.sleep(0.1)
+    thread.kill()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert counts
+
+
+@pytest.mark.skipif(os.name == "nt", reason="process groups are posix")
+def test_register_process() -> None:
+    proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"], start_new_session=True)
+    token = CancellationToken()
+    token.register_process(proc.pid)
+    start = time.monotonic()
+    token.cancel()
+    assert proc.wait(timeout=10) != 0
+    assert time.monotonic() - start < 5
+
+
+class _TracedThread(threading.Thread):
+    """The line tracing killable thread that ``KillableThread`` replaces."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        super().__init__(*args, **kwargs)
+        self.killed = False
+
+    def run(self) -> None:
+        sys.settrace(self._global_trace)
+        super().run()
+
+    def _global_trace(self, frame: FrameType, event: str, arg: object) -> Callable | None:
+        return self._local_trace if event == "call" else None
+
+    def _local_trace(self, frame: FrameType, event: str, arg: object) -> Callable | None:
+        if event == "line" and self.killed:
+            raise SystemExit()
+        return self._local_trace
+
+
+def _busy(n: int) -> int:
+    total = 0
+    for i in range(n):
+        total += i % 7
+    return total
+
+
+def _time_thread(cls: type, n: int) -> float:
+    best = float("inf")
+    for _ in range(3):
+        thread = cls(target=_busy, args=(n,))
+        start = time.perf_counter()
+        thread.start()
+        thread.join(timeout=30)
+        assert not thread.is_alive()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def test_benchmark_traced_thread() -> None:
+    n = 200_000
+    traced = _time_thread(_TracedThread, n)
+    cooperative = _time_thread(KillableThread, n)
+    plain = _time_thread(threading.Thread, n)
+    print(
+        f"\nkillable thread, {n} loop iterations:"
+        f"\n  traced      {traced * 1000:8.1f} ms"
+        f"\n  cooperative {cooperative * 1000:8.1f} ms"
+        f"\n  plain       {plain * 1000:8.1f} ms"
+    )
+
+    def work() -> None:
+        while True:
+            check_cancelled()
+            _busy(1_000)
+
+    # the cooperative thread still stops when it checks its token.
+    thread = KillableThread(target=work)
+    thread.start()
+    thread.kill()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert thread.killed
@@ -0,0 +1,115 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import TYPE_CHECKING, List
+import json
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from ...oxt.___lo_pip___.timing.phase_timer import (
+        PhaseRecord,
+        PhaseTimer,
+        format_summary,
+        percentile,
+        read_trace,
+        summarize,
+    )
+else:
+    from oxt.___lo_pip___.timing.phase_timer import (
+        PhaseRecord,
+        PhaseTimer,
+        format_summary,
+        percentile,
+        read_trace,
+        summarize,
+    )
+
+
+def test_phase_write(tmp_path: Path) -> None:
+    trace = tmp_path / "install.trace.jsonl"
+    timer = PhaseTimer()
+    run = timer.run
+    with timer.phase("requirements_check"):
+        pass
+    with pytest.raises(ValueError):
+        with timer.phase("install_pkg", package="spam"):
+            raise ValueError("failed")
+    timer.record("total", 1.5, start=100.0)
+
+    assert timer.write(trace) == 3
+    assert timer.run != run
+    assert timer.records == []
+    assert timer.write(trace) == 0
+
+    lines = [json.loads(line) for line in trace.read_text(encoding="utf-8").splitlines()]
+    assert [line["phase"] for line in lines] == ["requirements_check", "install_pkg", "total"]
+    assert {line["run"] for line in lines} == {run}
+    assert lines[1]["args"] == {"package": "spam"}
+    assert lines[2]["start"] == 100.0
+    assert lines[2]["duration"] == 1.5
+    assert read_trace(trace)[2] == PhaseRecord(run, "total", 100.0, 1.5, {})
+
+
+def test_write_rotates(tmp_path: Path) -> None:
+    trace = tmp_path / "install.trace.jsonl"
+    trace.write_text("x" * 20, encoding="utf-8")
+    timer = PhaseTimer(max_bytes=10)
+    timer.record("total", 1.0)
+    timer.write(trace)
+    assert (tmp_path / "install.trace.jsonl.1").read_text(encoding="utf-8") == "x" * 20
+    assert len(read_trace(trace)) == 1
+
+
+def test_read_trace_skips_bad_lines(tmp_path: Path) -> None:
+    trace = tmp_path / "install.trace.jsonl"
+    trace.write_text(
+        '{"run": "a", "phase": "total", "start": 1, "duration": 2}\nnot json\n{"run": "b"}\n', encoding="utf-8"
+    )
+    assert read_trace(trace) == [PhaseRecord("a", "total", 1.0, 2.0, {})]
+
+
+@pytest.mark.parametrize(
+    "values,pct,expected",
+    [
+        ([], 50, 0.0),
+        ([3.0], 90, 3.0),
+        ([1.0, 2.0, 3.0, 4.0], 50, 2.5),
+        ([4.0, 1.0, 3.0, 2.0], 0, 1.0),
+        ([1.0, 2.0, 3.0, 4.0], 100, 4.0),
+        ([0.0, 10.0], 90, 9.0),
+    ],
+)
+def test_percentile(values: List[float], pct: float, expected: float) -> None:
+    assert percentile(values, pct) == pytest.approx(expected)
+
+
+def test_summarize() -> None:
+    records = [
+        PhaseRecord("r1", "install_pkg", 0, 1.0, {"package": "spam"}),
+        PhaseRecord("r1", "install_pkg", 0, 2.0, {"package": "eggs"}),
+        PhaseRecord("r1", "total", 0, 4.0, {}),
+        PhaseRecord("r2", "total", 0, 2.0, {}),
+        PhaseRecord("r3", "total", 0, 6.0, {}),
+    ]
+    summary = summarize(records, percentiles=(50, 90))
+    assert summary["install_pkg"] == {"runs": 1.0, "mean": 3.0, "max": 3.0, "p50": 3.0, "p90": 3.0}
+    assert summary["total"]["runs"] == 3.0
+    assert summary["total"]["mean"] == pytest.approx(4.0)
+    assert summary["total"]["p50"] == pytest.approx(4.0)
+    assert summary["total"]["p90"] == pytest.approx(5.6)
+
+    report = format_summary(summary).splitlines()
+    assert report[0].split() == ["phase", "runs", "mean", "max", "p50", "p90"]
+    assert report[1].split()[:3] == ["total", "3", "4000.0"]
+    assert format_summary({}) == ""
+
+
+def test_summarize_file(tmp_path: Path) -> None:
+    trace = tmp_path / "install.trace.jsonl"
+    for duration in (1.0, 3.0):
+        timer = PhaseTimer()
+        timer.record("requirements_check", duration)
+        timer.write(trace)
+    assert summarize(trace)["requirements_check"]["p50"] == pytest.approx(2.0)